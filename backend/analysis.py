@@ -0,0 +1,409 @@
+"""
+Repo Analysis Pipeline
+======================
+The analyze job: fetch GitHub data, save instant heuristic matches, then
+refine them with the LLM batch by batch, publishing progress events along
+the way. Shared by the API process (in-process job workers, /api/scan) and
+the standalone worker (worker.py), which is why it lives outside main.py.
+
+Duplicate submissions are coalesced by normalized "owner/repo" (repo_key):
+concurrent requests attach to the analysis already in flight — a queued job,
+or an inline run in this process (analyze_once) — instead of starting another
+GitHub + LLM pipeline.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, or_
+
+import events
+import job_queue
+import leaderboard
+from models import SessionLocal, Repo, Match
+from github_api import fetch_repo_data, GitHubTransientError
+from matcher import run_matching, funding_hash, MATCHING_MODE
+from funding_db import get_all_funding_sources
+
+# Longest /api/scan waits on an analysis started by another request
+ANALYSIS_WAIT_TIMEOUT = float(os.getenv("ANALYSIS_WAIT_TIMEOUT", "180"))
+
+# Inline analyses running in this process, by repo_key
+_inflight: dict[str, asyncio.Task] = {}
+
+
+def _bucket(value) -> int:
+    """Log2 bucket: a repo doubling its stars is material, +3 stars is not."""
+    return int(math.log2(max(0.0, float(value or 0)) + 1))
+
+
+def input_hash(repo_dict: dict) -> str:
+    """Hash of the GitHub inputs that can change a repo's matches."""
+    material = {
+        "description": repo_dict.get("description") or "",
+        "topics": sorted(repo_dict.get("topics") or []),
+        "language": repo_dict.get("language") or "",
+        "license": repo_dict.get("license_name") or "",
+        "readme": hashlib.sha256((repo_dict.get("readme_excerpt") or "").encode("utf-8")).hexdigest(),
+        "is_fork": bool(repo_dict.get("is_fork")),
+        "stars": _bucket(repo_dict.get("stars")),
+        "contributors": _bucket(repo_dict.get("contributors_count")),
+        "activity": _bucket(repo_dict.get("commit_frequency")),
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _apply_match(row: Match, m: dict, provisional: bool, refinement: str) -> None:
+    """Copy a matcher result onto a Match row."""
+    row.match_score = m["score"]
+    row.reasoning = m.get("reasoning", "")
+    row.strengths = m.get("strengths", [])
+    row.gaps = m.get("gaps", [])
+    row.application_tips = m.get("application_tips", "")
+    row.provisional = provisional
+    row.refinement = refinement
+
+
+def match_event(row: Match) -> dict:
+    """Payload of a "match" SSE event."""
+    return {
+        "id": row.id,
+        "funding_id": row.funding_id,
+        "match_score": row.match_score,
+        "reasoning": row.reasoning,
+        "strengths": row.strengths or [],
+        "gaps": row.gaps or [],
+        "application_tips": row.application_tips,
+        "provisional": bool(row.provisional),
+        "refinement": row.refinement,
+    }
+
+
+async def analyze_and_match(repo_id: str, mode: Optional[str] = None, raise_errors: bool = False,
+                            refresh: bool = False):
+    """
+    Background task that:
+    1. Fetches GitHub data for the repo
+    2. Saves instant heuristic matches (provisional) and marks the repo analyzed
+    3. Refines each match with the LLM as batches complete (`mode`: see
+       matcher.run_matching; "heuristic" stops after step 2)
+
+    Re-analyzing a repo whose material inputs (input_hash) haven't changed
+    only re-scores funding sources added or modified since the last run.
+
+    With raise_errors, transient failures propagate instead of marking the repo
+    as errored, so the job queue can retry them. With refresh (scheduled
+    re-analysis), a failure never demotes an already analyzed repo: its
+    previous results stay published.
+    """
+    db = SessionLocal()
+    try:
+        repo = db.query(Repo).filter(Repo.id == repo_id).first()
+        if not repo:
+            return
+
+        def fail(message: str) -> None:
+            if refresh and repo.status == "analyzed":
+                return
+            repo.status = "error"
+            repo.error_message = message
+            db.commit()
+            events.publish(repo_id, "error", {"status": "error", "message": message})
+
+        # 1. Fetch GitHub data
+        events.publish(repo_id, "status", {"status": "fetching"})
+        try:
+            gh_data = await fetch_repo_data(repo.github_url)
+        except GitHubTransientError as e:
+            # Rate limited / GitHub down: let the job queue retry with backoff
+            if raise_errors:
+                raise
+            fail(str(e))
+            return
+        except ValueError as e:
+            fail(str(e))
+            return
+        except Exception as e:
+            if raise_errors:
+                raise
+            fail(f"GitHub API error: {str(e)}")
+            return
+
+        # 2. Update repo with GitHub data
+        for field, value in gh_data.items():
+            if hasattr(repo, field) and field != "id":
+                setattr(repo, field, value)
+
+        # Parse datetime strings
+        for dt_field in ("created_at_github", "updated_at_github"):
+            val = gh_data.get(dt_field)
+            if val and isinstance(val, str):
+                try:
+                    setattr(repo, dt_field, datetime.fromisoformat(val.replace("Z", "+00:00")))
+                except Exception:
+                    pass
+
+        db.commit()
+        events.publish(repo_id, "status", {"status": "fetched"})
+
+        # 3. Run AI matching
+        funding_sources = get_all_funding_sources(db)
+        repo_dict = {
+            c.name: getattr(repo, c.name)
+            for c in repo.__table__.columns
+        }
+        # JSON fields stored as strings in SQLite — decode if needed
+        for json_field in ("topics",):
+            val = repo_dict.get(json_field)
+            if isinstance(val, str):
+                try:
+                    repo_dict[json_field] = json.loads(val)
+                except Exception:
+                    repo_dict[json_field] = []
+
+        # 4. Incremental refresh: if the material inputs are unchanged since
+        #    the last complete run, only funding sources added or modified
+        #    since then are re-scored; every other match is kept as is
+        final = (mode or MATCHING_MODE) == "heuristic"
+        inputs = input_hash(repo_dict)
+        catalog = {str(fs.id): funding_hash(fs) for fs in funding_sources}
+        previous = repo.catalog_hashes or {}
+        reusable = ("complete", "skipped") if final else ("complete",)
+        only_ids = None
+        if previous and repo.input_hash == inputs and repo.refinement_status in reusable:
+            only_ids = {int(k) for k, h in catalog.items() if previous.get(k) != h}
+            removed = [int(k) for k in previous if k not in catalog]
+            rows: dict[int, Match] = {
+                row.funding_id: row
+                for row in db.query(Match).filter(
+                    Match.repo_id == repo_id, Match.funding_id.in_(list(only_ids) + removed)
+                )
+            }
+            if not only_ids:
+                for row in rows.values():
+                    db.delete(row)
+                repo.catalog_hashes = catalog
+                repo.analyzed_at = datetime.utcnow()
+                db.commit()
+                events.publish(repo_id, "status", {"status": "unchanged"})
+                events.publish(repo_id, "complete", {"status": "analyzed", "refinement_status": repo.refinement_status})
+                return
+        else:
+            db.query(Match).filter(Match.repo_id == repo_id).delete()
+            rows = {}
+
+        # 5. Phase one: instant heuristic matches, so the repo is usable while
+        #    the LLM works. Old rows for sources that are no longer candidates go.
+        heuristic = await run_matching(repo_dict, funding_sources, mode="heuristic", only_ids=only_ids)
+        scored_ids = {m["funding_id"] for m in heuristic}
+        for funding_id in [f for f in rows if f not in scored_ids]:
+            db.delete(rows.pop(funding_id))
+        for m in heuristic:
+            if m["funding_id"] not in rows:
+                rows[m["funding_id"]] = Match(repo_id=repo_id, funding_id=m["funding_id"])
+                db.add(rows[m["funding_id"]])
+            _apply_match(rows[m["funding_id"]], m, provisional=not final, refinement="heuristic" if final else "pending")
+
+        repo.status = "analyzed"
+        repo.error_message = None
+        repo.refinement_status = "skipped" if final else "refining"
+        repo.input_hash = inputs
+        repo.catalog_hashes = catalog
+        repo.analyzed_at = datetime.utcnow()
+        db.commit()
+        events.publish(repo_id, "status", {
+            "status": "prefiltered", "candidates": len(rows), "incremental": only_ids is not None,
+        })
+        for row in rows.values():
+            events.publish(repo_id, "match", match_event(row))
+        events.publish(repo_id, "status", {"status": "analyzed", "refinement_status": repo.refinement_status})
+        if final:
+            events.publish(repo_id, "complete", {"status": "analyzed", "refinement_status": "skipped"})
+            return
+
+        # 6. Phase two: upgrade each match in place as LLM batches complete
+        batches_done = 0
+
+        def save_batch(batch: list[dict]) -> None:
+            nonlocal batches_done
+            changed = []
+            for m in batch:
+                row = rows.get(m["funding_id"])
+                if row is None:
+                    row = rows[m["funding_id"]] = Match(repo_id=repo_id, funding_id=m["funding_id"])
+                    db.add(row)
+                _apply_match(row, m, provisional=False, refinement="refined" if m["method"] == "llm" else "fallback")
+                changed.append(row)
+            db.commit()
+            batches_done += 1
+            events.publish(repo_id, "status", {"status": "batch_scored", "batch": batches_done, "matches": len(changed)})
+            for row in changed:
+                events.publish(repo_id, "match", match_event(row))
+
+        try:
+            await run_matching(repo_dict, funding_sources, mode=mode, on_batch=save_batch, only_ids=only_ids)
+            refinement_error = None
+        except Exception as e:
+            refinement_error = f"LLM refinement failed: {str(e)}"
+
+        # Anything the LLM never scored keeps its heuristic score
+        leftovers = [row for row in rows.values() if row.provisional]
+        for row in leftovers:
+            row.provisional = False
+            row.refinement = "fallback"
+        # In auto mode run_matching falls back to heuristics instead of raising
+        # when the LLM is down, so "complete" requires every row to be refined;
+        # only complete runs are reused by the next incremental refresh
+        if refinement_error:
+            repo.refinement_status = "failed"
+            repo.error_message = refinement_error
+        elif any(row.refinement == "fallback" for row in rows.values()):
+            repo.refinement_status = "partial"
+        else:
+            repo.refinement_status = "complete"
+        db.commit()
+        for row in leftovers:
+            events.publish(repo_id, "match", match_event(row))
+        events.publish(repo_id, "complete", {"status": "analyzed", "refinement_status": repo.refinement_status})
+
+    except Exception as e:
+        # Drop half-applied changes (e.g. deleted matches) before anything commits
+        db.rollback()
+        if raise_errors:
+            raise
+        try:
+            repo = db.query(Repo).filter(Repo.id == repo_id).first()
+            if repo and refresh and repo.status == "analyzed":
+                return
+            if repo:
+                repo.status = "error"
+                repo.error_message = f"Unexpected error: {str(e)}"
+                db.commit()
+        except Exception:
+            pass
+        events.publish(repo_id, "error", {"status": "error", "message": f"Unexpected error: {str(e)}"})
+    finally:
+        # Re-rank the repo whatever the outcome (an errored repo drops out)
+        try:
+            leaderboard.update_repo(db, repo_id)
+        except Exception:
+            db.rollback()
+        db.close()
+
+
+async def run_analyze_job(payload: dict) -> None:
+    await analyze_and_match(payload["repo_id"], payload.get("mode"), raise_errors=True,
+                            refresh=payload.get("refresh", False))
+
+
+job_queue.register("analyze", run_analyze_job)
+
+
+# ---------------------------------------------------------------------------
+# Single-flight coalescing
+# ---------------------------------------------------------------------------
+def repo_key(github_url: str) -> str:
+    """Normalize a GitHub URL to lowercase "owner/repo"."""
+    parts = github_url.strip().rstrip("/").split("/")
+    owner, name = parts[-2], parts[-1]
+    if name.endswith(".git"):
+        name = name[:-4]
+    return f"{owner}/{name}".lower()
+
+
+def find_repo(db, key: str) -> Optional[Repo]:
+    """Most recent Repo row for a normalized key (rows predating repo_key match by URL)."""
+    return (
+        db.query(Repo)
+        .filter(or_(Repo.repo_key == key, func.lower(Repo.github_url) == f"https://github.com/{key}"))
+        .order_by(Repo.created_at.desc())
+        .first()
+    )
+
+
+def claim_repo(db, key: str, github_url: str, repo_name: str, owner: Optional[str] = None) -> tuple[Repo, bool]:
+    """
+    Create a pending Repo for `key`, or attach to one another request created
+    concurrently. Every racer keeps the oldest pending row, so all converge on
+    the same repo_id. Returns (repo, created).
+    """
+    repo = Repo(github_url=github_url, repo_name=repo_name, owner=owner, repo_key=key, status="pending")
+    db.add(repo)
+    db.commit()
+
+    first = (
+        db.query(Repo)
+        .filter(Repo.repo_key == key, Repo.status == "pending")
+        .order_by(Repo.created_at.asc(), Repo.id.asc())
+        .first()
+    )
+    if first is not None and first.id != repo.id:
+        db.delete(repo)
+        db.commit()
+        return first, False
+    return repo, True
+
+
+def record_view(db, repo_id: str) -> None:
+    """Count a request for this repo (refresh_scheduler prioritizes by traffic)."""
+    db.query(Repo).filter(Repo.id == repo_id).update(
+        {Repo.view_count: func.coalesce(Repo.view_count, 0) + 1, Repo.last_viewed_at: datetime.utcnow()},
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+def is_in_flight(db, key: str, repo_id: str) -> bool:
+    """An analysis for this repo is queued, running in a worker, or running inline here."""
+    task = _inflight.get(key)
+    return (task is not None and not task.done()) or job_queue.has_active_job(repo_id, db)
+
+
+async def analyze_once(key: str, repo_id: str, mode: Optional[str] = None) -> None:
+    """
+    Run analyze_and_match inline, single-flight per key: concurrent callers
+    share one run, and a repo owned by a queued job is waited on instead.
+    """
+    task = _inflight.get(key)
+    if task is None or task.done():
+        if job_queue.has_active_job(repo_id):
+            await wait_for_analysis(repo_id)
+            return
+        task = asyncio.ensure_future(analyze_and_match(repo_id, mode))
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _inflight.pop(key, None) if _inflight.get(key) is t else None)
+    await asyncio.shield(task)
+
+
+async def wait_for_analysis(repo_id: str, timeout: float = ANALYSIS_WAIT_TIMEOUT) -> None:
+    """Wait until an analysis started elsewhere finishes (or errors, or times out)."""
+    queue = events.subscribe(repo_id)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while True:
+            db = SessionLocal()
+            try:
+                repo = db.query(Repo).filter(Repo.id == repo_id).first()
+                done = (
+                    repo is None
+                    or repo.status == "error"
+                    or (repo.status == "analyzed" and repo.refinement_status != "refining")
+                )
+            finally:
+                db.close()
+            remaining = deadline - loop.time()
+            if done or remaining <= 0:
+                return
+            try:
+                # Events wake us early; the periodic re-check covers missed ones
+                await asyncio.wait_for(queue.get(), timeout=min(remaining, 2.0))
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        events.unsubscribe(repo_id, queue)
@@ -0,0 +1,87 @@
+"""
+Import-Time Benchmark
+=====================
+Cold-start cost of the API and the CLI, each measured in a fresh interpreter
+(median of --runs) so module caches from one run never help the next:
+
+    cd backend && python bench_imports.py
+    python bench_imports.py --runs 10
+
+  api          what `uvicorn main:app` imports before serving
+  cli          `opengrant.py` up to its first backend call (get_logic)
+  cli-backend  the backend modules the CLI loads, without its UI
+               dependencies (typer, rich, questionary)
+
+For a per-module breakdown: python -X importtime -c "import main"
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BACKEND_DIR)
+
+_CLI_BACKEND = """
+import sys, os
+sys.path.append(os.path.join(os.getcwd(), "backend"))
+from llm_utils import load_settings, save_settings, test_connection
+from backend.matcher import run_matching
+from backend.github_api import fetch_repo_data
+from backend.monetization import fetch_live_bounties, generate_monetization_strategy
+from backend.fundability import analyze_fundability
+from backend.time_machine import generate_roadmap
+from backend.portfolio import optimize_portfolio
+from backend.funding_db import FUNDING_SOURCES
+from backend.org_scanner import scan_org
+from backend.funded_dna import compare_repo_to_funded_dna
+from backend.dependency_analyzer import analyze_dependencies
+"""
+
+TARGETS = {
+    "api": (BACKEND_DIR, "import main"),
+    "cli": (ROOT_DIR, "import opengrant; opengrant.get_logic()"),
+    "cli-backend": (ROOT_DIR, _CLI_BACKEND),
+}
+
+
+def _time_once(cwd: str, code: str) -> float:
+    """Seconds spent running `code` in a new interpreter (import time only)."""
+    wrapped = (
+        "import time\n"
+        "_t = time.perf_counter()\n"
+        f"exec(compile({code!r}, '<bench>', 'exec'))\n"
+        "print(time.perf_counter() - _t)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", wrapped], cwd=cwd, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError((proc.stderr or proc.stdout).strip().splitlines()[-1])
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure API / CLI import time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("targets", nargs="*", help=f"subset of: {', '.join(TARGETS)}")
+    args = parser.parse_args()
+
+    for name in args.targets or TARGETS:
+        if name not in TARGETS:
+            parser.error(f"unknown target '{name}'")
+        cwd, code = TARGETS[name]
+        try:
+            _time_once(cwd, code)  # warm the bytecode cache; not counted
+            times = [_time_once(cwd, code) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{name:<12} skipped: {e}")
+            continue
+        print(f"{name:<12} median {statistics.median(times) * 1000:7.1f} ms   "
+              f"min {min(times) * 1000:7.1f} ms   ({args.runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
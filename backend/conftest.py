@@ -0,0 +1,41 @@
+"""
+Shared pytest setup.
+Backend modules build their SQLAlchemy engine from DATABASE_URL at import
+time, so the test database (a throwaway SQLite file) and a credential-free
+environment are set here, before any test module imports them. Values set
+here win over backend/.env (load_dotenv never overrides existing variables).
+
+    cd backend && python -m pytest
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+_TEST_DIR = tempfile.mkdtemp(prefix="opengrant-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TEST_DIR, 'test.db')}"
+for _var in ("GITHUB_TOKEN", "GITHUB_TOKENS"):
+    os.environ[_var] = ""
+os.environ["GITHUB_BACKEND"] = "rest"
+os.environ["EMBEDDING_BACKEND"] = "off"
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def db():
+    """A session on freshly created tables (every test starts from an empty database)."""
+    import funding_catalog
+    from models import Base, SessionLocal, engine, init_db
+
+    Base.metadata.drop_all(engine)
+    init_db()
+    funding_catalog._snapshot = None
+    funding_catalog.invalidate()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -1,105 +1,477 @@
+"""
+Dependency Funding Map
+=======================
+Parses a dependency manifest or lockfile, resolves each package to its GitHub
+repo via the npm / PyPI registry, and checks the repo's funding health.
+Shared by the /api/dependencies/analyze endpoints and the CLI.
+
+Packages are resolved concurrently (bounded by DEPENDENCY_CONCURRENCY) so a
+30-package manifest costs roughly the slowest few lookups, not 90 serial
+round-trips. Package -> repo mappings are cached in the package_resolutions
+table (PACKAGE_CACHE_TTL_DAYS; packages without a GitHub repo are cached for
+PACKAGE_CACHE_NEGATIVE_TTL_HOURS), so repeat scans skip the registries.
+
+stream_dependencies() is the uncapped lockfile mode: results are yielded as
+each package finishes, and packages that resolve to the same repo share one
+GitHub lookup.
+
+With a GitHub token, repo health comes from batched GraphQL queries: lookups
+issued within HEALTH_BATCH_WINDOW of each other (up to
+GITHUB_GRAPHQL_BATCH_SIZE repos) share one query instead of two REST calls per
+repo. Repos the batch can't answer fall back to REST.
+"""
+
 import os
 import re
 import json
-import httpx
-from typing import List, Dict, Any
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, AsyncIterator
+from http_client import get_http_client
+from github_api import github_get, _headers
+from github_graphql import GITHUB_GRAPHQL_BATCH_SIZE, fetch_repo_health_graphql, graphql_available
+from models import SessionLocal, PackageResolution
+
+MAX_PACKAGES = 30
+# Upper bound for the streaming lockfile mode (no 30-package cap there)
+MAX_STREAM_PACKAGES = int(os.getenv("DEPENDENCY_STREAM_MAX_PACKAGES", "2000"))
+DEPENDENCY_CONCURRENCY = int(os.getenv("DEPENDENCY_CONCURRENCY", "8"))
+PACKAGE_CACHE_TTL_DAYS = float(os.getenv("PACKAGE_CACHE_TTL_DAYS", "7"))
+PACKAGE_CACHE_NEGATIVE_TTL_HOURS = float(os.getenv("PACKAGE_CACHE_NEGATIVE_TTL_HOURS", "24"))
+# Seconds a health lookup waits for others to share its GraphQL query
+HEALTH_BATCH_WINDOW = float(os.getenv("DEPENDENCY_HEALTH_BATCH_WINDOW", "0.05"))
+
+RISK_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+
+def _npm_lock_packages(parsed: dict) -> List[str]:
+    """Every installed package in a package-lock.json (v1 nested or v2/v3 flat)."""
+    names = []
+    if isinstance(parsed.get("packages"), dict):
+        for path in parsed["packages"]:
+            if "node_modules/" in path:
+                names.append(path.rsplit("node_modules/", 1)[1])
+        return names
+
+    def walk(deps: dict) -> None:
+        for name, info in (deps or {}).items():
+            names.append(name)
+            if isinstance(info, dict):
+                walk(info.get("dependencies"))
+
+    walk(parsed.get("dependencies"))
+    return names
+
 
-async def analyze_dependencies(content: str, ecosystem: str) -> List[Dict[str, Any]]:
+def _requirements_packages(content: str) -> List[str]:
+    """requirements.txt, including hash-pinned files (`--hash=...` continuation lines)."""
+    names = []
+    # Join backslash continuations so hashes stay on their requirement line
+    for line in content.replace("\\\n", " ").splitlines():
+        line = line.split(" #", 1)[0].strip()
+        if not line or line.startswith(("#", "-")):
+            continue  # comments and pip options (-r, -e, --hash, --index-url ...)
+        pkg = re.split(r"[>=<!~;\[\s@]", line)[0].strip()
+        if pkg:
+            names.append(pkg)
+    return names
+
+
+def _poetry_lock_packages(content: str) -> List[str]:
+    import tomllib
+    try:
+        parsed = tomllib.loads(content)
+    except tomllib.TOMLDecodeError:
+        raise ValueError("Invalid poetry.lock")
+    return [p["name"] for p in parsed.get("package", []) if p.get("name")]
+
+
+def parse_packages(content: str, ecosystem: str) -> List[str]:
     """
-    Parse a package.json or requirements.txt and check each dependency's
-    funding health on GitHub.
+    Extract package names from a dependency manifest or lockfile.
+      npm: package.json, package-lock.json
+      pip: requirements.txt (optionally hash-pinned), poetry.lock, Pipfile.lock
+    The format is detected from the content; names are deduplicated in order.
     """
     ecosystem = ecosystem.lower()
     content = content.strip()
     packages = []
 
-    # ── Parse package names ─────────────────────────────────────────────
     if ecosystem == "npm":
         try:
             parsed = json.loads(content)
-            deps = {**parsed.get("dependencies", {}), **parsed.get("devDependencies", {})}
-            packages = list(deps.keys())[:30]
         except Exception:
             raise ValueError("Invalid package.json")
+        if "lockfileVersion" in parsed:
+            packages = _npm_lock_packages(parsed)
+        else:
+            deps = {**parsed.get("dependencies", {}), **parsed.get("devDependencies", {})}
+            packages = list(deps.keys())
     else:  # pip
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            pkg = re.split(r"[>=<!;\[]", line)[0].strip()
-            if pkg:
-                packages.append(pkg)
-        packages = packages[:30]
+        if content.startswith("{"):
+            try:
+                parsed = json.loads(content)
+            except Exception:
+                raise ValueError("Invalid Pipfile.lock")
+            packages = [*parsed.get("default", {}), *parsed.get("develop", {})]
+        elif "[[package]]" in content:
+            packages = _poetry_lock_packages(content)
+        else:
+            packages = _requirements_packages(content)
 
+    packages = list(dict.fromkeys(packages))
     if not packages:
         raise ValueError("No packages found.")
+    return packages
 
-    results = []
-    gh_token = os.getenv("GITHUB_TOKEN", "")
-    gh_headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "FundMatcher/1.0",
-        **({"Authorization": f"token {gh_token}"} if gh_token else {}),
+
+def _cache_name(pkg: str, ecosystem: str) -> str:
+    """PyPI names are case-insensitive and treat -, _ and . alike (PEP 503)."""
+    if ecosystem == "npm":
+        return pkg.strip().lower()
+    return re.sub(r"[-_.]+", "-", pkg.strip()).lower()
+
+
+def load_cached_resolutions(packages: List[str], ecosystem: str) -> Dict[str, Optional[str]]:
+    """
+    Fresh cached resolutions for `packages` in one query.
+    Returns {package: github_url or None}; packages missing or expired are absent.
+    Blocking: call off the event loop.
+    """
+    names = {_cache_name(p, ecosystem): p for p in packages}
+    now = datetime.utcnow()
+    positive_cutoff = now - timedelta(days=PACKAGE_CACHE_TTL_DAYS)
+    negative_cutoff = now - timedelta(hours=PACKAGE_CACHE_NEGATIVE_TTL_HOURS)
+
+    cached: Dict[str, Optional[str]] = {}
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(PackageResolution)
+            .filter(PackageResolution.ecosystem == ecosystem, PackageResolution.name.in_(list(names)))
+            .all()
+        )
+        for row in rows:
+            cutoff = positive_cutoff if row.github_url else negative_cutoff
+            if row.resolved_at and row.resolved_at >= cutoff:
+                cached[names[row.name]] = row.github_url
+    except Exception:
+        pass
+    finally:
+        db.close()
+    return cached
+
+
+def store_resolutions(resolutions: Dict[str, Optional[str]], ecosystem: str) -> None:
+    """Upsert freshly resolved package -> repo mappings. Blocking: call off the event loop."""
+    if not resolutions:
+        return
+    now = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        for pkg, github_url in resolutions.items():
+            db.merge(PackageResolution(
+                ecosystem=ecosystem,
+                name=_cache_name(pkg, ecosystem),
+                github_url=github_url,
+                resolved_at=now,
+            ))
+        db.commit()
+    except Exception:
+        db.rollback()
+    finally:
+        db.close()
+
+
+async def _lookup_registry(pkg: str, ecosystem: str) -> tuple[Optional[str], bool]:
+    """
+    Look up a package on npm / PyPI.
+    Returns (github_url, definitive): definitive is False when the registry could
+    not be reached, so the miss is not cached.
+    """
+    client = get_http_client()
+    github_url = None
+    try:
+        if ecosystem == "npm":
+            r = await client.get(f"https://registry.npmjs.org/{pkg}/latest")
+            if r.status_code == 200:
+                data = r.json()
+                repo = data.get("repository", {})
+                rawurl = repo.get("url", "") if isinstance(repo, dict) else ""
+                match = re.search(r"github\.com[/:]([^/]+/[^/.\s]+)", rawurl)
+                if match:
+                    github_url = f"https://github.com/{match.group(1).removesuffix('.git')}"
+        else:
+            r = await client.get(f"https://pypi.org/pypi/{pkg}/json")
+            if r.status_code == 200:
+                info = r.json().get("info", {})
+                urls = info.get("project_urls") or {}
+                for k, v in urls.items():
+                    if "github.com" in (v or ""):
+                        m = re.search(r"github\.com/([^/]+/[^/\s]+)", v)
+                        if m:
+                            github_url = f"https://github.com/{m.group(1).rstrip('/')}"
+                            break
+                if not github_url:
+                    hp = info.get("home_page") or ""
+                    if "github.com" in hp:
+                        m = re.search(r"github\.com/([^/]+/[^/\s]+)", hp)
+                        if m:
+                            github_url = f"https://github.com/{m.group(1).rstrip('/')}"
+    except Exception:
+        return None, False
+    return github_url, r.status_code in (200, 404)
+
+
+async def resolve_github_url(pkg: str, ecosystem: str) -> Optional[str]:
+    """Look up a package on npm / PyPI and return its GitHub repo URL, if any (cached)."""
+    cached = await asyncio.to_thread(load_cached_resolutions, [pkg], ecosystem)
+    if pkg in cached:
+        return cached[pkg]
+    github_url, definitive = await _lookup_registry(pkg, ecosystem)
+    if definitive:
+        await asyncio.to_thread(store_resolutions, {pkg: github_url}, ecosystem)
+    return github_url
+
+
+class HealthBatch:
+    """Coalesces concurrent repo health lookups into batched GraphQL queries."""
+
+    def __init__(self):
+        self._waiting: Dict[str, tuple[str, asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop only keeps weak references to tasks: hold in-flight batches here
+        self._running: set[asyncio.Task] = set()
+
+    def fetch(self, full_name: str) -> "asyncio.Future":
+        """
+        Future resolving to the repo's health dict, or None if GraphQL didn't
+        return it. Raises the batch's error if the GraphQL query failed.
+        """
+        key = full_name.lower()
+        if key not in self._waiting:
+            self._waiting[key] = (full_name, asyncio.get_running_loop().create_future())
+        future = self._waiting[key][1]
+        if len(self._waiting) >= GITHUB_GRAPHQL_BATCH_SIZE:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(HEALTH_BATCH_WINDOW, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._waiting = self._waiting, {}
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: Dict[str, tuple[str, asyncio.Future]]) -> None:
+        try:
+            found = await fetch_repo_health_graphql([name for name, _ in batch.values()])
+        except asyncio.CancelledError:
+            for _, future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            # Delivered to every waiter (so it is observed there), never left pending
+            for _, future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, (_, future) in batch.items():
+            if not future.done():
+                future.set_result(found.get(key))
+
+
+def _health_batch() -> Optional[HealthBatch]:
+    return HealthBatch() if graphql_available() else None
+
+
+async def fetch_repo_health(github_url: str, batch: Optional[HealthBatch] = None) -> Dict[str, Any]:
+    """Stars, forks, language, license and FUNDING.yml presence for a GitHub repo."""
+    health = {"stars": 0, "forks": 0, "language": "", "license": "", "has_sponsors": False}
+    path = github_url.replace("https://github.com/", "")
+    if batch is not None:
+        try:
+            batched = await batch.fetch(path)
+        except Exception:
+            batched = None  # GraphQL failed: fall back to REST below
+        if batched is not None:
+            return batched
+    try:
+        r, fund_r = await asyncio.gather(
+            github_get(f"https://api.github.com/repos/{path}", headers=_headers()),
+            # GitHub Sponsors / funding links live in .github/FUNDING.yml
+            github_get(f"https://api.github.com/repos/{path}/contents/.github/FUNDING.yml", headers=_headers()),
+        )
+        if r.status_code == 200:
+            d = r.json()
+            lic = d.get("license") or {}
+            health.update({
+                "stars": d.get("stargazers_count", 0),
+                "forks": d.get("forks_count", 0),
+                "language": d.get("language") or "",
+                "license": lic.get("spdx_id") or "",
+            })
+        health["has_sponsors"] = fund_r.status_code == 200
+    except Exception:
+        pass
+    return health
+
+
+def assess_risk(stars: int, has_sponsors: bool, license_name: str) -> tuple[str, List[str]]:
+    """Funding risk level and the reasons behind it."""
+    risk = "low"
+    risk_reasons = []
+    if stars < 100:
+        risk = "high"
+        risk_reasons.append(f"Only {stars} stars")
+    if not has_sponsors:
+        if risk != "high":
+            risk = "medium"
+        risk_reasons.append("No funding setup")
+    if not license_name:
+        risk = "high"
+        risk_reasons.append("No license")
+    return risk, risk_reasons
+
+
+async def analyze_package(
+    pkg: str,
+    ecosystem: str,
+    cached: Optional[Dict[str, Optional[str]]] = None,
+    fresh: Optional[Dict[str, Optional[str]]] = None,
+    health_lookups: Optional[Dict[str, "asyncio.Task"]] = None,
+    health_batch: Optional[HealthBatch] = None,
+) -> Dict[str, Any]:
+    """
+    Resolve one package and score its funding health.
+    `cached` holds preloaded resolutions; registry hits are recorded in `fresh`
+    so the caller can persist them in one write. `health_lookups` shares one
+    GitHub lookup per repo across packages (e.g. a monorepo's @scope/* packages),
+    and `health_batch` folds those lookups into batched GraphQL queries.
+    """
+    if cached is not None and pkg in cached:
+        github_url = cached[pkg]
+    elif fresh is not None:
+        github_url, definitive = await _lookup_registry(pkg, ecosystem)
+        if definitive:
+            fresh[pkg] = github_url
+    else:
+        github_url = await resolve_github_url(pkg, ecosystem)
+
+    if not github_url:
+        health = {"stars": 0, "forks": 0, "language": "", "license": "", "has_sponsors": False}
+    elif health_lookups is None:
+        health = await fetch_repo_health(github_url, health_batch)
+    else:
+        repo_key = github_url.lower().rstrip("/")
+        if repo_key not in health_lookups:
+            health_lookups[repo_key] = asyncio.ensure_future(fetch_repo_health(github_url, health_batch))
+        health = dict(await asyncio.shield(health_lookups[repo_key]))
+
+    risk, risk_reasons = assess_risk(health["stars"], health["has_sponsors"], health["license"])
+    return {
+        "package": pkg,
+        "ecosystem": ecosystem,
+        "github_url": github_url,
+        **health,
+        "risk": risk,
+        "risk_reasons": risk_reasons,
     }
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        for pkg in packages:
-            github_url = None
-            # Resolve GitHub URL from registry
+
+def _summary(ecosystem: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "ecosystem": ecosystem,
+        "total": len(results),
+        "high_risk": sum(1 for r in results if r["risk"] == "high"),
+        "medium_risk": sum(1 for r in results if r["risk"] == "medium"),
+    }
+
+
+async def analyze_dependencies(content: str, ecosystem: str) -> Dict[str, Any]:
+    """
+    Parse a package.json or requirements.txt and check each dependency's
+    funding health on GitHub. Raises ValueError for unparseable input.
+    """
+    ecosystem = ecosystem.lower()
+    packages = parse_packages(content, ecosystem)[:MAX_PACKAGES]
+
+    cached = await asyncio.to_thread(load_cached_resolutions, packages, ecosystem)
+    fresh: Dict[str, Optional[str]] = {}
+    health_lookups: Dict[str, asyncio.Task] = {}
+    health_batch = _health_batch()
+    sem = asyncio.Semaphore(DEPENDENCY_CONCURRENCY)
+
+    async def bounded(pkg: str) -> Dict[str, Any]:
+        async with sem:
+            return await analyze_package(pkg, ecosystem, cached, fresh, health_lookups, health_batch)
+
+    results = await asyncio.gather(*(bounded(pkg) for pkg in packages))
+    results = list(results)
+    await asyncio.to_thread(store_resolutions, fresh, ecosystem)
+
+    # Sort: high risk first
+    results.sort(key=lambda x: RISK_ORDER.get(x["risk"], 3))
+
+    return {**_summary(ecosystem, results), "packages": results}
+
+
+async def stream_dependencies(packages: List[str], ecosystem: str) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Analyze every package (up to MAX_STREAM_PACKAGES) through a bounded worker
+    pool, yielding events as soon as each package completes:
+      {"type": "start", "total": N}
+      {"type": "package", ...analyze_package fields}
+      {"type": "summary", "total", "high_risk", "medium_risk", "unique_repos"}
+    Use parse_packages() first so format errors surface before streaming starts.
+    """
+    ecosystem = ecosystem.lower()
+    packages = packages[:MAX_STREAM_PACKAGES]
+    yield {"type": "start", "ecosystem": ecosystem, "total": len(packages)}
+
+    cached = await asyncio.to_thread(load_cached_resolutions, packages, ecosystem)
+    fresh: Dict[str, Optional[str]] = {}
+    health_lookups: Dict[str, asyncio.Task] = {}
+    health_batch = _health_batch()
+    todo: asyncio.Queue = asyncio.Queue()
+    done: asyncio.Queue = asyncio.Queue()
+    for pkg in packages:
+        todo.put_nowait(pkg)
+
+    async def worker() -> None:
+        while True:
             try:
-                if ecosystem == "npm":
-                    r = await client.get(f"https://registry.npmjs.org/{pkg}/latest")
-                    if r.status_code == 200:
-                        data = r.json()
-                        repo = data.get("repository", {})
-                        rawurl = repo.get("url", "") if isinstance(repo, dict) else ""
-                        match = re.search(r"github\.com[/:]([^/]+/[^/.\s]+)", rawurl)
-                        if match:
-                            github_url = f"https://github.com/{match.group(1).removesuffix('.git')}"
-                else:
-                    r = await client.get(f"https://pypi.org/pypi/{pkg}/json")
-                    if r.status_code == 200:
-                        info = r.json().get("info", {})
-                        urls = info.get("project_urls") or {}
-                        for k, v in urls.items():
-                            if "github.com" in (v or ""):
-                                m = re.search(r"github\.com/([^/]+/[^/\s]+)", v)
-                                if m:
-                                    github_url = f"https://github.com/{m.group(1).rstrip('/')}"
-                                    break
-                        if not github_url:
-                            hp = info.get("home_page") or ""
-                            if "github.com" in hp:
-                                m = re.search(r"github\.com/([^/]+/[^/\s]+)", hp)
-                                if m:
-                                    github_url = f"https://github.com/{m.group(1).rstrip('/')}"
+                pkg = todo.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                result = await analyze_package(pkg, ecosystem, cached, fresh, health_lookups, health_batch)
             except Exception:
-                pass
-
-            # Fetch GitHub stats
-            stars = 0
-            has_sponsors = False
-
-            if github_url:
-                try:
-                    path = github_url.replace("https://github.com/", "")
-                    r = await client.get(f"https://api.github.com/repos/{path}", headers=gh_headers)
-                    if r.status_code == 200:
-                        d = r.json()
-                        stars = d.get("stargazers_count", 0)
-
-                    fund_r = await client.get(
-                        f"https://api.github.com/repos/{path}/contents/.github/FUNDING.yml",
-                        headers=gh_headers,
-                    )
-                    has_sponsors = fund_r.status_code == 200
-                except Exception:
-                    pass
-
-            results.append({
-                "name": pkg,
-                "github_url": github_url,
-                "stars": stars,
-                "has_sponsors": has_sponsors
-            })
-    return results
+                result = {
+                    "package": pkg, "ecosystem": ecosystem, "github_url": None,
+                    "stars": 0, "forks": 0, "language": "", "license": "", "has_sponsors": False,
+                    "risk": "high", "risk_reasons": ["Lookup failed"],
+                }
+            await done.put(result)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(min(DEPENDENCY_CONCURRENCY, len(packages)))]
+    results = []
+    try:
+        for _ in range(len(packages)):
+            result = await done.get()
+            results.append(result)
+            yield {"type": "package", **result}
+    finally:
+        # Client went away mid-stream: stop the pool and drop pending lookups
+        for w in workers:
+            w.cancel()
+        for task in health_lookups.values():
+            task.cancel()
+        await asyncio.to_thread(store_resolutions, fresh, ecosystem)
+
+    yield {"type": "summary", **_summary(ecosystem, results), "unique_repos": len(health_lookups)}
@@ -0,0 +1,173 @@
+"""
+Funding Source Embeddings
+=========================
+Optional semantic retrieval stage for the matcher pre-filter.
+
+Every funding source is embedded once; a repo's description, topics and README
+are embedded per request and the closest sources by cosine similarity are
+fused with the BM25 ranking (see matcher._prefilter). This catches funders the
+keyword index misses ("zero-knowledge" vs "cryptography") without sending more
+candidates to the LLM.
+
+EMBEDDING_BACKEND selects the encoder:
+  off    — disabled (default)
+  local  — small CPU model via sentence-transformers (EMBEDDING_MODEL);
+           falls back to hashed when the package isn't installed
+  hashed — dependency-free hashed word + character n-gram vectors
+
+Source vectors are persisted in the `funding_embeddings` table keyed by a hash
+of encoder + text, so restarts and unchanged catalogs never re-encode.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import re
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from models import SessionLocal, FundingEmbedding
+
+load_dotenv()
+
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "off").lower()
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "512"))  # hashed backend only
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+_model = None
+_model_failed = False
+_matrix: Optional[list[list[float]]] = None
+_matrix_fingerprint: Optional[int] = None
+
+
+def embeddings_enabled() -> bool:
+    return EMBEDDING_BACKEND in ("local", "hashed")
+
+
+def _local_model():
+    """Load the sentence-transformers model once; None if unavailable."""
+    global _model, _model_failed
+    if _model is None and not _model_failed:
+        try:
+            from sentence_transformers import SentenceTransformer
+            _model = SentenceTransformer(EMBEDDING_MODEL, device="cpu")
+        except Exception:
+            _model_failed = True
+    return _model
+
+
+def encoder_name() -> str:
+    """Identifies the vector space; part of the persistence key."""
+    if EMBEDDING_BACKEND == "local" and _local_model() is not None:
+        return f"local:{EMBEDDING_MODEL}"
+    return f"hashed:{EMBEDDING_DIM}"
+
+
+def _normalize(vec: list[float]) -> list[float]:
+    norm = math.sqrt(sum(v * v for v in vec))
+    return [v / norm for v in vec] if norm else vec
+
+
+def _hashed_vector(text: str) -> list[float]:
+    """Signed feature hashing of words, word bigrams and character trigrams."""
+    vec = [0.0] * EMBEDDING_DIM
+    words = _WORD_RE.findall(text.lower())
+    features = list(words)
+    features += [f"{a} {b}" for a, b in zip(words, words[1:])]
+    for w in words:
+        padded = f"<{w}>"
+        features += [padded[i : i + 3] for i in range(len(padded) - 2)]
+    for feat in features:
+        h = int.from_bytes(hashlib.blake2b(feat.encode("utf-8"), digest_size=8).digest(), "little")
+        vec[h % EMBEDDING_DIM] += 1.0 if (h >> 63) & 1 else -1.0
+    return _normalize(vec)
+
+
+def embed_texts(texts: list[str]) -> list[list[float]]:
+    """Unit-length vectors for `texts` using the configured encoder."""
+    model = _local_model() if EMBEDDING_BACKEND == "local" else None
+    if model is not None:
+        return [_normalize([float(v) for v in row]) for row in model.encode(texts)]
+    return [_hashed_vector(t) for t in texts]
+
+
+def funding_text(fs: dict) -> str:
+    return " ".join([
+        fs.get("name") or "",
+        fs.get("description") or "",
+        " ".join(fs.get("tags") or []),
+        " ".join(fs.get("focus_areas") or []),
+    ])
+
+
+def repo_text(repo_data: dict) -> str:
+    return " ".join([
+        repo_data.get("description") or "",
+        " ".join(repo_data.get("topics") or []),
+        repo_data.get("language") or "",
+        (repo_data.get("readme_excerpt") or "")[:2000],
+    ])
+
+
+def _text_key(encoder: str, text: str) -> str:
+    return hashlib.sha256(f"{encoder}\x00{text}".encode("utf-8")).hexdigest()
+
+
+def _load_or_embed(texts: list[str]) -> list[list[float]]:
+    """Fetch persisted vectors, encoding (and storing) only the missing ones."""
+    encoder = encoder_name()
+    keys = [_text_key(encoder, t) for t in texts]
+    vectors: dict[str, list[float]] = {}
+
+    db = SessionLocal()
+    try:
+        try:
+            for row in db.query(FundingEmbedding).filter(FundingEmbedding.key.in_(set(keys))):
+                vectors[row.key] = row.vector
+        except Exception:
+            db.rollback()
+
+        missing = [(k, t) for k, t in zip(keys, texts) if k not in vectors]
+        if missing:
+            fresh = embed_texts([t for _, t in missing])
+            for (k, _), vec in zip(missing, fresh):
+                vectors[k] = vec
+            try:
+                for (k, _), vec in zip(missing, fresh):
+                    db.merge(FundingEmbedding(key=k, encoder=encoder, vector=vec))
+                db.commit()
+            except Exception:
+                db.rollback()
+    finally:
+        db.close()
+
+    return [vectors[k] for k in keys]
+
+
+def _funding_matrix(funding_sources: list[dict]) -> list[list[float]]:
+    global _matrix, _matrix_fingerprint
+    texts = [funding_text(fs) for fs in funding_sources]
+    fp = hash((encoder_name(), tuple(texts)))
+    if _matrix is None or fp != _matrix_fingerprint:
+        _matrix = _load_or_embed(texts)
+        _matrix_fingerprint = fp
+    return _matrix
+
+
+def warm_embeddings(funding_sources: list[dict]) -> None:
+    """Encode / load all funding vectors ahead of the first request."""
+    if embeddings_enabled():
+        _funding_matrix(funding_sources)
+
+
+def rank_by_similarity(repo_data: dict, funding_sources: list[dict]) -> list[int]:
+    """Indices of funding_sources ordered by cosine similarity to the repo."""
+    matrix = _funding_matrix(funding_sources)
+    query = embed_texts([repo_text(repo_data)])[0]
+    sims = [sum(q * v for q, v in zip(query, row)) for row in matrix]
+    return sorted(range(len(sims)), key=lambda i: (-sims[i], i))
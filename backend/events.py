@@ -0,0 +1,128 @@
+"""
+Analysis event bus.
+In-process pub/sub that carries analysis progress for one repo at a time to
+Server-Sent Events subscribers (GET /api/repos/{repo_id}/events), so clients
+get status transitions and matches the moment they are written instead of
+polling the database.
+
+Events are plain dicts: {"event": <name>, "repo_id": ..., "data": {...}}.
+Terminal events ("complete", "error") tell subscribers to close the stream.
+
+Standalone worker processes (worker.py) can't reach the API's subscribers, so
+they call enable_persistence() and their events go to the `analysis_events`
+table instead; the API process runs relay() to tail that table and fan new
+rows out to its local subscribers.
+"""
+
+import asyncio
+import json
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Optional
+
+from models import SessionLocal, AnalysisEvent
+
+TERMINAL_EVENTS = ("complete", "error")
+
+# Per-subscriber buffer; a client that stops reading loses the oldest events
+_QUEUE_SIZE = 500
+
+# How often the API polls analysis_events, and how long rows are kept
+EVENTS_RELAY_INTERVAL = 0.5
+_EVENT_RETENTION = timedelta(hours=1)
+
+_subscribers: dict[str, set[asyncio.Queue]] = defaultdict(set)
+_persist = False
+
+
+def enable_persistence() -> None:
+    """Route this process's events through the database (worker processes)."""
+    global _persist
+    _persist = True
+
+
+def subscribe(repo_id: str) -> asyncio.Queue:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+    _subscribers[repo_id].add(queue)
+    return queue
+
+
+def unsubscribe(repo_id: str, queue: asyncio.Queue) -> None:
+    subs = _subscribers.get(repo_id)
+    if subs is None:
+        return
+    subs.discard(queue)
+    if not subs:
+        _subscribers.pop(repo_id, None)
+
+
+def publish(repo_id: str, event: str, data: Optional[dict] = None) -> None:
+    """Deliver an event to every current subscriber of `repo_id` (never blocks)."""
+    if _persist:
+        _store(repo_id, event, data or {})
+        return
+    _fan_out({"event": event, "repo_id": repo_id, "data": data or {}})
+
+
+def _store(repo_id: str, event: str, data: dict) -> None:
+    db = SessionLocal()
+    try:
+        db.add(AnalysisEvent(repo_id=repo_id, event=event, data=json.loads(json.dumps(data, default=str))))
+        db.commit()
+    except Exception:
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _fan_out(message: dict) -> None:
+    for queue in list(_subscribers.get(message["repo_id"], ())):
+        if queue.full():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(message)
+
+
+async def relay() -> None:
+    """
+    Tail analysis_events forever, delivering worker-written events to local
+    subscribers. Rows older than an hour are deleted as it goes.
+    """
+    last_id = None
+    last_prune = datetime.utcnow()
+    while True:
+        db = SessionLocal()
+        try:
+            if last_id is None:
+                newest = db.query(AnalysisEvent.id).order_by(AnalysisEvent.id.desc()).first()
+                last_id = newest[0] if newest else 0
+            rows = (
+                db.query(AnalysisEvent)
+                .filter(AnalysisEvent.id > last_id)
+                .order_by(AnalysisEvent.id.asc())
+                .limit(1000)
+                .all()
+            )
+            for row in rows:
+                last_id = row.id
+                if row.repo_id in _subscribers:
+                    _fan_out({"event": row.event, "repo_id": row.repo_id, "data": row.data or {}})
+
+            if datetime.utcnow() - last_prune > _EVENT_RETENTION / 6:
+                last_prune = datetime.utcnow()
+                db.query(AnalysisEvent).filter(
+                    AnalysisEvent.created_at < last_prune - _EVENT_RETENTION
+                ).delete(synchronize_session=False)
+                db.commit()
+        except Exception:
+            db.rollback()
+        finally:
+            db.close()
+        await asyncio.sleep(EVENTS_RELAY_INTERVAL)
+
+
+def format_sse(message: dict) -> str:
+    """Encode an event in text/event-stream framing."""
+    return f"event: {message['event']}\ndata: {json.dumps(message['data'], default=str)}\n\n"
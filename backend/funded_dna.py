@@ -7,502 +7,34 @@ to surface which funders historically support projects like theirs.
 """
 
 from __future__ import annotations
+import json
 import math
+import os
+from typing import Optional
 
 # ---------------------------------------------------------------------------
 # Static DB: known funded OSS projects
 # ---------------------------------------------------------------------------
-FUNDED_PROJECTS = [
-    # ── Security / Privacy ────────────────────────────────────────────────
-    {
-        "name": "GnuPG",
-        "github": "gpg/gnupg",
-        "funders": ["Linux Foundation", "NLnet Foundation", "Sovereign Tech Fund"],
-        "category": "security",
-        "language": "C",
-        "license": "GPL-3.0",
-        "approximate_stars": 4000,
-        "focus": ["encryption", "privacy", "cryptography", "pgp", "security"],
-        "description_keywords": ["encryption", "gpg", "pgp", "openssl", "cryptographic"],
-    },
-    {
-        "name": "OpenSSL",
-        "github": "openssl/openssl",
-        "funders": ["Linux Foundation", "Open Source Collective", "Sovereign Tech Fund"],
-        "category": "security",
-        "language": "C",
-        "license": "Apache-2.0",
-        "approximate_stars": 25000,
-        "focus": ["ssl", "tls", "cryptography", "security", "certificates"],
-        "description_keywords": ["ssl", "tls", "certificate", "encryption", "openssl"],
-    },
-    {
-        "name": "Wireshark",
-        "github": "wireshark/wireshark",
-        "funders": ["Linux Foundation", "NLnet Foundation"],
-        "category": "security",
-        "language": "C",
-        "license": "GPL-2.0",
-        "approximate_stars": 6000,
-        "focus": ["network analysis", "packet capture", "security", "protocol analysis"],
-        "description_keywords": ["network", "packet", "protocol", "capture", "analysis"],
-    },
-    {
-        "name": "WireGuard",
-        "github": "WireGuard/wireguard-linux",
-        "funders": ["NLnet Foundation", "Linux Foundation"],
-        "category": "security",
-        "language": "C",
-        "license": "GPL-2.0",
-        "approximate_stars": 4000,
-        "focus": ["vpn", "networking", "privacy", "security", "cryptography"],
-        "description_keywords": ["vpn", "tunnel", "wireguard", "network", "privacy"],
-    },
-    # ── Infrastructure / Networking ───────────────────────────────────────
-    {
-        "name": "curl",
-        "github": "curl/curl",
-        "funders": ["Sovereign Tech Fund", "Mozilla MOSS", "Open Source Collective"],
-        "category": "infrastructure",
-        "language": "C",
-        "license": "curl",
-        "approximate_stars": 34000,
-        "focus": ["http", "networking", "data transfer", "api", "internet protocol"],
-        "description_keywords": ["http", "curl", "networking", "data transfer", "protocol"],
-    },
-    {
-        "name": "nginx",
-        "github": "nginx/nginx",
-        "funders": ["Linux Foundation", "CNCF"],
-        "category": "infrastructure",
-        "language": "C",
-        "license": "BSD-2-Clause",
-        "approximate_stars": 20000,
-        "focus": ["web server", "reverse proxy", "load balancer", "infrastructure"],
-        "description_keywords": ["nginx", "web server", "proxy", "load balancing", "http"],
-    },
-    {
-        "name": "Kubernetes",
-        "github": "kubernetes/kubernetes",
-        "funders": ["CNCF", "Linux Foundation", "Google"],
-        "category": "infrastructure",
-        "language": "Go",
-        "license": "Apache-2.0",
-        "approximate_stars": 108000,
-        "focus": ["container orchestration", "cloud native", "devops", "infrastructure"],
-        "description_keywords": ["kubernetes", "container", "orchestration", "cloud", "cluster"],
-    },
-    {
-        "name": "Prometheus",
-        "github": "prometheus/prometheus",
-        "funders": ["CNCF", "Linux Foundation"],
-        "category": "infrastructure",
-        "language": "Go",
-        "license": "Apache-2.0",
-        "approximate_stars": 55000,
-        "focus": ["monitoring", "metrics", "alerting", "observability", "cloud native"],
-        "description_keywords": ["prometheus", "monitoring", "metrics", "alerting", "observability"],
-    },
-    {
-        "name": "Grafana",
-        "github": "grafana/grafana",
-        "funders": ["CNCF", "Linux Foundation"],
-        "category": "infrastructure",
-        "language": "Go",
-        "license": "AGPL-3.0",
-        "approximate_stars": 62000,
-        "focus": ["visualization", "dashboards", "monitoring", "observability"],
-        "description_keywords": ["grafana", "dashboard", "visualization", "metrics", "monitoring"],
-    },
-    {
-        "name": "OpenTelemetry",
-        "github": "open-telemetry/opentelemetry-collector",
-        "funders": ["CNCF", "Linux Foundation"],
-        "category": "infrastructure",
-        "language": "Go",
-        "license": "Apache-2.0",
-        "approximate_stars": 4000,
-        "focus": ["observability", "tracing", "metrics", "logs", "telemetry"],
-        "description_keywords": ["telemetry", "tracing", "observability", "metrics", "spans"],
-    },
-    # ── Web / Internet ────────────────────────────────────────────────────
-    {
-        "name": "Firefox",
-        "github": "mozilla/gecko-dev",
-        "funders": ["Mozilla MOSS"],
-        "category": "web",
-        "language": "C++",
-        "license": "MPL-2.0",
-        "approximate_stars": 2000,
-        "focus": ["browser", "web standards", "privacy", "open web"],
-        "description_keywords": ["browser", "firefox", "gecko", "web", "html"],
-    },
-    {
-        "name": "Mastodon",
-        "github": "mastodon/mastodon",
-        "funders": ["NLnet Foundation", "Prototype Fund Germany", "Open Source Collective"],
-        "category": "social",
-        "language": "Ruby",
-        "license": "AGPL-3.0",
-        "approximate_stars": 46000,
-        "focus": ["decentralization", "social media", "fediverse", "activitypub", "privacy"],
-        "description_keywords": ["mastodon", "fediverse", "activitypub", "decentralized", "social"],
-    },
-    {
-        "name": "Matrix (Element)",
-        "github": "matrix-org/synapse",
-        "funders": ["Mozilla MOSS", "NLnet Foundation"],
-        "category": "communication",
-        "language": "Python",
-        "license": "Apache-2.0",
-        "approximate_stars": 12000,
-        "focus": ["decentralized messaging", "communications", "privacy", "federation"],
-        "description_keywords": ["matrix", "chat", "messaging", "federation", "homeserver"],
-    },
-    {
-        "name": "Tor Project",
-        "github": "torproject/tor",
-        "funders": ["Open Technology Fund", "NLnet Foundation", "Mozilla MOSS"],
-        "category": "privacy",
-        "language": "C",
-        "license": "BSD-3-Clause",
-        "approximate_stars": 4000,
-        "focus": ["anonymity", "privacy", "censorship circumvention", "security", "networking"],
-        "description_keywords": ["tor", "anonymity", "privacy", "censorship", "onion routing"],
-    },
-    # ── Scientific / Research ─────────────────────────────────────────────
-    {
-        "name": "NumPy",
-        "github": "numpy/numpy",
-        "funders": ["Sloan Foundation", "Chan Zuckerberg Initiative", "NSF POSE"],
-        "category": "scientific",
-        "language": "Python",
-        "license": "BSD-3-Clause",
-        "approximate_stars": 27000,
-        "focus": ["scientific computing", "linear algebra", "python", "mathematics"],
-        "description_keywords": ["numpy", "array", "linear algebra", "numerical", "scientific"],
-    },
-    {
-        "name": "SciPy",
-        "github": "scipy/scipy",
-        "funders": ["Sloan Foundation", "NSF POSE", "Chan Zuckerberg Initiative"],
-        "category": "scientific",
-        "language": "Python",
-        "license": "BSD-3-Clause",
-        "approximate_stars": 13000,
-        "focus": ["scientific computing", "mathematics", "python", "statistics"],
-        "description_keywords": ["scipy", "scientific", "mathematics", "statistics", "algorithms"],
-    },
-    {
-        "name": "Jupyter",
-        "github": "jupyter/notebook",
-        "funders": ["Sloan Foundation", "Chan Zuckerberg Initiative", "NSF POSE"],
-        "category": "scientific",
-        "language": "JavaScript",
-        "license": "BSD-3-Clause",
-        "approximate_stars": 11000,
-        "focus": ["notebooks", "interactive computing", "data science", "python", "education"],
-        "description_keywords": ["jupyter", "notebook", "interactive", "kernel", "ipython"],
-    },
-    {
-        "name": "Pandas",
-        "github": "pandas-dev/pandas",
-        "funders": ["Sloan Foundation", "Chan Zuckerberg Initiative"],
-        "category": "scientific",
-        "language": "Python",
-        "license": "BSD-3-Clause",
-        "approximate_stars": 43000,
-        "focus": ["data analysis", "dataframes", "python", "statistics", "data science"],
-        "description_keywords": ["pandas", "dataframe", "data analysis", "csv", "tabular"],
-    },
-    {
-        "name": "Matplotlib",
-        "github": "matplotlib/matplotlib",
-        "funders": ["Sloan Foundation", "Chan Zuckerberg Initiative"],
-        "category": "scientific",
-        "language": "Python",
-        "license": "BSD-3-Clause",
-        "approximate_stars": 19000,
-        "focus": ["visualization", "plotting", "data science", "python", "charts"],
-        "description_keywords": ["matplotlib", "plotting", "visualization", "chart", "figure"],
-    },
-    # ── Languages / Runtimes ──────────────────────────────────────────────
-    {
-        "name": "Rust",
-        "github": "rust-lang/rust",
-        "funders": ["Rust Foundation", "Mozilla MOSS", "Linux Foundation"],
-        "category": "language",
-        "language": "Rust",
-        "license": "MIT",
-        "approximate_stars": 95000,
-        "focus": ["systems programming", "memory safety", "compiler", "language"],
-        "description_keywords": ["rust", "compiler", "memory safety", "systems", "language"],
-    },
-    {
-        "name": "CPython",
-        "github": "python/cpython",
-        "funders": ["Python Software Foundation", "NSF POSE"],
-        "category": "language",
-        "language": "Python",
-        "license": "PSF-2.0",
-        "approximate_stars": 63000,
-        "focus": ["python", "interpreter", "language", "runtime"],
-        "description_keywords": ["python", "interpreter", "cpython", "runtime", "stdlib"],
-    },
-    {
-        "name": "Go",
-        "github": "golang/go",
-        "funders": ["Linux Foundation", "CNCF"],
-        "category": "language",
-        "language": "Go",
-        "license": "BSD-3-Clause",
-        "approximate_stars": 123000,
-        "focus": ["systems programming", "concurrency", "cloud", "networking"],
-        "description_keywords": ["go", "golang", "concurrency", "goroutine", "runtime"],
-    },
-    # ── Developer Tools ───────────────────────────────────────────────────
-    {
-        "name": "Git",
-        "github": "git/git",
-        "funders": ["Linux Foundation", "Google Summer of Code"],
-        "category": "developer-tools",
-        "language": "C",
-        "license": "GPL-2.0",
-        "approximate_stars": 52000,
-        "focus": ["version control", "developer tools", "collaboration"],
-        "description_keywords": ["git", "version control", "commits", "repository", "branches"],
-    },
-    {
-        "name": "VS Code",
-        "github": "microsoft/vscode",
-        "funders": ["Open Source Collective"],
-        "category": "developer-tools",
-        "language": "TypeScript",
-        "license": "MIT",
-        "approximate_stars": 162000,
-        "focus": ["editor", "ide", "developer tools", "extensions", "typescript"],
-        "description_keywords": ["editor", "vscode", "ide", "extension", "typescript"],
-    },
-    {
-        "name": "Neovim",
-        "github": "neovim/neovim",
-        "funders": ["Open Source Collective", "Mozilla MOSS"],
-        "category": "developer-tools",
-        "language": "C",
-        "license": "Apache-2.0",
-        "approximate_stars": 82000,
-        "focus": ["editor", "vim", "developer tools", "scripting", "lua"],
-        "description_keywords": ["neovim", "vim", "editor", "lua", "plugin"],
-    },
-    # ── Web Frameworks ────────────────────────────────────────────────────
-    {
-        "name": "Django",
-        "github": "django/django",
-        "funders": ["Django Software Foundation", "Open Source Collective"],
-        "category": "framework",
-        "language": "Python",
-        "license": "BSD-3-Clause",
-        "approximate_stars": 80000,
-        "focus": ["web framework", "python", "backend", "orm", "web development"],
-        "description_keywords": ["django", "web framework", "orm", "views", "models"],
-    },
-    {
-        "name": "React",
-        "github": "facebook/react",
-        "funders": ["Open Source Collective"],
-        "category": "framework",
-        "language": "JavaScript",
-        "license": "MIT",
-        "approximate_stars": 228000,
-        "focus": ["ui", "javascript", "frontend", "components", "web"],
-        "description_keywords": ["react", "component", "jsx", "virtual dom", "hooks"],
-    },
-    {
-        "name": "Vue.js",
-        "github": "vuejs/vue",
-        "funders": ["Open Source Collective", "Patreon"],
-        "category": "framework",
-        "language": "JavaScript",
-        "license": "MIT",
-        "approximate_stars": 207000,
-        "focus": ["ui", "javascript", "frontend", "components", "progressive"],
-        "description_keywords": ["vue", "component", "reactive", "templates", "composition"],
-    },
-    # ── Blockchain / Web3 ─────────────────────────────────────────────────
-    {
-        "name": "go-ethereum",
-        "github": "ethereum/go-ethereum",
-        "funders": ["Ethereum Foundation"],
-        "category": "blockchain",
-        "language": "Go",
-        "license": "LGPL-3.0",
-        "approximate_stars": 47000,
-        "focus": ["ethereum", "blockchain", "smart contracts", "web3", "defi"],
-        "description_keywords": ["ethereum", "geth", "blockchain", "evm", "smart contract"],
-    },
-    {
-        "name": "IPFS (Kubo)",
-        "github": "ipfs/kubo",
-        "funders": ["Filecoin Foundation", "Protocol Labs"],
-        "category": "decentralized",
-        "language": "Go",
-        "license": "MIT",
-        "approximate_stars": 16000,
-        "focus": ["ipfs", "decentralized storage", "p2p", "content addressing"],
-        "description_keywords": ["ipfs", "peer-to-peer", "content addressing", "distributed", "storage"],
-    },
-    # ── AI / ML ───────────────────────────────────────────────────────────
-    {
-        "name": "PyTorch",
-        "github": "pytorch/pytorch",
-        "funders": ["Chan Zuckerberg Initiative", "Linux Foundation"],
-        "category": "ai-ml",
-        "language": "Python",
-        "license": "BSD-3-Clause",
-        "approximate_stars": 83000,
-        "focus": ["machine learning", "deep learning", "neural networks", "ai", "tensors"],
-        "description_keywords": ["pytorch", "tensor", "neural network", "gradient", "deep learning"],
-    },
-    {
-        "name": "Hugging Face Transformers",
-        "github": "huggingface/transformers",
-        "funders": ["Sloan Foundation"],
-        "category": "ai-ml",
-        "language": "Python",
-        "license": "Apache-2.0",
-        "approximate_stars": 133000,
-        "focus": ["nlp", "transformers", "machine learning", "llm", "ai"],
-        "description_keywords": ["transformers", "nlp", "bert", "gpt", "llm", "fine-tuning"],
-    },
-    # ── Database / Storage ────────────────────────────────────────────────
-    {
-        "name": "PostgreSQL",
-        "github": "postgres/postgres",
-        "funders": ["Linux Foundation", "Sovereign Tech Fund"],
-        "category": "database",
-        "language": "C",
-        "license": "PostgreSQL",
-        "approximate_stars": 16000,
-        "focus": ["database", "sql", "relational", "storage", "transactions"],
-        "description_keywords": ["postgresql", "sql", "database", "transactions", "query"],
-    },
-    {
-        "name": "Redis",
-        "github": "redis/redis",
-        "funders": ["Linux Foundation"],
-        "category": "database",
-        "language": "C",
-        "license": "BSD-3-Clause",
-        "approximate_stars": 67000,
-        "focus": ["cache", "database", "in-memory", "key-value", "pub-sub"],
-        "description_keywords": ["redis", "cache", "key-value", "in-memory", "pub-sub"],
-    },
-    # ── Desktop / GUI ─────────────────────────────────────────────────────
-    {
-        "name": "Blender",
-        "github": "blender/blender",
-        "funders": ["Blender Foundation", "Open Source Collective"],
-        "category": "creative",
-        "language": "C",
-        "license": "GPL-3.0",
-        "approximate_stars": 13000,
-        "focus": ["3d modeling", "animation", "rendering", "creative tools", "vfx"],
-        "description_keywords": ["blender", "3d", "animation", "rendering", "mesh", "shader"],
-    },
-    {
-        "name": "GIMP",
-        "github": "GNOME/gimp",
-        "funders": ["GNOME Foundation", "Open Source Collective"],
-        "category": "creative",
-        "language": "C",
-        "license": "GPL-3.0",
-        "approximate_stars": 5000,
-        "focus": ["image editing", "graphics", "creative tools", "raster"],
-        "description_keywords": ["gimp", "image", "pixel", "layer", "graphic", "photo"],
-    },
-    # ── Accessibility / Civic ─────────────────────────────────────────────
-    {
-        "name": "Open Food Facts",
-        "github": "openfoodfacts/openfoodfacts-server",
-        "funders": ["Open Food Facts", "Prototype Fund Germany"],
-        "category": "civic",
-        "language": "Perl",
-        "license": "AGPL-3.0",
-        "approximate_stars": 4000,
-        "focus": ["open data", "food", "public database", "transparency"],
-        "description_keywords": ["food", "data", "product", "nutrition", "barcode"],
-    },
-    {
-        "name": "OpenStreetMap",
-        "github": "openstreetmap/openstreetmap-website",
-        "funders": ["Prototype Fund Germany", "NLnet Foundation"],
-        "category": "civic",
-        "language": "Ruby",
-        "license": "GPL-2.0",
-        "approximate_stars": 2000,
-        "focus": ["maps", "geospatial", "open data", "civic tech"],
-        "description_keywords": ["openstreetmap", "map", "geo", "location", "coordinates"],
-    },
-    # ── Documentation / Education ─────────────────────────────────────────
-    {
-        "name": "The Odin Project",
-        "github": "TheOdinProject/curriculum",
-        "funders": ["Open Source Collective"],
-        "category": "education",
-        "language": "JavaScript",
-        "license": "CC-BY-SA-4.0",
-        "approximate_stars": 4000,
-        "focus": ["education", "web development", "curriculum", "open learning"],
-        "description_keywords": ["curriculum", "education", "web development", "learning", "html"],
-    },
-    # ── Health / Bio ──────────────────────────────────────────────────────
-    {
-        "name": "OpenMRS",
-        "github": "openmrs/openmrs-core",
-        "funders": ["Chan Zuckerberg Initiative", "Wellcome Trust"],
-        "category": "health",
-        "language": "Java",
-        "license": "MPL-2.0",
-        "approximate_stars": 1100,
-        "focus": ["electronic health records", "healthcare", "global health", "open source"],
-        "description_keywords": ["medical", "health record", "patient", "clinical", "healthcare"],
-    },
-    {
-        "name": "Bioconductor",
-        "github": "Bioconductor/Bioconductor",
-        "funders": ["Chan Zuckerberg Initiative", "Sloan Foundation", "Wellcome Trust"],
-        "category": "bioinformatics",
-        "language": "R",
-        "license": "Artistic-2.0",
-        "approximate_stars": 500,
-        "focus": ["genomics", "bioinformatics", "biostatistics", "r", "biology"],
-        "description_keywords": ["bioinformatics", "genomics", "rna", "dna", "biology"],
-    },
-    # ── Mobile / Embedded ─────────────────────────────────────────────────
-    {
-        "name": "F-Droid",
-        "github": "f-droid/fdroidclient",
-        "funders": ["Open Technology Fund", "NLnet Foundation"],
-        "category": "mobile",
-        "language": "Kotlin",
-        "license": "GPL-3.0",
-        "approximate_stars": 2500,
-        "focus": ["android", "app store", "privacy", "free software", "mobile"],
-        "description_keywords": ["android", "app", "fdroid", "apk", "free software"],
-    },
-    # ── Writing / Publishing ──────────────────────────────────────────────
-    {
-        "name": "LibreOffice",
-        "github": "LibreOffice/core",
-        "funders": ["The Document Foundation", "NLnet Foundation"],
-        "category": "productivity",
-        "language": "C++",
-        "license": "MPL-2.0",
-        "approximate_stars": 2500,
-        "focus": ["office suite", "documents", "spreadsheets", "open document format"],
-        "description_keywords": ["libreoffice", "office", "document", "spreadsheet", "presentation"],
-    },
-]
+# Kept in data/funded_projects.json and parsed on first use (see __getattr__)
+FUNDED_PROJECTS_PATH = os.path.join(os.path.dirname(__file__), "data", "funded_projects.json")
+
+_funded_projects: Optional[list[dict]] = None
+
+
+def load_funded_projects() -> list[dict]:
+    """Funded project profiles, parsed once per process."""
+    global _funded_projects
+    if _funded_projects is None:
+        with open(FUNDED_PROJECTS_PATH, encoding="utf-8") as f:
+            _funded_projects = json.load(f)
+    return _funded_projects
+
+
+def __getattr__(name: str):
+    if name == "FUNDED_PROJECTS":
+        return load_funded_projects()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ---------------------------------------------------------------------------
 # Benchmarks for velocity comparisons
@@ -700,7 +232,7 @@ def compare_repo_to_funded_dna(repo: dict) -> dict:
     }
 
     scores = []
-    for proj in FUNDED_PROJECTS:
+    for proj in load_funded_projects():
         lang_score = _score_language(repo_lang, proj["language"])
         star_score = _score_stars(repo_stars, proj["approximate_stars"])
         lic_score = _score_license(repo_license, proj["license"])
@@ -790,5 +322,5 @@ def compare_repo_to_funded_dna(repo: dict) -> dict:
         "top_matches": top_matches,
         "insights": insights,
         "funder_frequency": funder_freq,
-        "total_projects_compared": len(FUNDED_PROJECTS),
+        "total_projects_compared": len(load_funded_projects()),
     }
@@ -0,0 +1,128 @@
+"""
+Funding Catalog Snapshot
+========================
+Immutable in-process copy of the funding_sources table, indexed by id, name,
+category, type and focus area, so lookups are dict access instead of DB
+round-trips.
+
+The catalog only changes when it is seeded or edited, and every such write
+calls bump_version(), which increments the row in `catalog_version`. Each
+process re-reads that number at most every CATALOG_CHECK_SECONDS and reloads
+its snapshot when it has moved, so API and worker processes converge on the
+same catalog without restarts.
+
+Records are namedtuples with the FundingSource column names (list fields as
+tuples), so code written against ORM objects — attribute access like fs.id,
+fs.tags — works unchanged.
+"""
+
+import os
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from models import SessionLocal, FundingSource, CatalogVersion
+
+load_dotenv()
+
+CATALOG_CHECK_SECONDS = float(os.getenv("CATALOG_CHECK_SECONDS", "5"))
+
+FundingRecord = namedtuple("FundingRecord", [c.name for c in FundingSource.__table__.columns])
+
+_LIST_FIELDS = ("tags", "focus_areas")
+
+
+class CatalogSnapshot:
+    """One version of the catalog; never mutated after construction."""
+
+    def __init__(self, version: int, records: list[FundingRecord]):
+        self.version = version
+        self.all = tuple(sorted(records, key=lambda r: (r.category or "", r.name)))
+        self.active = tuple(r for r in self.all if r.active)
+        self.by_id = {r.id: r for r in self.all}
+        self.by_name = {r.name.lower(): r for r in self.all}
+        self.by_category: dict[str, tuple] = {}
+        self.by_type: dict[str, tuple] = {}
+        self.by_focus_area: dict[str, tuple] = {}
+        for r in self.active:
+            self.by_category[r.category] = self.by_category.get(r.category, ()) + (r,)
+            self.by_type[r.type] = self.by_type.get(r.type, ()) + (r,)
+            for area in r.focus_areas:
+                key = area.lower()
+                self.by_focus_area[key] = self.by_focus_area.get(key, ()) + (r,)
+
+    def get(self, funding_id) -> Optional[FundingRecord]:
+        return self.by_id.get(funding_id)
+
+    def filter(self, category: Optional[str] = None, type: Optional[str] = None) -> tuple:
+        """Active sources, optionally narrowed by category and / or type (catalog order)."""
+        records = self.active
+        if category is not None:
+            records = self.by_category.get(category, ())
+        if type is not None:
+            records = tuple(r for r in records if r.type == type)
+        return records
+
+
+_snapshot: Optional[CatalogSnapshot] = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def _record(fs: FundingSource) -> FundingRecord:
+    values = {c.name: getattr(fs, c.name) for c in FundingSource.__table__.columns}
+    for field in _LIST_FIELDS:
+        values[field] = tuple(values[field] or ())
+    values["eligibility"] = dict(values["eligibility"] or {})
+    return FundingRecord(**values)
+
+
+def _current_version(db) -> int:
+    row = db.get(CatalogVersion, 1)
+    return row.version if row else 0
+
+
+def bump_version(db) -> int:
+    """Mark the catalog as changed (call after seeding / editing funding_sources)."""
+    row = db.get(CatalogVersion, 1)
+    if row is None:
+        row = CatalogVersion(id=1, version=0)
+        db.add(row)
+    row.version += 1
+    row.updated_at = datetime.utcnow()
+    db.commit()
+    invalidate()
+    return row.version
+
+
+def invalidate() -> None:
+    """Force the next get_catalog() call to re-check the version."""
+    global _checked_at
+    _checked_at = 0.0
+
+
+def get_catalog(db=None) -> CatalogSnapshot:
+    """The current snapshot, reloaded if another process bumped the version."""
+    global _snapshot, _checked_at
+    now = time.monotonic()
+    if _snapshot is not None and now - _checked_at < CATALOG_CHECK_SECONDS:
+        return _snapshot
+
+    with _lock:
+        if _snapshot is not None and time.monotonic() - _checked_at < CATALOG_CHECK_SECONDS:
+            return _snapshot
+        own_session = db is None
+        db = db or SessionLocal()
+        try:
+            version = _current_version(db)
+            if _snapshot is None or _snapshot.version != version:
+                _snapshot = CatalogSnapshot(version, [_record(fs) for fs in db.query(FundingSource).all()])
+            _checked_at = time.monotonic()
+        finally:
+            if own_session:
+                db.close()
+        return _snapshot
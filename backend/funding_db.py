@@ -4,4626 +4,118 @@ Contains 60+ real funding sources across all major categories.
 Seeded once on startup into SQLite; can be exported/replaced with a CMS later.
 """
 
+import hashlib
+import json
+import os
+from typing import Optional
+
 from sqlalchemy.orm import Session
-from models import FundingSource
+from models import FundingSource, CatalogVersion
+from funding_catalog import FundingRecord, bump_version, get_catalog
 
 # ---------------------------------------------------------------------------
 # Master list of funding opportunities
 # ---------------------------------------------------------------------------
-FUNDING_SOURCES = [
-    # ── PLATFORM / SPONSORSHIP ──────────────────────────────────────────────
-    {
-        "name": "GitHub Sponsors",
-        "type": "sponsorship",
-        "min_amount": 1,
-        "max_amount": 0,          # variable
-        "description": "GitHub Sponsors lets the community financially support open source maintainers and projects directly on GitHub. Supports monthly and one-time donations.",
-        "url": "https://github.com/sponsors",
-        "category": "platform",
-        "tags": ["sponsorship", "recurring", "individual", "community", "global"],
-        "eligibility": {"location": "global", "type": "individual or org"},
-        "focus_areas": ["any"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Open Collective",
-        "type": "sponsorship",
-        "min_amount": 0,
-        "max_amount": 0,
-        "description": "Open Collective is a platform for open and transparent communities. Collect and spend money with full financial transparency.",
-        "url": "https://opencollective.com",
-        "category": "platform",
-        "tags": ["transparent", "community", "fiscal-host", "recurring", "global"],
-        "eligibility": {"location": "global", "type": "collective or project"},
-        "focus_areas": ["any"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Patreon for Open Source",
-        "type": "sponsorship",
-        "min_amount": 1,
-        "max_amount": 0,
-        "description": "Patreon allows creators and open source maintainers to receive recurring revenue directly from their community of supporters.",
-        "url": "https://www.patreon.com",
-        "category": "platform",
-        "tags": ["sponsorship", "recurring", "individual", "content"],
-        "eligibility": {"location": "global", "type": "individual"},
-        "focus_areas": ["any"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Buy Me a Coffee",
-        "type": "sponsorship",
-        "min_amount": 1,
-        "max_amount": 0,
-        "description": "Simple and free way to accept one-time and recurring payments from supporters of your open source work.",
-        "url": "https://buymeacoffee.com",
-        "category": "platform",
-        "tags": ["one-time", "recurring", "simple", "individual"],
-        "eligibility": {"location": "global", "type": "individual"},
-        "focus_areas": ["any"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    # ── FOUNDATION GRANTS ──────────────────────────────────────────────────
-    {
-        "name": "Mozilla Open Source Support (MOSS)",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "MOSS supports the open source and free software ecosystem, with a particular focus on projects that contribute to the health of the internet. Three tracks: Foundational Technology, Mission Partners, and Secure Open Source.",
-        "url": "https://www.mozilla.org/en-US/moss/",
-        "category": "foundation",
-        "tags": ["internet", "security", "privacy", "infrastructure", "global"],
-        "eligibility": {"location": "global", "type": "project or org"},
-        "focus_areas": ["security", "privacy", "infrastructure", "web", "networking"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Linux Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "The Linux Foundation supports open source projects through mentorship, events, and direct funding. Includes LFX Mentorship and project membership benefits.",
-        "url": "https://www.linuxfoundation.org",
-        "category": "foundation",
-        "tags": ["linux", "infrastructure", "enterprise", "cloud", "networking"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["infrastructure", "cloud", "networking", "security", "kernel"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Apache Software Foundation (ASF) Incubator",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 50000,
-        "description": "The ASF Incubator provides infrastructure, mentorship, and resources for open source projects that want to become Apache top-level projects.",
-        "url": "https://incubator.apache.org",
-        "category": "foundation",
-        "tags": ["apache", "java", "infrastructure", "community", "governance"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["infrastructure", "data", "web", "cloud", "java"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Python Software Foundation Grants",
-        "type": "grant",
-        "min_amount": 500,
-        "max_amount": 150000,
-        "description": "The PSF awards grants to support the Python community and ecosystem. Supports conferences, sprints, education, and development of Python tools.",
-        "url": "https://www.python.org/psf/grants/",
-        "category": "foundation",
-        "tags": ["python", "community", "education", "tools", "conferences"],
-        "eligibility": {"location": "global", "type": "individual or org"},
-        "focus_areas": ["python", "education", "tooling", "data-science"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "NumFOCUS Small Development Grants",
-        "type": "grant",
-        "min_amount": 1000,
-        "max_amount": 10000,
-        "description": "NumFOCUS supports open source scientific computing tools. SDG program offers up to $10k for NumFOCUS-affiliated projects to fund specific development goals.",
-        "url": "https://numfocus.org/programs/small-development-grants",
-        "category": "foundation",
-        "tags": ["scientific", "python", "data-science", "research", "numpy", "scipy"],
-        "eligibility": {"location": "global", "type": "affiliated project"},
-        "focus_areas": ["data-science", "scientific-computing", "machine-learning", "python"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Quarterly",
-    },
-    {
-        "name": "NLnet Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 50000,
-        "description": "NLnet Foundation (Netherlands) funds projects that contribute to an open information society, with focus on internet protocols, privacy, and security. Part of NGI (Next Generation Internet) programs.",
-        "url": "https://nlnet.nl/propose/",
-        "category": "foundation",
-        "tags": ["internet", "privacy", "security", "protocols", "EU", "NGI"],
-        "eligibility": {"location": "global", "type": "individual or org"},
-        "focus_areas": ["networking", "privacy", "security", "protocols", "decentralization"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling (quarterly rounds)",
-    },
-    {
-        "name": "Rust Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "The Rust Foundation supports the development and maintenance of the Rust programming language and its ecosystem through fellowship and project grants.",
-        "url": "https://foundation.rust-lang.org/grants/",
-        "category": "foundation",
-        "tags": ["rust", "systems-programming", "tooling", "compiler"],
-        "eligibility": {"location": "global", "type": "individual or project"},
-        "focus_areas": ["systems-programming", "compiler", "tooling", "security"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Ruby Central Grant Program",
-        "type": "grant",
-        "min_amount": 1000,
-        "max_amount": 50000,
-        "description": "Ruby Central supports the Ruby programming language ecosystem through grants for development, tooling, and community projects.",
-        "url": "https://rubycentral.org/grants",
-        "category": "foundation",
-        "tags": ["ruby", "rails", "community", "tooling"],
-        "eligibility": {"location": "global", "type": "project or individual"},
-        "focus_areas": ["ruby", "web", "tooling"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    # ── CORPORATE PROGRAMS ─────────────────────────────────────────────────
-    {
-        "name": "Google Summer of Code (GSoC)",
-        "type": "grant",
-        "min_amount": 1500,
-        "max_amount": 6600,
-        "description": "Google Summer of Code is a global program focused on bringing more student/beginner contributors into open source. Organizations receive stipends for mentored student contributors.",
-        "url": "https://summerofcode.withgoogle.com",
-        "category": "corporate",
-        "tags": ["google", "students", "mentorship", "annual", "global"],
-        "eligibility": {"location": "global", "type": "established OSS org"},
-        "focus_areas": ["any"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual (January-February)",
-    },
-    {
-        "name": "Google.org Impact Challenge",
-        "type": "grant",
-        "min_amount": 250000,
-        "max_amount": 2000000,
-        "description": "Google.org provides grants to nonprofits and social enterprises using technology to address humanity's biggest challenges. Includes tech-for-good and open source infrastructure.",
-        "url": "https://www.google.org/impact-challenge/",
-        "category": "corporate",
-        "tags": ["google", "social-impact", "nonprofit", "large-grant"],
-        "eligibility": {"location": "global", "type": "nonprofit or NGO"},
-        "focus_areas": ["social-impact", "education", "climate", "health"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Varies by region",
-    },
-    {
-        "name": "Microsoft FOSS Fund",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 10000,
-        "description": "Microsoft's FOSS Fund gives $10,000 to open source projects nominated and voted on by Microsoft employees. Any OSS project is eligible.",
-        "url": "https://github.com/microsoft/foss-fund",
-        "category": "corporate",
-        "tags": ["microsoft", "employee-voted", "any-oss", "monthly"],
-        "eligibility": {"location": "global", "type": "any OSS project"},
-        "focus_areas": ["any"],
-        "is_recurring": False,
-        "application_required": False,
-        "deadline": "Monthly (nomination-based)",
-    },
-    {
-        "name": "Meta Open Source Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "Meta supports open source projects that align with their technology interests, including AI/ML, developer tools, infrastructure, and React ecosystem projects.",
-        "url": "https://opensource.fb.com",
-        "category": "corporate",
-        "tags": ["meta", "AI", "react", "developer-tools", "infrastructure"],
-        "eligibility": {"location": "global", "type": "project or org"},
-        "focus_areas": ["AI", "machine-learning", "developer-tools", "infrastructure", "web"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Amazon Sustainability Data Initiative",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "AWS provides free cloud credits, technical support, and sometimes direct funding for open source projects focused on sustainability and climate change.",
-        "url": "https://aws.amazon.com/sustainability/open-data/",
-        "category": "corporate",
-        "tags": ["amazon", "AWS", "climate", "sustainability", "cloud-credits"],
-        "eligibility": {"location": "global", "type": "research or nonprofit"},
-        "focus_areas": ["climate", "sustainability", "data-science", "research"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Indeed FOSS Contributor Fund",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 10000,
-        "description": "Indeed's FOSS Contributor Fund gives $10,000/quarter to open source projects nominated and voted on by Indeed employees who contribute to open source.",
-        "url": "https://engineering.indeedblog.com/blog/2019/07/foss-fund-six-months-in/",
-        "category": "corporate",
-        "tags": ["indeed", "employee-voted", "quarterly"],
-        "eligibility": {"location": "global", "type": "any OSS project"},
-        "focus_areas": ["any"],
-        "is_recurring": False,
-        "application_required": False,
-        "deadline": "Quarterly (nomination-based)",
-    },
-    {
-        "name": "Stripe Open Source Retreat",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 75000,
-        "description": "Stripe's Open Source Retreat gives developers 3 months of paid time to work on open source software that the whole internet depends on.",
-        "url": "https://stripe.com/open-source/retreat",
-        "category": "corporate",
-        "tags": ["stripe", "payments", "infrastructure", "retreat", "full-time"],
-        "eligibility": {"location": "global", "type": "individual developer"},
-        "focus_areas": ["infrastructure", "security", "developer-tools", "payments"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Shopify FOSS Fund",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 25000,
-        "description": "Shopify's FOSS Fund supports open source projects that power Shopify's infrastructure and that benefit the broader ecosystem.",
-        "url": "https://github.com/Shopify/foss-fund",
-        "category": "corporate",
-        "tags": ["shopify", "ecommerce", "ruby", "developer-tools"],
-        "eligibility": {"location": "global", "type": "any OSS project"},
-        "focus_areas": ["ruby", "developer-tools", "infrastructure", "ecommerce"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Salesforce Open Source Community Fund",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 10000,
-        "description": "Salesforce's OSCF donates to open source projects voted on by Salesforce engineers who contribute to open source.",
-        "url": "https://engineering.salesforce.com/open-source-community-fund",
-        "category": "corporate",
-        "tags": ["salesforce", "enterprise", "CRM", "employee-voted"],
-        "eligibility": {"location": "global", "type": "any OSS project"},
-        "focus_areas": ["any"],
-        "is_recurring": False,
-        "application_required": False,
-        "deadline": "Quarterly",
-    },
-    {
-        "name": "Fastly Open Source Program",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 50000,
-        "description": "Fastly sponsors open source projects that improve internet infrastructure, performance, and security. Also provides free CDN credits to OSS projects.",
-        "url": "https://www.fastly.com/open-source",
-        "category": "corporate",
-        "tags": ["fastly", "CDN", "performance", "infrastructure", "networking"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["infrastructure", "networking", "performance", "security"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    # ── GOVERNMENT / ACADEMIC ─────────────────────────────────────────────
-    {
-        "name": "NSF Small Business Innovation Research (SBIR)",
-        "type": "grant",
-        "min_amount": 150000,
-        "max_amount": 1500000,
-        "description": "NSF SBIR provides non-dilutive funding to small businesses developing deep technology with commercial potential. Phase I up to $275k, Phase II up to $1M+. Open source tools with commercial applications eligible.",
-        "url": "https://seedfund.nsf.gov",
-        "category": "government",
-        "tags": ["NSF", "US-only", "non-dilutive", "deep-tech", "commercial"],
-        "eligibility": {"location": "US", "type": "small business"},
-        "focus_areas": ["AI", "scientific-computing", "biotech", "climate", "security", "infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling (multiple deadlines/year)",
-    },
-    {
-        "name": "NSF CAREER Award",
-        "type": "grant",
-        "min_amount": 400000,
-        "max_amount": 600000,
-        "description": "NSF CAREER Award supports early-career faculty who have potential to serve as academic role models in research and education. Can fund open source tools used in research.",
-        "url": "https://www.nsf.gov/funding/pgm_summ.jsp?pims_id=503214",
-        "category": "government",
-        "tags": ["NSF", "academic", "US-only", "early-career", "research"],
-        "eligibility": {"location": "US", "type": "academic researcher"},
-        "focus_areas": ["research", "education", "scientific-computing"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual (July)",
-    },
-    {
-        "name": "EU Horizon Europe",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 5000000,
-        "description": "EU Horizon Europe is the EU's key funding programme for research and innovation. Many calls specifically support open source software for research infrastructure.",
-        "url": "https://research-and-innovation.ec.europa.eu/funding/funding-opportunities/funding-programmes-and-open-calls/horizon-europe_en",
-        "category": "government",
-        "tags": ["EU", "research", "innovation", "large-grant", "consortium"],
-        "eligibility": {"location": "EU", "type": "organization or consortium"},
-        "focus_areas": ["research", "climate", "health", "digital", "AI"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Varies by call",
-    },
-    {
-        "name": "Sovereign Tech Fund",
-        "type": "grant",
-        "min_amount": 30000,
-        "max_amount": 1000000,
-        "description": "German government fund that invests in open source digital infrastructure. Focuses on security, maintainability, and sustainability of critical OSS used across the public sector.",
-        "url": "https://www.sovereigntechfund.de",
-        "category": "government",
-        "tags": ["Germany", "EU", "infrastructure", "security", "sustainability"],
-        "eligibility": {"location": "global", "type": "project or org"},
-        "focus_areas": ["infrastructure", "security", "cryptography", "networking"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Prototype Fund (Germany)",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 95000,
-        "description": "Prototype Fund by German Federal Ministry of Education and Research (BMBF) funds open source tools for civil society. Focus on privacy, security, and civic tech.",
-        "url": "https://prototypefund.de/en/",
-        "category": "government",
-        "tags": ["Germany", "EU", "civic-tech", "privacy", "security"],
-        "eligibility": {"location": "Germany", "type": "individual or small team"},
-        "focus_areas": ["privacy", "security", "civic-tech", "democracy"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Bi-annual",
-    },
-    {
-        "name": "CISA Open Source Security Program",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 10000000,
-        "description": "CISA (Cybersecurity and Infrastructure Security Agency) funds projects that improve the security of critical open source software used in US government and critical infrastructure.",
-        "url": "https://www.cisa.gov/topics/partnerships-and-engagement/open-source-software-security",
-        "category": "government",
-        "tags": ["US", "security", "critical-infrastructure", "cybersecurity"],
-        "eligibility": {"location": "US", "type": "org or project"},
-        "focus_areas": ["security", "cryptography", "infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "UKRI Future Leaders Fellowship",
-        "type": "grant",
-        "min_amount": 400000,
-        "max_amount": 2000000,
-        "description": "UK Research and Innovation funds exceptional researchers and innovators with potential to lead in their field. Can support open source research tools.",
-        "url": "https://www.ukri.org/opportunity/future-leaders-fellowships/",
-        "category": "government",
-        "tags": ["UK", "research", "academic", "leadership"],
-        "eligibility": {"location": "UK", "type": "researcher"},
-        "focus_areas": ["research", "scientific-computing", "AI"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    # ── NONPROFIT / IMPACT ─────────────────────────────────────────────────
-    {
-        "name": "Chan Zuckerberg Initiative (CZI) - Essential Open Source",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 200000,
-        "description": "CZI's Essential Open Source Software for Science program funds the maintenance and improvement of open source software that is essential to biomedical research.",
-        "url": "https://chanzuckerberg.com/rfa/essential-open-source-software-for-science/",
-        "category": "nonprofit",
-        "tags": ["science", "biomedical", "research", "maintenance", "sustainability"],
-        "eligibility": {"location": "global", "type": "project or org"},
-        "focus_areas": ["scientific-computing", "bioinformatics", "data-science", "research-tools"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Alfred P. Sloan Foundation",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 500000,
-        "description": "Sloan Foundation funds research and education in science, technology, engineering, mathematics and economics. Supports open source scientific software infrastructure.",
-        "url": "https://sloan.org/programs/digital-technology",
-        "category": "nonprofit",
-        "tags": ["science", "technology", "research", "academic", "software"],
-        "eligibility": {"location": "US", "type": "nonprofit or academic"},
-        "focus_areas": ["scientific-computing", "data-science", "research-infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Ford Foundation Technology and Society",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 2000000,
-        "description": "Ford Foundation invests in technology that advances equity and justice. Supports open source tools and infrastructure for civil society and social change.",
-        "url": "https://www.fordfoundation.org/work/challenging-inequality/technology-and-society/",
-        "category": "nonprofit",
-        "tags": ["equity", "justice", "civil-society", "large-grant", "social-impact"],
-        "eligibility": {"location": "global", "type": "nonprofit"},
-        "focus_areas": ["civic-tech", "social-impact", "privacy", "democracy"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling (invitation-based)",
-    },
-    {
-        "name": "Open Technology Fund",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 900000,
-        "description": "OTF funds development of open source tools that support internet freedom, circumvention, and digital security for users in repressive environments.",
-        "url": "https://www.opentech.fund/funds/",
-        "category": "nonprofit",
-        "tags": ["internet-freedom", "circumvention", "privacy", "security", "US-government-funded"],
-        "eligibility": {"location": "global", "type": "project or org"},
-        "focus_areas": ["privacy", "security", "censorship-circumvention", "cryptography"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Knight Foundation Technology Grants",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 1000000,
-        "description": "Knight Foundation supports journalism, arts and democracy. Technology grants focus on news, information, and communication tools including open source journalism software.",
-        "url": "https://knightfoundation.org/programs/technology/",
-        "category": "nonprofit",
-        "tags": ["journalism", "media", "democracy", "civic-tech"],
-        "eligibility": {"location": "US", "type": "nonprofit or project"},
-        "focus_areas": ["journalism", "civic-tech", "media-tools", "democracy"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Wellcome Trust Open Research",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 500000,
-        "description": "Wellcome Trust funds open research in health and life sciences. Strongly encourages open source tools and data sharing in biomedical and health research.",
-        "url": "https://wellcome.org/grant-funding",
-        "category": "nonprofit",
-        "tags": ["health", "biomedical", "research", "open-data", "UK"],
-        "eligibility": {"location": "global", "type": "researcher or org"},
-        "focus_areas": ["health", "bioinformatics", "medical-research", "data-science"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Omidyar Network Technology and Society",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 5000000,
-        "description": "Omidyar Network invests in projects that enable people to participate in an open and fair society. Supports digital infrastructure and open tech ecosystems.",
-        "url": "https://omidyar.com/omidyar_network/technology-and-society/",
-        "category": "nonprofit",
-        "tags": ["open-internet", "digital-rights", "equity", "large-grant"],
-        "eligibility": {"location": "global", "type": "nonprofit or social enterprise"},
-        "focus_areas": ["digital-rights", "civic-tech", "social-impact"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling (invitation-based)",
-    },
-    {
-        "name": "Open Source Security Foundation (OpenSSF) Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "OpenSSF funds projects that improve the security of the open source ecosystem, including supply chain security, vulnerability disclosure, and security tooling.",
-        "url": "https://openssf.org/grants/",
-        "category": "nonprofit",
-        "tags": ["security", "supply-chain", "vulnerability", "infrastructure"],
-        "eligibility": {"location": "global", "type": "project or org"},
-        "focus_areas": ["security", "cryptography", "supply-chain-security", "devops"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Software Freedom Conservancy",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "SFC provides a non-profit home for open source software projects and offers legal, financial, and administrative support. Projects can receive grants and fiscal sponsorship.",
-        "url": "https://sfconservancy.org/projects/apply/",
-        "category": "nonprofit",
-        "tags": ["fiscal-sponsorship", "legal-support", "governance", "copyleft"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["any"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    # ── CRYPTO / WEB3 ─────────────────────────────────────────────────────
-    {
-        "name": "Ethereum Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 500000,
-        "description": "The Ethereum Foundation funds open source projects that benefit the Ethereum ecosystem, including infrastructure, tooling, research, and Layer 2 development.",
-        "url": "https://esp.ethereum.foundation",
-        "category": "crypto",
-        "tags": ["ethereum", "blockchain", "web3", "L2", "smart-contracts", "research"],
-        "eligibility": {"location": "global", "type": "project or individual"},
-        "focus_areas": ["blockchain", "cryptography", "smart-contracts", "zero-knowledge"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Protocol Labs / Filecoin Foundation",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 500000,
-        "description": "Protocol Labs and Filecoin Foundation fund open source projects in decentralized storage, IPFS ecosystem, and distributed web infrastructure.",
-        "url": "https://grants.filecoin.io",
-        "category": "crypto",
-        "tags": ["IPFS", "filecoin", "decentralized-storage", "distributed-web"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["decentralization", "storage", "networking", "distributed-systems"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Web3 Foundation Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Web3 Foundation funds research and development of Polkadot, Substrate, and the decentralized web ecosystem. Strong focus on interoperability and cross-chain tooling.",
-        "url": "https://grants.web3.foundation",
-        "category": "crypto",
-        "tags": ["polkadot", "substrate", "interoperability", "cross-chain", "rust"],
-        "eligibility": {"location": "global", "type": "project or team"},
-        "focus_areas": ["blockchain", "interoperability", "rust", "cryptography"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Gitcoin Grants",
-        "type": "grant",
-        "min_amount": 100,
-        "max_amount": 500000,
-        "description": "Gitcoin uses quadratic funding to support open source public goods. Community donations are matched by a matching pool funded by donors. Great for community-driven projects.",
-        "url": "https://www.gitcoin.co/grants",
-        "category": "crypto",
-        "tags": ["quadratic-funding", "public-goods", "web3", "community", "ethereum"],
-        "eligibility": {"location": "global", "type": "any OSS project"},
-        "focus_areas": ["any", "web3", "public-goods", "developer-tools"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Quarterly rounds",
-    },
-    {
-        "name": "Optimism Collective RetroPGF",
-        "type": "grant",
-        "min_amount": 1000,
-        "max_amount": 1000000,
-        "description": "Optimism's Retroactive Public Goods Funding rewards past contributions to the Ethereum and Optimism ecosystem. Open source tools that enable the ecosystem are eligible.",
-        "url": "https://app.optimism.io/retropgf",
-        "category": "crypto",
-        "tags": ["optimism", "retroactive", "public-goods", "ethereum", "L2"],
-        "eligibility": {"location": "global", "type": "any contributor"},
-        "focus_areas": ["blockchain", "developer-tools", "infrastructure", "public-goods"],
-        "is_recurring": False,
-        "application_required": False,
-        "deadline": "Annual rounds",
-    },
-    {
-        "name": "NEAR Protocol Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 1000000,
-        "description": "NEAR Foundation funds open source projects building on or benefiting the NEAR ecosystem, including developer tools, infrastructure, and applications.",
-        "url": "https://near.foundation/grants/",
-        "category": "crypto",
-        "tags": ["near", "sharding", "developer-tools", "blockchain"],
-        "eligibility": {"location": "global", "type": "team or org"},
-        "focus_areas": ["blockchain", "developer-tools", "sharding", "web3"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Tezos Foundation Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "The Tezos Foundation funds projects contributing to the Tezos ecosystem, including core development, developer tooling, and applications.",
-        "url": "https://tezos.foundation/grants/",
-        "category": "crypto",
-        "tags": ["tezos", "smart-contracts", "formal-verification", "OCaml"],
-        "eligibility": {"location": "global", "type": "project or team"},
-        "focus_areas": ["blockchain", "formal-verification", "developer-tools"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    # ── STARTUP / VC ───────────────────────────────────────────────────────
-    {
-        "name": "Y Combinator",
-        "type": "accelerator",
-        "min_amount": 500000,
-        "max_amount": 500000,
-        "description": "Y Combinator accepts companies building on open source and those commercializing OSS. Standard deal: $500k for 7% equity. Many successful OSS companies (Supabase, PostHog, etc.) started here.",
-        "url": "https://www.ycombinator.com/apply",
-        "category": "vc",
-        "tags": ["YC", "equity", "startup", "accelerator", "Silicon-Valley"],
-        "eligibility": {"location": "global", "type": "startup or company"},
-        "focus_areas": ["any", "developer-tools", "infrastructure", "AI"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Bi-annual (March, September)",
-    },
-    {
-        "name": "Techstars Open Source Accelerator",
-        "type": "accelerator",
-        "min_amount": 120000,
-        "max_amount": 120000,
-        "description": "Techstars provides seed investment, mentorship, and a global network. Several Techstars programs specifically target open source and developer tools companies.",
-        "url": "https://www.techstars.com/accelerators",
-        "category": "vc",
-        "tags": ["accelerator", "equity", "mentorship", "global", "startup"],
-        "eligibility": {"location": "global", "type": "startup"},
-        "focus_areas": ["developer-tools", "infrastructure", "AI", "fintech"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling by program",
-    },
-    {
-        "name": "OSS Capital",
-        "type": "grant",
-        "min_amount": 150000,
-        "max_amount": 10000000,
-        "description": "OSS Capital is the first and leading VC fund exclusively focused on investing in Commercial Open Source Software (COSS) startups. Backs companies building open core products.",
-        "url": "https://oss.capital",
-        "category": "vc",
-        "tags": ["COSS", "open-core", "equity", "commercial", "startup"],
-        "eligibility": {"location": "global", "type": "startup with OSS core"},
-        "focus_areas": ["developer-tools", "infrastructure", "data", "security"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    # ── DIGITAL INFRASTRUCTURE ─────────────────────────────────────────────
-    {
-        "name": "Ford/Sloan Digital Infrastructure Research Initiative",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 600000,
-        "description": "Joint initiative by Ford Foundation and Sloan Foundation to understand and support the digital infrastructure — the open source code — that the world relies on.",
-        "url": "https://www.fordfoundation.org/campaigns/critical-digital-infrastructure-research/",
-        "category": "nonprofit",
-        "tags": ["infrastructure", "sustainability", "maintenance", "research"],
-        "eligibility": {"location": "global", "type": "researcher or org"},
-        "focus_areas": ["infrastructure", "sustainability", "open-source-economics"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Handshake Developer Fund",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 250000,
-        "description": "Handshake project funds developers building decentralized DNS and naming system tooling, wallets, and ecosystem projects.",
-        "url": "https://handshake.org/grant-program/",
-        "category": "crypto",
-        "tags": ["DNS", "decentralized", "naming", "HNS"],
-        "eligibility": {"location": "global", "type": "developer or team"},
-        "focus_areas": ["networking", "decentralization", "DNS", "cryptography"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "AWS Open Source Program",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "AWS provides cloud credits, direct grants, and sponsorships for open source projects. Particularly interested in cloud-native, container, serverless, and ML tooling.",
-        "url": "https://aws.amazon.com/opensource/",
-        "category": "corporate",
-        "tags": ["AWS", "cloud", "kubernetes", "serverless", "ML"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["cloud", "infrastructure", "machine-learning", "containers"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Cloudflare Workers Open Source Fund",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 50000,
-        "description": "Cloudflare funds open source projects building on Cloudflare Workers and improving the edge computing ecosystem.",
-        "url": "https://www.cloudflare.com/developer-platform/",
-        "category": "corporate",
-        "tags": ["edge", "workers", "serverless", "networking", "cloudflare"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["edge-computing", "networking", "serverless"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Digital Public Goods Alliance",
-        "type": "grant",
-        "min_amount": 25000,
-        "max_amount": 500000,
-        "description": "DPGA supports digital public goods — open source software, open data, and open content that advance sustainable development goals (SDGs). UN-backed initiative.",
-        "url": "https://digitalpublicgoods.net",
-        "category": "nonprofit",
-        "tags": ["SDGs", "UN", "global-south", "public-good", "digital"],
-        "eligibility": {"location": "global", "type": "project or org"},
-        "focus_areas": ["health", "education", "climate", "civic-tech", "social-impact"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Algorand Foundation Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 300000,
-        "description": "Algorand Foundation funds open source projects building on the Algorand blockchain, with focus on DeFi, NFTs, developer tools, and smart contract infrastructure.",
-        "url": "https://www.algorand.foundation/grants-program",
-        "category": "crypto",
-        "tags": ["algorand", "blockchain", "DeFi", "smart-contracts"],
-        "eligibility": {"location": "global", "type": "team"},
-        "focus_areas": ["blockchain", "DeFi", "developer-tools"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Celo Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Celo Foundation funds mobile-first blockchain projects focused on financial inclusion and prosperity for all. Open source tools for the Celo ecosystem.",
-        "url": "https://celo.org/community",
-        "category": "crypto",
-        "tags": ["celo", "mobile", "financial-inclusion", "DeFi"],
-        "eligibility": {"location": "global", "type": "team or project"},
-        "focus_areas": ["mobile", "blockchain", "financial-inclusion", "DeFi"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Open Collective Foundation",
-        "type": "grant",
-        "min_amount": 1000,
-        "max_amount": 50000,
-        "description": "Open Collective Foundation provides fiscal hosting, legal support, and access to grants for open source projects and community initiatives in the US.",
-        "url": "https://opencollective.foundation",
-        "category": "nonprofit",
-        "tags": ["fiscal-hosting", "US", "community", "nonprofit"],
-        "eligibility": {"location": "US", "type": "project or community"},
-        "focus_areas": ["any"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Aragon Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 300000,
-        "description": "Aragon funds open source DAO infrastructure, governance tools, and decentralized organization tooling.",
-        "url": "https://aragon.org/ecosystem",
-        "category": "crypto",
-        "tags": ["DAO", "governance", "ethereum", "decentralized"],
-        "eligibility": {"location": "global", "type": "team"},
-        "focus_areas": ["governance", "DAO", "blockchain", "decentralization"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Interchain Foundation Grants (Cosmos)",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Interchain Foundation funds open source projects in the Cosmos ecosystem, including IBC (Inter-Blockchain Communication), CosmWasm, and interoperability tooling.",
-        "url": "https://interchain.io",
-        "category": "crypto",
-        "tags": ["cosmos", "IBC", "interoperability", "blockchain", "rust"],
-        "eligibility": {"location": "global", "type": "team or project"},
-        "focus_areas": ["blockchain", "interoperability", "rust", "networking"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Apache Incubator Podling Sponsorship",
-        "type": "sponsorship",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Companies can sponsor Apache Incubator projects, and the ASF provides infrastructure and mentorship. Projects that graduate can access ASF's corporate sponsor funds.",
-        "url": "https://www.apache.org/foundation/sponsorship.html",
-        "category": "foundation",
-        "tags": ["apache", "sponsorship", "enterprise", "java", "infrastructure"],
-        "eligibility": {"location": "global", "type": "apache project"},
-        "focus_areas": ["infrastructure", "data", "web", "cloud"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "JetBrains Open Source Support Program",
-        "type": "sponsorship",
-        "min_amount": 0,
-        "max_amount": 50000,
-        "description": "JetBrains provides free licenses and monetary sponsorship for open source projects. All major JetBrains IDEs and tools are available free for active OSS contributors.",
-        "url": "https://www.jetbrains.com/community/opensource/",
-        "category": "corporate",
-        "tags": ["jetbrains", "tools", "IDE", "free-licenses", "developer-tools"],
-        "eligibility": {"location": "global", "type": "active OSS project"},
-        "focus_areas": ["any"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "1Password for Open Source",
-        "type": "sponsorship",
-        "min_amount": 0,
-        "max_amount": 7500,
-        "description": "1Password offers free team accounts to open source projects, and also funds security research and tooling that improves password and credential management.",
-        "url": "https://github.com/1Password/1password-teams-open-source",
-        "category": "corporate",
-        "tags": ["security", "passwords", "credentials", "free-tools"],
-        "eligibility": {"location": "global", "type": "active OSS project"},
-        "focus_areas": ["security", "credentials", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-
-    # ── CRYPTO / WEB3 — EXTENDED ────────────────────────────────────────────
-
-    {
-        "name": "Solana Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 500000,
-        "description": "Solana Foundation funds open source projects building on Solana — DeFi protocols, NFT tools, developer SDKs, RPC infrastructure, and ecosystem tooling. Fast-growing ecosystem with large grant pool.",
-        "url": "https://solana.org/grants",
-        "category": "crypto",
-        "tags": ["solana", "SOL", "rust", "developer-tools", "DeFi", "NFT", "high-throughput"],
-        "eligibility": {"location": "global", "type": "team or individual"},
-        "focus_areas": ["blockchain", "developer-tools", "DeFi", "NFT", "rust", "infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Avalanche Foundation Grants (AVAX)",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Avalanche Foundation's Multiverse program funds projects building subnets, DeFi protocols, and developer tools on Avalanche. Includes cash + AVAX token grants.",
-        "url": "https://www.avax.network/grants",
-        "category": "crypto",
-        "tags": ["avalanche", "AVAX", "subnets", "DeFi", "EVM", "multiverse"],
-        "eligibility": {"location": "global", "type": "team or project"},
-        "focus_areas": ["blockchain", "DeFi", "subnets", "developer-tools", "EVM"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Polygon Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 250000,
-        "description": "Polygon Foundation funds developer tools, DeFi infrastructure, NFT platforms, and ZK-rollup ecosystem projects. Focus on scaling Ethereum and web3 adoption.",
-        "url": "https://polygon.technology/village/grants",
-        "category": "crypto",
-        "tags": ["polygon", "MATIC", "zkEVM", "ZK-rollup", "DeFi", "Ethereum-scaling"],
-        "eligibility": {"location": "global", "type": "project or team"},
-        "focus_areas": ["blockchain", "ZK-proofs", "developer-tools", "DeFi", "NFT"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Chainlink BUILD Program",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 300000,
-        "description": "Chainlink BUILD provides early-stage projects with LINK token grants, technical support, and access to Chainlink's oracle services. Ideal for DeFi and data-dependent protocols.",
-        "url": "https://chain.link/community/grants",
-        "category": "crypto",
-        "tags": ["chainlink", "LINK", "oracles", "DeFi", "data-feeds", "VRF"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["oracles", "DeFi", "data", "blockchain", "smart-contracts"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Uniswap Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 500000,
-        "description": "Uniswap Foundation funds research, developer tools, and protocol improvements for the Uniswap ecosystem and broader DeFi infrastructure. Open to researchers, developers, and designers.",
-        "url": "https://www.uniswapfoundation.org/grants",
-        "category": "crypto",
-        "tags": ["uniswap", "UNI", "AMM", "DeFi", "DEX", "liquidity"],
-        "eligibility": {"location": "global", "type": "individual or project"},
-        "focus_areas": ["DeFi", "AMM", "research", "developer-tools", "smart-contracts"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Aave Grants DAO",
-        "type": "grant",
-        "min_amount": 1000,
-        "max_amount": 100000,
-        "description": "Aave Grants DAO funds projects that benefit the Aave ecosystem — developer tools, integrations, analytics, risk tooling, and community resources. Community-voted grants.",
-        "url": "https://aavegrants.org",
-        "category": "crypto",
-        "tags": ["aave", "DeFi", "lending", "community-voted", "DAO", "analytics"],
-        "eligibility": {"location": "global", "type": "any contributor"},
-        "focus_areas": ["DeFi", "lending", "developer-tools", "analytics", "governance"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Compound Grants Program",
-        "type": "grant",
-        "min_amount": 1000,
-        "max_amount": 150000,
-        "description": "Compound Grants funds development of tools, integrations, security improvements, and research that benefit the Compound protocol and broader DeFi lending ecosystem.",
-        "url": "https://compoundgrants.org",
-        "category": "crypto",
-        "tags": ["compound", "COMP", "DeFi", "lending", "security", "governance"],
-        "eligibility": {"location": "global", "type": "developer or researcher"},
-        "focus_areas": ["DeFi", "lending", "security", "governance", "smart-contracts"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "StarkNet Foundation Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "StarkWare and StarkNet Foundation fund ZK-STARK based projects — developer tools, Cairo language ecosystem, DeFi protocols, and infrastructure for Ethereum ZK-scaling.",
-        "url": "https://starknet.io/grants/",
-        "category": "crypto",
-        "tags": ["starknet", "ZK-STARKs", "cairo", "ZK-rollup", "Ethereum-scaling", "zero-knowledge"],
-        "eligibility": {"location": "global", "type": "project or individual"},
-        "focus_areas": ["ZK-proofs", "blockchain", "cryptography", "developer-tools", "cairo"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "zkSync / Matter Labs Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 250000,
-        "description": "Matter Labs funds projects building on zkSync Era — the EVM-compatible ZK-rollup. Supports DeFi, developer tooling, infrastructure, and ecosystem growth.",
-        "url": "https://zksync.io/developer-grants",
-        "category": "crypto",
-        "tags": ["zksync", "ZK-rollup", "EVM", "DeFi", "Ethereum-scaling", "zero-knowledge"],
-        "eligibility": {"location": "global", "type": "team or project"},
-        "focus_areas": ["ZK-proofs", "DeFi", "blockchain", "developer-tools"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Aptos Foundation Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Aptos Foundation funds open source projects built on Aptos — Move language tools, DeFi protocols, NFT platforms, wallets, and infrastructure. High-performance L1 blockchain with active grant program.",
-        "url": "https://aptosfoundation.org/grants",
-        "category": "crypto",
-        "tags": ["aptos", "APT", "move-language", "DeFi", "NFT", "high-performance"],
-        "eligibility": {"location": "global", "type": "project or team"},
-        "focus_areas": ["blockchain", "move-language", "DeFi", "developer-tools", "NFT"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Sui Foundation Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Sui Foundation funds projects on the Sui blockchain — Move language development, DeFi, gaming, NFTs, and developer tooling. Mysten Labs backed with strong funding pool.",
-        "url": "https://sui.io/grants",
-        "category": "crypto",
-        "tags": ["sui", "SUI", "move-language", "gaming", "DeFi", "NFT", "Mysten-Labs"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["blockchain", "gaming", "DeFi", "developer-tools", "move-language"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "ICP / DFINITY Developer Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 250000,
-        "description": "DFINITY Foundation funds applications and infrastructure built on the Internet Computer Protocol (ICP). Supports DeFi, social media, enterprise apps, and Web3 infrastructure on ICP.",
-        "url": "https://dfinity.org/grants",
-        "category": "crypto",
-        "tags": ["ICP", "DFINITY", "internet-computer", "canister", "motoko", "rust"],
-        "eligibility": {"location": "global", "type": "individual or team"},
-        "focus_areas": ["blockchain", "decentralization", "developer-tools", "DeFi", "enterprise"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Arbitrum DAO Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 500000,
-        "description": "Arbitrum DAO treasury funds projects building on Arbitrum One and Arbitrum Nova — the leading Ethereum L2 rollups. DeFi, gaming, NFTs, developer tools all eligible. Community-governed.",
-        "url": "https://arbitrum.foundation/grants",
-        "category": "crypto",
-        "tags": ["arbitrum", "ARB", "L2", "Ethereum", "rollup", "DAO", "community"],
-        "eligibility": {"location": "global", "type": "project or team"},
-        "focus_areas": ["DeFi", "gaming", "developer-tools", "L2", "blockchain"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Cardano Project Catalyst",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 1000000,
-        "description": "Project Catalyst is the world's largest decentralized innovation fund. ADA holders vote on proposals every quarter. Funds OSS tools, DeFi, education, and community projects on Cardano.",
-        "url": "https://projectcatalyst.io",
-        "category": "crypto",
-        "tags": ["cardano", "ADA", "community-voted", "quarterly", "DAO", "haskell", "plutus"],
-        "eligibility": {"location": "global", "type": "any project"},
-        "focus_areas": ["blockchain", "DeFi", "education", "developer-tools", "governance"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Quarterly rounds",
-    },
-    {
-        "name": "The Graph Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 250000,
-        "description": "The Graph Foundation funds subgraph development, indexing infrastructure, and web3 data tooling. Critical blockchain data layer — grants for anyone improving the ecosystem.",
-        "url": "https://thegraph.com/grants/",
-        "category": "crypto",
-        "tags": ["the-graph", "GRT", "subgraph", "indexing", "web3-data", "GraphQL"],
-        "eligibility": {"location": "global", "type": "developer or project"},
-        "focus_areas": ["data", "indexing", "developer-tools", "blockchain", "GraphQL"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Polkadot Treasury Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 1000000,
-        "description": "Polkadot's on-chain treasury funds ecosystem development. DOT holders vote on treasury proposals. Funds parachain development, wallets, infrastructure, research, and developer tooling.",
-        "url": "https://polkadot.network/ecosystem/grants/",
-        "category": "crypto",
-        "tags": ["polkadot", "DOT", "parachain", "substrate", "governance", "treasury", "rust"],
-        "eligibility": {"location": "global", "type": "any contributor"},
-        "focus_areas": ["blockchain", "interoperability", "rust", "developer-tools", "infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "TON Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 500000,
-        "description": "TON Foundation (Telegram's blockchain) funds mini-apps, DeFi protocols, NFT platforms, and developer tools on The Open Network. Massive Telegram user base = huge distribution advantage.",
-        "url": "https://ton.org/grants",
-        "category": "crypto",
-        "tags": ["TON", "telegram", "mini-apps", "DeFi", "NFT", "messaging-blockchain"],
-        "eligibility": {"location": "global", "type": "project or team"},
-        "focus_areas": ["blockchain", "mobile", "DeFi", "developer-tools", "mini-apps"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "LayerZero Foundation Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 300000,
-        "description": "LayerZero Foundation funds cross-chain interoperability projects, omnichain applications, and developer tools that leverage the LayerZero messaging protocol.",
-        "url": "https://layerzero.network/",
-        "category": "crypto",
-        "tags": ["layerzero", "cross-chain", "interoperability", "omnichain", "messaging"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["interoperability", "cross-chain", "developer-tools", "blockchain"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "dYdX Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "dYdX Foundation funds trading tools, analytics, integrations, and community resources for the dYdX decentralized perpetuals exchange and its Cosmos-based chain.",
-        "url": "https://dydx.foundation/grants",
-        "category": "crypto",
-        "tags": ["dydx", "DYDX", "perpetuals", "derivatives", "DeFi", "cosmos", "trading"],
-        "eligibility": {"location": "global", "type": "developer or project"},
-        "focus_areas": ["DeFi", "trading", "analytics", "developer-tools", "cosmos"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Injective Foundation Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 300000,
-        "description": "Injective Protocol funds DeFi applications, derivatives platforms, and developer tools built on Injective — the finance-optimized L1 blockchain in the Cosmos ecosystem.",
-        "url": "https://injective.com/grants/",
-        "category": "crypto",
-        "tags": ["injective", "INJ", "DeFi", "derivatives", "cosmos", "finance"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["DeFi", "derivatives", "developer-tools", "cosmos"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Hedera Foundation Grants (HBAR)",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 250000,
-        "description": "HBAR Foundation funds enterprise-grade DApps, DeFi, NFT, and sustainability projects on Hedera Hashgraph. Known for fast finality and carbon-negative consensus.",
-        "url": "https://hbarfoundation.org/grants/",
-        "category": "crypto",
-        "tags": ["hedera", "HBAR", "hashgraph", "enterprise", "carbon-negative", "DeFi"],
-        "eligibility": {"location": "global", "type": "team or company"},
-        "focus_areas": ["enterprise", "DeFi", "sustainability", "developer-tools", "NFT"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Flow Foundation Grants (Dapper Labs)",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Flow Foundation (creators of NBA Top Shot and CryptoKitties) funds NFT platforms, gaming applications, and developer tools on the Flow blockchain. Consumer-focused crypto platform.",
-        "url": "https://flow.com/flow-grants-program",
-        "category": "crypto",
-        "tags": ["flow", "FLOW", "NFT", "gaming", "consumer", "cadence", "Dapper-Labs"],
-        "eligibility": {"location": "global", "type": "project or studio"},
-        "focus_areas": ["NFT", "gaming", "consumer-apps", "developer-tools", "cadence"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Sei Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Sei Foundation funds DeFi trading applications, DEX infrastructure, and developer tools on Sei — the fastest L1 blockchain optimized for trading.",
-        "url": "https://sei.io/ecosystem",
-        "category": "crypto",
-        "tags": ["sei", "SEI", "trading", "DEX", "cosmos", "high-performance"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["DeFi", "trading", "developer-tools", "cosmos"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Immunefi Bug Bounties",
-        "type": "grant",
-        "min_amount": 1000,
-        "max_amount": 10000000,
-        "description": "Immunefi is the largest Web3 bug bounty platform. Security researchers can earn up to $10M for critical vulnerabilities in DeFi protocols. Over $80M paid out to white-hat hackers.",
-        "url": "https://immunefi.com",
-        "category": "crypto",
-        "tags": ["bug-bounty", "security", "white-hat", "DeFi", "smart-contracts", "hacking"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "smart-contracts", "cryptography", "DeFi"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Gitcoin Grants (Quadratic Funding)",
-        "type": "grant",
-        "min_amount": 100,
-        "max_amount": 500000,
-        "description": "Gitcoin's quadratic funding rounds match community donations from a large pool. Every $1 from the community is multiplied. Run quarterly with specific round themes (DeFi, climate, OSS).",
-        "url": "https://grants.gitcoin.co",
-        "category": "crypto",
-        "tags": ["gitcoin", "quadratic-funding", "community", "public-goods", "matching"],
-        "eligibility": {"location": "global", "type": "any OSS project"},
-        "focus_areas": ["public-goods", "developer-tools", "web3", "any"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Quarterly rounds",
-    },
-    {
-        "name": "ETHGlobal Hackathons",
-        "type": "grant",
-        "min_amount": 500,
-        "max_amount": 100000,
-        "description": "ETHGlobal runs the world's largest Ethereum hackathons (ETHDenver, ETHParis, etc.). Winners receive grants, bounties from sponsors (Ethereum Foundation, Chainlink, Uniswap), and exposure.",
-        "url": "https://ethglobal.com",
-        "category": "crypto",
-        "tags": ["hackathon", "ethereum", "global", "competition", "bounties", "networking"],
-        "eligibility": {"location": "global", "type": "developer or team"},
-        "focus_areas": ["any", "DeFi", "infrastructure", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "Superfluid Protocol Grants",
-        "type": "grant",
-        "min_amount": 2000,
-        "max_amount": 100000,
-        "description": "Superfluid funds projects that use real-time token streaming for payroll, subscriptions, and continuous DeFi. Novel primitive enabling developers to earn streaming payments.",
-        "url": "https://superfluid.finance/grants",
-        "category": "crypto",
-        "tags": ["superfluid", "token-streaming", "payroll", "subscriptions", "DeFi", "real-time"],
-        "eligibility": {"location": "global", "type": "developer or project"},
-        "focus_areas": ["DeFi", "payments", "payroll", "developer-tools"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "MakerDAO / Sky Ecosystem Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 250000,
-        "description": "MakerDAO (now Sky) funds DAI/USDS stablecoin integrations, RWA (Real World Assets) tools, risk analytics, and DeFi infrastructure. One of the oldest and largest DeFi treasuries.",
-        "url": "https://mips.makerdao.com/mips/details/MIP40",
-        "category": "crypto",
-        "tags": ["makerdao", "DAI", "stablecoin", "RWA", "DeFi", "governance", "risk"],
-        "eligibility": {"location": "global", "type": "project or team"},
-        "focus_areas": ["DeFi", "stablecoins", "RWA", "risk", "governance"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "BNB Chain Innovation Program",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "BNB Chain (Binance) funds DApps, DeFi protocols, GameFi, and infrastructure on BNB Smart Chain and opBNB. Large user base with $1B+ annual grant budget.",
-        "url": "https://www.bnbchain.org/en/developers/developer-programs/builder-grants",
-        "category": "crypto",
-        "tags": ["BNB", "binance", "BSC", "GameFi", "DeFi", "NFT", "large-budget"],
-        "eligibility": {"location": "global", "type": "project or company"},
-        "focus_areas": ["DeFi", "GameFi", "NFT", "developer-tools", "infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Cosmos Hub Community Pool Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 500000,
-        "description": "Cosmos Hub's community pool is governed by ATOM stakers. Funds IBC tooling, validators, public goods, and infrastructure for the Cosmos ecosystem of 50+ interconnected blockchains.",
-        "url": "https://forum.cosmos.network/c/governance/",
-        "category": "crypto",
-        "tags": ["cosmos", "ATOM", "IBC", "validators", "governance", "community"],
-        "eligibility": {"location": "global", "type": "any contributor"},
-        "focus_areas": ["infrastructure", "IBC", "developer-tools", "governance"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Devfolio / ETHIndia Grants",
-        "type": "grant",
-        "min_amount": 500,
-        "max_amount": 50000,
-        "description": "Devfolio runs India's largest Web3 hackathons including ETHIndia. Developers win grants and bounties from Ethereum Foundation, Polygon, and other sponsors. Great for Indian developers.",
-        "url": "https://devfolio.co/grants",
-        "category": "crypto",
-        "tags": ["india", "hackathon", "ethereum", "bounties", "web3", "community"],
-        "eligibility": {"location": "global", "type": "developer or team"},
-        "focus_areas": ["any", "DeFi", "developer-tools", "web3"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "Optimism Citizen House Grants",
-        "type": "grant",
-        "min_amount": 1000,
-        "max_amount": 250000,
-        "description": "Optimism's Citizen House funds public goods through both proactive and retroactive mechanisms. Builders, educators, and infrastructure providers are all eligible for OP token grants.",
-        "url": "https://optimism.io/vision",
-        "category": "crypto",
-        "tags": ["optimism", "OP", "L2", "public-goods", "retroactive", "Ethereum"],
-        "eligibility": {"location": "global", "type": "any contributor"},
-        "focus_areas": ["public-goods", "developer-tools", "infrastructure", "education"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Balancer Grants Program",
-        "type": "grant",
-        "min_amount": 2000,
-        "max_amount": 100000,
-        "description": "Balancer Grants DAO funds AMM integrations, analytics tools, research, and community initiatives that benefit the Balancer Protocol and decentralized liquidity.",
-        "url": "https://grants.balancer.community",
-        "category": "crypto",
-        "tags": ["balancer", "BAL", "AMM", "DeFi", "liquidity", "DAO"],
-        "eligibility": {"location": "global", "type": "developer or researcher"},
-        "focus_areas": ["DeFi", "AMM", "analytics", "developer-tools"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Wormhole Foundation Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 250000,
-        "description": "Wormhole Foundation funds cross-chain interoperability applications, bridges, and developer tools leveraging the Wormhole messaging protocol across 20+ blockchains.",
-        "url": "https://wormhole.com/grants",
-        "category": "crypto",
-        "tags": ["wormhole", "cross-chain", "bridge", "interoperability", "multi-chain"],
-        "eligibility": {"location": "global", "type": "project or team"},
-        "focus_areas": ["interoperability", "cross-chain", "developer-tools", "bridge"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Axelar Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Axelar Network funds cross-chain applications, General Message Passing (GMP) integrations, and developer tools connecting all blockchains through its universal interoperability layer.",
-        "url": "https://axelar.network/ecosystem",
-        "category": "crypto",
-        "tags": ["axelar", "AXL", "cross-chain", "GMP", "interoperability", "cosmos"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["interoperability", "cross-chain", "developer-tools"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Stacks Foundation Grants (Bitcoin L2)",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 250000,
-        "description": "Stacks Foundation funds apps, tools, and infrastructure on Stacks — the Bitcoin Layer 2 that brings smart contracts to Bitcoin. Unique opportunity to build on Bitcoin's security.",
-        "url": "https://stacks.org/grants",
-        "category": "crypto",
-        "tags": ["stacks", "STX", "bitcoin", "L2", "smart-contracts", "clarity"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["bitcoin", "blockchain", "developer-tools", "DeFi", "smart-contracts"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Lens Protocol Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Lens Protocol (Aave team) funds decentralized social media applications, creator monetization tools, and developer tooling for the Lens Protocol — Web3 social graph.",
-        "url": "https://lens.xyz/grants",
-        "category": "crypto",
-        "tags": ["lens", "social-media", "decentralized-social", "creator-economy", "NFT", "Polygon"],
-        "eligibility": {"location": "global", "type": "project"},
-        "focus_areas": ["social-media", "creator-economy", "NFT", "developer-tools"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Ocean Protocol Grants",
-        "type": "grant",
-        "min_amount": 3000,
-        "max_amount": 100000,
-        "description": "Ocean Protocol funds open source data monetization tools, data NFTs, compute-to-data applications, and AI/ML integrations. Unique niche combining AI and blockchain for data economy.",
-        "url": "https://oceanprotocol.com/dao",
-        "category": "crypto",
-        "tags": ["ocean", "OCEAN", "data-economy", "AI", "machine-learning", "data-NFT"],
-        "eligibility": {"location": "global", "type": "developer or data scientist"},
-        "focus_areas": ["data-science", "AI", "blockchain", "developer-tools"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Synthetix Grants Council",
-        "type": "grant",
-        "min_amount": 1000,
-        "max_amount": 100000,
-        "description": "Synthetix Grants Council funds integrations, analytics, research, and developer tools for the Synthetix synthetic assets protocol. Community-elected grant council reviews proposals.",
-        "url": "https://grants.synthetix.io",
-        "category": "crypto",
-        "tags": ["synthetix", "SNX", "synthetic-assets", "derivatives", "DeFi", "DAO"],
-        "eligibility": {"location": "global", "type": "developer"},
-        "focus_areas": ["DeFi", "synthetic-assets", "developer-tools", "analytics"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Solana Hackathon (SuperTeam / Colosseum)",
-        "type": "grant",
-        "min_amount": 1000,
-        "max_amount": 1000000,
-        "description": "Colosseum (formerly Solana Foundation) runs online hackathons with $1M+ prize pools. Winning projects often get fast-tracked to VC funding and Solana Foundation grants.",
-        "url": "https://www.colosseum.org",
-        "category": "crypto",
-        "tags": ["solana", "hackathon", "competition", "VC-pipeline", "large-prize"],
-        "eligibility": {"location": "global", "type": "developer or team"},
-        "focus_areas": ["any", "DeFi", "NFT", "developer-tools", "consumer-apps"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "Gitcoin Bounties (Issue-based)",
-        "type": "grant",
-        "min_amount": 25,
-        "max_amount": 50000,
-        "description": "Gitcoin Bounties lets developers earn crypto by solving specific GitHub issues posted by projects. Immediate earning for fixing bugs, adding features, writing docs. Pay per task.",
-        "url": "https://bounties.gitcoin.co",
-        "category": "crypto",
-        "tags": ["bounty", "pay-per-task", "github-issues", "immediate-earning", "freelance"],
-        "eligibility": {"location": "global", "type": "any developer"},
-        "focus_areas": ["any", "developer-tools", "web3"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # HACKATHONS — General Tech
-    # ══════════════════════════════════════════════════════════════════════════
-
-    {
-        "name": "Major League Hacking (MLH) Hackathons",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 10000,
-        "description": "MLH is the official student hackathon league. 300+ hackathons per year globally. Win prizes, hardware, AWS/GCP credits, and job offers. Best platform for student developers.",
-        "url": "https://mlh.io/seasons/2025/events",
-        "category": "platform",
-        "tags": ["student", "hackathon", "prizes", "hardware", "cloud-credits", "global", "annual"],
-        "eligibility": {"location": "global", "type": "student or early-career developer"},
-        "focus_areas": ["any", "developer-tools", "AI", "web", "mobile"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "Devpost Hackathons",
-        "type": "hackathon",
-        "min_amount": 100,
-        "max_amount": 500000,
-        "description": "Devpost hosts hundreds of online and in-person hackathons from companies like IBM, AWS, Google, and NASA. $500M+ in prizes awarded. Submit your project to win cash, hardware, and job offers.",
-        "url": "https://devpost.com/hackathons",
-        "category": "platform",
-        "tags": ["online", "in-person", "prizes", "corporate-sponsored", "global", "beginner-friendly"],
-        "eligibility": {"location": "global", "type": "any developer"},
-        "focus_areas": ["any", "AI", "web", "mobile", "IoT", "blockchain"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Hack the North (Canada's Biggest Hackathon)",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 25000,
-        "description": "University of Waterloo's Hack the North is Canada's biggest hackathon — 1000+ hackers, $1M+ in prizes and sponsorships from top tech companies. Travel reimbursement available globally.",
-        "url": "https://hackthenorth.com",
-        "category": "platform",
-        "tags": ["canada", "waterloo", "student", "large-scale", "travel-reimbursement", "annual"],
-        "eligibility": {"location": "global", "type": "student"},
-        "focus_areas": ["any", "AI", "hardware", "web", "mobile"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (September)",
-    },
-    {
-        "name": "HackMIT",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 10000,
-        "description": "MIT's flagship hackathon. One of the most prestigious in the world — 1000+ students from 100+ universities. Sponsors include Google, Microsoft, Dropbox. Travel reimbursement for top applicants.",
-        "url": "https://hackmit.org",
-        "category": "platform",
-        "tags": ["MIT", "prestigious", "student", "annual", "travel-reimbursement", "top-tier"],
-        "eligibility": {"location": "global", "type": "student"},
-        "focus_areas": ["any", "AI", "hardware", "biotech", "web"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (October)",
-    },
-    {
-        "name": "TreeHacks (Stanford University)",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 10000,
-        "description": "Stanford's official hackathon, TreeHacks focuses on building for social impact. 1500+ hackers, $200k+ in prizes. Travel grants for underrepresented groups. Major Silicon Valley company sponsors.",
-        "url": "https://treehacks.com",
-        "category": "platform",
-        "tags": ["stanford", "social-impact", "silicon-valley", "travel-grants", "student"],
-        "eligibility": {"location": "global", "type": "student"},
-        "focus_areas": ["social-impact", "health", "education", "climate", "AI"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (February)",
-    },
-    {
-        "name": "Microsoft Imagine Cup",
-        "type": "hackathon",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "Microsoft's global student technology competition with $100k grand prize. Projects must use Microsoft Azure. Categories: Earth, Education, Humanitarian. Winners meet Microsoft leadership and get Azure credits.",
-        "url": "https://imaginecup.microsoft.com",
-        "category": "corporate",
-        "tags": ["microsoft", "azure", "student", "global", "annual", "social-impact", "AI"],
-        "eligibility": {"location": "global", "type": "student (under 30)"},
-        "focus_areas": ["AI", "social-impact", "climate", "education", "cloud"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (January-April)",
-    },
-    {
-        "name": "NASA Space Apps Challenge",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 50000,
-        "description": "NASA's global hackathon — largest in the world with 50,000+ participants in 160+ countries. Use NASA's open data and APIs to solve space and Earth challenges. Winning teams go to NASA centers.",
-        "url": "https://www.spaceappschallenge.org",
-        "category": "government",
-        "tags": ["NASA", "space", "climate", "data", "open-data", "global", "largest-hackathon"],
-        "eligibility": {"location": "global", "type": "any developer or team"},
-        "focus_areas": ["space", "climate", "data-science", "AI", "earth-observation"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (October)",
-    },
-    {
-        "name": "IBM Call for Code",
-        "type": "hackathon",
-        "min_amount": 10000,
-        "max_amount": 200000,
-        "description": "IBM's global hackathon for developers using IBM Cloud and Red Hat to solve climate change and humanitarian crises. $200k+ in prizes, winning projects get deployed at scale with IBM support.",
-        "url": "https://developer.ibm.com/callforcode/",
-        "category": "corporate",
-        "tags": ["IBM", "climate", "humanitarian", "cloud", "Red-Hat", "social-impact", "open-source"],
-        "eligibility": {"location": "global", "type": "any developer or team"},
-        "focus_areas": ["climate", "social-impact", "cloud", "AI", "open-source"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "DoraHacks Global Hackathon Series",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 500000,
-        "description": "DoraHacks runs 100+ hackathons per year across Web3, AI, and deep tech. Also hosts BUIDLathons with quadratic funding. Major sponsors include Solana, Aptos, BNB Chain, and more.",
-        "url": "https://dorahacks.io",
-        "category": "platform",
-        "tags": ["web3", "AI", "deep-tech", "quadratic-funding", "global", "year-round", "BUIDLathon"],
-        "eligibility": {"location": "global", "type": "any developer"},
-        "focus_areas": ["blockchain", "AI", "developer-tools", "any"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Encode Club Hackathons",
-        "type": "hackathon",
-        "min_amount": 1000,
-        "max_amount": 100000,
-        "description": "Encode Club runs education programs and hackathons for Web3 developers. Partners with Polkadot, Chainlink, Filecoin, and more. Great for developers learning Web3 while earning.",
-        "url": "https://www.encode.club/hackathons",
-        "category": "crypto",
-        "tags": ["web3", "education", "polkadot", "chainlink", "filecoin", "learning", "community"],
-        "eligibility": {"location": "global", "type": "any developer"},
-        "focus_areas": ["blockchain", "developer-tools", "DeFi", "any"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "AngelHack Global Hackathon Series",
-        "type": "hackathon",
-        "min_amount": 1000,
-        "max_amount": 50000,
-        "description": "AngelHack runs hackathons in 50+ cities worldwide. Winners access the HACKcelerator — a virtual accelerator that connects winning teams with investors and corporate partners.",
-        "url": "https://angelhack.com",
-        "category": "platform",
-        "tags": ["global", "cities", "accelerator", "investors", "corporate", "networking"],
-        "eligibility": {"location": "global", "type": "developer or startup team"},
-        "focus_areas": ["any", "fintech", "health", "enterprise", "AI"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "TechCrunch Disrupt Hackathon",
-        "type": "hackathon",
-        "min_amount": 5000,
-        "max_amount": 50000,
-        "description": "TechCrunch Disrupt's Startup Battlefield and hackathon. Winners get massive media exposure, VC meetings, and prizes. Extremely high visibility event for early-stage projects.",
-        "url": "https://techcrunch.com/events/tc-disrupt/",
-        "category": "platform",
-        "tags": ["media", "VC", "startup", "high-visibility", "annual", "San-Francisco"],
-        "eligibility": {"location": "global", "type": "startup or developer team"},
-        "focus_areas": ["any", "AI", "SaaS", "consumer", "enterprise"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Junction Hackathon (Europe's Largest)",
-        "type": "hackathon",
-        "min_amount": 1000,
-        "max_amount": 30000,
-        "description": "Junction is Europe's biggest hackathon based in Helsinki, Finland. 1500+ participants from 60+ countries. Corporate sponsors include Nokia, Wolt, and major Finnish tech companies. Travel grants available.",
-        "url": "https://www.hackjunction.com",
-        "category": "platform",
-        "tags": ["europe", "finland", "helsinki", "student", "travel-grants", "corporate"],
-        "eligibility": {"location": "global", "type": "any developer"},
-        "focus_areas": ["any", "AI", "health", "sustainability", "smart-city"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (November)",
-    },
-    {
-        "name": "HackFS (Filecoin + IPFS Hackathon)",
-        "type": "hackathon",
-        "min_amount": 1000,
-        "max_amount": 100000,
-        "description": "HackFS by ETHGlobal and Protocol Labs — 3-week online hackathon focused on decentralized storage, IPFS, and Filecoin. Prizes from Filecoin Foundation, Chainlink, and Polygon.",
-        "url": "https://ethglobal.com/events/hackfs2024",
-        "category": "crypto",
-        "tags": ["IPFS", "filecoin", "decentralized-storage", "web3", "ETHGlobal", "online"],
-        "eligibility": {"location": "global", "type": "any developer"},
-        "focus_areas": ["decentralization", "storage", "web3", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Buildspace (n&w Season)",
-        "type": "hackathon",
-        "min_amount": 5000,
-        "max_amount": 500000,
-        "description": "Buildspace nights & weekends (n&w) — 6-week program where 1000+ developers build projects alongside their day jobs. Top projects get funding, investor intros, and massive community exposure.",
-        "url": "https://buildspace.so/nw",
-        "category": "platform",
-        "tags": ["community", "6-weeks", "side-project", "funding", "investor-intros", "builder"],
-        "eligibility": {"location": "global", "type": "any developer"},
-        "focus_areas": ["any", "AI", "web3", "consumer", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "AWS re:Invent Hackathon",
-        "type": "hackathon",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "Amazon Web Services runs hackathons at re:Invent and online year-round. Win AWS credits ($100k+), cash prizes, and direct access to AWS technical teams and Partner Network.",
-        "url": "https://aws.amazon.com/events/hackathons/",
-        "category": "corporate",
-        "tags": ["AWS", "amazon", "cloud", "serverless", "AI/ML", "credits"],
-        "eligibility": {"location": "global", "type": "developer or team"},
-        "focus_areas": ["cloud", "AI", "serverless", "infrastructure", "ML"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "Google Cloud Hackathon (Google Devfest)",
-        "type": "hackathon",
-        "min_amount": 1000,
-        "max_amount": 50000,
-        "description": "Google runs DevFest hackathons in 500+ cities globally. Win GCP credits, Google hardware, and meetings with Google developer advocates. GCP solutions get featured in Google case studies.",
-        "url": "https://developers.google.com/events/devfest",
-        "category": "corporate",
-        "tags": ["google", "GCP", "cloud", "AI", "Flutter", "Android", "global", "credits"],
-        "eligibility": {"location": "global", "type": "any developer"},
-        "focus_areas": ["cloud", "AI", "mobile", "web", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (November-December)",
-    },
-    {
-        "name": "Sui Overflow Hackathon",
-        "type": "hackathon",
-        "min_amount": 1000,
-        "max_amount": 250000,
-        "description": "Sui Foundation's annual hackathon with $500k+ in prizes. Build DeFi, gaming, NFT, and developer tools on Sui. Winners get fast-tracked to Sui Foundation grants and VC intros.",
-        "url": "https://sui.io/overflow",
-        "category": "crypto",
-        "tags": ["sui", "SUI", "move-language", "gaming", "DeFi", "annual", "large-prize"],
-        "eligibility": {"location": "global", "type": "developer or team"},
-        "focus_areas": ["blockchain", "gaming", "DeFi", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Aptos Move Hackathon",
-        "type": "hackathon",
-        "min_amount": 1000,
-        "max_amount": 150000,
-        "description": "Aptos Foundation's hackathons for the Move programming language ecosystem. Build smart contracts, DeFi protocols, and developer tools. Winners get Aptos Foundation grants and ecosystem support.",
-        "url": "https://aptosfoundation.org/hackathon",
-        "category": "crypto",
-        "tags": ["aptos", "move-language", "smart-contracts", "DeFi", "hackathon"],
-        "eligibility": {"location": "global", "type": "developer or team"},
-        "focus_areas": ["blockchain", "smart-contracts", "DeFi", "move-language"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # BUG BOUNTIES — Platforms
-    # ══════════════════════════════════════════════════════════════════════════
-
-    {
-        "name": "HackerOne Bug Bounty Platform",
-        "type": "bounty",
-        "min_amount": 100,
-        "max_amount": 1000000,
-        "description": "HackerOne is the world's #1 bug bounty platform. 3000+ companies pay hackers to find vulnerabilities — including Microsoft, Google, Twitter, PayPal, Uber. $300M+ paid out. Also offers pentesting jobs.",
-        "url": "https://hackerone.com",
-        "category": "platform",
-        "tags": ["bug-bounty", "security", "hacking", "CVE", "pentest", "disclosed", "global"],
-        "eligibility": {"location": "global", "type": "security researcher or ethical hacker"},
-        "focus_areas": ["security", "web-vulnerabilities", "cryptography", "infrastructure"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Bugcrowd Bug Bounty Platform",
-        "type": "bounty",
-        "min_amount": 100,
-        "max_amount": 500000,
-        "description": "Bugcrowd connects security researchers with 1500+ companies for bug bounties and vulnerability disclosure. Includes Tesla, Netgear, OpenAI, and US DoD. Has skill-based triage and researcher ranking.",
-        "url": "https://bugcrowd.com",
-        "category": "platform",
-        "tags": ["bug-bounty", "security", "pentest", "DoD", "Tesla", "OpenAI", "ranking"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "web-vulnerabilities", "IoT", "mobile", "infrastructure"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Intigriti Bug Bounty Platform",
-        "type": "bounty",
-        "min_amount": 50,
-        "max_amount": 250000,
-        "description": "Europe's leading bug bounty platform with 70,000+ ethical hackers. European company programs (GDPR-compliant). Great for EU-based developers. Partners include Nike, Coca-Cola, and EU institutions.",
-        "url": "https://intigriti.com",
-        "category": "platform",
-        "tags": ["europe", "bug-bounty", "GDPR", "ethical-hacking", "EU", "disclosure"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "web-vulnerabilities", "mobile", "infrastructure"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "YesWeHack Bug Bounty Platform",
-        "type": "bounty",
-        "min_amount": 50,
-        "max_amount": 150000,
-        "description": "French bug bounty platform with programs from European governments, NATO, and Fortune 500 companies. GDPR-compliant, strong in France/Germany/Switzerland. Government programs pay well.",
-        "url": "https://yeswehack.com",
-        "category": "platform",
-        "tags": ["bug-bounty", "europe", "government", "NATO", "France", "GDPR", "ethical-hacking"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "web-vulnerabilities", "government", "infrastructure"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Synack Red Team (Invite-only)",
-        "type": "bounty",
-        "min_amount": 1000,
-        "max_amount": 500000,
-        "description": "Synack's vetted Red Team — invite-only, higher payouts than public bounties. Work on US DoD, government, and Fortune 100 programs. Synack researchers earn $150k+ per year on average.",
-        "url": "https://synack.com/red-team/",
-        "category": "platform",
-        "tags": ["invite-only", "premium", "DoD", "government", "high-payout", "vetted"],
-        "eligibility": {"location": "global", "type": "experienced security researcher"},
-        "focus_areas": ["security", "pentest", "government", "enterprise"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-
-    # ── Corporate Bug Bounties ──────────────────────────────────────────────
-
-    {
-        "name": "Google Bug Hunters (Bughunters)",
-        "type": "bounty",
-        "min_amount": 100,
-        "max_amount": 150000,
-        "description": "Google's bug bounty covers all Google products — Android, Chrome, Gmail, GCP, YouTube, and more. $150k for critical Android vulnerabilities. Total $50M+ paid. Most prestigious security program.",
-        "url": "https://bughunters.google.com",
-        "category": "corporate",
-        "tags": ["google", "android", "chrome", "GCP", "prestige", "high-payout", "VRSP"],
-        "eligibility": {"location": "global", "type": "any security researcher"},
-        "focus_areas": ["security", "android", "web-vulnerabilities", "cloud"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Microsoft Bug Bounty Program",
-        "type": "bounty",
-        "min_amount": 500,
-        "max_amount": 250000,
-        "description": "Microsoft pays up to $250k for Azure and Windows vulnerabilities. Programs cover Azure, Microsoft 365, Xbox, Edge, Hyper-V, and more. $250k is among the highest corporate payouts.",
-        "url": "https://www.microsoft.com/en-us/msrc/bounty",
-        "category": "corporate",
-        "tags": ["microsoft", "azure", "windows", "office", "xbox", "high-payout", "cloud"],
-        "eligibility": {"location": "global", "type": "any security researcher"},
-        "focus_areas": ["security", "cloud", "operating-systems", "enterprise"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Meta Bug Bounty Program",
-        "type": "bounty",
-        "min_amount": 500,
-        "max_amount": 300000,
-        "description": "Meta (Facebook/Instagram/WhatsApp) bug bounty program. $300k for critical vulnerabilities. Also covers Oculus/VR and Llama AI models. $16M+ paid to researchers since 2011.",
-        "url": "https://www.facebook.com/whitehat",
-        "category": "corporate",
-        "tags": ["meta", "facebook", "instagram", "whatsapp", "VR", "AI", "social-media"],
-        "eligibility": {"location": "global", "type": "any security researcher"},
-        "focus_areas": ["security", "social-media", "VR", "AI", "mobile"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Apple Security Research Device Program",
-        "type": "bounty",
-        "min_amount": 5000,
-        "max_amount": 1000000,
-        "description": "Apple pays up to $1M for critical iOS/macOS vulnerabilities — the highest corporate bug bounty in the world. Also provides special research iPhones to top researchers. Extremely prestigious.",
-        "url": "https://security.apple.com/bounty/",
-        "category": "corporate",
-        "tags": ["apple", "iOS", "macOS", "highest-payout", "prestige", "security-device"],
-        "eligibility": {"location": "global", "type": "experienced security researcher"},
-        "focus_areas": ["security", "mobile", "operating-systems", "cryptography"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Mozilla Bug Bounty",
-        "type": "bounty",
-        "min_amount": 500,
-        "max_amount": 15000,
-        "description": "Mozilla pays for security vulnerabilities in Firefox, Thunderbird, and Mozilla web services. Critical browser vulnerabilities earn up to $15k. Great for web security researchers.",
-        "url": "https://www.mozilla.org/en-US/security/bug-bounty/",
-        "category": "nonprofit",
-        "tags": ["mozilla", "firefox", "browser", "web-security", "privacy", "open-source"],
-        "eligibility": {"location": "global", "type": "any security researcher"},
-        "focus_areas": ["security", "browser", "web-vulnerabilities", "privacy"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Cloudflare Bug Bounty",
-        "type": "bounty",
-        "min_amount": 200,
-        "max_amount": 100000,
-        "description": "Cloudflare's bug bounty on HackerOne covers Workers, Pages, R2, DNS, and global CDN infrastructure. Cloudflare processes 20% of all internet traffic — finding bugs here is highly impactful.",
-        "url": "https://hackerone.com/cloudflare",
-        "category": "corporate",
-        "tags": ["cloudflare", "CDN", "DNS", "workers", "edge", "infrastructure"],
-        "eligibility": {"location": "global", "type": "any security researcher"},
-        "focus_areas": ["security", "infrastructure", "networking", "edge-computing"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Coinbase Bug Bounty",
-        "type": "bounty",
-        "min_amount": 200,
-        "max_amount": 500000,
-        "description": "Coinbase pays top dollar for vulnerabilities in their exchange, wallet, and APIs. Critical bugs protecting user funds earn $500k. Very active program with fast response times.",
-        "url": "https://hackerone.com/coinbase",
-        "category": "crypto",
-        "tags": ["coinbase", "exchange", "crypto", "wallet", "API", "high-payout"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "cryptography", "web-vulnerabilities", "mobile"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Binance Bug Bounty",
-        "type": "bounty",
-        "min_amount": 500,
-        "max_amount": 1000000,
-        "description": "Binance's bug bounty program covers the world's largest crypto exchange. Up to $1M for critical vulnerabilities. Also covers BNB Chain, Trust Wallet, and Binance Academy.",
-        "url": "https://hackerone.com/binance",
-        "category": "crypto",
-        "tags": ["binance", "exchange", "BNB", "crypto", "wallet", "highest-crypto-bounty"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "cryptography", "blockchain", "web-vulnerabilities"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "OpenAI Cybersecurity Grant Program",
-        "type": "bounty",
-        "min_amount": 1000,
-        "max_amount": 25000,
-        "description": "OpenAI runs both a bug bounty (via Bugcrowd) and a cybersecurity grant program for AI safety research. Bugs in ChatGPT, API, and DALL-E earn bounties. Grants for AI security research.",
-        "url": "https://openai.com/security",
-        "category": "corporate",
-        "tags": ["OpenAI", "AI-security", "ChatGPT", "LLM", "safety", "bug-bounty", "grant"],
-        "eligibility": {"location": "global", "type": "security researcher or AI researcher"},
-        "focus_areas": ["AI", "security", "safety", "LLM", "web-vulnerabilities"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "US Department of Defense (DoD) Bug Bounty",
-        "type": "bounty",
-        "min_amount": 1000,
-        "max_amount": 50000,
-        "description": "US DoD's 'Hack the Pentagon' and related programs — first government bug bounty. Also includes Hack the Army, Hack the Air Force. Only for US citizens/residents. High prestige.",
-        "url": "https://hackerone.com/deptofdefense",
-        "category": "government",
-        "tags": ["DoD", "US-only", "pentagon", "military", "prestige", "patriotic-hacking"],
-        "eligibility": {"location": "US", "type": "US citizen or resident"},
-        "focus_areas": ["security", "infrastructure", "web-vulnerabilities", "network"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "EU Bug Bounty (FOSSA / European Commission)",
-        "type": "bounty",
-        "min_amount": 500,
-        "max_amount": 100000,
-        "description": "EU's Free and Open Source Software Audit (FOSSA) runs bug bounties on critical open source software used by EU institutions — Apache, FileZilla, VLC, PuTTY, and more.",
-        "url": "https://joinup.ec.europa.eu/collection/eu-fossa-2",
-        "category": "government",
-        "tags": ["EU", "open-source", "FOSSA", "government", "critical-infrastructure", "europe"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "open-source", "infrastructure"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "OpenSSF Alpha-Omega Security Fund",
-        "type": "bounty",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "OpenSSF Alpha-Omega pays security engineers to find and fix vulnerabilities in the most critical open source projects. Alpha targets the top 200 projects; Omega automates scanning the top 10,000.",
-        "url": "https://openssf.org/community/alpha-omega/",
-        "category": "nonprofit",
-        "tags": ["security", "open-source", "critical-infrastructure", "supply-chain", "funded-audit"],
-        "eligibility": {"location": "global", "type": "security engineer or researcher"},
-        "focus_areas": ["security", "supply-chain-security", "open-source", "cryptography"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Kraken Bug Bounty",
-        "type": "bounty",
-        "min_amount": 500,
-        "max_amount": 100000,
-        "description": "Kraken crypto exchange bug bounty program. Covers trading engine, API, mobile apps, and authentication systems. Good payout for exchange security vulnerabilities.",
-        "url": "https://kraken.com/en-us/features/security",
-        "category": "crypto",
-        "tags": ["kraken", "exchange", "crypto", "trading", "API", "security"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "cryptography", "web-vulnerabilities"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Intel Bug Bounty Program",
-        "type": "bounty",
-        "min_amount": 500,
-        "max_amount": 100000,
-        "description": "Intel pays for vulnerabilities in CPUs, firmware, chipsets, and software. Spectre/Meltdown-class bugs earn $100k+. Covers hardware security — rare and valuable expertise.",
-        "url": "https://hackerone.com/intel",
-        "category": "corporate",
-        "tags": ["intel", "hardware", "CPU", "firmware", "spectre", "meltdown", "hardware-security"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "hardware", "firmware", "cryptography"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "GitHub Security Advisories & Bug Bounty",
-        "type": "bounty",
-        "min_amount": 617,
-        "max_amount": 30000,
-        "description": "GitHub's own bug bounty program (via HackerOne) covers GitHub.com, GitHub Enterprise, GitHub Actions, Copilot, and more. $617 minimum payout. GitHub is used by 100M+ developers.",
-        "url": "https://hackerone.com/github",
-        "category": "corporate",
-        "tags": ["github", "git", "actions", "copilot", "enterprise", "developer-tools"],
-        "eligibility": {"location": "global", "type": "any security researcher"},
-        "focus_areas": ["security", "developer-tools", "web-vulnerabilities", "CI/CD"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Ethereum Bug Bounty Program",
-        "type": "bounty",
-        "min_amount": 2000,
-        "max_amount": 250000,
-        "description": "Ethereum Foundation pays for vulnerabilities in the Ethereum protocol, clients (Geth, Lighthouse), and core smart contracts. Critical consensus bugs can earn $250k. Most prestigious crypto security bounty.",
-        "url": "https://ethereum.org/en/bug-bounty/",
-        "category": "crypto",
-        "tags": ["ethereum", "ETH", "protocol", "consensus", "geth", "lighthouse", "security"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "cryptography", "blockchain", "smart-contracts"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Solana Bug Bounty Program",
-        "type": "bounty",
-        "min_amount": 1000,
-        "max_amount": 1000000,
-        "description": "Solana Foundation's bug bounty (via Immunefi) offers up to $1M for critical protocol vulnerabilities. Covers the Solana runtime, validator client, and core smart contracts. One of the highest crypto bug bounties.",
-        "url": "https://immunefi.com/bounty/solana/",
-        "category": "crypto",
-        "tags": ["solana", "SOL", "protocol", "validator", "rust", "high-payout", "immunefi"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "blockchain", "cryptography", "rust"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Uniswap Bug Bounty (Immunefi)",
-        "type": "bounty",
-        "min_amount": 2000,
-        "max_amount": 2000000,
-        "description": "Uniswap offers $2M for critical smart contract vulnerabilities — the largest DeFi bug bounty. Covers Uniswap v2, v3, and v4 contracts. Bugs affecting billions in liquidity are extremely valuable.",
-        "url": "https://uniswap.org/bug-bounty",
-        "category": "crypto",
-        "tags": ["uniswap", "DeFi", "smart-contracts", "AMM", "$2M-bounty", "immunefi", "solidity"],
-        "eligibility": {"location": "global", "type": "security researcher / smart contract auditor"},
-        "focus_areas": ["security", "smart-contracts", "DeFi", "cryptography"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Open Bug Bounty (Community Platform)",
-        "type": "bounty",
-        "min_amount": 0,
-        "max_amount": 10000,
-        "description": "Free, open, and non-commercial bug bounty platform. Coordinate responsible vulnerability disclosure without legal risk. 40,000+ websites participate. Great for building security research portfolio.",
-        "url": "https://www.openbugbounty.org",
-        "category": "platform",
-        "tags": ["free", "open", "community", "disclosure", "portfolio-building", "beginner"],
-        "eligibility": {"location": "global", "type": "any security researcher"},
-        "focus_areas": ["security", "web-vulnerabilities"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Stripe Bug Bounty",
-        "type": "bounty",
-        "min_amount": 500,
-        "max_amount": 100000,
-        "description": "Stripe's bug bounty covers their payment API, dashboard, and financial infrastructure. Critical payment vulnerabilities earn $100k. Stripe processes billions in transactions — bugs here matter.",
-        "url": "https://stripe.com/docs/security",
-        "category": "corporate",
-        "tags": ["stripe", "payments", "API", "fintech", "financial", "infrastructure"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "payments", "web-vulnerabilities", "API"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Shopify Bug Bounty",
-        "type": "bounty",
-        "min_amount": 500,
-        "max_amount": 50000,
-        "description": "Shopify's bug bounty via HackerOne. Covers Shopify.com, merchant stores, payment systems, and APIs. Shopify powers $200B+ in annual commerce — security is critical.",
-        "url": "https://hackerone.com/shopify",
-        "category": "corporate",
-        "tags": ["shopify", "ecommerce", "payments", "API", "merchant", "commerce"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "ecommerce", "web-vulnerabilities", "payments"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-
-    # ── INDIA ───────────────────────────────────────────────────────────────────
-    {
-        "name": "Startup India Seed Fund",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 50000,
-        "description": "Government of India initiative providing financial assistance to startups including tech/OSS projects. Managed by DPIIT. Provides seed funding up to INR 20 lakh for proof of concept and INR 50 lakh for commercialization.",
-        "url": "https://seedfund.startupindia.gov.in",
-        "category": "government",
-        "tags": ["india", "government", "seed", "startup", "DPIIT", "tech"],
-        "eligibility": {"location": "India", "type": "DPIIT-recognized startup"},
-        "focus_areas": ["any", "technology", "software", "open-source"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "MeitY Startup Hub (MSH)",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 40000,
-        "description": "Ministry of Electronics and Information Technology's startup incubation hub. Provides grants, mentoring, and market access for technology startups in India including software and open-source initiatives.",
-        "url": "https://www.msh.gov.in",
-        "category": "government",
-        "tags": ["india", "government", "MeitY", "technology", "incubation", "software"],
-        "eligibility": {"location": "India", "type": "tech startup or developer collective"},
-        "focus_areas": ["software", "AI", "cybersecurity", "digital-infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Quarterly",
-    },
-    {
-        "name": "iDEX (Innovations for Defence Excellence)",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 150000,
-        "description": "Indian Ministry of Defence grants for innovative startups building technology solutions including software, cybersecurity, and communication systems. Ideal for OSS with defence or security applications.",
-        "url": "https://idex.gov.in",
-        "category": "government",
-        "tags": ["india", "defence", "cybersecurity", "innovation", "government"],
-        "eligibility": {"location": "India", "type": "startup or individual innovator"},
-        "focus_areas": ["cybersecurity", "communication", "AI", "software"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Kerala Startup Mission (KSUM)",
-        "type": "grant",
-        "min_amount": 2000,
-        "max_amount": 25000,
-        "description": "Kerala government's flagship startup accelerator. Offers seed grants, infrastructure, and mentoring for tech startups. One of India's most active state-level startup ecosystems.",
-        "url": "https://startupmission.kerala.gov.in",
-        "category": "government",
-        "tags": ["india", "kerala", "state-grant", "tech", "accelerator"],
-        "eligibility": {"location": "India (preference for Kerala)", "type": "startup"},
-        "focus_areas": ["software", "AI", "IoT", "fintech", "healthtech"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-
-    # ── UNITED KINGDOM ──────────────────────────────────────────────────────────
-    {
-        "name": "Innovate UK Smart Grants",
-        "type": "grant",
-        "min_amount": 25000,
-        "max_amount": 500000,
-        "description": "UK government funding for game-changing innovation and R&D projects. Open to UK businesses including software and open-source technology projects. Part of UK Research and Innovation (UKRI).",
-        "url": "https://www.ukri.org/councils/innovate-uk",
-        "category": "government",
-        "tags": ["UK", "government", "R&D", "innovation", "UKRI", "smart-grant"],
-        "eligibility": {"location": "United Kingdom", "type": "UK-registered business or org"},
-        "focus_areas": ["technology", "software", "AI", "sustainability", "digital"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Quarterly",
-    },
-    {
-        "name": "UKRI Digital Security by Design",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 1000000,
-        "description": "UK Research and Innovation programme funding projects that improve digital security and privacy by design. Ideal for open-source security libraries and frameworks.",
-        "url": "https://www.ukri.org/opportunity",
-        "category": "government",
-        "tags": ["UK", "UKRI", "security", "privacy", "digital", "research"],
-        "eligibility": {"location": "United Kingdom", "type": "UK research org or business"},
-        "focus_areas": ["cybersecurity", "privacy", "software", "infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Open UK",
-        "type": "sponsorship",
-        "min_amount": 0,
-        "max_amount": 10000,
-        "description": "UK not-for-profit championing the use of open technology (Open Source Software, Open Hardware, Open Data) in the UK. Provides awards, advocacy, and community support.",
-        "url": "https://openuk.uk",
-        "category": "foundation",
-        "tags": ["UK", "open-source", "advocacy", "community", "awards"],
-        "eligibility": {"location": "United Kingdom", "type": "open source project or maintainer"},
-        "focus_areas": ["open-source", "any"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-
-    # ── GERMANY / EU ────────────────────────────────────────────────────────────
-    {
-        "name": "Sovereign Tech Fund (Germany)",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 1000000,
-        "description": "German government-backed fund investing in critical open-source digital infrastructure. Aims to strengthen the open source ecosystem that modern digital society depends on. Similar to MOSS but EU-focused.",
-        "url": "https://sovereigntechfund.de",
-        "category": "government",
-        "tags": ["Germany", "EU", "critical-infrastructure", "open-source", "government"],
-        "eligibility": {"location": "Global (preference for EU)", "type": "open source maintainer or org"},
-        "focus_areas": ["infrastructure", "security", "cryptography", "networking", "OS"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "NLnet Foundation (Netherlands)",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 50000,
-        "description": "Dutch foundation supporting organizations and people who contribute to an open internet and open technology. Funds open-source projects improving internet privacy, security, and freedom. Part of NGI (Next Generation Internet) initiative.",
-        "url": "https://nlnet.nl/funding",
-        "category": "foundation",
-        "tags": ["Netherlands", "EU", "internet", "privacy", "security", "NGI", "open-source"],
-        "eligibility": {"location": "Global", "type": "individual or org"},
-        "focus_areas": ["internet", "privacy", "security", "decentralization", "networking"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Quarterly",
-    },
-    # ── CANADA ──────────────────────────────────────────────────────────────────
-    {
-        "name": "NRC IRAP (Canada)",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 500000,
-        "description": "National Research Council Industrial Research Assistance Program. Provides financial support to Canadian small and medium-sized businesses doing R&D including software and open-source technology.",
-        "url": "https://nrc.canada.ca/en/support-technology-innovation",
-        "category": "government",
-        "tags": ["Canada", "government", "R&D", "SME", "NRC", "IRAP"],
-        "eligibility": {"location": "Canada", "type": "Canadian business"},
-        "focus_areas": ["technology", "software", "AI", "digital"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Canada Digital Adoption Program (CDAP)",
-        "type": "grant",
-        "min_amount": 15000,
-        "max_amount": 15000,
-        "description": "Canadian government program helping businesses adopt digital technologies including open-source software. Provides up to $15,000 in grants plus interest-free loans.",
-        "url": "https://ised-isde.canada.ca/site/canada-digital-adoption-program",
-        "category": "government",
-        "tags": ["Canada", "digital-adoption", "SME", "government", "tech"],
-        "eligibility": {"location": "Canada", "type": "Canadian business"},
-        "focus_areas": ["digital", "software", "technology"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-
-    # ── AUSTRALIA ───────────────────────────────────────────────────────────────
-    {
-        "name": "CSIRO's ON Accelerate",
-        "type": "accelerator",
-        "min_amount": 20000,
-        "max_amount": 50000,
-        "description": "Australia's national science agency CSIRO accelerator program. Helps technology startups and researchers commercialize innovations including open-source software and tools.",
-        "url": "https://www.csiro.au/on",
-        "category": "accelerator",
-        "tags": ["Australia", "CSIRO", "science", "accelerator", "deep-tech"],
-        "eligibility": {"location": "Australia", "type": "startup or researcher"},
-        "focus_areas": ["technology", "AI", "software", "science"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "ARC Linkage Projects (Australia)",
-        "type": "grant",
-        "min_amount": 30000,
-        "max_amount": 350000,
-        "description": "Australian Research Council funding for collaborative research between universities and industry. Supports open-source software research and digital infrastructure projects.",
-        "url": "https://www.arc.gov.au/funding-research/funding-schemes/linkage-program/linkage-projects",
-        "category": "government",
-        "tags": ["Australia", "research", "ARC", "university", "industry-collaboration"],
-        "eligibility": {"location": "Australia", "type": "research org with industry partner"},
-        "focus_areas": ["software", "AI", "computing", "digital"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-
-    # ── SINGAPORE / ASIA ────────────────────────────────────────────────────────
-    {
-        "name": "Enterprise Development Grant (Singapore)",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Singapore government grant helping companies grow and transform. Covers technology adoption and capability development including open-source software projects. Administered by Enterprise Singapore.",
-        "url": "https://www.enterprisesg.gov.sg/financial-support/enterprise-development-grant",
-        "category": "government",
-        "tags": ["Singapore", "government", "enterprise", "technology", "Asia"],
-        "eligibility": {"location": "Singapore", "type": "Singapore-registered company"},
-        "focus_areas": ["technology", "software", "digital", "AI"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Asia Pacific Foundation of Canada - Tech Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 100000,
-        "description": "Grants supporting Canada-Asia technology partnerships and knowledge exchange. Relevant for open-source projects bridging Canadian and Asian developer communities.",
-        "url": "https://www.asiapacific.ca/grants",
-        "category": "foundation",
-        "tags": ["Asia", "Canada", "cross-border", "technology", "partnership"],
-        "eligibility": {"location": "Canada or Asia-Pacific", "type": "org or collective"},
-        "focus_areas": ["technology", "software", "digital", "community"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-
-    # ── AFRICA ──────────────────────────────────────────────────────────────────
-    {
-        "name": "African Development Bank - Digital Innovation Fund",
-        "type": "grant",
-        "min_amount": 25000,
-        "max_amount": 500000,
-        "description": "AfDB initiative supporting digital innovation in Africa including open-source software solutions for agriculture, finance, health, and education challenges.",
-        "url": "https://www.afdb.org/en/topics-and-sectors/initiatives-partnerships/digital-africa",
-        "category": "government",
-        "tags": ["Africa", "development", "digital", "AfDB", "social-impact"],
-        "eligibility": {"location": "Africa (preference)", "type": "startup, NGO, or tech org"},
-        "focus_areas": ["fintech", "healthtech", "agritech", "edtech", "digital-infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Moringa School + MEST Africa Tech Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 50000,
-        "description": "MEST Africa and Moringa School support African tech entrepreneurs and open-source developers building solutions for African markets.",
-        "url": "https://meltwater.org/mest",
-        "category": "foundation",
-        "tags": ["Africa", "tech", "entrepreneur", "community", "education"],
-        "eligibility": {"location": "Africa", "type": "startup or developer"},
-        "focus_areas": ["software", "mobile", "fintech", "edtech"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-
-    # ── USA ──────────────────────────────────────────────────────────────────────
-    {
-        "name": "NSF SBIR/STTR (USA)",
-        "type": "grant",
-        "min_amount": 250000,
-        "max_amount": 2000000,
-        "description": "National Science Foundation Small Business Innovation Research program. Phase I: up to $275K; Phase II: up to $1.8M. One of the largest US government grant programs for technology innovation including software.",
-        "url": "https://seedfund.nsf.gov",
-        "category": "government",
-        "tags": ["USA", "NSF", "government", "R&D", "SBIR", "STTR", "large"],
-        "eligibility": {"location": "USA", "type": "US small business"},
-        "focus_areas": ["technology", "software", "AI", "computing", "science"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Quarterly",
-    },
-    {
-        "name": "US Department of Energy - ARPA-E",
-        "type": "grant",
-        "min_amount": 500000,
-        "max_amount": 10000000,
-        "description": "Advanced Research Projects Agency-Energy funds transformative energy technology projects. Relevant for open-source energy simulation, grid software, and climate tech tools.",
-        "url": "https://arpa-e.energy.gov/funding",
-        "category": "government",
-        "tags": ["USA", "energy", "climate", "government", "large-grant", "ARPA-E"],
-        "eligibility": {"location": "USA", "type": "company, university, or national lab"},
-        "focus_areas": ["energy", "climate", "simulation", "software", "AI"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Knight Foundation - Technology Grants",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 500000,
-        "description": "Knight Foundation supports journalism, arts, and informed communities. Technology grants go to open-source tools that strengthen democracy, media, and community engagement.",
-        "url": "https://knightfoundation.org/grants",
-        "category": "foundation",
-        "tags": ["USA", "journalism", "democracy", "civic-tech", "media", "open-source"],
-        "eligibility": {"location": "USA (preference)", "type": "nonprofit or open source project"},
-        "focus_areas": ["civic-tech", "journalism", "media", "democracy", "community"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Omidyar Network - Tech & Society",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 2000000,
-        "description": "Omidyar Network funds technology projects that empower individuals and advance social good. Supports open-source tools for digital rights, financial access, and civic technology.",
-        "url": "https://omidyar.com/our-work",
-        "category": "foundation",
-        "tags": ["USA", "social-impact", "digital-rights", "fintech", "civic-tech", "global"],
-        "eligibility": {"location": "Global", "type": "nonprofit or social enterprise"},
-        "focus_areas": ["digital-rights", "fintech", "education", "civic-tech", "media"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
+# Kept in data/funding_sources.json (one source per line) and parsed on first
+# use, so importing this module stays cheap. FUNDING_SOURCES still works as a
+# module attribute (see __getattr__).
+FUNDING_SOURCES_PATH = os.path.join(os.path.dirname(__file__), "data", "funding_sources.json")
 
-    # ── LATIN AMERICA ───────────────────────────────────────────────────────────
-    {
-        "name": "IDB Lab - Tech Innovation (Latin America)",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 1000000,
-        "description": "Inter-American Development Bank Lab funds technology and open-source solutions addressing challenges in Latin America and the Caribbean. Focus on fintech, agritech, edtech.",
-        "url": "https://bidlab.org/en/funding",
-        "category": "government",
-        "tags": ["Latin America", "Caribbean", "IDB", "development", "tech", "fintech"],
-        "eligibility": {"location": "Latin America or Caribbean", "type": "startup, NGO, or social enterprise"},
-        "focus_areas": ["fintech", "agritech", "edtech", "digital-infrastructure", "climate"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Wayra - Telefónica Open Future (LatAm/EU)",
-        "type": "accelerator",
-        "min_amount": 50000,
-        "max_amount": 200000,
-        "description": "Telefónica's global accelerator with presence in Spain, UK, Germany, and Latin America. Supports tech startups including open-source telecom and developer tools.",
-        "url": "https://www.wayra.com",
-        "category": "accelerator",
-        "tags": ["Spain", "LatAm", "EU", "telecom", "accelerator", "global"],
-        "eligibility": {"location": "Spain, UK, Germany, LatAm", "type": "startup"},
-        "focus_areas": ["telecom", "software", "AI", "developer-tools", "IoT"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
+_funding_sources: Optional[list[dict]] = None
 
-    # ── GLOBAL PROGRAMS ─────────────────────────────────────────────────────────
-    {
-        "name": "UNDP Accelerator Labs",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 200000,
-        "description": "United Nations Development Programme Accelerator Labs network spans 91 countries. Funds open-source digital solutions for the UN Sustainable Development Goals (SDGs).",
-        "url": "https://acceleratorlabs.undp.org",
-        "category": "government",
-        "tags": ["UN", "global", "SDGs", "development", "91-countries", "social-impact"],
-        "eligibility": {"location": "Global (developing countries)", "type": "org or startup"},
-        "focus_areas": ["sustainability", "healthcare", "education", "climate", "finance", "any"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "World Bank Open Data & Tech Grants",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 500000,
-        "description": "World Bank funds open data tools, digital public goods, and open-source platforms that support development goals globally. Special focus on low-income countries.",
-        "url": "https://www.worldbank.org/en/programs/open-data-and-tech-grants",
-        "category": "government",
-        "tags": ["World Bank", "global", "open-data", "digital-public-goods", "development"],
-        "eligibility": {"location": "Global (developing countries preferred)", "type": "org or project"},
-        "focus_areas": ["open-data", "digital-infrastructure", "healthcare", "education", "finance"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "UNICEF Innovation Fund",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 100000,
-        "description": "UNICEF makes equity investments in open-source technology startups in developing countries. Focuses on blockchain, AI, extended reality, drones, and connectivity solutions for children.",
-        "url": "https://www.unicef.org/innovation/venturefund",
-        "category": "foundation",
-        "tags": ["UNICEF", "global", "children", "open-source", "blockchain", "AI", "development"],
-        "eligibility": {"location": "UNICEF programme country", "type": "startup with open-source solution"},
-        "focus_areas": ["education", "health", "AI", "blockchain", "connectivity"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Quarterly",
-    },
-    {
-        "name": "Digital Public Goods Alliance (DPGA)",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 200000,
-        "description": "DPGA promotes digital public goods — open-source software, open data, open AI models that advance UN SDGs. Recognition + funding pathways for qualifying open-source projects globally.",
-        "url": "https://digitalpublicgoods.net",
-        "category": "foundation",
-        "tags": ["global", "digital-public-goods", "SDGs", "UN", "open-source", "recognition"],
-        "eligibility": {"location": "Global", "type": "open source project"},
-        "focus_areas": ["any", "education", "health", "climate", "finance", "infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Mozilla Technology Fund (Global)",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 200000,
-        "description": "Mozilla funds open-source technology projects that advance internet health, privacy, and security. Open to projects worldwide. Thematic calls every 6-12 months.",
-        "url": "https://foundation.mozilla.org/en/what-we-fund/awards",
-        "category": "foundation",
-        "tags": ["global", "Mozilla", "privacy", "internet-health", "open-source", "security"],
-        "eligibility": {"location": "Global", "type": "individual or org"},
-        "focus_areas": ["privacy", "security", "AI", "decentralization", "accessibility"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Biannual",
-    },
-    {
-        "name": "Ford Foundation - Technology for Social Justice",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 1000000,
-        "description": "Ford Foundation funds tech projects addressing inequality and injustice. Strong support for open-source tools, digital rights infrastructure, and civic technology globally.",
-        "url": "https://www.fordfoundation.org/work/challenging-inequality",
-        "category": "foundation",
-        "tags": ["global", "social-justice", "digital-rights", "civic-tech", "inequality", "Ford"],
-        "eligibility": {"location": "Global", "type": "nonprofit or social enterprise"},
-        "focus_areas": ["digital-rights", "civic-tech", "social-justice", "media", "democracy"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Shuttleworth Foundation Fellowships",
-        "type": "fellowship",
-        "min_amount": 100000,
-        "max_amount": 500000,
-        "description": "South Africa-based foundation funding open-source, open knowledge, and social change leaders globally. Fellows receive funding + mentoring over 3 years. Very competitive, very impactful.",
-        "url": "https://shuttleworthfoundation.org/fellowships",
-        "category": "foundation",
-        "tags": ["global", "fellowship", "open-source", "open-knowledge", "social-change", "3-years"],
-        "eligibility": {"location": "Global", "type": "individual visionary"},
-        "focus_areas": ["open-source", "education", "science", "environment", "social-change"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Biannual",
-    },
-    {
-        "name": "Schmidt Futures - Tech & Society",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 5000000,
-        "description": "Schmidt Futures (Eric Schmidt's philanthropy) funds breakthrough scientific and technology projects. Supports open-source AI research, computational science tools, and digital infrastructure.",
-        "url": "https://www.schmidtfutures.com/our-work",
-        "category": "foundation",
-        "tags": ["global", "AI", "science", "large-grant", "open-source", "Schmidt"],
-        "eligibility": {"location": "Global", "type": "researcher, university, or org"},
-        "focus_areas": ["AI", "science", "computing", "climate", "health"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Wellcome Trust - Open Research",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 500000,
-        "description": "UK-based global charitable foundation funding open science and open-source research tools. Strong focus on bioinformatics, health data, and open research infrastructure.",
-        "url": "https://wellcome.org/grant-funding",
-        "category": "foundation",
-        "tags": ["global", "health", "open-science", "bioinformatics", "research", "UK"],
-        "eligibility": {"location": "Global", "type": "researcher or org"},
-        "focus_areas": ["bioinformatics", "health", "open-science", "data", "software"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Chan Zuckerberg Initiative - Open Science",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 2000000,
-        "description": "CZI's Essential Open Source for Science (EOSS) program. Funds open-source software that is essential to scientific research. Ideal for bioinformatics tools, data analysis libraries, and scientific computing.",
-        "url": "https://chanzuckerberg.com/rfa/essential-open-source-software-for-science",
-        "category": "foundation",
-        "tags": ["global", "CZI", "science", "bioinformatics", "EOSS", "open-source", "data"],
-        "eligibility": {"location": "Global", "type": "open source maintainer or team"},
-        "focus_areas": ["science", "bioinformatics", "data", "Python", "R", "scientific-computing"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Patrick J. McGovern Foundation - AI for Good",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 500000,
-        "description": "Funds open-source AI and data projects that create sustainable, inclusive digital futures. Strong focus on AI ethics, open datasets, and social impact technology.",
-        "url": "https://www.mcgovern.org/what-we-fund",
-        "category": "foundation",
-        "tags": ["global", "AI", "data", "social-impact", "ethics", "open-source"],
-        "eligibility": {"location": "Global", "type": "nonprofit or open source project"},
-        "focus_areas": ["AI", "data", "ethics", "social-impact", "digital-equity"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
 
-    # ── JAPAN / EAST ASIA ───────────────────────────────────────────────────────
-    {
-        "name": "IPA (Information-technology Promotion Agency) - Japan",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 100000,
-        "description": "Japan's government IT promotion agency provides grants for open-source software development and security research. Includes the MITOU Program for young IT creators.",
-        "url": "https://www.ipa.go.jp/en/programs/mitou",
-        "category": "government",
-        "tags": ["Japan", "government", "IPA", "MITOU", "security", "open-source"],
-        "eligibility": {"location": "Japan", "type": "individual or small team"},
-        "focus_areas": ["software", "security", "AI", "open-source"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
+def load_funding_sources() -> list[dict]:
+    """The master list, parsed once per process."""
+    global _funding_sources
+    if _funding_sources is None:
+        with open(FUNDING_SOURCES_PATH, encoding="utf-8") as f:
+            _funding_sources = json.load(f)
+    return _funding_sources
 
-    # ── MIDDLE EAST ─────────────────────────────────────────────────────────────
-    {
-        "name": "GITEX Global Innovation Program (UAE/MENA)",
-        "type": "grant",
-        "min_amount": 25000,
-        "max_amount": 250000,
-        "description": "Dubai-based GITEX Global tech innovation grants and pitch competitions for startups in MENA region. Significant funding for tech and open-source solutions.",
-        "url": "https://gitex.com/startup-innovation",
-        "category": "accelerator",
-        "tags": ["UAE", "MENA", "Dubai", "accelerator", "startup", "competition"],
-        "eligibility": {"location": "MENA region", "type": "startup"},
-        "focus_areas": ["technology", "AI", "software", "fintech", "smart-city"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
 
-    # ══════════════════════════════════════════════════════════════════════════
-    # AI / MACHINE LEARNING GRANTS
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "Hugging Face Research Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "Hugging Face funds open-source AI/ML projects, model development, datasets, and tooling. Priority for projects using the HF ecosystem.",
-        "url": "https://huggingface.co/docs/hub/grants",
-        "category": "corporate",
-        "tags": ["huggingface", "AI", "NLP", "transformers", "LLM", "open-source-AI", "datasets"],
-        "eligibility": {"location": "global", "type": "researcher or developer"},
-        "focus_areas": ["AI", "machine-learning", "NLP", "datasets", "model-development"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "OpenAI Researcher Access Program",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 50000,
-        "description": "OpenAI provides API credits and research grants for AI safety tools, interpretability research, and beneficial AI applications.",
-        "url": "https://openai.com/researcher-access-program",
-        "category": "corporate",
-        "tags": ["openai", "GPT", "AI-safety", "interpretability", "research", "API-credits"],
-        "eligibility": {"location": "global", "type": "researcher or academic"},
-        "focus_areas": ["AI-safety", "research", "AI", "machine-learning", "interpretability"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Google TPU Research Cloud",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 500000,
-        "description": "Google provides free TPU cloud compute (equivalent to $500K+) to open source ML researchers for training large models and AI safety research.",
-        "url": "https://sites.research.google/trc/about/",
-        "category": "corporate",
-        "tags": ["google", "TPU", "compute", "ML", "deep-learning", "cloud-credits", "free"],
-        "eligibility": {"location": "global", "type": "researcher or student"},
-        "focus_areas": ["AI", "machine-learning", "deep-learning", "scientific-computing"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Anthropic Responsible Scaling Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Anthropic funds AI safety, interpretability, and alignment research. Open-source tools that help evaluate or audit large language models are prioritized.",
-        "url": "https://www.anthropic.com/research",
-        "category": "corporate",
-        "tags": ["anthropic", "Claude", "AI-safety", "alignment", "interpretability", "LLM"],
-        "eligibility": {"location": "global", "type": "researcher"},
-        "focus_areas": ["AI-safety", "alignment", "interpretability", "AI", "security"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Meta AI Research Grants (FAIR)",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 200000,
-        "description": "Meta's FAIR lab funds external researchers working on open-source AI in computer vision, NLP, and robotics. PyTorch ecosystem preferred.",
-        "url": "https://ai.meta.com/research/",
-        "category": "corporate",
-        "tags": ["meta", "FAIR", "PyTorch", "computer-vision", "NLP", "robotics", "AI"],
-        "eligibility": {"location": "global", "type": "researcher"},
-        "focus_areas": ["AI", "computer-vision", "NLP", "robotics", "machine-learning"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "AI Safety Fund (ARC / Redwood / MIRI)",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 2000000,
-        "description": "Multiple AI safety organizations (ARC Evals, Redwood Research, MIRI, CHAI) fund open-source tools for evaluating and mitigating risks from advanced AI systems.",
-        "url": "https://www.aisafetyfund.com",
-        "category": "nonprofit",
-        "tags": ["AI-safety", "alignment", "evaluation", "interpretability", "existential-risk"],
-        "eligibility": {"location": "global", "type": "researcher or team"},
-        "focus_areas": ["AI-safety", "alignment", "AI", "interpretability", "security"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Stability AI Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "Stability AI funds open-source generative AI tools, image generation research, and multimodal AI applications with openly released weights.",
-        "url": "https://stability.ai",
-        "category": "corporate",
-        "tags": ["stability-ai", "stable-diffusion", "generative-AI", "image-generation", "open-weights"],
-        "eligibility": {"location": "global", "type": "developer or researcher"},
-        "focus_areas": ["generative-AI", "computer-vision", "AI", "creative-tools"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
+def __getattr__(name: str):
+    if name == "FUNDING_SOURCES":
+        return load_funding_sources()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    # ══════════════════════════════════════════════════════════════════════════
-    # CLIMATE / SUSTAINABILITY
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "Stripe Climate Fund for OSS",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Stripe's climate initiative funds open-source carbon removal tools, climate data infrastructure, and sustainability measurement platforms.",
-        "url": "https://stripe.com/climate",
-        "category": "corporate",
-        "tags": ["climate", "carbon-removal", "sustainability", "stripe", "measurement", "open-data"],
-        "eligibility": {"location": "global", "type": "project or company"},
-        "focus_areas": ["climate", "sustainability", "data", "measurement"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Green Software Foundation Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "Linux Foundation project funding tools for measuring and reducing carbon footprint of software — energy-efficient coding practices and standards.",
-        "url": "https://greensoftware.foundation",
-        "category": "nonprofit",
-        "tags": ["green-software", "sustainability", "carbon", "energy-efficiency", "Linux-Foundation"],
-        "eligibility": {"location": "global", "type": "developer or project"},
-        "focus_areas": ["sustainability", "climate", "developer-tools", "standards"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Breakthrough Energy Ventures (Tech Grants)",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 5000000,
-        "description": "Bill Gates' Breakthrough Energy funds open-source climate tech: grid software, EV charging infrastructure, carbon accounting tools, and renewable energy optimization.",
-        "url": "https://breakthroughenergy.org",
-        "category": "nonprofit",
-        "tags": ["climate", "clean-energy", "grid", "EV", "carbon-accounting", "breakthrough"],
-        "eligibility": {"location": "global", "type": "project or company"},
-        "focus_areas": ["climate", "energy", "infrastructure", "sustainability"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "GitHub Accelerator (OSS + Climate Track)",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 20000,
-        "description": "GitHub's accelerator selects 20 OSS maintainers per cohort for $20K stipends plus mentorship. Special tracks for climate and AI projects.",
-        "url": "https://accelerator.github.com",
-        "category": "corporate",
-        "tags": ["github", "accelerator", "stipend", "mentorship", "climate", "AI", "cohort"],
-        "eligibility": {"location": "global", "type": "OSS maintainer"},
-        "focus_areas": ["any", "climate", "AI", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual cohort",
-    },
 
-    # ══════════════════════════════════════════════════════════════════════════
-    # MORE HACKATHONS (global, all regions)
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "TreeHacks (Stanford)",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 15000,
-        "description": "Stanford's premier hackathon focused on solving impactful problems. Strong track record of launching successful startups from winning projects.",
-        "url": "https://treehacks.com",
-        "category": "platform",
-        "tags": ["stanford", "hackathon", "student", "social-impact", "AI", "prizes"],
-        "eligibility": {"location": "global", "type": "student"},
-        "focus_areas": ["any", "social-impact", "AI", "health"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (February)",
-    },
-    {
-        "name": "Hack The North (UWaterloo)",
-        "type": "hackathon",
-        "min_amount": 1000,
-        "max_amount": 30000,
-        "description": "Canada's biggest hackathon at University of Waterloo. 3,000+ applications with Microsoft, Shopify, and Stripe as top sponsors.",
-        "url": "https://hackthenorth.com",
-        "category": "platform",
-        "tags": ["canada", "waterloo", "hackathon", "fintech", "systems", "large-prize"],
-        "eligibility": {"location": "global", "type": "student"},
-        "focus_areas": ["any", "fintech", "developer-tools", "AI"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (September)",
-    },
-    {
-        "name": "SpaceApps NASA Hackathon",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 5000,
-        "description": "NASA's global hackathon challenges developers to build open-source solutions using NASA's space data. Winners may receive NASA internship offers.",
-        "url": "https://www.spaceappschallenge.org",
-        "category": "government",
-        "tags": ["NASA", "space", "hackathon", "open-data", "global", "government"],
-        "eligibility": {"location": "global", "type": "any developer"},
-        "focus_areas": ["space", "data", "climate", "AI", "open-data"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (October)",
-    },
-    {
-        "name": "Junction Hackathon (Finland / Europe)",
-        "type": "hackathon",
-        "min_amount": 1000,
-        "max_amount": 20000,
-        "description": "Europe's largest hackathon in Helsinki. 1,500+ participants from 60+ countries. Nokia, Wolt, and top EU tech company sponsors.",
-        "url": "https://www.hackjunction.com",
-        "category": "platform",
-        "tags": ["europe", "finland", "hackathon", "international", "Nokia", "large"],
-        "eligibility": {"location": "global", "type": "developer or team"},
-        "focus_areas": ["any", "developer-tools", "AI", "IoT", "sustainability"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (November)",
-    },
-    {
-        "name": "Africa's Talking Hackathon",
-        "type": "hackathon",
-        "min_amount": 1000,
-        "max_amount": 20000,
-        "description": "Hackathons across Kenya, Nigeria, Ghana, and South Africa for developers building solutions using SMS, USSD, and mobile APIs for African markets.",
-        "url": "https://africastalking.com/hackathon",
-        "category": "platform",
-        "tags": ["africa", "mobile", "SMS", "USSD", "Kenya", "Nigeria", "hackathon"],
-        "eligibility": {"location": "Africa", "type": "developer or team"},
-        "focus_areas": ["mobile", "fintech", "health", "agritech", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "LabLab.ai AI Hackathons",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 50000,
-        "description": "Online AI hackathons weekly using cutting-edge APIs (GPT-4, Claude, Llama, Stable Diffusion). $50K+ in prizes per event. Best platform for building AI applications quickly.",
-        "url": "https://lablab.ai",
-        "category": "platform",
-        "tags": ["AI", "hackathon", "online", "GPT", "Claude", "LLM", "weekly", "global"],
-        "eligibility": {"location": "global", "type": "any developer"},
-        "focus_areas": ["AI", "machine-learning", "LLM", "developer-tools", "any"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Weekly events",
-    },
-    {
-        "name": "Devpost Hackathons Platform",
-        "type": "hackathon",
-        "min_amount": 100,
-        "max_amount": 1000000,
-        "description": "Devpost hosts 3,000+ virtual and in-person hackathons per year from AWS, Google, and startups. Largest hackathon platform — compete from anywhere in the world.",
-        "url": "https://devpost.com/hackathons",
-        "category": "platform",
-        "tags": ["devpost", "hackathon", "virtual", "online", "global", "AWS", "Google"],
-        "eligibility": {"location": "global", "type": "any developer"},
-        "focus_areas": ["any", "AI", "developer-tools", "web", "mobile"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Continuous (multiple weekly)",
-    },
-    {
-        "name": "DoraHacks Global Hackathon Platform",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 500000,
-        "description": "World's largest hackathon organizer with events in 50+ countries. Hosts both web3 and general tech hackathons. Integrated BUIDL platform for ongoing projects.",
-        "url": "https://dorahacks.io",
-        "category": "platform",
-        "tags": ["dorahacks", "hackathon", "global", "web3", "BUIDL", "large-scale"],
-        "eligibility": {"location": "global", "type": "developer or team"},
-        "focus_areas": ["any", "web3", "AI", "developer-tools", "public-goods"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Continuous",
-    },
-    {
-        "name": "Pragma Hackathon (IIT Bombay)",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 10000,
-        "description": "India's technical hackathon run by IIT Bombay students. Strong open-source culture with prizes across systems, AI, web3, and security tracks.",
-        "url": "https://pragmaticats.com",
-        "category": "platform",
-        "tags": ["india", "IIT-Bombay", "hackathon", "systems", "AI", "student"],
-        "eligibility": {"location": "India and global", "type": "student"},
-        "focus_areas": ["any", "systems", "AI", "web3", "security"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "HackHarvard",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 10000,
-        "description": "Harvard's annual hackathon focused on social good. Known for diverse sponsor prizes across healthcare, education, and civic tech.",
-        "url": "https://hackharvard.io",
-        "category": "platform",
-        "tags": ["harvard", "hackathon", "student", "social-good", "Boston"],
-        "eligibility": {"location": "global", "type": "student"},
-        "focus_areas": ["social-impact", "health", "education", "civic-tech"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (October)",
-    },
-    {
-        "name": "PennApps (UPenn Hackathon)",
-        "type": "hackathon",
-        "min_amount": 500,
-        "max_amount": 20000,
-        "description": "University of Pennsylvania's collegiate hackathon — one of the oldest in the world. 1,500+ hackers, major sponsor prizes, and strong alumni network.",
-        "url": "https://pennapps.com",
-        "category": "platform",
-        "tags": ["UPenn", "hackathon", "student", "collegiate", "prizes"],
-        "eligibility": {"location": "global", "type": "student"},
-        "focus_areas": ["any", "developer-tools", "AI", "mobile"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual (September)",
-    },
+# Columns the seed list owns; everything else (id) is left to the database
+_SEED_FIELDS = (
+    "name", "type", "min_amount", "max_amount", "description", "url", "category",
+    "tags", "eligibility", "focus_areas", "is_recurring", "application_required", "deadline",
+)
 
-    # ══════════════════════════════════════════════════════════════════════════
-    # BUG BOUNTIES — Expanded
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "HackerOne Bug Bounty Programs",
-        "type": "grant",
-        "min_amount": 100,
-        "max_amount": 2000000,
-        "description": "HackerOne hosts 3,000+ bug bounty programs from Uber, Twitter/X, PayPal, and government agencies. Security researchers can earn $100–$2M per vulnerability. Largest platform.",
-        "url": "https://hackerone.com/bug-bounty-programs",
-        "category": "platform",
-        "tags": ["bug-bounty", "security", "HackerOne", "white-hat", "vulnerability", "hacking", "CVE"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "cryptography", "web", "mobile", "infrastructure"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Bugcrowd Bug Bounties",
-        "type": "grant",
-        "min_amount": 50,
-        "max_amount": 500000,
-        "description": "Bugcrowd manages crowd-sourced security testing for 1,000+ companies. Earn per valid bug. Specialties in IoT security, automotive, and financial services.",
-        "url": "https://bugcrowd.com/programs",
-        "category": "platform",
-        "tags": ["bugcrowd", "bug-bounty", "crowd-security", "IoT", "fintech", "automotive"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "IoT", "fintech", "web", "mobile"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Microsoft Bug Bounty",
-        "type": "grant",
-        "min_amount": 500,
-        "max_amount": 250000,
-        "description": "Microsoft pays for critical vulnerabilities in Windows, Azure, Office 365, Xbox, and Edge. Azure cloud bugs can reach $250K.",
-        "url": "https://www.microsoft.com/en-us/msrc/bounty",
-        "category": "corporate",
-        "tags": ["microsoft", "bug-bounty", "Windows", "Azure", "Office", "security", "CVE"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "cloud", "operating-systems", "web"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Meta Bug Bounty",
-        "type": "grant",
-        "min_amount": 500,
-        "max_amount": 1000000,
-        "description": "Meta pays for bugs in Facebook, Instagram, WhatsApp, Messenger, Oculus, and AI infrastructure. Over $16M paid to researchers since launch.",
-        "url": "https://www.facebook.com/whitehat",
-        "category": "corporate",
-        "tags": ["meta", "facebook", "instagram", "whatsapp", "bug-bounty", "security", "VR"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "mobile", "web", "AI", "VR"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Ethereum Protocol Bug Bounty",
-        "type": "grant",
-        "min_amount": 2000,
-        "max_amount": 250000,
-        "description": "Ethereum Foundation bug bounty for core protocol (go-ethereum, Prysm, Lighthouse). Critical consensus bugs earn $250K. Covers execution and consensus layers.",
-        "url": "https://ethereum.org/en/bug-bounty/",
-        "category": "crypto",
-        "tags": ["ethereum", "bug-bounty", "consensus", "protocol", "go-ethereum", "security"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "blockchain", "cryptography", "protocol"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "US DoD Hack the Pentagon Bounty",
-        "type": "grant",
-        "min_amount": 100,
-        "max_amount": 150000,
-        "description": "US Department of Defense Vulnerability Disclosure Program. Legal protection guaranteed for good-faith researchers. Covers Pentagon, Air Force, and other DoD systems.",
-        "url": "https://hackerone.com/deptofdefense",
-        "category": "government",
-        "tags": ["US-government", "DoD", "Pentagon", "bug-bounty", "security", "VDP", "federal"],
-        "eligibility": {"location": "USA + allies", "type": "security researcher"},
-        "focus_areas": ["security", "infrastructure", "web", "network"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Intigriti Bug Bounty (EU Focus)",
-        "type": "grant",
-        "min_amount": 100,
-        "max_amount": 200000,
-        "description": "Europe's leading bug bounty platform with 200+ programs including ING Bank, Proximus, and EU government agencies. GDPR-compliant with strong EU focus.",
-        "url": "https://www.intigriti.com/programs",
-        "category": "platform",
-        "tags": ["intigriti", "EU", "bug-bounty", "europe", "banking", "government", "GDPR"],
-        "eligibility": {"location": "global", "type": "security researcher"},
-        "focus_areas": ["security", "fintech", "web", "mobile"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
 
-    # ══════════════════════════════════════════════════════════════════════════
-    # AFRICA & LATAM GRANTS
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "Orange Corners (Netherlands / Africa / MENA)",
-        "type": "grant",
-        "min_amount": 15000,
-        "max_amount": 100000,
-        "description": "Dutch government-backed program supporting tech startups in Africa and MENA. Open-source projects with social impact in Ghana, Nigeria, Egypt prioritized.",
-        "url": "https://orangecorners.com",
-        "category": "government",
-        "tags": ["netherlands", "africa", "MENA", "social-impact", "startup", "government"],
-        "eligibility": {"location": "Africa, MENA", "type": "startup or project"},
-        "focus_areas": ["social-impact", "fintech", "health", "agritech", "technology"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Google for Startups Africa",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 350000,
-        "description": "Google's Africa-focused program with cloud credits, mentorship, and equity-free funding for tech startups and OSS projects across Sub-Saharan Africa.",
-        "url": "https://startup.google.com/programs/black-founders-fund/africa/",
-        "category": "corporate",
-        "tags": ["google", "africa", "startup", "cloud-credits", "mentorship", "equity-free"],
-        "eligibility": {"location": "Africa", "type": "startup or developer"},
-        "focus_areas": ["any", "AI", "fintech", "health", "education"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual cohort",
-    },
-    {
-        "name": "iHub Research Grants (Kenya)",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 50000,
-        "description": "Nairobi's iHub funds open-source tech projects for African challenges in fintech, health, and civic tech. One of Africa's oldest and most respected tech hubs.",
-        "url": "https://ihub.co.ke",
-        "category": "nonprofit",
-        "tags": ["kenya", "nairobi", "africa", "open-source", "fintech", "civic-tech", "health"],
-        "eligibility": {"location": "East Africa", "type": "developer or team"},
-        "focus_areas": ["fintech", "health", "civic-tech", "mobile", "education"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "IADB Digital Innovation Grants (LATAM)",
-        "type": "grant",
-        "min_amount": 25000,
-        "max_amount": 500000,
-        "description": "Inter-American Development Bank funds open-source digital public goods across Latin America — civic tech, health information systems, and government transparency tools.",
-        "url": "https://www.iadb.org/en/digital-innovation",
-        "category": "government",
-        "tags": ["LATAM", "latin-america", "IADB", "civic-tech", "public-goods", "government"],
-        "eligibility": {"location": "Latin America and Caribbean", "type": "project or NGO"},
-        "focus_areas": ["civic-tech", "health", "education", "government", "public-goods"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Codeando México Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 50000,
-        "description": "Funds open-source civic technology for Mexican government transparency, open data portals, and citizen engagement platforms.",
-        "url": "https://www.codeandomexico.org",
-        "category": "nonprofit",
-        "tags": ["mexico", "civic-tech", "open-data", "government-transparency", "LATAM"],
-        "eligibility": {"location": "Mexico and LATAM", "type": "developer or team"},
-        "focus_areas": ["civic-tech", "government", "open-data", "education"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "CTIC Dakar Tech Hub (West Africa)",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 30000,
-        "description": "Senegal-based CTIC funds tech projects across Francophone West Africa (Senegal, Côte d'Ivoire, Mali). Focus on mobile apps, fintech, and agricultural technology.",
-        "url": "https://cticsenegal.com",
-        "category": "nonprofit",
-        "tags": ["senegal", "west-africa", "francophone", "mobile", "fintech", "agritech"],
-        "eligibility": {"location": "West Africa", "type": "developer or team"},
-        "focus_areas": ["fintech", "agritech", "mobile", "education"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
+def _content_hash(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
 
-    # ══════════════════════════════════════════════════════════════════════════
-    # ASIA-PACIFIC (expanded)
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "NAVER D2SF (South Korea)",
-        "type": "grant",
-        "min_amount": 30000,
-        "max_amount": 300000,
-        "description": "South Korea's NAVER (equivalent of Google in Korea) funds open-source developer tools, AI/ML infrastructure, and developer ecosystem projects.",
-        "url": "https://d2startup.com",
-        "category": "corporate",
-        "tags": ["korea", "NAVER", "AI", "developer-tools", "open-source", "Asia"],
-        "eligibility": {"location": "South Korea, Asia", "type": "startup or developer"},
-        "focus_areas": ["AI", "developer-tools", "infrastructure", "NLP"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "DATA61 / CSIRO Grants (Australia)",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 500000,
-        "description": "Australia's national science agency CSIRO funds open-source research in AI, data privacy, cybersecurity, and digital infrastructure. Partner with Australian universities.",
-        "url": "https://www.csiro.au/en/research/technology-space/data61",
-        "category": "government",
-        "tags": ["australia", "CSIRO", "Data61", "AI", "cybersecurity", "privacy", "research"],
-        "eligibility": {"location": "Australia", "type": "researcher or project"},
-        "focus_areas": ["AI", "security", "privacy", "data-science", "infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Singapore NRF Open Innovation Platform",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 1000000,
-        "description": "Singapore's National Research Foundation funds deep-tech open-source projects in AI, smart city tech, and digital infrastructure. Gateway to ASEAN market.",
-        "url": "https://www.nrf.gov.sg",
-        "category": "government",
-        "tags": ["singapore", "ASEAN", "AI", "smart-city", "deep-tech", "government"],
-        "eligibility": {"location": "Singapore", "type": "company or research institution"},
-        "focus_areas": ["AI", "smart-city", "infrastructure", "sustainability"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "ADB Digital Innovation Grants (Asia)",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 1000000,
-        "description": "Asian Development Bank funds open-source digital solutions for developing Asia — financial inclusion, health information systems, and civic tech for Southeast Asia and South Asia.",
-        "url": "https://www.adb.org/what-we-do/digital/main",
-        "category": "government",
-        "tags": ["ADB", "Asia", "financial-inclusion", "health", "civic-tech", "development"],
-        "eligibility": {"location": "Asia-Pacific", "type": "project or NGO"},
-        "focus_areas": ["fintech", "health", "civic-tech", "education", "infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
 
-    # ══════════════════════════════════════════════════════════════════════════
-    # EDUCATION & ACCESSIBILITY
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "Gates Foundation Grand Challenges",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 2000000,
-        "description": "Bill & Melinda Gates Foundation funds open-source solutions to global development: agriculture, health, financial inclusion. Software for low-resource environments prioritized.",
-        "url": "https://gcgh.grandchallenges.org",
-        "category": "nonprofit",
-        "tags": ["Gates", "global-health", "agriculture", "education", "financial-inclusion", "development"],
-        "eligibility": {"location": "global", "type": "researcher or project"},
-        "focus_areas": ["health", "education", "agriculture", "financial-inclusion"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Tidelift OSS Maintainer Subscriptions",
-        "type": "sponsorship",
-        "min_amount": 1000,
-        "max_amount": 50000,
-        "description": "Tidelift pays open-source maintainers to provide professional-grade guarantees for their packages. Enterprise customers pay Tidelift; maintainers get subscription income.",
-        "url": "https://tidelift.com/subscription/join",
-        "category": "platform",
-        "tags": ["tidelift", "maintainer-income", "enterprise", "subscription", "npm", "pypi", "recurring"],
-        "eligibility": {"location": "global", "type": "OSS maintainer"},
-        "focus_areas": ["any", "developer-tools", "infrastructure", "security"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "W3C Grants for the Web",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 100000,
-        "description": "W3C and the Web Monetization community fund projects using open web standards for a more equitable web. Focus on decentralized payments and web accessibility.",
-        "url": "https://www.grantsfortheweb.org",
-        "category": "nonprofit",
-        "tags": ["W3C", "web-standards", "web-monetization", "accessibility", "decentralized", "protocols"],
-        "eligibility": {"location": "global", "type": "developer or project"},
-        "focus_areas": ["web-standards", "accessibility", "decentralization", "payments"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Microsoft AI for Accessibility Fund",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "Microsoft AI for Accessibility funds open-source tools empowering people with disabilities using AI. Screen readers, AAC devices, sign language recognition tools.",
-        "url": "https://www.microsoft.com/en-us/ai/ai-for-accessibility",
-        "category": "corporate",
-        "tags": ["microsoft", "accessibility", "disability", "AI", "screen-reader", "AAC"],
-        "eligibility": {"location": "global", "type": "developer or nonprofit"},
-        "focus_areas": ["accessibility", "AI", "health", "education"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
+def _upsert(db: Session, rows: list[dict]) -> None:
+    """Insert-or-update rows by name in one statement (executemany)."""
+    dialect = db.bind.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(FundingSource)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={field: stmt.excluded[field] for field in rows[0] if field != "name"},
+        )
+        db.execute(stmt, rows)
+        return
 
-    # ══════════════════════════════════════════════════════════════════════════
-    # MORE GOVERNMENT GRANTS (global expansion)
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "NSERC Canada Research Grants",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 1000000,
-        "description": "Natural Sciences and Engineering Research Council of Canada funds open-source research software and computing infrastructure. Collaborative grants available for non-academics.",
-        "url": "https://www.nserc-crsng.gc.ca",
-        "category": "government",
-        "tags": ["canada", "research", "NSERC", "computing", "open-source", "academic"],
-        "eligibility": {"location": "Canada", "type": "researcher or company"},
-        "focus_areas": ["research", "scientific-computing", "AI", "infrastructure"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "EIC Accelerator (EU Deep-Tech Grants)",
-        "type": "grant",
-        "min_amount": 500000,
-        "max_amount": 2500000,
-        "description": "European Innovation Council provides up to €2.5M grants + €15M equity for deep-tech startups including open-source software companies. EU's top innovation program.",
-        "url": "https://eic.ec.europa.eu/eic-funding-opportunities/eic-accelerator_en",
-        "category": "government",
-        "tags": ["EU", "deep-tech", "startup", "EIC", "innovation", "europe", "large-grant"],
-        "eligibility": {"location": "EU + associated countries", "type": "startup or SME"},
-        "focus_areas": ["any", "AI", "health", "climate", "deep-tech"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "Vinnova Sweden Innovation Grants",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 2000000,
-        "description": "Sweden's government innovation agency funds open-source software, digital public infrastructure, and research. Strong support for health tech and smart mobility.",
-        "url": "https://www.vinnova.se",
-        "category": "government",
-        "tags": ["sweden", "nordic", "innovation", "health-tech", "mobility", "government"],
-        "eligibility": {"location": "Sweden", "type": "company or research org"},
-        "focus_areas": ["health", "mobility", "infrastructure", "AI"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "BIRD Foundation US-Israel R&D",
-        "type": "grant",
-        "min_amount": 500000,
-        "max_amount": 1000000,
-        "description": "US-Israel Binational Industrial R&D Foundation funds joint US-Israeli projects. Strong cybersecurity, AI, and developer tools focus due to Israel's tech ecosystem.",
-        "url": "https://www.birdf.com",
-        "category": "government",
-        "tags": ["US-Israel", "R&D", "cybersecurity", "AI", "bilateral", "government"],
-        "eligibility": {"location": "USA and Israel", "type": "company (joint US+Israel team)"},
-        "focus_areas": ["security", "AI", "developer-tools", "any"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Tec de Monterrey Innovation Grants (Mexico)",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 200000,
-        "description": "Tec de Monterrey's Innovation Hub funds tech and open-source projects in Mexico and LATAM with strong social impact, fintech, and education technology focus.",
-        "url": "https://innovacion.tec.mx",
-        "category": "nonprofit",
-        "tags": ["mexico", "LATAM", "innovation", "education-tech", "fintech", "social-impact"],
-        "eligibility": {"location": "Mexico and LATAM", "type": "startup or project"},
-        "focus_areas": ["education", "fintech", "social-impact", "AI"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Brazil FINEP Research Grants",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 2000000,
-        "description": "Brazil's FINEP (Ministry of Science) funds tech innovation and open-source research. Priority for Brazilian companies and research institutes building software infrastructure.",
-        "url": "https://www.finep.gov.br",
-        "category": "government",
-        "tags": ["brazil", "LATAM", "research", "innovation", "government", "software"],
-        "eligibility": {"location": "Brazil", "type": "company or research institution"},
-        "focus_areas": ["any", "AI", "infrastructure", "health", "agritech"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Multiple per year",
-    },
-    {
-        "name": "New Zealand Callaghan Innovation Grants",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 500000,
-        "description": "New Zealand's Callaghan Innovation provides R&D grants to tech companies including open-source software projects. Growth grants available for sustained R&D investment.",
-        "url": "https://www.callaghaninnovation.govt.nz",
-        "category": "government",
-        "tags": ["new-zealand", "Pacific", "R&D", "innovation", "government", "growth-grant"],
-        "eligibility": {"location": "New Zealand", "type": "company"},
-        "focus_areas": ["any", "AI", "developer-tools", "health", "agriculture"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "BEIS UK Ayrshire AI Safety Fund",
-        "type": "grant",
-        "min_amount": 200000,
-        "max_amount": 5000000,
-        "description": "UK Department for Science's AI Safety Institute funds research and open-source tools for AI evaluation and safety. Priority for projects supporting the Bletchley AI Safety Summit commitments.",
-        "url": "https://www.gov.uk/government/organisations/ai-safety-institute",
-        "category": "government",
-        "tags": ["UK", "AI-safety", "government", "Bletchley", "evaluation", "safety"],
-        "eligibility": {"location": "UK and global", "type": "researcher or company"},
-        "focus_areas": ["AI-safety", "AI", "research", "evaluation"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # DEVELOPER TOOLS & INFRASTRUCTURE FREE TIER PROGRAMS
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "JetBrains Open Source Sponsorship",
-        "type": "sponsorship",
-        "min_amount": 0,
-        "max_amount": 5000,
-        "description": "JetBrains provides free licenses to all its IDEs (IntelliJ, PyCharm, GoLand, WebStorm) for qualifying open-source projects. Free for all team members.",
-        "url": "https://www.jetbrains.com/community/opensource/",
-        "category": "corporate",
-        "tags": ["JetBrains", "IDE", "IntelliJ", "PyCharm", "free-license", "developer-tools"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["developer-tools", "any"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Cloudflare Workers OSS Program",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 50000,
-        "description": "Cloudflare provides free Workers, Pages, and R2 storage for open-source projects plus cash grants for projects that improve internet infrastructure.",
-        "url": "https://www.cloudflare.com/foratrust/open-source/",
-        "category": "corporate",
-        "tags": ["cloudflare", "CDN", "edge-computing", "workers", "hosting", "infrastructure"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["infrastructure", "developer-tools", "security", "networking"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "DigitalOcean Hatch Program",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 25000,
-        "description": "DigitalOcean's Hatch provides $25K in cloud credits per year to qualifying open-source projects. Simple application, fast approval, any OSS project eligible.",
-        "url": "https://www.digitalocean.com/hatch",
-        "category": "corporate",
-        "tags": ["digitalocean", "cloud", "VPS", "credits", "hosting", "kubernetes"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["infrastructure", "developer-tools", "any"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Sentry Open Source Sponsorship",
-        "type": "sponsorship",
-        "min_amount": 0,
-        "max_amount": 10000,
-        "description": "Sentry provides free error monitoring, performance tracking, and session replay for any public OSS repository. No application needed, instant setup.",
-        "url": "https://sentry.io/for/open-source/",
-        "category": "corporate",
-        "tags": ["sentry", "error-monitoring", "debugging", "observability", "developer-tools", "free"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["developer-tools", "any"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # FOUNDATION / NONPROFIT (more)
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "Hewlett Foundation Open Knowledge Grants",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 3000000,
-        "description": "William and Flora Hewlett Foundation funds open educational resources, digital public goods, and open knowledge projects. One of the largest OER funders worldwide.",
-        "url": "https://hewlett.org",
-        "category": "nonprofit",
-        "tags": ["Hewlett", "OER", "education", "open-knowledge", "public-goods", "large-grant"],
-        "eligibility": {"location": "global", "type": "nonprofit or institution"},
-        "focus_areas": ["education", "open-knowledge", "public-goods", "any"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Free Software Foundation Grants",
-        "type": "grant",
-        "min_amount": 2000,
-        "max_amount": 30000,
-        "description": "FSF funds development of free software (GPL-licensed) tools. Priority for projects that replace proprietary software with freedom-respecting alternatives.",
-        "url": "https://www.fsf.org",
-        "category": "nonprofit",
-        "tags": ["FSF", "free-software", "GPL", "copyleft", "freedom", "anti-proprietary"],
-        "eligibility": {"location": "global", "type": "developer"},
-        "focus_areas": ["any", "developer-tools", "operating-systems", "privacy"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Omidyar Network Tech & Society",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 5000000,
-        "description": "Pierre Omidyar's network funds technology strengthening democracy, responsible AI, and digital public infrastructure. Major funder of fact-checking and trust & safety tools.",
-        "url": "https://omidyar.com",
-        "category": "nonprofit",
-        "tags": ["omidyar", "democracy", "AI-safety", "digital-ID", "trust-safety", "large-grant"],
-        "eligibility": {"location": "global", "type": "nonprofit or project"},
-        "focus_areas": ["democracy", "AI-safety", "civic-tech", "digital-rights"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # JAPAN
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "IPA Mitou Project (Japan)",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 60000,
-        "description": "Japan's IPA Mitou Program funds cutting-edge software projects by young developers. Open source, AI, security, and infrastructure projects all welcome. One of Japan's top tech grants.",
-        "url": "https://www.ipa.go.jp/jinzai/mitou/about.html",
-        "category": "government",
-        "tags": ["Japan", "IPA", "Mitou", "young-developers", "software", "government", "Asia"],
-        "eligibility": {"location": "Japan", "type": "developer"},
-        "focus_areas": ["any", "AI", "security", "infrastructure", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "JST PRESTO / CREST (Japan)",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 3000000,
-        "description": "Japan Science and Technology Agency funds basic research with open source output in AI, quantum, and ICT. PRESTO is for individual researchers; CREST for teams.",
-        "url": "https://www.jst.go.jp/kisoken/presto/",
-        "category": "government",
-        "tags": ["Japan", "JST", "PRESTO", "CREST", "research", "AI", "quantum", "Asia"],
-        "eligibility": {"location": "Japan", "type": "researcher"},
-        "focus_areas": ["AI", "quantum-computing", "ICT", "security", "scientific-computing"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "NEDO Open Innovation Challenge (Japan)",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 1000000,
-        "description": "Japan NEDO funds energy, robotics, and smart city open source projects via open innovation challenges. Strong focus on clean-tech and industrial IoT.",
-        "url": "https://www.nedo.go.jp",
-        "category": "government",
-        "tags": ["Japan", "NEDO", "energy", "robotics", "IoT", "clean-tech", "Asia"],
-        "eligibility": {"location": "Japan", "type": "company or researcher"},
-        "focus_areas": ["clean-energy", "robotics", "IoT", "smart-city"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # SOUTH KOREA
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "IITP Korea ICT R&D Grant",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 5000000,
-        "description": "Korea's Institute for Information and Communications Technology Planning & Evaluation funds ICT, AI, 5G, and semiconductor open source R&D projects.",
-        "url": "https://www.iitp.kr",
-        "category": "government",
-        "tags": ["Korea", "IITP", "ICT", "AI", "5G", "semiconductor", "research", "Asia"],
-        "eligibility": {"location": "South Korea", "type": "company or university"},
-        "focus_areas": ["AI", "5G", "semiconductor", "IoT", "cloud", "security"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "NIPA Korea Open Source Promotion",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Korea's National IT Industry Promotion Agency runs open source contribution grants, OSS training, and foundation programs for Korean developers.",
-        "url": "https://www.nipa.kr",
-        "category": "government",
-        "tags": ["Korea", "NIPA", "open-source", "OSS", "developer", "Asia"],
-        "eligibility": {"location": "South Korea", "type": "developer or company"},
-        "focus_areas": ["any", "developer-tools", "infrastructure"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # NORDIC COUNTRIES
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "Research Council of Norway (RCN)",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 2000000,
-        "description": "Norway's RCN funds open source digital infrastructure, AI, and climate tech. Strong focus on open science and reproducible research with open source output.",
-        "url": "https://www.forskningsradet.no",
-        "category": "government",
-        "tags": ["Norway", "RCN", "Nordic", "open-science", "AI", "climate", "research"],
-        "eligibility": {"location": "Norway", "type": "researcher or university"},
-        "focus_areas": ["AI", "climate-tech", "digital-infrastructure", "open-science"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple rounds",
-    },
-    {
-        "name": "Danish Innovation Fund (Innovationsfonden)",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 5000000,
-        "description": "Denmark's Innovation Fund supports open source research and tech projects in AI, green transition, and life sciences. Open to companies, universities, and consortia.",
-        "url": "https://innovationsfonden.dk",
-        "category": "government",
-        "tags": ["Denmark", "Danish", "Nordic", "innovation", "AI", "green-tech", "life-sciences"],
-        "eligibility": {"location": "Denmark", "type": "any"},
-        "focus_areas": ["AI", "green-tech", "life-sciences", "digital-infrastructure"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple rounds",
-    },
-    {
-        "name": "Finnish Research Academy (Suomen Akatemia)",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 3000000,
-        "description": "Finland's Academy of Finland funds open source research infrastructure, AI, quantum computing, and sustainability technology. Active supporter of open science.",
-        "url": "https://www.aka.fi",
-        "category": "government",
-        "tags": ["Finland", "Nordic", "research", "AI", "quantum", "open-science"],
-        "eligibility": {"location": "Finland", "type": "researcher or university"},
-        "focus_areas": ["AI", "quantum-computing", "sustainability", "digital-infrastructure"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # MORE EUROPE
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "NWO Netherlands Organisation for Scientific Research",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 2000000,
-        "description": "NWO funds Dutch and EU researchers with open source digital infrastructure, e-science tools, and research software engineering grants.",
-        "url": "https://www.nwo.nl",
-        "category": "government",
-        "tags": ["Netherlands", "Dutch", "NWO", "research", "e-science", "open-source"],
-        "eligibility": {"location": "Netherlands", "type": "researcher"},
-        "focus_areas": ["research-software", "digital-infrastructure", "AI", "data-science"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple rounds",
-    },
-    {
-        "name": "CDTI Spain Tech Innovation Grant",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 5000000,
-        "description": "Spain's Centre for Industrial Technological Development funds AI, cybersecurity, and digital health open source R&D for Spanish companies and researchers.",
-        "url": "https://www.cdti.es",
-        "category": "government",
-        "tags": ["Spain", "CDTI", "Spanish", "innovation", "AI", "cybersecurity", "health"],
-        "eligibility": {"location": "Spain", "type": "company or researcher"},
-        "focus_areas": ["AI", "cybersecurity", "digital-health", "IoT"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple rounds",
-    },
-    {
-        "name": "FCT Portugal — Funding for Science & Technology",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 1000000,
-        "description": "Portugal's FCT funds open source research projects in AI, data science, and digital infrastructure. Strong focus on reproducible science and open data.",
-        "url": "https://www.fct.pt",
-        "category": "government",
-        "tags": ["Portugal", "FCT", "research", "AI", "open-data", "digital"],
-        "eligibility": {"location": "Portugal", "type": "researcher or university"},
-        "focus_areas": ["AI", "data-science", "digital-infrastructure", "open-science"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "FFG Austria Research Promotion Agency",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 3000000,
-        "description": "Austria's FFG funds open source industrial research and innovation. Covers AI, cybersecurity, quantum computing, and digital infrastructure projects.",
-        "url": "https://www.ffg.at",
-        "category": "government",
-        "tags": ["Austria", "FFG", "research", "AI", "quantum", "cybersecurity", "Europe"],
-        "eligibility": {"location": "Austria", "type": "company or university"},
-        "focus_areas": ["AI", "quantum-computing", "cybersecurity", "digital-infrastructure"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple rounds",
-    },
-    {
-        "name": "Innosuisse Switzerland Innovation Agency",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 2000000,
-        "description": "Swiss innovation agency co-funds open source projects between companies and universities. Focus on AI, MedTech, clean-tech, and manufacturing.",
-        "url": "https://www.innosuisse.ch",
-        "category": "government",
-        "tags": ["Switzerland", "Swiss", "Innosuisse", "innovation", "AI", "MedTech", "clean-tech"],
-        "eligibility": {"location": "Switzerland", "type": "company + university"},
-        "focus_areas": ["AI", "clean-tech", "MedTech", "manufacturing"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "NKFIH Hungary National Research Fund",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 500000,
-        "description": "Hungary's National Research Development and Innovation Office funds AI, data science, and digital infrastructure open source projects for Hungarian researchers.",
-        "url": "https://nkfih.gov.hu",
-        "category": "government",
-        "tags": ["Hungary", "NKFIH", "research", "AI", "data-science", "Eastern-Europe"],
-        "eligibility": {"location": "Hungary", "type": "researcher or university"},
-        "focus_areas": ["AI", "data-science", "digital-infrastructure"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "NCBR Poland National Centre for Research and Development",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 3000000,
-        "description": "Poland's NCBR funds applied R&D in AI, cybersecurity, and digital economy. Supports open source development with EU co-financing.",
-        "url": "https://www.ncbr.gov.pl",
-        "category": "government",
-        "tags": ["Poland", "NCBR", "research", "AI", "cybersecurity", "Eastern-Europe"],
-        "eligibility": {"location": "Poland", "type": "company or university"},
-        "focus_areas": ["AI", "cybersecurity", "digital-economy", "IoT"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple rounds",
-    },
-    {
-        "name": "Technology Agency Czech Republic (TACR)",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 2000000,
-        "description": "Czech Technology Agency funds applied R&D with open source output. Priority for AI, cybersecurity, smart mobility, and digital industry.",
-        "url": "https://www.tacr.cz",
-        "category": "government",
-        "tags": ["Czech", "TACR", "research", "AI", "cybersecurity", "Eastern-Europe"],
-        "eligibility": {"location": "Czech Republic", "type": "company or university"},
-        "focus_areas": ["AI", "cybersecurity", "smart-mobility", "digital-industry"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple rounds",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # SOUTHEAST ASIA
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "Thailand NSTDA Open Source Grant",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Thailand's National Science and Technology Development Agency funds open source software in AI, agriculture, and health. Supports Thai developers and startups.",
-        "url": "https://www.nstda.or.th",
-        "category": "government",
-        "tags": ["Thailand", "NSTDA", "ASEAN", "AI", "AgriTech", "health", "Southeast-Asia"],
-        "eligibility": {"location": "Thailand", "type": "developer or company"},
-        "focus_areas": ["AI", "agriculture", "health", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Indonesia BRIN Research Grant",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 500000,
-        "description": "Indonesia's National Research and Innovation Agency (BRIN) funds open source tech R&D. Supports AI, IoT, and digital infrastructure for Indonesian researchers.",
-        "url": "https://www.brin.go.id",
-        "category": "government",
-        "tags": ["Indonesia", "BRIN", "ASEAN", "research", "AI", "IoT", "Southeast-Asia"],
-        "eligibility": {"location": "Indonesia", "type": "researcher"},
-        "focus_areas": ["AI", "IoT", "digital-infrastructure", "agriculture"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Philippines DOST-PCIEERD ICT Grant",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Philippines Department of Science and Technology ICT program funds open source software, AI, and digital health tools developed by Filipino developers.",
-        "url": "https://pcieerd.dost.gov.ph",
-        "category": "government",
-        "tags": ["Philippines", "DOST", "ICT", "AI", "digital-health", "Southeast-Asia"],
-        "eligibility": {"location": "Philippines", "type": "researcher or developer"},
-        "focus_areas": ["AI", "digital-health", "developer-tools", "IoT"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Malaysia MRANTI Tech Grant",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Malaysian Research Accelerator for Technology & Innovation funds deep tech, AI, and open source tools for Malaysian developers and startups.",
-        "url": "https://mranti.my",
-        "category": "government",
-        "tags": ["Malaysia", "MRANTI", "deep-tech", "AI", "startup", "Southeast-Asia"],
-        "eligibility": {"location": "Malaysia", "type": "developer or startup"},
-        "focus_areas": ["AI", "deep-tech", "digital-infrastructure", "health"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Vietnam Ministry of Science and Technology Grant",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "Vietnam MOST supports open source software development for digital transformation, AI, and e-government projects by Vietnamese developers.",
-        "url": "https://www.most.gov.vn",
-        "category": "government",
-        "tags": ["Vietnam", "MOST", "open-source", "AI", "e-government", "Southeast-Asia"],
-        "eligibility": {"location": "Vietnam", "type": "developer or researcher"},
-        "focus_areas": ["AI", "e-government", "digital-transformation"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # MIDDLE EAST
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "KACST Saudi Arabia Open Source Initiative",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 2000000,
-        "description": "Saudi Arabia's King Abdulaziz City for Science & Technology funds AI, robotics, and digital transformation open source projects under Vision 2030.",
-        "url": "https://www.kacst.edu.sa",
-        "category": "government",
-        "tags": ["Saudi-Arabia", "KACST", "Vision2030", "AI", "robotics", "Middle-East"],
-        "eligibility": {"location": "Saudi Arabia", "type": "researcher or company"},
-        "focus_areas": ["AI", "robotics", "digital-transformation", "clean-energy"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "UAE TDRA Digital Innovation Grant",
-        "type": "grant",
-        "min_amount": 50000,
-        "max_amount": 1000000,
-        "description": "UAE Telecommunications and Digital Government Regulatory Authority supports open source digital infrastructure, AI, and smart city projects under UAE Digital Economy Strategy.",
-        "url": "https://tdra.gov.ae",
-        "category": "government",
-        "tags": ["UAE", "Dubai", "TDRA", "AI", "smart-city", "digital", "Middle-East"],
-        "eligibility": {"location": "UAE", "type": "company or researcher"},
-        "focus_areas": ["AI", "smart-city", "digital-infrastructure", "IoT"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Israel Innovation Authority (IIA)",
-        "type": "grant",
-        "min_amount": 100000,
-        "max_amount": 5000000,
-        "description": "Israel Innovation Authority provides non-dilutive grants for deep tech, AI, cybersecurity, and open source projects. Up to 50% grant on R&D costs for Israeli startups and companies.",
-        "url": "https://innovationisrael.org.il",
-        "category": "government",
-        "tags": ["Israel", "IIA", "deep-tech", "AI", "cybersecurity", "startup", "Middle-East"],
-        "eligibility": {"location": "Israel", "type": "startup or company"},
-        "focus_areas": ["AI", "cybersecurity", "deep-tech", "digital-health"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Jordan INTAJ Digital Innovation Fund",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "Jordan's IT Association supports open source and digital economy projects for Jordanian developers and startups through various innovation programs.",
-        "url": "https://intaj.net",
-        "category": "government",
-        "tags": ["Jordan", "INTAJ", "digital", "startup", "developer", "Middle-East"],
-        "eligibility": {"location": "Jordan", "type": "developer or startup"},
-        "focus_areas": ["digital-economy", "AI", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # LATIN AMERICA (EXPANDED)
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "CONICET Argentina Open Science Grant",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Argentina's National Scientific and Technical Research Council funds open source research tools, scientific software, and digital infrastructure for Argentine researchers.",
-        "url": "https://www.conicet.gov.ar",
-        "category": "government",
-        "tags": ["Argentina", "CONICET", "research", "open-science", "scientific-software", "LATAM"],
-        "eligibility": {"location": "Argentina", "type": "researcher"},
-        "focus_areas": ["scientific-computing", "data-science", "open-science"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "CNPq Brazil Open Source Software Grant",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Brazil's National Council for Scientific and Technological Development funds open source software projects and research platforms developed by Brazilian researchers.",
-        "url": "https://www.gov.br/cnpq",
-        "category": "government",
-        "tags": ["Brazil", "CNPq", "research", "open-source", "scientific", "LATAM"],
-        "eligibility": {"location": "Brazil", "type": "researcher"},
-        "focus_areas": ["scientific-computing", "AI", "data-science"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "CONACYT Mexico Innovation Grant",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 1000000,
-        "description": "Mexico's National Council of Science and Technology funds AI, digital health, and open source software projects for Mexican researchers, startups and universities.",
-        "url": "https://conahcyt.mx",
-        "category": "government",
-        "tags": ["Mexico", "CONACYT", "CONAHCYT", "research", "AI", "digital-health", "LATAM"],
-        "eligibility": {"location": "Mexico", "type": "researcher or startup"},
-        "focus_areas": ["AI", "digital-health", "open-science"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Colombia MinCiencias Digital Transformation Grant",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Colombia's Ministry of Science funds open source projects in digital transformation, AI, and civic tech for Colombian developers and researchers.",
-        "url": "https://minciencias.gov.co",
-        "category": "government",
-        "tags": ["Colombia", "MinCiencias", "digital", "AI", "civic-tech", "LATAM"],
-        "eligibility": {"location": "Colombia", "type": "researcher or developer"},
-        "focus_areas": ["AI", "digital-transformation", "civic-tech"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Chile CORFO Digital Innovation Grant",
-        "type": "grant",
-        "min_amount": 20000,
-        "max_amount": 1000000,
-        "description": "Chile's Economic Development Agency co-funds open source deep tech, AI, and digital infrastructure projects for Chilean startups and companies.",
-        "url": "https://www.corfo.cl",
-        "category": "government",
-        "tags": ["Chile", "CORFO", "deep-tech", "AI", "startup", "LATAM"],
-        "eligibility": {"location": "Chile", "type": "startup or company"},
-        "focus_areas": ["AI", "deep-tech", "digital-infrastructure", "clean-energy"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Multiple rounds",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # AFRICA (EXPANDED)
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "South Africa NRF Open Source Grant",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "South Africa's National Research Foundation funds open source research software, digital infrastructure, and data science tools for South African researchers.",
-        "url": "https://www.nrf.ac.za",
-        "category": "government",
-        "tags": ["South-Africa", "NRF", "research", "open-source", "data-science", "Africa"],
-        "eligibility": {"location": "South Africa", "type": "researcher"},
-        "focus_areas": ["data-science", "scientific-computing", "digital-infrastructure"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Egypt ITIDA Technology Innovation Grant",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "Egypt's Information Technology Industry Development Agency funds AI, software, and digital transformation open source projects for Egyptian developers and startups.",
-        "url": "https://www.itida.gov.eg",
-        "category": "government",
-        "tags": ["Egypt", "ITIDA", "AI", "software", "digital", "Africa", "MENA"],
-        "eligibility": {"location": "Egypt", "type": "developer or startup"},
-        "focus_areas": ["AI", "digital-transformation", "software"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Morocco CNRST Digital Research Grant",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Morocco's National Centre for Scientific and Technical Research funds open source software tools and digital research projects for Moroccan researchers.",
-        "url": "https://www.cnrst.ma",
-        "category": "government",
-        "tags": ["Morocco", "CNRST", "research", "digital", "Africa", "MENA"],
-        "eligibility": {"location": "Morocco", "type": "researcher"},
-        "focus_areas": ["scientific-computing", "AI", "digital-infrastructure"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-    {
-        "name": "Lagos Angel Network (LAN) Africa",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 250000,
-        "description": "Lagos Angel Network backs African tech startups and open source projects building for the African market, particularly fintech, agritech, and health tech.",
-        "url": "https://lagosangelnetwork.com",
-        "category": "vc",
-        "tags": ["Nigeria", "Lagos", "Africa", "startup", "fintech", "agritech", "healthtech"],
-        "eligibility": {"location": "Africa", "type": "startup"},
-        "focus_areas": ["fintech", "agritech", "digital-health", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Merck Foundation Africa Digital Health Prize",
-        "type": "grant",
-        "min_amount": 25000,
-        "max_amount": 250000,
-        "description": "Merck Africa Foundation funds digital health tools and open source medical software for African patients and healthcare workers.",
-        "url": "https://merckfoundation.com",
-        "category": "nonprofit",
-        "tags": ["Africa", "Merck", "digital-health", "medical", "healthcare", "OSS"],
-        "eligibility": {"location": "Africa", "type": "developer or nonprofit"},
-        "focus_areas": ["digital-health", "medical", "AI"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Annual",
-    },
-
-    # ══════════════════════════════════════════════════════════════════════════
-    # GLOBAL PLATFORMS & TECH COMPANIES (ADDITIONAL)
-    # ══════════════════════════════════════════════════════════════════════════
-    {
-        "name": "AWS Open Source Credits",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 100000,
-        "description": "Amazon Web Services provides free cloud credits to open source projects, research institutions, and nonprofits. Includes compute, storage, and ML services.",
-        "url": "https://aws.amazon.com/government-education/nonprofits/",
-        "category": "corporate",
-        "tags": ["AWS", "Amazon", "cloud", "credits", "compute", "ML", "hosting"],
-        "eligibility": {"location": "global", "type": "OSS project or nonprofit"},
-        "focus_areas": ["infrastructure", "ML", "any"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Microsoft Azure for Open Source",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 150000,
-        "description": "Microsoft Azure provides free cloud credits and AI services to open source projects. Popular projects like Linux, Kubernetes, and Node.js get significant credits.",
-        "url": "https://azure.microsoft.com/en-us/free/open-source/",
-        "category": "corporate",
-        "tags": ["Microsoft", "Azure", "cloud", "credits", "AI", "open-source", "hosting"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["infrastructure", "AI", "developer-tools", "any"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Google Cloud for Open Source",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Google Cloud provides free credits to open source projects, including GCP compute, BigQuery, and Vertex AI. Used by Kubernetes, TensorFlow, and many others.",
-        "url": "https://cloud.google.com/developers/startups",
-        "category": "corporate",
-        "tags": ["Google", "GCP", "cloud", "credits", "AI", "BigQuery", "open-source"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["infrastructure", "AI", "data-science", "any"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Vercel Open Source Program",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 20000,
-        "description": "Vercel provides free hosting, CI/CD, and edge network to open source projects. Next.js, Svelte Kit, and many frameworks are hosted free on Vercel.",
-        "url": "https://vercel.com/solutions/open-source",
-        "category": "corporate",
-        "tags": ["Vercel", "hosting", "edge", "CI-CD", "frontend", "open-source", "free"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["frontend", "developer-tools", "infrastructure"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Netlify Open Source Sponsorship",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 10000,
-        "description": "Netlify sponsors open source projects with free Pro plan hosting, CI/CD pipelines, forms, and edge functions. Good for documentation sites and web tools.",
-        "url": "https://www.netlify.com/legal/open-source-policy/",
-        "category": "corporate",
-        "tags": ["Netlify", "hosting", "JAMstack", "CI-CD", "open-source", "free"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["frontend", "documentation", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Supabase OSS Grants Program",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 25000,
-        "description": "Supabase provides free database hosting, auth, and storage to open source projects. Developers building open source SaaS and tools get significant free credits.",
-        "url": "https://supabase.com/open-source",
-        "category": "corporate",
-        "tags": ["Supabase", "database", "PostgreSQL", "auth", "storage", "open-source"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["developer-tools", "infrastructure", "database"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "PlanetScale Open Source Sponsorship",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 10000,
-        "description": "PlanetScale offers free Hobby tier and discounted plans to open source projects using MySQL/Vitess. Targets developer-tool OSS projects and frameworks.",
-        "url": "https://planetscale.com",
-        "category": "corporate",
-        "tags": ["PlanetScale", "MySQL", "Vitess", "database", "open-source"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["developer-tools", "database", "infrastructure"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Algolia Open Source Program",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 50000,
-        "description": "Algolia provides free search API to open source projects. Large open source documentation sites and developer tools get free access to the $50K+/year search platform.",
-        "url": "https://www.algolia.com/for-open-source/",
-        "category": "corporate",
-        "tags": ["Algolia", "search", "API", "documentation", "open-source", "free"],
-        "eligibility": {"location": "global", "type": "OSS project"},
-        "focus_areas": ["developer-tools", "documentation", "search"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "MongoDB For Startups & OSS",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 25000,
-        "description": "MongoDB Atlas provides free cloud database credits to open source projects and startups. $25K+ Atlas credits for qualifying OSS projects using MongoDB.",
-        "url": "https://www.mongodb.com/startups",
-        "category": "corporate",
-        "tags": ["MongoDB", "Atlas", "database", "NoSQL", "cloud", "credits", "open-source"],
-        "eligibility": {"location": "global", "type": "OSS project or startup"},
-        "focus_areas": ["developer-tools", "database", "infrastructure"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Redis Labs Open Source Credits",
-        "type": "grant",
-        "min_amount": 0,
-        "max_amount": 10000,
-        "description": "Redis provides free Redis Cloud credits to open source projects. Useful for caching, pub/sub, and real-time applications built on OSS Redis.",
-        "url": "https://redis.com/redis-enterprise-cloud/redis-for-startups/",
-        "category": "corporate",
-        "tags": ["Redis", "cache", "database", "real-time", "cloud", "credits", "open-source"],
-        "eligibility": {"location": "global", "type": "OSS project or startup"},
-        "focus_areas": ["infrastructure", "developer-tools", "real-time"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Open Collective Fiscal Sponsorship",
-        "type": "sponsorship",
-        "min_amount": 0,
-        "max_amount": 500000,
-        "description": "Open Collective lets open source projects accept donations, manage finances, and apply for foundation fiscal sponsorship from 1,000+ corporate and individual sponsors.",
-        "url": "https://opencollective.com",
-        "category": "platform",
-        "tags": ["OpenCollective", "fiscal-sponsorship", "donations", "community", "crowdfunding"],
-        "eligibility": {"location": "global", "type": "any OSS project"},
-        "focus_areas": ["any"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "IssueHunt Bug Bounty Platform",
-        "type": "bounty",
-        "min_amount": 20,
-        "max_amount": 10000,
-        "description": "IssueHunt is an open source bug bounty and feature bounty platform. Companies and individuals fund GitHub issues; developers earn by fixing them.",
-        "url": "https://issuehunt.io",
-        "category": "platform",
-        "tags": ["IssueHunt", "bug-bounty", "feature-bounty", "GitHub", "issue", "developer"],
-        "eligibility": {"location": "global", "type": "developer"},
-        "focus_areas": ["any", "developer-tools", "security"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Bountysource Open Source Funding",
-        "type": "bounty",
-        "min_amount": 5,
-        "max_amount": 50000,
-        "description": "Bountysource allows anyone to put bounties on open source issues. Developers who fix the issue claim the bounty. Used by thousands of OSS projects.",
-        "url": "https://www.bountysource.com",
-        "category": "platform",
-        "tags": ["Bountysource", "bounty", "issue", "crowdfunding", "GitHub", "developer"],
-        "eligibility": {"location": "global", "type": "developer"},
-        "focus_areas": ["any"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Polar.sh Creator Funding",
-        "type": "sponsorship",
-        "min_amount": 0,
-        "max_amount": 100000,
-        "description": "Polar.sh is a modern GitHub-native monetization platform for OSS developers. Offers subscriptions, issue funding, and newsletter monetization for developers.",
-        "url": "https://polar.sh",
-        "category": "platform",
-        "tags": ["Polar", "creator", "sponsorship", "GitHub", "subscription", "monetization"],
-        "eligibility": {"location": "global", "type": "developer"},
-        "focus_areas": ["any"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Thanks.dev OSS Funding",
-        "type": "sponsorship",
-        "min_amount": 0,
-        "max_amount": 50000,
-        "description": "Thanks.dev analyzes your project's dependency graph and distributes sponsorship funds to all upstream OSS dependencies automatically. Companies fund whole ecosystems.",
-        "url": "https://thanks.dev",
-        "category": "platform",
-        "tags": ["thanks.dev", "dependency-funding", "sponsorship", "ecosystem", "automatic"],
-        "eligibility": {"location": "global", "type": "OSS developer"},
-        "focus_areas": ["any"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "StackAid Dependency Funding",
-        "type": "sponsorship",
-        "min_amount": 0,
-        "max_amount": 10000,
-        "description": "StackAid distributes sponsorship funds across an OSS project's full dependency tree. Teams pay one subscription; all dependency authors receive a share.",
-        "url": "https://stackaid.us",
-        "category": "platform",
-        "tags": ["StackAid", "dependency", "sponsorship", "funding", "ecosystem"],
-        "eligibility": {"location": "global", "type": "OSS developer"},
-        "focus_areas": ["any"],
-        "is_recurring": True,
-        "application_required": False,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Protocol Labs Research Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 500000,
-        "description": "Protocol Labs (creators of IPFS, Filecoin, libp2p) funds open source research in distributed systems, cryptography, networking, and Web3 protocols.",
-        "url": "https://protocol.ai/research",
-        "category": "crypto",
-        "tags": ["Protocol-Labs", "IPFS", "distributed-systems", "cryptography", "networking", "Web3"],
-        "eligibility": {"location": "global", "type": "researcher or developer"},
-        "focus_areas": ["distributed-systems", "cryptography", "networking", "Web3"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Electric Coin Company (Zcash) Grants",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 200000,
-        "description": "Electric Coin Company and the Zcash Foundation fund open source privacy technology, cryptography, and blockchain development through ZF grants.",
-        "url": "https://grants.zfnd.org",
-        "category": "crypto",
-        "tags": ["Zcash", "ZEC", "privacy", "cryptography", "zero-knowledge", "blockchain"],
-        "eligibility": {"location": "global", "type": "developer"},
-        "focus_areas": ["privacy", "cryptography", "zero-knowledge", "blockchain"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Interchain Foundation Cosmos Grants",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 500000,
-        "description": "The Interchain Foundation funds open source tooling, research, and education for the Cosmos ecosystem, IBC protocol, and inter-blockchain communication.",
-        "url": "https://interchain.io",
-        "category": "crypto",
-        "tags": ["Cosmos", "IBC", "interchain", "blockchain", "Tendermint", "Rust", "Go"],
-        "eligibility": {"location": "global", "type": "developer or researcher"},
-        "focus_areas": ["blockchain", "distributed-systems", "cryptography", "developer-tools"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Polkadot Treasury Grants (Web3 Foundation)",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 1000000,
-        "description": "Web3 Foundation's open grants program funds open source projects building on Polkadot, Substrate, and cross-chain infrastructure. Community-governed treasury.",
-        "url": "https://grants.web3.foundation",
-        "category": "crypto",
-        "tags": ["Polkadot", "Web3-Foundation", "Substrate", "parachain", "cross-chain", "Rust"],
-        "eligibility": {"location": "global", "type": "developer"},
-        "focus_areas": ["blockchain", "Rust", "developer-tools", "distributed-systems"],
-        "is_recurring": True,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Internet Archive Open Source Award",
-        "type": "grant",
-        "min_amount": 5000,
-        "max_amount": 50000,
-        "description": "The Internet Archive occasionally funds open source projects related to digital preservation, web archiving, and universal access to knowledge.",
-        "url": "https://archive.org",
-        "category": "nonprofit",
-        "tags": ["Internet-Archive", "preservation", "archiving", "knowledge", "FOSS"],
-        "eligibility": {"location": "global", "type": "developer or organization"},
-        "focus_areas": ["digital-preservation", "archiving", "accessibility"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-    {
-        "name": "Pineapple Fund OSS Donations",
-        "type": "grant",
-        "min_amount": 10000,
-        "max_amount": 5000000,
-        "description": "Anonymous crypto whale charity that donated $55M in Bitcoin to open source projects and charities. Occasionally revisited through Pineapple Fund alumni.",
-        "url": "https://pineapplefund.org",
-        "category": "crypto",
-        "tags": ["Bitcoin", "crypto", "donation", "charity", "OSS", "large-grant"],
-        "eligibility": {"location": "global", "type": "OSS project or nonprofit"},
-        "focus_areas": ["any"],
-        "is_recurring": False,
-        "application_required": True,
-        "deadline": "Rolling",
-    },
-]
+    # Other databases: split into bulk inserts and bulk updates
+    ids = dict(db.query(FundingSource.name, FundingSource.id).filter(FundingSource.name.in_([r["name"] for r in rows])))
+    db.bulk_insert_mappings(FundingSource, [r for r in rows if r["name"] not in ids])
+    db.bulk_update_mappings(FundingSource, [{**r, "id": ids[r["name"]]} for r in rows if r["name"] in ids])
 
 
 def seed_funding_sources(db: Session) -> None:
     """
-    Seed the funding_sources table with the master list above.
-    Safe to call repeatedly — only inserts new records (by name).
+    Sync the funding_sources table with the master list above.
+    Skipped entirely — without even parsing the list — when the data file's
+    content hash matches the one stored at the last seed; otherwise new and changed entries are upserted in bulk and
+    entries no longer in the list are deactivated. Safe to call on every boot.
     """
-    existing_names = {fs.name for fs in db.query(FundingSource.name).all()}
-
-    new_sources = []
-    for src in FUNDING_SOURCES:
-        if src["name"] not in existing_names:
-            new_sources.append(FundingSource(**src))
-
-    if new_sources:
-        db.add_all(new_sources)
-        db.commit()
-
-
-def get_all_funding_sources(db: Session) -> list[FundingSource]:
-    """Return all active funding sources."""
-    return db.query(FundingSource).filter(FundingSource.active == True).all()
+    with open(FUNDING_SOURCES_PATH, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    state = db.get(CatalogVersion, 1)
+    if state is not None and state.content_hash == digest:
+        return
+
+    sources = load_funding_sources()
+    stored = {
+        row[0]: _content_hash(dict(zip(_SEED_FIELDS, row)))
+        for row in db.query(*[getattr(FundingSource, f) for f in _SEED_FIELDS]).filter(FundingSource.active == True)
+    }
+    changed = [
+        {**{f: src.get(f) for f in _SEED_FIELDS}, "active": True}
+        for src in sources
+        if stored.get(src["name"]) != _content_hash({f: src.get(f) for f in _SEED_FIELDS})
+    ]
+    if changed:
+        _upsert(db, changed)
+
+    seeded = {src["name"] for src in sources}
+    removed = [name for name in stored if name not in seeded]
+    if removed:
+        db.query(FundingSource).filter(FundingSource.name.in_(removed)).update(
+            {FundingSource.active: False}, synchronize_session=False
+        )
+    db.commit()
+
+    if changed or removed or state is None:
+        bump_version(db)
+    state = db.get(CatalogVersion, 1)
+    if state is None:
+        state = CatalogVersion(id=1, version=0)
+        db.add(state)
+    state.content_hash = digest
+    db.commit()
+
+
+def get_all_funding_sources(db: Session) -> list[FundingRecord]:
+    """Return all active funding sources (from the in-memory catalog snapshot)."""
+    return list(get_catalog(db).active)
@@ -4,17 +4,40 @@ Fetches comprehensive repo data: stats, topics, README, contributors, commit act
 Uses httpx for async HTTP calls. Respects rate limits gracefully.
 """
 
+import asyncio
 import httpx
 import base64
 import os
 import re
 from typing import Optional
 from dotenv import load_dotenv
+import github_cache
+from github_scheduler import github_request
+from github_graphql import fetch_repos_graphql, graphql_available
 
 load_dotenv()
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
 GITHUB_API_BASE = "https://api.github.com"
+# "rest" (default) or "graphql": one GraphQL query instead of 5 REST calls (needs a token)
+GITHUB_BACKEND = os.getenv("GITHUB_BACKEND", "rest").lower()
+
+
+class GitHubTransientError(Exception):
+    """
+    GitHub failed for a reason that clears on its own (rate limiting, 5xx).
+    Unlike the ValueErrors for bad URLs / missing repos, worth retrying later.
+    """
+
+
+def _is_rate_limited(resp: httpx.Response) -> bool:
+    if resp.status_code == 429:
+        return True
+    return resp.status_code == 403 and (
+        resp.headers.get("X-RateLimit-Remaining") == "0"
+        or "Retry-After" in resp.headers
+        or "rate limit" in resp.text.lower()
+    )
 
 # Headers sent with every request
 def _headers() -> dict:
@@ -52,108 +75,166 @@ def _parse_repo_url(github_url: str) -> tuple[str, str]:
     raise ValueError(f"Cannot parse GitHub URL: {github_url}")
 
 
+async def github_get(
+    url: str,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    timeout: Optional[float] = None,
+) -> httpx.Response:
+    """
+    GET a GitHub REST URL through the token-pool scheduler with conditional caching.
+    A 304 from GitHub comes back to the caller as a 200 with the cached body.
+    The cache entry is keyed by the pool token the scheduler actually sends.
+    """
+    cached = {}
+
+    async def conditional(req_headers: dict) -> dict:
+        key = github_cache.cache_key(url, params, req_headers)
+        entry = await asyncio.to_thread(github_cache.lookup, key) if github_cache.GITHUB_CACHE_ENABLED else None
+        cached.update(key=key, entry=entry)
+        return github_cache.validators(entry)
+
+    kwargs = {"params": params, "headers": headers or _headers(), "prepare": conditional}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    resp = await github_request("GET", url, **kwargs)
+    return github_cache.resolve(cached["key"], url, resp, cached["entry"])
+
+
+# Per-call timeout (seconds) for the optional sub-resources fetched alongside the repo
+SUBRESOURCE_TIMEOUT = float(os.getenv("GITHUB_SUBRESOURCE_TIMEOUT", "10"))
+
+
+async def _fetch_topics(repo_full_name: str) -> list[str]:
+    resp = await github_get(
+        f"{GITHUB_API_BASE}/repos/{repo_full_name}/topics",
+        headers={**_headers(), "Accept": "application/vnd.github.mercy-preview+json"},
+    )
+    return resp.json().get("names", []) if resp.status_code == 200 else []
+
+
+async def _fetch_readme(repo_full_name: str) -> str:
+    """README decoded from base64, first 3k chars."""
+    resp = await github_get(f"{GITHUB_API_BASE}/repos/{repo_full_name}/readme")
+    if resp.status_code != 200:
+        return ""
+    encoded = resp.json().get("content", "")
+    readme_bytes = base64.b64decode(encoded.replace("\n", ""))
+    return readme_bytes.decode("utf-8", errors="replace")[:3000]
+
+
+async def _fetch_contributors_count(repo_full_name: str) -> int:
+    resp = await github_get(
+        f"{GITHUB_API_BASE}/repos/{repo_full_name}/contributors",
+        params={"per_page": 1, "anon": "false"},
+    )
+    if resp.status_code != 200:
+        return 0
+    # GitHub returns X-Total count only when using Link pagination
+    link_header = resp.headers.get("Link", "")
+    if 'rel="last"' in link_header:
+        # parse page number from last link
+        last_match = re.search(r"page=(\d+)>; rel=\"last\"", link_header)
+        return int(last_match.group(1)) if last_match else 1
+    return len(resp.json())
+
+
+async def _fetch_commit_frequency(repo_full_name: str) -> float:
+    """Average commits/week over the last 12 weeks of the participation stats."""
+    resp = await github_get(f"{GITHUB_API_BASE}/repos/{repo_full_name}/stats/participation")
+    if resp.status_code != 200:
+        return 0.0
+    all_weeks = resp.json().get("all", [])
+    if not all_weeks:
+        return 0.0
+    recent = all_weeks[-12:]
+    return sum(recent) / len(recent)
+
+
+async def _optional(coro, default):
+    """
+    Await a sub-resource fetch with its own timeout.
+    Any failure (timeout, network, bad payload) yields the default instead of
+    failing the whole repo fetch.
+    """
+    try:
+        return await asyncio.wait_for(coro, timeout=SUBRESOURCE_TIMEOUT)
+    except Exception:
+        return default
+
+
 async def fetch_repo_data(github_url: str) -> dict:
     """
     Fetch all relevant data for a GitHub repository.
     Returns a unified dict with repo stats, README, topics, contributors.
-    Raises ValueError for invalid URLs or httpx.HTTPStatusError for API errors.
+    Raises ValueError for invalid URLs / inaccessible repos, GitHubTransientError
+    for rate limiting and GitHub 5xx, or httpx.HTTPStatusError for other API errors.
+
+    The core repo call runs first (it decides 404/401/403); topics, README,
+    contributors and commit activity are then fetched concurrently, so the
+    total latency is roughly repo call + slowest sub-resource.
     """
     owner, repo = _parse_repo_url(github_url)
     repo_full_name = f"{owner}/{repo}"
 
-    async with httpx.AsyncClient(headers=_headers(), timeout=20.0) as client:
-        # --- Core repo info ---
-        repo_resp = await client.get(f"{GITHUB_API_BASE}/repos/{repo_full_name}")
-
-        # Handle various GitHub API errors
-        if repo_resp.status_code == 404:
-            raise ValueError(f"Repository '{repo_full_name}' not found on GitHub.")
-        elif repo_resp.status_code == 401:
-            if GITHUB_TOKEN:
-                raise ValueError("GitHub token is invalid or expired. Please check your GITHUB_TOKEN in .env")
-            else:
-                raise ValueError("GitHub API requires authentication for this operation. Add GITHUB_TOKEN to .env (optional but recommended)")
-        elif repo_resp.status_code == 403:
-            remaining = repo_resp.headers.get("X-RateLimit-Remaining", "unknown")
-            raise ValueError(f"GitHub API rate limit exceeded (remaining: {remaining}). Add a GITHUB_TOKEN in .env to increase limits from 60 to 5000 requests/hour.")
-
-        repo_resp.raise_for_status()
-        repo_data = repo_resp.json()
-
-        # --- Topics ---
-        topics_resp = await client.get(
-            f"{GITHUB_API_BASE}/repos/{repo_full_name}/topics",
-            headers={**_headers(), "Accept": "application/vnd.github.mercy-preview+json"},
-        )
-        topics = topics_resp.json().get("names", []) if topics_resp.status_code == 200 else []
-
-        # --- README (decoded from base64) ---
-        readme_text = ""
-        try:
-            readme_resp = await client.get(f"{GITHUB_API_BASE}/repos/{repo_full_name}/readme")
-            if readme_resp.status_code == 200:
-                readme_json = readme_resp.json()
-                encoded = readme_json.get("content", "")
-                readme_bytes = base64.b64decode(encoded.replace("\n", ""))
-                readme_text = readme_bytes.decode("utf-8", errors="replace")[:3000]  # first 3k chars
-        except Exception:
-            readme_text = ""
-
-        # --- Contributors count ---
-        contributors_count = 0
-        try:
-            contrib_resp = await client.get(
-                f"{GITHUB_API_BASE}/repos/{repo_full_name}/contributors",
-                params={"per_page": 1, "anon": "false"},
-            )
-            if contrib_resp.status_code == 200:
-                # GitHub returns X-Total count only when using Link pagination
-                link_header = contrib_resp.headers.get("Link", "")
-                if 'rel="last"' in link_header:
-                    # parse page number from last link
-                    last_match = re.search(r"page=(\d+)>; rel=\"last\"", link_header)
-                    contributors_count = int(last_match.group(1)) if last_match else 1
-                else:
-                    contributors_count = len(contrib_resp.json())
-        except Exception:
-            contributors_count = 0
-
-        # --- Weekly commit activity (last 52 weeks) ---
-        commit_frequency = 0.0
-        try:
-            activity_resp = await client.get(
-                f"{GITHUB_API_BASE}/repos/{repo_full_name}/stats/participation"
-            )
-            if activity_resp.status_code == 200:
-                all_weeks = activity_resp.json().get("all", [])
-                if all_weeks:
-                    # avg commits/week over last 12 weeks
-                    recent = all_weeks[-12:]
-                    commit_frequency = sum(recent) / len(recent)
-        except Exception:
-            commit_frequency = 0.0
-
-        # --- Assemble result ---
-        license_info = repo_data.get("license") or {}
-        return {
-            "github_url": github_url,
-            "repo_name": repo_data.get("full_name", repo_full_name),
-            "owner": repo_data.get("owner", {}).get("login", owner),
-            "stars": repo_data.get("stargazers_count", 0),
-            "forks": repo_data.get("forks_count", 0),
-            "watchers": repo_data.get("watchers_count", 0),
-            "open_issues": repo_data.get("open_issues_count", 0),
-            "language": repo_data.get("language"),
-            "description": repo_data.get("description", ""),
-            "topics": topics,
-            "readme_excerpt": readme_text,
-            "license_name": license_info.get("spdx_id") or license_info.get("name"),
-            "created_at_github": repo_data.get("created_at"),
-            "updated_at_github": repo_data.get("updated_at"),
-            "homepage": repo_data.get("homepage"),
-            "is_fork": repo_data.get("fork", False),
-            "has_wiki": repo_data.get("has_wiki", False),
-            "has_pages": repo_data.get("has_pages", False),
-            "contributors_count": contributors_count,
-            "commit_frequency": round(commit_frequency, 2),
-        }
+    if GITHUB_BACKEND == "graphql" and graphql_available():
+        found = await fetch_repos_graphql([repo_full_name])
+        if repo_full_name.lower() in found:
+            return {**found[repo_full_name.lower()], "github_url": github_url}
+        # Not found / refused: fall through to REST for the precise 404/401/403 message
+
+    # --- Core repo info ---
+    repo_resp = await github_get(f"{GITHUB_API_BASE}/repos/{repo_full_name}")
+
+    # Handle various GitHub API errors
+    if repo_resp.status_code == 404:
+        raise ValueError(f"Repository '{repo_full_name}' not found on GitHub.")
+    elif repo_resp.status_code == 401:
+        if GITHUB_TOKEN:
+            raise ValueError("GitHub token is invalid or expired. Please check your GITHUB_TOKEN in .env")
+        else:
+            raise ValueError("GitHub API requires authentication for this operation. Add GITHUB_TOKEN to .env (optional but recommended)")
+    elif _is_rate_limited(repo_resp):
+        remaining = repo_resp.headers.get("X-RateLimit-Remaining", "unknown")
+        raise GitHubTransientError(f"GitHub API rate limit exceeded (remaining: {remaining}). Add a GITHUB_TOKEN (or several, comma-separated, in GITHUB_TOKENS) in .env to increase limits from 60 to 5000 requests/hour per token.")
+
+    elif repo_resp.status_code == 403:
+        raise ValueError(f"GitHub refused access to '{repo_full_name}' (403).")
+    elif repo_resp.status_code >= 500:
+        raise GitHubTransientError(f"GitHub is unavailable (HTTP {repo_resp.status_code}). Try again shortly.")
+
+    repo_resp.raise_for_status()
+    repo_data = repo_resp.json()
+
+    # --- Topics, README, contributors, weekly commit activity (concurrently) ---
+    topics, readme_text, contributors_count, commit_frequency = await asyncio.gather(
+        _optional(_fetch_topics(repo_full_name), []),
+        _optional(_fetch_readme(repo_full_name), ""),
+        _optional(_fetch_contributors_count(repo_full_name), 0),
+        _optional(_fetch_commit_frequency(repo_full_name), 0.0),
+    )
+
+    # --- Assemble result ---
+    license_info = repo_data.get("license") or {}
+    return {
+        "github_url": github_url,
+        "repo_name": repo_data.get("full_name", repo_full_name),
+        "owner": repo_data.get("owner", {}).get("login", owner),
+        "stars": repo_data.get("stargazers_count", 0),
+        "forks": repo_data.get("forks_count", 0),
+        "watchers": repo_data.get("watchers_count", 0),
+        "open_issues": repo_data.get("open_issues_count", 0),
+        "language": repo_data.get("language"),
+        "description": repo_data.get("description", ""),
+        "topics": topics,
+        "readme_excerpt": readme_text,
+        "license_name": license_info.get("spdx_id") or license_info.get("name"),
+        "created_at_github": repo_data.get("created_at"),
+        "updated_at_github": repo_data.get("updated_at"),
+        "homepage": repo_data.get("homepage"),
+        "is_fork": repo_data.get("fork", False),
+        "has_wiki": repo_data.get("has_wiki", False),
+        "has_pages": repo_data.get("has_pages", False),
+        "contributors_count": contributors_count,
+        "commit_frequency": round(commit_frequency, 2),
+    }
@@ -0,0 +1,178 @@
+"""
+Conditional-request cache for GitHub REST responses.
+Stores the ETag / Last-Modified and body of every cacheable 200 response in the
+`http_cache` table. Later requests for the same URL + params + auth send
+If-None-Match / If-Modified-Since; GitHub answers 304 without charging the rate
+limit, and the cached body is served as if it were a fresh 200.
+
+Lookups run in a worker thread (github_api awaits them with asyncio.to_thread)
+and writes are queued to a single background writer thread, so the concurrent
+sub-resource fetches never block the event loop on SQLite and never contend
+with each other for its write lock. A 304 only refreshes validated_at (used for
+pruning) once per _TOUCH_INTERVAL.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
+
+import httpx
+from dotenv import load_dotenv
+
+from models import SessionLocal, HttpCacheEntry
+
+load_dotenv()
+
+GITHUB_CACHE_ENABLED = os.getenv("GITHUB_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+GITHUB_CACHE_MAX_ENTRIES = int(os.getenv("GITHUB_CACHE_MAX_ENTRIES", "20000"))
+
+# Response headers worth replaying on a 304 (pagination + content negotiation)
+_KEPT_HEADERS = ("Link", "Content-Type")
+
+# Prune the table every N stores rather than on each write
+_PRUNE_EVERY = 200
+_stores_since_prune = 0
+
+# validated_at only orders pruning, so hourly precision is plenty
+_TOUCH_INTERVAL = timedelta(hours=1)
+
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="github-cache-writer")
+
+
+def cache_key(url: str, params: Optional[dict], headers: dict) -> str:
+    """Key by URL, query params, Accept (media type changes the body) and auth identity."""
+    query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+    auth = hashlib.sha256(headers.get("Authorization", "").encode()).hexdigest()
+    raw = f"{url}?{query}|{headers.get('Accept', '')}|{auth}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def lookup(key: str) -> Optional[dict]:
+    """Return the cached entry as a plain dict, or None (blocking: call off the event loop)."""
+    if not GITHUB_CACHE_ENABLED:
+        return None
+    db = SessionLocal()
+    try:
+        entry = db.query(HttpCacheEntry).filter(HttpCacheEntry.key == key).first()
+        if not entry:
+            return None
+        return {
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "headers": entry.headers or {},
+            "body": entry.body,
+            "validated_at": entry.validated_at,
+        }
+    except Exception:
+        return None
+    finally:
+        db.close()
+
+
+def validators(entry: Optional[dict]) -> dict:
+    """Conditional request headers for a cached entry."""
+    if not entry:
+        return {}
+    h = {}
+    if entry.get("etag"):
+        h["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        h["If-Modified-Since"] = entry["last_modified"]
+    return h
+
+
+def resolve(key: str, url: str, resp: httpx.Response, entry: Optional[dict]) -> httpx.Response:
+    """
+    Turn the network response into what the caller sees:
+      304 + cached entry -> synthetic 200 carrying the cached body
+      200 with validators -> stored, returned unchanged
+      anything else       -> returned unchanged
+    """
+    if not GITHUB_CACHE_ENABLED:
+        return resp
+
+    if resp.status_code == 304 and entry:
+        validated_at = entry.get("validated_at")
+        if validated_at is None or datetime.utcnow() - validated_at >= _TOUCH_INTERVAL:
+            _writer.submit(_touch, key)
+        headers = {
+            k: v for k, v in resp.headers.items()
+            if k.lower() not in ("content-length", "content-encoding", "transfer-encoding")
+        }
+        headers.update(entry["headers"])
+        if entry.get("etag"):
+            headers["ETag"] = entry["etag"]
+        return httpx.Response(
+            200,
+            headers=headers,
+            content=entry["body"].encode("utf-8"),
+            request=resp.request,
+        )
+
+    if resp.status_code == 200 and (resp.headers.get("ETag") or resp.headers.get("Last-Modified")):
+        kept = {h: resp.headers[h] for h in _KEPT_HEADERS if h in resp.headers}
+        _writer.submit(_store, key, url, resp.headers.get("ETag"), resp.headers.get("Last-Modified"), kept, resp.text)
+    return resp
+
+
+def flush() -> None:
+    """Wait until every queued cache write has been applied."""
+    _writer.submit(lambda: None).result()
+
+
+def _store(key: str, url: str, etag: Optional[str], last_modified: Optional[str], headers: dict, body: str) -> None:
+    global _stores_since_prune
+    now = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        entry = db.query(HttpCacheEntry).filter(HttpCacheEntry.key == key).first()
+        if not entry:
+            entry = HttpCacheEntry(key=key, url=url)
+            db.add(entry)
+        entry.etag = etag
+        entry.last_modified = last_modified
+        entry.headers = headers
+        entry.body = body
+        entry.fetched_at = now
+        entry.validated_at = now
+        db.commit()
+
+        _stores_since_prune += 1
+        if _stores_since_prune >= _PRUNE_EVERY:
+            _stores_since_prune = 0
+            _prune(db)
+    except Exception:
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _touch(key: str) -> None:
+    db = SessionLocal()
+    try:
+        db.query(HttpCacheEntry).filter(HttpCacheEntry.key == key).update(
+            {HttpCacheEntry.validated_at: datetime.utcnow()}
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _prune(db) -> None:
+    """Keep the table bounded: drop the least recently validated entries."""
+    total = db.query(HttpCacheEntry).count()
+    excess = total - GITHUB_CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return
+    stale = (
+        db.query(HttpCacheEntry.key)
+        .order_by(HttpCacheEntry.validated_at.asc())
+        .limit(excess)
+        .subquery()
+    )
+    db.query(HttpCacheEntry).filter(HttpCacheEntry.key.in_(stale.select())).delete(synchronize_session=False)
+    db.commit()
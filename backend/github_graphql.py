@@ -0,0 +1,243 @@
+"""
+GitHub GraphQL batch backend.
+Fetches the same fields as github_api.fetch_repo_data (core stats, topics,
+license, README text, 12-week commit count) for many repositories in a single
+query, using one aliased `repository(...)` block per repo. One GraphQL call
+replaces 5 REST calls per repo, which is what lets org and dependency scans
+afford full-fidelity data. fetch_repo_health_graphql() is the lighter variant
+dependency scans use (stars, forks, language, license, FUNDING.yml).
+
+GitHub Pages status is not in the GraphQL schema, so repo data from this
+backend has no "has_pages" key; callers keep whatever value they already had
+rather than recording a false negative.
+
+GraphQL requires an authenticated token; graphql_available() tells callers
+whether to use it. Every reply's `rateLimit { cost remaining }` block is
+accumulated in graphql_cost_stats() and the batch size is halved automatically
+when GitHub rejects a query as too expensive or times out.
+"""
+
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from github_scheduler import github_request, token_pool
+
+load_dotenv()
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GITHUB_GRAPHQL_BATCH_SIZE = int(os.getenv("GITHUB_GRAPHQL_BATCH_SIZE", "20"))
+
+# Weeks of default-branch history used for commit_frequency (matches the REST path)
+_ACTIVITY_WEEKS = 12
+_NAME_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+_REPO_FIELDS = """
+fragment RepoFields on Repository {
+  nameWithOwner
+  url
+  owner { login }
+  description
+  homepageUrl
+  stargazerCount
+  forkCount
+  watchers { totalCount }
+  issues(states: OPEN) { totalCount }
+  pullRequests(states: OPEN) { totalCount }
+  primaryLanguage { name }
+  repositoryTopics(first: 20) { nodes { topic { name } } }
+  licenseInfo { spdxId name }
+  createdAt
+  updatedAt
+  isFork
+  hasWikiEnabled
+  mentionableUsers { totalCount }
+  readmeMd: object(expression: "HEAD:README.md") { ... on Blob { text } }
+  readmeRst: object(expression: "HEAD:README.rst") { ... on Blob { text } }
+  readmePlain: object(expression: "HEAD:README") { ... on Blob { text } }
+  defaultBranchRef {
+    target { ... on Commit { history(since: $since) { totalCount } } }
+  }
+}
+"""
+
+_HEALTH_FIELDS = """
+fragment RepoFields on Repository {
+  stargazerCount
+  forkCount
+  primaryLanguage { name }
+  licenseInfo { spdxId }
+  fundingFile: object(expression: "HEAD:.github/FUNDING.yml") { id }
+}
+"""
+
+_cost_stats = {"queries": 0, "repos": 0, "cost": 0, "remaining": None, "reset_at": None}
+
+
+def graphql_available() -> bool:
+    """GraphQL needs an authenticated token in the pool."""
+    return any(s.token for s in token_pool.states)
+
+
+def graphql_cost_stats() -> dict:
+    """Cumulative GraphQL point usage for ops/debugging."""
+    return dict(_cost_stats)
+
+
+def _build_query(full_names: list[str], fields: str, with_since: bool) -> str:
+    blocks = []
+    for i, full_name in enumerate(full_names):
+        owner, name = full_name.split("/", 1)
+        blocks.append(f"  r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ ...RepoFields }}")
+    return (
+        ("query($since: GitTimestamp!) {\n" if with_since else "query {\n")
+        + "  rateLimit { cost remaining resetAt limit }\n"
+        + "\n".join(blocks)
+        + "\n}\n"
+        + fields
+    )
+
+
+def _to_repo_data(node: dict) -> dict:
+    """Map a GraphQL repository node onto the fetch_repo_data() dict shape."""
+    readme = ""
+    for key in ("readmeMd", "readmeRst", "readmePlain"):
+        blob = node.get(key) or {}
+        if blob.get("text"):
+            readme = blob["text"][:3000]
+            break
+
+    history = (((node.get("defaultBranchRef") or {}).get("target") or {}).get("history") or {})
+    commits = history.get("totalCount", 0)
+    license_info = node.get("licenseInfo") or {}
+    full_name = node.get("nameWithOwner", "")
+
+    return {
+        "github_url": node.get("url") or f"https://github.com/{full_name}",
+        "repo_name": full_name,
+        "owner": (node.get("owner") or {}).get("login"),
+        "stars": node.get("stargazerCount", 0),
+        "forks": node.get("forkCount", 0),
+        "watchers": (node.get("watchers") or {}).get("totalCount", 0),
+        # REST open_issues_count includes open pull requests
+        "open_issues": (node.get("issues") or {}).get("totalCount", 0)
+        + (node.get("pullRequests") or {}).get("totalCount", 0),
+        "language": (node.get("primaryLanguage") or {}).get("name"),
+        "description": node.get("description") or "",
+        "topics": [n["topic"]["name"] for n in (node.get("repositoryTopics") or {}).get("nodes", [])],
+        "readme_excerpt": readme,
+        "license_name": license_info.get("spdxId") or license_info.get("name"),
+        "created_at_github": node.get("createdAt"),
+        "updated_at_github": node.get("updatedAt"),
+        "homepage": node.get("homepageUrl"),
+        "is_fork": node.get("isFork", False),
+        "has_wiki": node.get("hasWikiEnabled", False),
+        # Closest GraphQL equivalent of the REST contributors count
+        "contributors_count": (node.get("mentionableUsers") or {}).get("totalCount", 0),
+        "commit_frequency": round(commits / _ACTIVITY_WEEKS, 2),
+    }
+
+
+def _to_health(node: dict) -> dict:
+    """Map a node onto dependency_analyzer.fetch_repo_health()'s dict shape."""
+    return {
+        "stars": node.get("stargazerCount", 0),
+        "forks": node.get("forkCount", 0),
+        "language": (node.get("primaryLanguage") or {}).get("name") or "",
+        "license": (node.get("licenseInfo") or {}).get("spdxId") or "",
+        "has_sponsors": node.get("fundingFile") is not None,
+    }
+
+
+def _is_too_expensive(resp, payload: Optional[dict]) -> bool:
+    if resp.status_code in (502, 504):
+        return True
+    for err in (payload or {}).get("errors") or []:
+        msg = (err.get("message") or "").lower()
+        if err.get("type") in ("MAX_NODE_LIMIT_EXCEEDED", "RESOURCE_LIMITS_EXCEEDED") or "timeout" in msg:
+            return True
+    return False
+
+
+async def _run_batch(full_names: list[str], since: Optional[str], fields: str = _REPO_FIELDS,
+                     to_dict=_to_repo_data) -> dict[str, dict]:
+    query = _build_query(full_names, fields, with_since=since is not None)
+    resp = await github_request(
+        "POST",
+        GITHUB_GRAPHQL_URL,
+        headers={"User-Agent": "OpenSourceFundMatcher/1.0", "Content-Type": "application/json"},
+        json={"query": query, "variables": {"since": since} if since is not None else {}},
+        timeout=30.0,
+    )
+    try:
+        payload = resp.json()
+    except ValueError:
+        payload = None
+
+    if _is_too_expensive(resp, payload) and len(full_names) > 1:
+        mid = len(full_names) // 2
+        first = await _run_batch(full_names[:mid], since, fields, to_dict)
+        return {**first, **await _run_batch(full_names[mid:], since, fields, to_dict)}
+
+    if resp.status_code != 200 or not payload:
+        return {}
+
+    data = payload.get("data") or {}
+    rate = data.get("rateLimit") or {}
+    _cost_stats["queries"] += 1
+    _cost_stats["repos"] += len(full_names)
+    _cost_stats["cost"] += rate.get("cost", 0) or 0
+    if rate.get("remaining") is not None:
+        _cost_stats["remaining"] = rate["remaining"]
+        _cost_stats["reset_at"] = rate.get("resetAt")
+
+    results = {}
+    for i, full_name in enumerate(full_names):
+        node = data.get(f"r{i}")
+        if node:  # null when the repo is missing or private
+            results[full_name.lower()] = to_dict(node)
+    return results
+
+
+def _valid_names(full_names: list[str]) -> list[str]:
+    """Well-formed, de-duplicated "owner/repo" names (anything else can't be queried)."""
+    names = []
+    seen = set()
+    for full_name in full_names:
+        parts = full_name.strip().split("/")
+        if len(parts) != 2 or not all(_NAME_RE.match(p) for p in parts):
+            continue
+        if full_name.lower() not in seen:
+            seen.add(full_name.lower())
+            names.append(full_name.strip())
+    return names
+
+
+async def fetch_repos_graphql(full_names: list[str]) -> dict[str, dict]:
+    """
+    Fetch repo data for many "owner/repo" names.
+    Returns {lowercased "owner/repo": repo_data}; repos that don't exist (or that
+    GitHub refused) are simply absent so callers can fall back to REST.
+    """
+    names = _valid_names(full_names)
+    since = (datetime.utcnow() - timedelta(weeks=_ACTIVITY_WEEKS)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    results: dict[str, dict] = {}
+    for i in range(0, len(names), GITHUB_GRAPHQL_BATCH_SIZE):
+        results.update(await _run_batch(names[i : i + GITHUB_GRAPHQL_BATCH_SIZE], since))
+    return results
+
+
+async def fetch_repo_health_graphql(full_names: list[str]) -> dict[str, dict]:
+    """
+    Dependency-health fields for many "owner/repo" names, keyed like
+    fetch_repos_graphql(); missing repos are absent.
+    """
+    names = _valid_names(full_names)
+    results: dict[str, dict] = {}
+    for i in range(0, len(names), GITHUB_GRAPHQL_BATCH_SIZE):
+        results.update(await _run_batch(names[i : i + GITHUB_GRAPHQL_BATCH_SIZE], None, _HEALTH_FIELDS, _to_health))
+    return results
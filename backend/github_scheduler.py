@@ -0,0 +1,218 @@
+"""
+Rate-limit-aware GitHub request scheduler.
+Every GitHub call goes through a pool of tokens (GITHUB_TOKENS, comma-separated,
+plus GITHUB_TOKEN). For each token and rate-limit resource (core, search,
+graphql) the pool tracks X-RateLimit-Remaining / X-RateLimit-Reset from the
+responses it sees, picks the least-used token that still has budget, and holds
+requests back (instead of failing them) until a token frees up.
+
+403/429 responses caused by rate limiting are retried: Retry-After is honored,
+an exhausted primary limit moves the request to another token or waits for the
+reset, and secondary ("abuse") limits back off exponentially. When the wait
+would exceed GITHUB_RATE_LIMIT_MAX_WAIT the last response is returned as-is, so
+callers keep their existing 403 handling.
+"""
+
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+from http_client import get_http_client
+
+load_dotenv()
+
+
+def _configured_tokens() -> list[str]:
+    tokens = [t.strip() for t in os.getenv("GITHUB_TOKENS", "").split(",") if t.strip()]
+    single = os.getenv("GITHUB_TOKEN", "").strip()
+    if single and single not in tokens:
+        tokens.insert(0, single)
+    return tokens
+
+
+# Longest a request may be held back (seconds) waiting for rate-limit budget
+GITHUB_RATE_LIMIT_MAX_WAIT = float(os.getenv("GITHUB_RATE_LIMIT_MAX_WAIT", "60"))
+GITHUB_MAX_RETRIES = int(os.getenv("GITHUB_MAX_RETRIES", "3"))
+# Concurrent in-flight requests per token (GitHub flags bursts as secondary rate limiting)
+GITHUB_CONCURRENCY_PER_TOKEN = int(os.getenv("GITHUB_CONCURRENCY_PER_TOKEN", "10"))
+
+# Base delay for secondary rate limit backoff without Retry-After (GitHub asks for >= 60s,
+# but we cap at the max wait so interactive requests don't hang)
+_SECONDARY_BACKOFF_BASE = 5.0
+_POLL_INTERVAL = 0.05
+
+
+def _resource_for(url: str) -> str:
+    if "/graphql" in url:
+        return "graphql"
+    if "/search/" in url:
+        return "search"
+    return "core"
+
+
+class _TokenState:
+    """Budget bookkeeping for one token (None = unauthenticated)."""
+
+    def __init__(self, token: Optional[str]):
+        self.token = token
+        self.remaining: dict[str, int] = {}      # resource -> last known remaining
+        self.limit: dict[str, int] = {}          # resource -> last known limit
+        self.reset_at: dict[str, float] = {}     # resource -> epoch seconds
+        self.blocked_until = 0.0                 # Retry-After / secondary limit
+        self.in_flight = 0
+        self.used = 0
+
+    @property
+    def label(self) -> str:
+        return f"…{self.token[-4:]}" if self.token else "anonymous"
+
+    def available_at(self, resource: str, now: float) -> float:
+        """Epoch time when this token can take another request for `resource`."""
+        at = self.blocked_until
+        if self.remaining.get(resource, 1) <= 0:
+            at = max(at, self.reset_at.get(resource, now))
+        return at
+
+
+class TokenPool:
+    """Pool of GitHub tokens with per-resource rate-limit tracking."""
+
+    def __init__(self, tokens: list[str]):
+        self.states = [_TokenState(t) for t in tokens] or [_TokenState(None)]
+
+    async def acquire(self, resource: str, deadline: float) -> _TokenState:
+        """
+        Wait for a token with budget for `resource` and reserve one request on it.
+        Past the deadline the token that frees up soonest is returned anyway.
+        """
+        while True:
+            now = time.time()
+            ready = [
+                s for s in self.states
+                if s.available_at(resource, now) <= now and s.in_flight < GITHUB_CONCURRENCY_PER_TOKEN
+            ]
+            if ready or now >= deadline:
+                pick = min(
+                    ready or self.states,
+                    key=lambda s: (s.available_at(resource, now), s.in_flight, s.used),
+                )
+                pick.in_flight += 1
+                pick.used += 1
+                if resource in pick.remaining:
+                    pick.remaining[resource] -= 1
+                return pick
+            soonest = min(s.available_at(resource, now) for s in self.states)
+            await asyncio.sleep(min(max(soonest - now, _POLL_INTERVAL), deadline - now, 1.0))
+
+    def release(self, state: _TokenState, resp: Optional[httpx.Response], resource: str) -> None:
+        """Return the slot and record the budget GitHub reported."""
+        state.in_flight = max(0, state.in_flight - 1)
+        if resp is None:
+            return
+        h = resp.headers
+        resource = h.get("X-RateLimit-Resource", resource)
+        try:
+            if "X-RateLimit-Remaining" in h:
+                state.remaining[resource] = int(h["X-RateLimit-Remaining"])
+            if "X-RateLimit-Limit" in h:
+                state.limit[resource] = int(h["X-RateLimit-Limit"])
+            if "X-RateLimit-Reset" in h:
+                state.reset_at[resource] = float(h["X-RateLimit-Reset"])
+        except ValueError:
+            pass
+
+    def backoff(self, state: _TokenState, resp: httpx.Response, resource: str, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying a rate-limited response, or None if the
+        response is not a rate-limit error. Blocks the token for that long.
+        """
+        if resp.status_code not in (403, 429):
+            return None
+        now = time.time()
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                delay = _SECONDARY_BACKOFF_BASE
+            state.blocked_until = now + delay
+            return delay
+        if resp.headers.get("X-RateLimit-Remaining") == "0":
+            # Primary limit: this token is done until reset; another token may still have budget
+            return max(0.0, state.reset_at.get(resource, now) - now)
+        if resp.status_code == 429 or "rate limit" in resp.text.lower():
+            delay = _SECONDARY_BACKOFF_BASE * (2 ** attempt)
+            state.blocked_until = now + delay
+            return delay
+        return None
+
+    def snapshot(self) -> list[dict]:
+        """Per-token budget view for ops endpoints (tokens are masked)."""
+        now = time.time()
+        return [
+            {
+                "token": s.label,
+                "in_flight": s.in_flight,
+                "requests_sent": s.used,
+                "remaining": dict(s.remaining),
+                "limit": dict(s.limit),
+                "reset_in_seconds": {r: max(0, round(t - now)) for r, t in s.reset_at.items()},
+                "blocked_for_seconds": max(0, round(s.blocked_until - now)),
+            }
+            for s in self.states
+        ]
+
+
+token_pool = TokenPool(_configured_tokens())
+
+
+async def github_request(
+    method: str,
+    url: str,
+    headers: Optional[dict] = None,
+    prepare: Optional[Callable[[dict], Awaitable[dict]]] = None,
+    **kwargs,
+) -> httpx.Response:
+    """
+    Send a GitHub API request through the token pool.
+    The Authorization header is set from the selected token; other headers and
+    httpx kwargs (params, json, timeout) pass through unchanged. `prepare`, if
+    given, is awaited with each attempt's final headers (after the token is
+    picked) and returns extra headers for that attempt, e.g. cache validators
+    keyed by the credential actually sent.
+    """
+    resource = _resource_for(url)
+    deadline = time.time() + GITHUB_RATE_LIMIT_MAX_WAIT
+    base_headers = {k: v for k, v in (headers or {}).items() if k.lower() != "authorization"}
+
+    attempt = 0
+    while True:
+        state = await token_pool.acquire(resource, deadline)
+        req_headers = dict(base_headers)
+        if state.token:
+            req_headers["Authorization"] = f"token {state.token}"
+
+        resp = None
+        try:
+            if prepare is not None:
+                req_headers.update(await prepare(req_headers))
+            resp = await get_http_client().request(method, url, headers=req_headers, **kwargs)
+        finally:
+            token_pool.release(state, resp, resource)
+
+        delay = token_pool.backoff(state, resp, resource, attempt)
+        if delay is None or attempt >= GITHUB_MAX_RETRIES:
+            return resp
+        now = time.time()
+        others_ready = any(
+            s is not state and s.available_at(resource, now) <= now for s in token_pool.states
+        )
+        if not others_ready and now + delay > deadline:
+            return resp
+        attempt += 1
+        if not others_ready:
+            await asyncio.sleep(delay)
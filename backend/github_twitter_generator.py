@@ -6,8 +6,7 @@ Automatically extracts GitHub repo data and generates Twitter-ready posts
 import asyncio
 import os
 from datetime import datetime
-from github_api import fetch_repo_data, _parse_repo_url
-import httpx
+from github_api import fetch_repo_data, github_get, _parse_repo_url
 
 GITHUB_API_BASE = "https://api.github.com"
 
@@ -25,21 +24,20 @@ def _headers():
 
 async def get_github_user_info(username: str) -> dict:
     """Fetch GitHub user profile data"""
-    async with httpx.AsyncClient(headers=_headers(), timeout=20.0) as client:
-        resp = await client.get(f"{GITHUB_API_BASE}/users/{username}")
-        if resp.status_code == 200:
-            data = resp.json()
-            return {
-                "name": data.get("name") or username,
-                "bio": data.get("bio") or "Open Source Developer",
-                "location": data.get("location") or "",
-                "company": data.get("company") or "",
-                "followers": data.get("followers", 0),
-                "following": data.get("following", 0),
-                "public_repos": data.get("public_repos", 0),
-                "avatar_url": data.get("avatar_url"),
-                "github_url": data.get("html_url"),
-            }
+    resp = await github_get(f"{GITHUB_API_BASE}/users/{username}", headers=_headers(), timeout=20.0)
+    if resp.status_code == 200:
+        data = resp.json()
+        return {
+            "name": data.get("name") or username,
+            "bio": data.get("bio") or "Open Source Developer",
+            "location": data.get("location") or "",
+            "company": data.get("company") or "",
+            "followers": data.get("followers", 0),
+            "following": data.get("following", 0),
+            "public_repos": data.get("public_repos", 0),
+            "avatar_url": data.get("avatar_url"),
+            "github_url": data.get("html_url"),
+        }
     return {}
 
 
@@ -48,26 +46,25 @@ async def get_repo_stats(github_url: str) -> dict:
     owner, repo = _parse_repo_url(github_url)
     repo_full_name = f"{owner}/{repo}"
 
-    async with httpx.AsyncClient(headers=_headers(), timeout=20.0) as client:
-        resp = await client.get(f"{GITHUB_API_BASE}/repos/{repo_full_name}")
-        if resp.status_code == 200:
-            data = resp.json()
-            return {
-                "name": data.get("name"),
-                "description": data.get("description") or "Amazing project",
-                "stars": data.get("stargazers_count", 0),
-                "forks": data.get("forks_count", 0),
-                "watchers": data.get("watchers_count", 0),
-                "language": data.get("language") or "Multi-language",
-                "topics": data.get("topics", [])[:3],  # Top 3 topics
-                "url": data.get("html_url"),
-                "created_at": data.get("created_at"),
-                "updated_at": data.get("updated_at"),
-                "owner": data.get("owner", {}).get("login"),
-                "is_fork": data.get("fork", False),
-                "open_issues": data.get("open_issues_count", 0),
-                "license": data.get("license", {}).get("name") if data.get("license") else "MIT",
-            }
+    resp = await github_get(f"{GITHUB_API_BASE}/repos/{repo_full_name}", headers=_headers(), timeout=20.0)
+    if resp.status_code == 200:
+        data = resp.json()
+        return {
+            "name": data.get("name"),
+            "description": data.get("description") or "Amazing project",
+            "stars": data.get("stargazers_count", 0),
+            "forks": data.get("forks_count", 0),
+            "watchers": data.get("watchers_count", 0),
+            "language": data.get("language") or "Multi-language",
+            "topics": data.get("topics", [])[:3],  # Top 3 topics
+            "url": data.get("html_url"),
+            "created_at": data.get("created_at"),
+            "updated_at": data.get("updated_at"),
+            "owner": data.get("owner", {}).get("login"),
+            "is_fork": data.get("fork", False),
+            "open_issues": data.get("open_issues_count", 0),
+            "license": data.get("license", {}).get("name") if data.get("license") else "MIT",
+        }
     return {}
 
 
@@ -0,0 +1,173 @@
+"""
+Heuristic Matcher
+=================
+Deterministic, fully local scoring of funding candidates — no LLM calls.
+
+Used when the caller asks for instant results (mode="heuristic") and as the
+automatic fallback when the LLM provider is slow, rate-limited or down. Each
+candidate's 0-100 score blends four signals the app already computes:
+
+  relevance   — BM25 pre-filter score, relative to the best candidate
+  funded DNA  — funders that backed projects similar to this repo
+  readiness   — velocity.GRANT_THRESHOLDS (stars, contributors, commits,
+                license, README) for funders that have known bars
+  eligibility — the funder's location / applicant-type restrictions
+
+Output has the same shape as the LLM matches (funding_id, score, reasoning,
+strengths, gaps, application_tips) so callers can store either.
+"""
+
+from __future__ import annotations
+
+import re
+
+from funded_dna import compare_repo_to_funded_dna
+from search_index import get_funding_index, repo_query, tokenize_field
+from velocity import GRANT_THRESHOLDS
+
+WEIGHTS = {"relevance": 0.45, "dna": 0.20, "readiness": 0.25, "eligibility": 0.10}
+
+# Heuristic scores stay inside this band: without an LLM we never claim certainty
+MIN_SCORE = 5
+MAX_SCORE = 90
+
+_NAME_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _name_tokens(name: str) -> set[str]:
+    return set(_NAME_WORD_RE.findall((name or "").lower()))
+
+
+def _same_funder(a: str, b: str) -> bool:
+    """'Mozilla MOSS' ~ 'Mozilla Open Source Support (MOSS)': shorter name's words all appear in the longer."""
+    ta, tb = _name_tokens(a), _name_tokens(b)
+    if not ta or not tb:
+        return False
+    short, long_ = (ta, tb) if len(ta) <= len(tb) else (tb, ta)
+    return short <= long_
+
+
+def _readiness(repo: dict, fs_name: str) -> tuple[float, list[str], list[str]]:
+    """Fraction of the funder's known bars the repo clears, plus strengths / gaps."""
+    stars = int(repo.get("stars") or 0)
+    contributors = int(repo.get("contributors_count") or 0)
+    commits_pw = float(repo.get("commit_frequency") or 0)
+    has_license = bool(repo.get("license_name"))
+    has_readme = bool(repo.get("readme_excerpt"))
+
+    thresholds = next((t for name, t in GRANT_THRESHOLDS.items() if _same_funder(name, fs_name)), None)
+    if thresholds is None:
+        # No published bar: basic hygiene most funders check
+        checks = [
+            (has_license, "Has an open source license", "No license — most funders require one"),
+            (has_readme, "Has a README", "Missing README"),
+            (commits_pw > 0, "Actively maintained", "No recent commit activity"),
+        ]
+    else:
+        checks = [
+            (stars >= thresholds["min_stars"],
+             f"{stars:,} stars meets the ~{thresholds['min_stars']:,} typical bar",
+             f"{stars:,} stars vs ~{thresholds['min_stars']:,} typically funded"),
+            (contributors >= thresholds["min_contributors"],
+             f"{contributors} contributors",
+             f"Needs {thresholds['min_contributors'] - contributors} more contributor(s)"),
+            (commits_pw >= thresholds["min_commits_pw"],
+             f"{commits_pw:.1f} commits/week shows active development",
+             f"{commits_pw:.1f} commits/week vs {thresholds['min_commits_pw']} expected"),
+        ]
+        if thresholds["needs_license"]:
+            checks.append((has_license, "Has an open source license", "No license — required"))
+        if thresholds["needs_readme"]:
+            checks.append((has_readme, "Has a README", "Missing README"))
+
+    met = [ok for ok, _, _ in checks]
+    strengths = [s for ok, s, _ in checks if ok]
+    gaps = [g for ok, _, g in checks if not ok]
+    return sum(met) / len(met), strengths, gaps
+
+
+def _eligibility(fs: dict) -> tuple[float, list[str]]:
+    elig = fs.get("eligibility") or {}
+    location = (elig.get("location") or "global").strip()
+    if "global" in location.lower():
+        return 1.0, []
+    return 0.5, [f"Eligibility limited to {location}"]
+
+
+def score_heuristically(repo_data: dict, candidates: list[dict], funding_sources: list[dict]) -> list[dict]:
+    """
+    Score `candidates` (a subset of `funding_sources`, e.g. the pre-filter
+    output) without an LLM. Returns match dicts like matcher._score_batch.
+    """
+    if not candidates:
+        return []
+
+    index = get_funding_index(funding_sources)
+    bm25 = index.scores(repo_query(repo_data))
+    relevance_by_obj = {id(fs): bm25[i] for i, fs in enumerate(funding_sources)}
+    best = max((relevance_by_obj.get(id(fs), 0.0) for fs in candidates), default=0.0) or 1.0
+
+    dna = compare_repo_to_funded_dna(repo_data)
+    similar = dna.get("top_matches") or []
+
+    repo_terms = set(tokenize_field(repo_data.get("topics"))) | set(tokenize_field(repo_data.get("description")))
+    if repo_data.get("language"):
+        repo_terms.add(repo_data["language"].lower())
+
+    matches = []
+    for fs in candidates:
+        name = fs.get("name", "")
+        relevance = max(0.0, relevance_by_obj.get(id(fs), 0.0) / best)
+
+        funded_similar = [p for p in similar if any(_same_funder(f, name) for f in p["funders"])]
+        dna_signal = min(1.0, len(funded_similar) / 3)
+
+        readiness, ready_strengths, ready_gaps = _readiness(repo_data, name)
+        elig_signal, elig_gaps = _eligibility(fs)
+
+        raw = (
+            relevance * WEIGHTS["relevance"]
+            + dna_signal * WEIGHTS["dna"]
+            + readiness * WEIGHTS["readiness"]
+            + elig_signal * WEIGHTS["eligibility"]
+        )
+        score = int(round(MIN_SCORE + raw * (MAX_SCORE - MIN_SCORE)))
+
+        focus_hits = [
+            a for a in (fs.get("focus_areas") or []) + (fs.get("tags") or [])
+            if a.lower() != "any" and set(tokenize_field(a)) & repo_terms
+        ]
+        strengths = []
+        if focus_hits:
+            strengths.append(f"Focus alignment: {', '.join(dict.fromkeys(focus_hits[:4]))}")
+        if funded_similar:
+            strengths.append(
+                f"Funded similar projects: {', '.join(p['project_name'] for p in funded_similar[:3])}"
+            )
+        strengths += ready_strengths[:2]
+
+        gaps = ready_gaps + elig_gaps
+        if not focus_hits and relevance < 0.3:
+            gaps.append("Weak overlap with the funder's stated focus areas")
+
+        reasoning = (
+            f"Heuristic estimate for {name}: "
+            f"{'strong' if relevance >= 0.6 else 'partial' if relevance >= 0.3 else 'limited'} topical fit, "
+            f"{round(readiness * 100)}% of typical funding bars met"
+            + (f", and {len(funded_similar)} similar project(s) previously funded." if funded_similar else ".")
+        )
+        if gaps:
+            tips = f"Address first: {gaps[0]}. Then review the program requirements at {fs.get('url', 'the funder site')}."
+        else:
+            tips = f"The repo clears the usual bars — tailor the application to the focus areas of {name}."
+
+        matches.append({
+            "funding_id": fs.get("id"),
+            "score": max(MIN_SCORE, min(MAX_SCORE, score)),
+            "reasoning": reasoning,
+            "strengths": strengths,
+            "gaps": gaps,
+            "application_tips": tips,
+        })
+
+    return matches
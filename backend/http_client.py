@@ -0,0 +1,91 @@
+"""
+Shared HTTP client layer.
+One pooled httpx.AsyncClient is reused by every module that talks to GitHub or
+the package registries, so keep-alive connections (and HTTP/2 multiplexing when
+the `h2` package is installed) survive across requests instead of paying a
+TCP+TLS handshake per call.
+
+The FastAPI lifespan opens and closes the client. Outside the web app (CLI,
+scripts) it is created lazily on first use; because httpx connection pools are
+bound to the event loop that created them, a fresh client is built whenever the
+running loop changes (e.g. successive asyncio.run() calls in the CLI). Each
+client is closed when its loop shuts down: asyncio.run() cancels pending tasks
+before closing the loop, and a watcher task closes the pool on cancellation.
+"""
+
+import asyncio
+import os
+from typing import Optional
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "20"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() in ("1", "true", "yes")
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (pip install httpx[http2])."""
+    if not HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _build_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=HTTP_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        http2=_http2_available(),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide pooled client for the running event loop.
+    Callers pass their own headers/timeout per request and must NOT close it.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = _build_client()
+        _client_loop = loop
+        loop.create_task(_close_with_loop(_client))
+    return _client
+
+
+async def _close_with_loop(client: httpx.AsyncClient) -> None:
+    """Sleep until the loop shuts down (task cancelled), then close the client's pool."""
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        if not client.is_closed:
+            await client.aclose()
+
+
+async def init_http_client() -> None:
+    """Open the shared client up front (called from the FastAPI lifespan)."""
+    get_http_client()
+
+
+async def close_http_client() -> None:
+    """Close the shared client and release pooled connections."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
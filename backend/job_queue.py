@@ -0,0 +1,301 @@
+"""
+Durable Job Queue
+=================
+DB-backed background jobs that survive restarts and can be spread across
+processes. Replaces FastAPI BackgroundTasks for repo analysis.
+
+- enqueue() writes a row to the `jobs` table.
+- Workers claim jobs with a conditional UPDATE (only one worker's update can
+  match), taking a lease of JOB_VISIBILITY_TIMEOUT seconds that is renewed
+  while the job runs. If a worker dies, the lease expires and the job becomes
+  claimable again.
+- A failing job is retried with exponential backoff (JOB_RETRY_BASE_SECONDS)
+  up to JOB_MAX_ATTEMPTS, then marked failed.
+- Jobs tied to a repo keep Repo.status in step: "pending" while queued or
+  retrying, "error" once the job is given up.
+
+Handlers are registered per job kind with register(); JobWorkerPool runs
+JOB_WORKERS concurrent workers in the current event loop.
+"""
+
+import asyncio
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import and_, func, or_
+
+import events
+from models import SessionLocal, Job, Repo
+
+load_dotenv()
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_VISIBILITY_TIMEOUT = float(os.getenv("JOB_VISIBILITY_TIMEOUT", "300"))
+JOB_RETRY_BASE_SECONDS = float(os.getenv("JOB_RETRY_BASE_SECONDS", "10"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1.0"))
+JOB_SHUTDOWN_GRACE = float(os.getenv("JOB_SHUTDOWN_GRACE", "30"))
+
+# Candidate rows fetched per claim attempt (others may win the race for some)
+_CLAIM_BATCH = 5
+
+Handler = Callable[[dict], Awaitable[None]]
+_handlers: dict[str, Handler] = {}
+
+
+def register(kind: str, handler: Handler) -> None:
+    """Register the coroutine function that runs jobs of `kind` (called with the payload)."""
+    _handlers[kind] = handler
+
+
+def enqueue(kind: str, payload: Optional[dict] = None, repo_id: Optional[str] = None,
+            max_attempts: Optional[int] = None, db=None) -> str:
+    """Persist a new job and return its id."""
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        job = Job(
+            kind=kind,
+            repo_id=repo_id,
+            payload=payload or {},
+            max_attempts=max_attempts or JOB_MAX_ATTEMPTS,
+        )
+        db.add(job)
+        db.commit()
+        return job.id
+    finally:
+        if own_session:
+            db.close()
+
+
+def _claimable(now: datetime):
+    return or_(
+        and_(Job.status == "queued", Job.run_after <= now),
+        and_(Job.status == "running", Job.lease_expires_at < now),  # lease expired: worker died
+    )
+
+
+def claim(worker_id: str, kinds: Optional[list[str]] = None) -> Optional[dict]:
+    """Lease the next runnable job for `worker_id`, or return None."""
+    db = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        query = db.query(Job.id).filter(_claimable(now))
+        if kinds:
+            query = query.filter(Job.kind.in_(kinds))
+        candidates = [row[0] for row in query.order_by(Job.run_after.asc()).limit(_CLAIM_BATCH)]
+
+        for job_id in candidates:
+            claimed = (
+                db.query(Job)
+                .filter(Job.id == job_id, _claimable(now))
+                .update(
+                    {
+                        Job.status: "running",
+                        Job.locked_by: worker_id,
+                        Job.lease_expires_at: now + timedelta(seconds=JOB_VISIBILITY_TIMEOUT),
+                        Job.attempts: Job.attempts + 1,
+                        Job.updated_at: now,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            if claimed == 1:
+                job = db.get(Job, job_id)
+                return {
+                    "id": job.id,
+                    "kind": job.kind,
+                    "repo_id": job.repo_id,
+                    "payload": job.payload or {},
+                    "attempts": job.attempts,
+                    "max_attempts": job.max_attempts,
+                }
+        return None
+    except Exception:
+        db.rollback()
+        return None
+    finally:
+        db.close()
+
+
+def _update_owned(job_id: str, worker_id: str, values: dict) -> bool:
+    """Update a job only while `worker_id` still holds its lease."""
+    db = SessionLocal()
+    try:
+        values = {**values, Job.updated_at: datetime.utcnow()}
+        n = (
+            db.query(Job)
+            .filter(Job.id == job_id, Job.locked_by == worker_id, Job.status == "running")
+            .update(values, synchronize_session=False)
+        )
+        db.commit()
+        return n == 1
+    except Exception:
+        db.rollback()
+        return False
+    finally:
+        db.close()
+
+
+def extend_lease(job_id: str, worker_id: str) -> bool:
+    return _update_owned(job_id, worker_id, {
+        Job.lease_expires_at: datetime.utcnow() + timedelta(seconds=JOB_VISIBILITY_TIMEOUT),
+    })
+
+
+def complete(job_id: str, worker_id: str) -> None:
+    _update_owned(job_id, worker_id, {Job.status: "done", Job.lease_expires_at: None, Job.last_error: None})
+
+
+def release(job_id: str, worker_id: str) -> None:
+    """Hand a running job back to the queue untouched (graceful shutdown)."""
+    db = SessionLocal()
+    try:
+        db.query(Job).filter(Job.id == job_id, Job.locked_by == worker_id, Job.status == "running").update(
+            {
+                Job.status: "queued",
+                Job.locked_by: None,
+                Job.lease_expires_at: None,
+                Job.attempts: Job.attempts - 1,
+                Job.run_after: datetime.utcnow(),
+            },
+            synchronize_session=False,
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+    finally:
+        db.close()
+
+
+def fail(job: dict, worker_id: str, error: str) -> None:
+    """Schedule a retry with exponential backoff, or give up after max attempts."""
+    retry = job["attempts"] < job["max_attempts"]
+    if retry:
+        delay = JOB_RETRY_BASE_SECONDS * (2 ** (job["attempts"] - 1))
+        values = {
+            Job.status: "queued",
+            Job.run_after: datetime.utcnow() + timedelta(seconds=delay),
+            Job.locked_by: None,
+            Job.lease_expires_at: None,
+            Job.last_error: error,
+        }
+    else:
+        values = {Job.status: "failed", Job.lease_expires_at: None, Job.last_error: error}
+    if not _update_owned(job["id"], worker_id, values) or not job.get("repo_id"):
+        return
+
+    db = SessionLocal()
+    published = False
+    try:
+        repo = db.query(Repo).filter(Repo.id == job["repo_id"]).first()
+        # A failed refresh of an analyzed repo keeps its published results
+        published = repo is not None and repo.status == "analyzed"
+        if repo and not published:
+            if retry:
+                repo.status = "pending"
+                repo.error_message = f"Retrying after error (attempt {job['attempts']}/{job['max_attempts']}): {error}"
+            else:
+                repo.status = "error"
+                repo.error_message = error
+            db.commit()
+    except Exception:
+        db.rollback()
+    finally:
+        db.close()
+    if not retry and not published:
+        events.publish(job["repo_id"], "error", {"status": "error", "message": error})
+
+
+def has_active_job(repo_id: str, db=None) -> bool:
+    """True if a queued or running job exists for `repo_id`."""
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        return db.query(Job.id).filter(
+            Job.repo_id == repo_id, Job.status.in_(("queued", "running"))
+        ).first() is not None
+    finally:
+        if own_session:
+            db.close()
+
+
+def queue_depth() -> dict:
+    """Job counts by status, for ops endpoints."""
+    db = SessionLocal()
+    try:
+        return dict(db.query(Job.status, func.count(Job.id)).group_by(Job.status).all())
+    finally:
+        db.close()
+
+
+class JobWorkerPool:
+    """N concurrent workers claiming jobs from the queue in this event loop."""
+
+    def __init__(self, workers: int = JOB_WORKERS, kinds: Optional[list[str]] = None, name: Optional[str] = None):
+        self.workers = workers
+        self.kinds = kinds
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._tasks: list[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+
+    def start(self) -> None:
+        self._stopping = asyncio.Event()
+        self._tasks = [asyncio.ensure_future(self._worker(f"{self.name}#{i}")) for i in range(self.workers)]
+
+    async def stop(self, timeout: float = 0.0) -> None:
+        """
+        Stop claiming. Running jobs get `timeout` seconds to finish; whatever is
+        still running after that is cancelled and handed back to the queue.
+        """
+        self._stopping.set()
+        if self._tasks and timeout > 0:
+            await asyncio.wait(self._tasks, timeout=timeout)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self, worker_id: str) -> None:
+        while not self._stopping.is_set():
+            job = claim(worker_id, self.kinds)
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=JOB_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job, worker_id)
+
+    async def _run(self, job: dict, worker_id: str) -> None:
+        handler = _handlers.get(job["kind"])
+        if handler is None:
+            fail({**job, "attempts": job["max_attempts"]}, worker_id, f"No handler for job kind '{job['kind']}'")
+            return
+        if job["attempts"] > job["max_attempts"]:
+            # Lease expired on the last attempt (worker crashed): give up
+            fail(job, worker_id, "Job lease expired too many times")
+            return
+
+        keeper = asyncio.ensure_future(self._keep_lease(job["id"], worker_id))
+        try:
+            await handler(job["payload"])
+        except asyncio.CancelledError:
+            release(job["id"], worker_id)
+            raise
+        except Exception as e:
+            fail(job, worker_id, str(e) or e.__class__.__name__)
+        else:
+            complete(job["id"], worker_id)
+        finally:
+            keeper.cancel()
+
+    async def _keep_lease(self, job_id: str, worker_id: str) -> None:
+        while True:
+            await asyncio.sleep(JOB_VISIBILITY_TIMEOUT / 3)
+            extend_lease(job_id, worker_id)
@@ -0,0 +1,105 @@
+"""
+Leaderboard
+===========
+Repos ranked by funding match quality (top_score * match_count).
+
+Rankings are materialized in the `leaderboard` table, so GET /api/leaderboard
+reads `limit` rows off the rank_score index instead of aggregating every
+repo's matches per request. The aggregate itself is a single GROUP BY over
+repos x matches x funding_sources:
+
+- update_repo() recomputes one repo's row when its analysis finishes
+  (called from analysis.analyze_and_match)
+- rebuild() recomputes the whole table (API startup), which also backfills
+  repos analyzed before the table existed
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func
+
+from models import Repo, Match, FundingSource, LeaderboardEntry
+
+
+def _aggregate(db, repo_id: Optional[str] = None):
+    """(Repo, match_count, avg_score, top_score, total_potential) per analyzed repo with matches."""
+    query = (
+        db.query(
+            Repo,
+            func.count(Match.id),
+            func.avg(Match.match_score),
+            func.max(Match.match_score),
+            func.coalesce(func.sum(FundingSource.max_amount), 0),
+        )
+        .join(Match, Match.repo_id == Repo.id)
+        .outerjoin(FundingSource, FundingSource.id == Match.funding_id)
+        .filter(Repo.status == "analyzed")
+        .group_by(Repo.id)
+    )
+    if repo_id is not None:
+        query = query.filter(Repo.id == repo_id)
+    return query.all()
+
+
+def _entry(repo: Repo, match_count: int, avg_score: float, top_score: float, total_potential: int) -> LeaderboardEntry:
+    return LeaderboardEntry(
+        repo_id=repo.id,
+        repo_name=repo.repo_name,
+        github_url=repo.github_url,
+        stars=repo.stars or 0,
+        language=repo.language or "",
+        description=repo.description or "",
+        match_count=match_count,
+        avg_score=round(avg_score or 0.0, 1),
+        top_score=round(top_score or 0.0, 1),
+        total_potential_usd=int(total_potential or 0),
+        rank_score=(top_score or 0.0) * match_count,
+        analyzed_at=repo.analyzed_at or repo.created_at,
+        updated_at=datetime.utcnow(),
+    )
+
+
+def update_repo(db, repo_id: str) -> None:
+    """Recompute one repo's leaderboard row (dropped if it's no longer ranked)."""
+    rows = _aggregate(db, repo_id)
+    if rows:
+        db.merge(_entry(*rows[0]))
+    else:
+        db.query(LeaderboardEntry).filter(LeaderboardEntry.repo_id == repo_id).delete(synchronize_session=False)
+    db.commit()
+
+
+def rebuild(db) -> int:
+    """Recompute the whole table from one aggregate query; returns the row count."""
+    entries = [_entry(*row) for row in _aggregate(db)]
+    db.query(LeaderboardEntry).delete(synchronize_session=False)
+    db.add_all(entries)
+    db.commit()
+    return len(entries)
+
+
+def top(db, limit: int) -> list[dict]:
+    """The `limit` best-ranked repos."""
+    rows = (
+        db.query(LeaderboardEntry)
+        .order_by(LeaderboardEntry.rank_score.desc())
+        .limit(limit)
+        .all()
+    )
+    return [
+        {
+            "repo_id": e.repo_id,
+            "repo_name": e.repo_name,
+            "github_url": e.github_url,
+            "stars": e.stars or 0,
+            "language": e.language or "",
+            "description": e.description or "",
+            "match_count": e.match_count,
+            "avg_score": e.avg_score,
+            "top_score": e.top_score,
+            "total_potential_usd": e.total_potential_usd,
+            "analyzed_at": e.analyzed_at.isoformat() if e.analyzed_at else "",
+        }
+        for e in rows
+    ]
@@ -0,0 +1,132 @@
+"""
+Content-addressed cache for LLM matching responses.
+Each scoring batch is keyed by a hash of everything that determines the answer
+(provider, model and the exact system + user messages, so editing either prompt
+template invalidates old entries) and the parsed match list is stored in the
+`llm_cache` table. Re-analyzing an unchanged repo against unchanged funding
+sources then skips the LLM round-trip entirely.
+
+Entries expire after LLM_CACHE_TTL_HOURS; the table is capped at
+LLM_CACHE_MAX_ENTRIES by evicting the least recently used rows.
+
+lookup() only reads (matcher awaits it with asyncio.to_thread); hit counts and
+new entries are written by a single background thread, so batch scoring never
+blocks the event loop on a commit.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import func
+
+from models import SessionLocal, LlmCacheEntry
+
+load_dotenv()
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+LLM_CACHE_TTL_HOURS = float(os.getenv("LLM_CACHE_TTL_HOURS", "168"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+
+# Prune the table every N stores rather than on each write
+_PRUNE_EVERY = 100
+_stores_since_prune = 0
+
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-cache-writer")
+
+
+def cache_key(provider: str, model: Optional[str], system_prompt: str, user_message: str) -> str:
+    h = hashlib.sha256()
+    for part in (provider, model or "", system_prompt, user_message):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def lookup(key: str) -> Optional[list]:
+    """
+    Return the cached match list, or None on a miss or expired entry (expired
+    rows are left for _prune). Blocking: call off the event loop.
+    """
+    if not LLM_CACHE_ENABLED:
+        return None
+    db = SessionLocal()
+    try:
+        entry = db.query(LlmCacheEntry).filter(LlmCacheEntry.key == key).first()
+        if not entry or entry.created_at < datetime.utcnow() - timedelta(hours=LLM_CACHE_TTL_HOURS):
+            return None
+        _writer.submit(_record_hit, key)
+        return list(entry.response or [])
+    except Exception:
+        return None
+    finally:
+        db.close()
+
+
+def store(key: str, provider: str, model: Optional[str], matches: list) -> None:
+    """Remember a parsed match list (written in the background). Empty results are never cached."""
+    if not LLM_CACHE_ENABLED or not matches:
+        return
+    _writer.submit(_store, key, provider, model, matches)
+
+
+def flush() -> None:
+    """Wait until every queued cache write has been applied."""
+    _writer.submit(lambda: None).result()
+
+
+def _record_hit(key: str) -> None:
+    db = SessionLocal()
+    try:
+        db.query(LlmCacheEntry).filter(LlmCacheEntry.key == key).update(
+            {LlmCacheEntry.last_used_at: datetime.utcnow(), LlmCacheEntry.hits: func.coalesce(LlmCacheEntry.hits, 0) + 1},
+            synchronize_session=False,
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _store(key: str, provider: str, model: Optional[str], matches: list) -> None:
+    global _stores_since_prune
+    now = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        db.merge(LlmCacheEntry(
+            key=key, provider=provider, model=model, response=matches,
+            created_at=now, last_used_at=now, hits=0,
+        ))
+        db.commit()
+
+        _stores_since_prune += 1
+        if _stores_since_prune >= _PRUNE_EVERY:
+            _stores_since_prune = 0
+            _prune(db)
+    except Exception:
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _prune(db) -> None:
+    """Drop expired entries, then the least recently used beyond the size cap."""
+    cutoff = datetime.utcnow() - timedelta(hours=LLM_CACHE_TTL_HOURS)
+    db.query(LlmCacheEntry).filter(LlmCacheEntry.created_at < cutoff).delete(synchronize_session=False)
+    db.commit()
+
+    excess = db.query(LlmCacheEntry).count() - LLM_CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return
+    stale = (
+        db.query(LlmCacheEntry.key)
+        .order_by(LlmCacheEntry.last_used_at.asc())
+        .limit(excess)
+        .subquery()
+    )
+    db.query(LlmCacheEntry).filter(LlmCacheEntry.key.in_(stale.select())).delete(synchronize_session=False)
+    db.commit()
@@ -1,14 +1,20 @@
 import os
 import json
 import asyncio
-import httpx
-from openai import AsyncOpenAI
 from dotenv import load_dotenv
+from http_client import get_http_client
 
 load_dotenv()
 
 SETTINGS_PATH = os.path.join(os.path.dirname(__file__), "settings.json")
 
+# Max in-flight LLM requests per provider; override one provider with
+# LLM_CONCURRENCY_<PROVIDER> (e.g. LLM_CONCURRENCY_GROQ=2)
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))
+# Local models serve one request at a time
+_DEFAULT_PROVIDER_CONCURRENCY = {"ollama": 1}
+_semaphores = {}
+
 def load_settings():
     """Load settings from JSON, with robust error handling and defaults for ALL providers."""
     default_providers = {
@@ -83,28 +89,24 @@ class LLMShim:
         self.base_url = config.get("base_url")
         self.model = config.get("model")
         self.internal_client = None
+        self._internal = None
 
-        # Provider-specific client setup
+        # Provider SDKs are imported on first use, so only the selected one
+        # is ever loaded (the openai package alone takes ~0.5s to import)
         if provider == "anthropic":
             try:
                 import anthropic
                 self.internal_client = anthropic.AsyncAnthropic(api_key=self.api_key)
-                self.internal = self.internal_client
-            except (ImportError, Exception) as e:
-                # Fallback to OpenAI compatible mode
-                self.internal = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, timeout=60.0)
-        elif provider == "gemini":
-            # Gemini works via OpenAI compatibility layer
-            self.internal = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, timeout=60.0)
-        elif provider == "nvidia":
-            # NVIDIA NIM API is OpenAI compatible
-            self.internal = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, timeout=60.0)
-        elif provider == "openrouter":
-            # OpenRouter is OpenAI compatible
-            self.internal = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, timeout=60.0)
-        else:
-            # Groq, OpenAI, Ollama (all OpenAI compatible)
-            self.internal = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, timeout=60.0)
+            except Exception:
+                pass  # SDK missing: OpenAI compatible mode (self.internal)
+
+    @property
+    def internal(self):
+        """OpenAI-compatible client: Groq, OpenAI, Gemini, NVIDIA, OpenRouter, Ollama (and Anthropic fallback)."""
+        if self._internal is None:
+            from openai import AsyncOpenAI
+            self._internal = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, timeout=60.0)
+        return self._internal
 
     @property
     def chat(self): return self
@@ -190,15 +192,34 @@ def get_llm_client():
     config = settings.get("providers", {}).get(p_name, {})
     return LLMShim(p_name, config), config.get("model")
 
+def provider_concurrency(provider):
+    """Concurrency limit for one provider (env override, then built-in default)."""
+    override = os.getenv(f"LLM_CONCURRENCY_{provider.upper()}")
+    if override:
+        return max(1, int(override))
+    return max(1, _DEFAULT_PROVIDER_CONCURRENCY.get(provider, LLM_CONCURRENCY))
+
+def llm_semaphore(provider):
+    """
+    Shared semaphore bounding concurrent requests to `provider`.
+    Rebuilt when the event loop changes (the CLI calls asyncio.run repeatedly).
+    """
+    loop = asyncio.get_running_loop()
+    entry = _semaphores.get(provider)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, asyncio.Semaphore(provider_concurrency(provider)))
+        _semaphores[provider] = entry
+    return entry[1]
+
 async def get_ollama_models(base_url):
     """Fetch available models from Ollama API."""
     if not base_url: return []
     try:
         tags_url = base_url.replace("/v1", "/api/tags")
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(tags_url, timeout=3.0)
-            if resp.status_code == 200:
-                return [m["name"] for m in resp.json().get("models", [])]
+        client = get_http_client()
+        resp = await client.get(tags_url, timeout=3.0)
+        if resp.status_code == 200:
+            return [m["name"] for m in resp.json().get("models", [])]
     except: pass
     return []
 
@@ -13,13 +13,14 @@ Endpoints:
 
 import os
 import json
+import asyncio
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, field_validator
 from pydantic import ConfigDict
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -28,10 +29,21 @@ from slowapi.errors import RateLimitExceeded
 from sqlalchemy.orm import Session
 from dotenv import load_dotenv
 
-from models import init_db, get_db, Repo, FundingSource, Match
-from github_api import fetch_repo_data
-from matcher import run_matching
+import events
+import job_queue
+import leaderboard
+import refresh_scheduler
+from models import init_db, get_db, SessionLocal, Repo, Match
+from http_client import init_http_client, close_http_client
+from github_api import github_get
+from github_scheduler import token_pool
+from github_graphql import graphql_cost_stats
+from matcher import warm_prefilter_index, MATCHING_MODES
+from analysis import (
+    analyze_once, claim_repo, find_repo, is_in_flight, match_event, record_view, repo_key,
+)
 from funding_db import seed_funding_sources, get_all_funding_sources
+from funding_catalog import FundingRecord, get_catalog
 from application_writer import generate_application
 from fundability import analyze_fundability
 from badge import generate_badge_svg
@@ -41,6 +53,11 @@ from portfolio import optimize_portfolio
 from velocity import calculate_velocity
 from time_machine import generate_roadmap
 from monetization import fetch_live_bounties, generate_monetization_strategy
+from dependency_analyzer import (
+    analyze_dependencies as analyze_dependency_manifest,
+    parse_packages,
+    stream_dependencies,
+)
 from llm_utils import load_settings, save_settings
 
 load_dotenv()
@@ -58,13 +75,30 @@ async def lifespan(app: FastAPI):
     db = next(get_db())
     try:
         seed_funding_sources(db)
+        warm_prefilter_index(get_all_funding_sources(db))
+        leaderboard.rebuild(db)
     finally:
         db.close()
+    await init_http_client()
+    workers = job_queue.JobWorkerPool(job_queue.JOB_WORKERS)
+    if job_queue.JOB_WORKERS > 0:
+        workers.start()
+    # Progress events from standalone workers (worker.py) arrive via the DB
+    relay = asyncio.ensure_future(events.relay())
+    # Keep popular repos warm by refreshing them before their cache expires
+    refresher = asyncio.ensure_future(refresh_scheduler.run_scheduler()) if refresh_scheduler.REFRESH_ENABLED else None
     yield
-    # Shutdown (nothing to clean up)
+    # Shutdown: let in-flight jobs finish (re-queue stragglers), release pooled HTTP connections
+    relay.cancel()
+    if refresher:
+        refresher.cancel()
+    await workers.stop(timeout=job_queue.JOB_SHUTDOWN_GRACE)
+    await close_http_client()
 
 
 _IS_PROD = os.getenv("ENVIRONMENT", "development") == "production"
+# Comment line sent on idle SSE streams so proxies don't drop the connection
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
 app = FastAPI(
     title="OpenGrant API",
     description="AI-powered matching between GitHub repos and funding opportunities.",
@@ -107,6 +141,14 @@ app.add_middleware(
 # ---------------------------------------------------------------------------
 class RepoSubmitRequest(BaseModel):
     github_url: str
+    mode: Optional[str] = None      # matching mode: auto | llm | heuristic (default MATCHING_MODE)
+
+    @field_validator("mode")
+    @classmethod
+    def known_mode(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and v.lower() not in MATCHING_MODES:
+            raise ValueError(f"mode must be one of: {', '.join(MATCHING_MODES)}")
+        return v.lower() if v else v
 
     @field_validator("github_url")
     @classmethod
@@ -170,96 +212,53 @@ class MatchResponse(BaseModel):
 
 
 # ---------------------------------------------------------------------------
-# Background task: analyze repo + run matching
+# Serializers (shared by the match, portfolio and roadmap endpoints)
 # ---------------------------------------------------------------------------
-async def _analyze_and_match(repo_id: str):
-    """
-    Background task that:
-    1. Fetches GitHub data for the repo
-    2. Runs AI matching against all funding sources
-    3. Saves results to the database
-    """
-    db = next(get_db())
-    try:
-        repo = db.query(Repo).filter(Repo.id == repo_id).first()
-        if not repo:
-            return
+def _funding_source_dict(fs: FundingRecord) -> dict:
+    return {
+        "id": fs.id,
+        "name": fs.name,
+        "type": fs.type,
+        "min_amount": fs.min_amount,
+        "max_amount": fs.max_amount,
+        "description": fs.description,
+        "url": fs.url,
+        "category": fs.category,
+        "tags": list(fs.tags or []),
+        "focus_areas": list(fs.focus_areas or []),
+        "is_recurring": fs.is_recurring,
+        "deadline": fs.deadline,
+        "application_required": fs.application_required,
+    }
 
-        # 1. Fetch GitHub data
-        try:
-            gh_data = await fetch_repo_data(repo.github_url)
-        except ValueError as e:
-            repo.status = "error"
-            repo.error_message = str(e)
-            db.commit()
-            return
-        except Exception as e:
-            repo.status = "error"
-            repo.error_message = f"GitHub API error: {str(e)}"
-            db.commit()
-            return
-
-        # 2. Update repo with GitHub data
-        for field, value in gh_data.items():
-            if hasattr(repo, field) and field != "id":
-                setattr(repo, field, value)
-
-        # Parse datetime strings
-        for dt_field in ("created_at_github", "updated_at_github"):
-            val = gh_data.get(dt_field)
-            if val and isinstance(val, str):
-                try:
-                    setattr(repo, dt_field, datetime.fromisoformat(val.replace("Z", "+00:00")))
-                except Exception:
-                    pass
 
-        db.commit()
+def _match_dict(m: Match, fs: FundingRecord) -> dict:
+    return {
+        "id": m.id,
+        "repo_id": m.repo_id,
+        "funding_id": m.funding_id,
+        "match_score": m.match_score,
+        "reasoning": m.reasoning,
+        "strengths": m.strengths or [],
+        "gaps": m.gaps or [],
+        "application_tips": m.application_tips,
+        "provisional": bool(m.provisional),
+        "refinement": m.refinement,
+        "funding_source": _funding_source_dict(fs),
+    }
 
-        # 3. Run AI matching
-        funding_sources = get_all_funding_sources(db)
-        repo_dict = {
-            c.name: getattr(repo, c.name)
-            for c in repo.__table__.columns
-        }
-        # JSON fields stored as strings in SQLite — decode if needed
-        for json_field in ("topics",):
-            val = repo_dict.get(json_field)
-            if isinstance(val, str):
-                try:
-                    repo_dict[json_field] = json.loads(val)
-                except Exception:
-                    repo_dict[json_field] = []
-
-        matches = await run_matching(repo_dict, funding_sources)
-
-        # 4. Save matches to DB (clear old ones first)
-        db.query(Match).filter(Match.repo_id == repo_id).delete()
-        for m in matches:
-            db_match = Match(
-                repo_id=repo_id,
-                funding_id=m["funding_id"],
-                match_score=m["score"],
-                reasoning=m.get("reasoning", ""),
-                strengths=m.get("strengths", []),
-                gaps=m.get("gaps", []),
-                application_tips=m.get("application_tips", ""),
-            )
-            db.add(db_match)
-
-        repo.status = "analyzed"
-        db.commit()
 
-    except Exception as e:
-        try:
-            repo = db.query(Repo).filter(Repo.id == repo_id).first()
-            if repo:
-                repo.status = "error"
-                repo.error_message = f"Unexpected error: {str(e)}"
-                db.commit()
-        except Exception:
-            pass
-    finally:
-        db.close()
+def _top_matches(db: Session, repo_id: str, limit: int) -> list[tuple[Match, FundingRecord]]:
+    """A repo's best matches paired with their catalog records (one query)."""
+    catalog = get_catalog(db)
+    matches = (
+        db.query(Match)
+        .filter(Match.repo_id == repo_id)
+        .order_by(Match.match_score.desc())
+        .limit(limit)
+        .all()
+    )
+    return [(m, catalog.get(m.funding_id)) for m in matches if catalog.get(m.funding_id) is not None]
 
 
 # ---------------------------------------------------------------------------
@@ -308,14 +307,13 @@ async def generate_monetize_strategy(body: MonetizeRequest, db: Session = Depend
 
 @app.get("/api/scan")
 @limiter.limit("5/minute")
-async def scan_repo_get(request: Request, url: str, db: Session = Depends(get_db)):
+async def scan_repo_get(request: Request, url: str, mode: Optional[str] = None, db: Session = Depends(get_db)):
     """
     Single GET endpoint for AI agents (web_fetch compatible).
     Submits repo, waits for analysis, returns formatted results.
     Usage: GET /api/scan?url=https://github.com/owner/repo
+    Add &mode=heuristic for instant results without LLM calls.
     """
-    import uuid as _uuid
-
     try:
         # Validate URL strictly
         import re as _re
@@ -331,28 +329,26 @@ async def scan_repo_get(request: Request, url: str, db: Session = Depends(get_db
 
         owner, repo_name = parts[3], parts[4]
 
-        # Check if already analyzed
-        existing = db.query(Repo).filter(Repo.github_url == url).first()
-        if existing and existing.status == "analyzed":
+        if mode and mode.lower() not in MATCHING_MODES:
+            return {"error": f"Invalid mode. Use one of: {', '.join(MATCHING_MODES)}"}
+
+        # Check if already analyzed (or being analyzed by another request)
+        key = repo_key(url)
+        existing = find_repo(db, key)
+        if existing and existing.status == "analyzed" and existing.refinement_status != "refining":
             repo_id = existing.id
         else:
             # Submit new or reuse pending
             if existing:
                 repo_id = existing.id
             else:
-                repo_id = str(_uuid.uuid4())
-                new_repo = Repo(
-                    id=repo_id,
-                    github_url=url,
-                    repo_name=repo_name,
-                    owner=owner,
-                    status="pending",
-                )
-                db.add(new_repo)
-                db.commit()
-
-            # Run analysis inline (await)
-            await _analyze_and_match(repo_id)
+                repo_id = claim_repo(db, key, url, repo_name, owner)[0].id
+
+            # Run analysis inline (await), or attach to the run already in
+            # flight for this repo — another scan or a queued job
+            await analyze_once(key, repo_id, mode)
+        record_view(db, repo_id)
+        db.expire_all()
 
         # Re-fetch fresh from DB
         repo = db.query(Repo).filter(Repo.id == repo_id).first()
@@ -366,14 +362,7 @@ async def scan_repo_get(request: Request, url: str, db: Session = Depends(get_db
             return {"error": "Analysis not complete. Try again in a few seconds."}
 
         # Get top matches
-        matches = (
-            db.query(Match, FundingSource)
-            .join(FundingSource, Match.funding_id == FundingSource.id)
-            .filter(Match.repo_id == repo.id)
-            .order_by(Match.match_score.desc())
-            .limit(5)
-            .all()
-        )
+        matches = _top_matches(db, repo.id, 5)
 
         # Build repo dict for fundability (exclude SQLAlchemy internals)
         repo_dict = {c.name: getattr(repo, c.name) for c in repo.__table__.columns}
@@ -426,7 +415,7 @@ def get_stats(db: Session = Depends(get_db)):
     """Platform statistics for the landing page."""
     total_repos = db.query(Repo).count()
     analyzed = db.query(Repo).filter(Repo.status == "analyzed").count()
-    total_funding = db.query(FundingSource).filter(FundingSource.active == True).count()
+    total_funding = len(get_catalog(db).active)
     total_matches = db.query(Match).count()
     return {
         "repos_submitted": total_repos,
@@ -436,57 +425,81 @@ def get_stats(db: Session = Depends(get_db)):
     }
 
 
+@app.get("/api/ops/status")
+def ops_status():
+    """Job queue depth, refresh scheduler budget and GitHub rate-limit usage, for ops."""
+    return {
+        "jobs": job_queue.queue_depth(),
+        "refresh": refresh_scheduler.status(),
+        "github_tokens": token_pool.snapshot(),
+        "github_graphql": graphql_cost_stats(),
+    }
+
+
 @app.post("/api/repos/submit", status_code=202)
 @limiter.limit("10/minute")
 async def submit_repo(
     request: Request,
     body: RepoSubmitRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
     Submit a GitHub repository URL for analysis.
-    Returns a repo_id immediately; analysis runs in the background.
-    Poll GET /api/repos/{repo_id} for status updates.
+    Returns a repo_id immediately; analysis is queued for a job worker.
+    Follow GET /api/repos/{repo_id}/events (or poll GET /api/repos/{repo_id}).
     """
-    # Check if this URL was already analyzed recently (last 24h)
+    # Coalesce on normalized owner/repo: identical URLs in different spellings
+    # (case, trailing ".git") and concurrent submissions share one analysis
     from datetime import timedelta
-    cutoff = datetime.utcnow() - timedelta(hours=24)
-    existing = (
-        db.query(Repo)
-        .filter(
-            Repo.github_url == body.github_url,
-            Repo.status == "analyzed",
-            Repo.created_at >= cutoff,
-        )
-        .first()
-    )
+    key = repo_key(body.github_url)
+    existing = find_repo(db, key)
     if existing:
+        record_view(db, existing.id)
+
+    # Already analyzed recently (last 24h)
+    cutoff = datetime.utcnow() - timedelta(hours=24)
+    if existing and existing.status == "analyzed" and (existing.analyzed_at or existing.created_at) >= cutoff \
+            and existing.refinement_status != "refining":
         return {
             "repo_id": existing.id,
             "status": "cached",
             "message": "This repo was recently analyzed. Returning cached results.",
         }
 
-    # Create a new repo record (status=pending, will be updated by background task)
-    # Do a quick URL parse to get repo_name early
-    try:
-        parts = body.github_url.rstrip("/").split("/")
-        repo_name = f"{parts[-2]}/{parts[-1]}".replace(".git", "")
-    except Exception:
-        repo_name = body.github_url
-
-    repo = Repo(
-        github_url=body.github_url,
-        repo_name=repo_name,
-        status="pending",
-    )
-    db.add(repo)
-    db.commit()
-    db.refresh(repo)
+    # Analysis already in flight: attach to it
+    if existing and existing.status in ("pending", "analyzed") and is_in_flight(db, key, existing.id):
+        return {
+            "repo_id": existing.id,
+            "status": existing.status,
+            "message": "This repo is already being analyzed. Follow /api/repos/{repo_id}/events for progress.",
+        }
 
-    # Kick off background analysis
-    background_tasks.add_task(_analyze_and_match, repo.id)
+    if existing and existing.status == "pending":
+        # Pending row whose job is gone (e.g. cancelled): re-queue it
+        repo, created = existing, True
+    elif existing and existing.status == "analyzed":
+        # Stale analysis: refresh the same row. Current results stay visible,
+        # and only what changed since the last run is re-scored.
+        job_queue.enqueue("analyze", {"repo_id": existing.id, "mode": body.mode, "refresh": True},
+                          repo_id=existing.id, db=db)
+        return {
+            "repo_id": existing.id,
+            "status": "refreshing",
+            "message": "Refreshing a previous analysis. Follow /api/repos/{repo_id}/events for updates.",
+        }
+    else:
+        # Quick URL parse to get repo_name early
+        try:
+            parts = body.github_url.rstrip("/").split("/")
+            repo_name = f"{parts[-2]}/{parts[-1]}".replace(".git", "")
+        except Exception:
+            repo_name = body.github_url
+        repo, created = claim_repo(db, key, body.github_url, repo_name)
+        record_view(db, repo.id)
+
+    # Queue the analysis; a job worker picks it up
+    if created:
+        job_queue.enqueue("analyze", {"repo_id": repo.id, "mode": body.mode}, repo_id=repo.id, db=db)
 
     return {
         "repo_id": repo.id,
@@ -517,11 +530,68 @@ def get_repo(repo_id: str, db: Session = Depends(get_db)):
         "commit_frequency": repo.commit_frequency,
         "homepage": repo.homepage,
         "status": repo.status,
+        "refinement_status": repo.refinement_status,
         "error_message": repo.error_message,
         "created_at": repo.created_at.isoformat() if repo.created_at else None,
+        "analyzed_at": repo.analyzed_at.isoformat() if repo.analyzed_at else None,
     }
 
 
+@app.get("/api/repos/{repo_id}/events")
+async def repo_events(repo_id: str, request: Request):
+    """
+    Server-Sent Events stream of analysis progress for one repo.
+    Emits "status" events (fetching, fetched, prefiltered, analyzed,
+    batch_scored, unchanged), a "match" event per match written, and closes after a
+    "complete" or "error" event. A finished repo gets its current state and
+    matches replayed, then "complete".
+    """
+    queue = events.subscribe(repo_id)  # before reading state so nothing is missed
+
+    db = SessionLocal()
+    try:
+        repo = db.query(Repo).filter(Repo.id == repo_id).first()
+        if not repo:
+            events.unsubscribe(repo_id, queue)
+            raise HTTPException(status_code=404, detail="Repository not found.")
+        snapshot = [{"event": "status", "data": {"status": repo.status, "refinement_status": repo.refinement_status}}]
+        if repo.status == "analyzed":
+            for m in db.query(Match).filter(Match.repo_id == repo_id).order_by(Match.match_score.desc()):
+                snapshot.append({"event": "match", "data": match_event(m)})
+        if repo.status == "error":
+            snapshot.append({"event": "error", "data": {"status": "error", "message": repo.error_message}})
+        elif repo.status == "analyzed" and repo.refinement_status != "refining":
+            snapshot.append({"event": "complete", "data": {"status": "analyzed", "refinement_status": repo.refinement_status}})
+    finally:
+        db.close()
+
+    async def stream():
+        try:
+            for message in snapshot:
+                yield events.format_sse(message)
+                if message["event"] in events.TERMINAL_EVENTS:
+                    return
+            while True:
+                if await request.is_disconnected():
+                    return
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield events.format_sse(message)
+                if message["event"] in events.TERMINAL_EVENTS:
+                    return
+        finally:
+            events.unsubscribe(repo_id, queue)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/repos/{repo_id}/matches")
 def get_matches(repo_id: str, limit: int = 20, db: Session = Depends(get_db)):
     """
@@ -538,47 +608,11 @@ def get_matches(repo_id: str, limit: int = 20, db: Session = Depends(get_db)):
     if repo.status == "error":
         raise HTTPException(status_code=400, detail=repo.error_message or "Analysis failed.")
 
-    matches = (
-        db.query(Match)
-        .filter(Match.repo_id == repo_id)
-        .order_by(Match.match_score.desc())
-        .limit(limit)
-        .all()
-    )
-
-    result = []
-    for m in matches:
-        fs = db.query(FundingSource).filter(FundingSource.id == m.funding_id).first()
-        if not fs:
-            continue
-        result.append({
-            "id": m.id,
-            "repo_id": m.repo_id,
-            "funding_id": m.funding_id,
-            "match_score": m.match_score,
-            "reasoning": m.reasoning,
-            "strengths": m.strengths or [],
-            "gaps": m.gaps or [],
-            "application_tips": m.application_tips,
-            "funding_source": {
-                "id": fs.id,
-                "name": fs.name,
-                "type": fs.type,
-                "min_amount": fs.min_amount,
-                "max_amount": fs.max_amount,
-                "description": fs.description,
-                "url": fs.url,
-                "category": fs.category,
-                "tags": fs.tags or [],
-                "focus_areas": fs.focus_areas or [],
-                "is_recurring": fs.is_recurring,
-                "deadline": fs.deadline,
-                "application_required": fs.application_required,
-            },
-        })
+    result = [_match_dict(m, fs) for m, fs in _top_matches(db, repo_id, limit)]
 
     return {
         "status": "analyzed",
+        "refinement_status": repo.refinement_status,
         "repo_id": repo_id,
         "repo_name": repo.repo_name,
         "matches": result,
@@ -597,33 +631,10 @@ def list_funding_sources(
     Optional filters: category (platform|foundation|corporate|government|crypto|nonprofit|vc)
                      type (grant|sponsorship|accelerator)
     """
-    query = db.query(FundingSource).filter(FundingSource.active == True)
-    if category:
-        query = query.filter(FundingSource.category == category)
-    if type:
-        query = query.filter(FundingSource.type == type)
-
-    sources = query.order_by(FundingSource.category, FundingSource.name).all()
+    sources = get_catalog(db).filter(category or None, type or None)
 
     return {
-        "funding_sources": [
-            {
-                "id": fs.id,
-                "name": fs.name,
-                "type": fs.type,
-                "min_amount": fs.min_amount,
-                "max_amount": fs.max_amount,
-                "description": fs.description,
-                "url": fs.url,
-                "category": fs.category,
-                "tags": fs.tags or [],
-                "focus_areas": fs.focus_areas or [],
-                "is_recurring": fs.is_recurring,
-                "deadline": fs.deadline,
-                "application_required": fs.application_required,
-            }
-            for fs in sources
-        ],
+        "funding_sources": [_funding_source_dict(fs) for fs in sources],
         "total": len(sources),
         "categories": list({fs.category for fs in sources}),
     }
@@ -640,7 +651,7 @@ def get_match_details(body: MatchDetailsRequest, db: Session = Depends(get_db)):
     if not match:
         raise HTTPException(status_code=404, detail="Match not found.")
 
-    fs = db.query(FundingSource).filter(FundingSource.id == body.funding_id).first()
+    fs = get_catalog(db).get(body.funding_id)
     repo = db.query(Repo).filter(Repo.id == body.repo_id).first()
 
     return {
@@ -662,7 +673,7 @@ def get_match_details(body: MatchDetailsRequest, db: Session = Depends(get_db)):
             "min_amount": fs.min_amount,
             "max_amount": fs.max_amount,
             "deadline": fs.deadline,
-            "eligibility": fs.eligibility or {},
+            "eligibility": dict(fs.eligibility or {}),
         } if fs else None,
         "repo": {
             "id": repo.id,
@@ -718,7 +729,7 @@ async def generate_application_endpoint(
     if repo.status != "analyzed":
         raise HTTPException(status_code=400, detail="Repository analysis not complete yet.")
 
-    fs = db.query(FundingSource).filter(FundingSource.id == body.funding_id).first()
+    fs = get_catalog(db).get(body.funding_id)
     if not fs:
         raise HTTPException(status_code=404, detail="Funding source not found.")
 
@@ -740,9 +751,9 @@ async def generate_application_endpoint(
         "description": fs.description,
         "url": fs.url,
         "category": fs.category,
-        "tags": fs.tags or [],
-        "focus_areas": fs.focus_areas or [],
-        "eligibility": fs.eligibility or {},
+        "tags": list(fs.tags or []),
+        "focus_areas": list(fs.focus_areas or []),
+        "eligibility": dict(fs.eligibility or {}),
         "min_amount": fs.min_amount,
         "max_amount": fs.max_amount,
     }
@@ -845,7 +856,7 @@ async def api_scan_org(body: OrgScanRequest):
 # Dependency Funding Map
 # ---------------------------------------------------------------------------
 class DepsRequest(BaseModel):
-    content: str        # Raw package.json or requirements.txt content
+    content: str        # Raw manifest or lockfile (package.json, package-lock.json, requirements.txt, poetry.lock, Pipfile.lock)
     ecosystem: str      # "npm" or "pip"
 
 
@@ -855,141 +866,29 @@ async def analyze_dependencies(body: DepsRequest):
     Parse a package.json or requirements.txt and check each dependency's
     funding health on GitHub.
     """
-    import httpx, re, json as json_mod
-
-    ecosystem = body.ecosystem.lower()
-    content   = body.content.strip()
-    packages  = []
-
-    # ── Parse package names ─────────────────────────────────────────────
-    if ecosystem == "npm":
-        try:
-            parsed = json_mod.loads(content)
-            deps   = {**parsed.get("dependencies", {}), **parsed.get("devDependencies", {})}
-            packages = list(deps.keys())[:30]
-        except Exception:
-            raise HTTPException(status_code=400, detail="Invalid package.json")
-    else:  # pip
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            pkg = re.split(r"[>=<!;\[]", line)[0].strip()
-            if pkg:
-                packages.append(pkg)
-        packages = packages[:30]
-
-    if not packages:
-        raise HTTPException(status_code=400, detail="No packages found.")
-
-    results = []
-    gh_token = os.getenv("GITHUB_TOKEN", "")
-    gh_headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "FundMatcher/1.0",
-        **({"Authorization": f"token {gh_token}"} if gh_token else {}),
-    }
-
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        for pkg in packages:
-            github_url = None
-
-            # Resolve GitHub URL from registry
-            try:
-                if ecosystem == "npm":
-                    r = await client.get(f"https://registry.npmjs.org/{pkg}/latest")
-                    if r.status_code == 200:
-                        data   = r.json()
-                        repo   = data.get("repository", {})
-                        rawurl = repo.get("url", "") if isinstance(repo, dict) else ""
-                        match  = re.search(r"github\.com[/:]([^/]+/[^/.\s]+)", rawurl)
-                        if match:
-                            github_url = f"https://github.com/{match.group(1).removesuffix('.git')}"
-                else:
-                    r = await client.get(f"https://pypi.org/pypi/{pkg}/json")
-                    if r.status_code == 200:
-                        info   = r.json().get("info", {})
-                        urls   = info.get("project_urls") or {}
-                        for k, v in urls.items():
-                            if "github.com" in (v or ""):
-                                m = re.search(r"github\.com/([^/]+/[^/\s]+)", v)
-                                if m:
-                                    github_url = f"https://github.com/{m.group(1).rstrip('/')}"
-                                    break
-                        if not github_url:
-                            hp = info.get("home_page") or ""
-                            if "github.com" in hp:
-                                m = re.search(r"github\.com/([^/]+/[^/\s]+)", hp)
-                                if m:
-                                    github_url = f"https://github.com/{m.group(1).rstrip('/')}"
-            except Exception:
-                pass
+    try:
+        return await analyze_dependency_manifest(body.content, body.ecosystem)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-            # Fetch GitHub stats
-            stars = forks = contributors = 0
-            language = license_name = ""
-            commit_freq = 0.0
-            has_sponsors = False
 
-            if github_url:
-                try:
-                    path   = github_url.replace("https://github.com/", "")
-                    r      = await client.get(f"https://api.github.com/repos/{path}", headers=gh_headers)
-                    if r.status_code == 200:
-                        d            = r.json()
-                        stars        = d.get("stargazers_count", 0)
-                        forks        = d.get("forks_count", 0)
-                        language     = d.get("language", "")
-                        lic          = d.get("license") or {}
-                        license_name = lic.get("spdx_id", "")
-
-                    # Check GitHub Sponsors (funding.yml)
-                    fund_r = await client.get(
-                        f"https://api.github.com/repos/{path}/contents/.github/FUNDING.yml",
-                        headers=gh_headers,
-                    )
-                    has_sponsors = fund_r.status_code == 200
-                except Exception:
-                    pass
-
-            # Determine risk level
-            risk = "low"
-            risk_reasons = []
-            if stars < 100:
-                risk = "high"
-                risk_reasons.append(f"Only {stars} stars")
-            if not has_sponsors:
-                if risk != "high":
-                    risk = "medium"
-                risk_reasons.append("No funding setup")
-            if not license_name:
-                risk = "high"
-                risk_reasons.append("No license")
-
-            results.append({
-                "package": pkg,
-                "ecosystem": ecosystem,
-                "github_url": github_url,
-                "stars": stars,
-                "forks": forks,
-                "language": language,
-                "license": license_name,
-                "has_sponsors": has_sponsors,
-                "risk": risk,
-                "risk_reasons": risk_reasons,
-            })
+@app.post("/api/dependencies/analyze/stream")
+async def analyze_dependencies_stream(body: DepsRequest):
+    """
+    Lockfile mode: analyze every dependency (not just the first 30) and stream
+    NDJSON events — one "start", one "package" per finished dependency, then a
+    "summary" — so the UI can render results as they arrive.
+    """
+    try:
+        packages = parse_packages(body.content, body.ecosystem)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    # Sort: high risk first
-    risk_order = {"high": 0, "medium": 1, "low": 2}
-    results.sort(key=lambda x: risk_order.get(x["risk"], 3))
+    async def ndjson():
+        async for event in stream_dependencies(packages, body.ecosystem):
+            yield json.dumps(event) + "\n"
 
-    return {
-        "ecosystem": ecosystem,
-        "total": len(results),
-        "high_risk": sum(1 for r in results if r["risk"] == "high"),
-        "medium_risk": sum(1 for r in results if r["risk"] == "medium"),
-        "packages": results,
-    }
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 
 # ---------------------------------------------------------------------------
@@ -1039,41 +938,10 @@ def get_portfolio(repo_id: str, max_grants: int = 6, db: Session = Depends(get_d
     if repo.status != "analyzed":
         raise HTTPException(status_code=400, detail="Repository must be analyzed first. Run /api/repos/{repo_id}/matches.")
 
-    matches = (
-        db.query(Match)
-        .filter(Match.repo_id == repo_id)
-        .order_by(Match.match_score.desc())
-        .limit(30)
-        .all()
-    )
-
-    if not matches:
+    match_dicts = [_match_dict(m, fs) for m, fs in _top_matches(db, repo_id, 30)]
+    if not match_dicts:
         raise HTTPException(status_code=404, detail="No matches found. Run AI matching first.")
 
-    # Build match dicts
-    match_dicts = []
-    for m in matches:
-        fs = db.query(FundingSource).filter(FundingSource.id == m.funding_id).first()
-        if not fs:
-            continue
-        match_dicts.append({
-            "funding_id": m.funding_id,
-            "match_score": m.match_score,
-            "reasoning": m.reasoning,
-            "strengths": m.strengths or [],
-            "gaps": m.gaps or [],
-            "funding_source": {
-                "id": fs.id,
-                "name": fs.name,
-                "type": fs.type,
-                "min_amount": fs.min_amount,
-                "max_amount": fs.max_amount,
-                "description": fs.description,
-                "url": fs.url,
-                "category": fs.category,
-            },
-        })
-
     result = optimize_portfolio(match_dicts, max_grants=max_grants)
     result["repo_name"] = repo.repo_name
     result["repo_id"] = repo_id
@@ -1136,22 +1004,10 @@ async def generate_roadmap_endpoint(
     if not body.funding_ids:
         raise HTTPException(status_code=400, detail="Provide at least one funding_id.")
 
-    # Fetch up to 5 funding sources
-    funding_sources = []
-    for fid in body.funding_ids[:5]:
-        fs = db.query(FundingSource).filter(FundingSource.id == fid).first()
-        if fs:
-            funding_sources.append({
-                "id": fs.id,
-                "name": fs.name,
-                "type": fs.type,
-                "description": fs.description,
-                "category": fs.category,
-                "focus_areas": fs.focus_areas or [],
-                "min_amount": fs.min_amount,
-                "max_amount": fs.max_amount,
-                "url": fs.url,
-            })
+    # Up to 5 funding sources, in request order
+    ids = body.funding_ids[:5]
+    catalog = get_catalog(db)
+    funding_sources = [_funding_source_dict(catalog.get(fid)) for fid in ids if catalog.get(fid) is not None]
 
     if not funding_sources:
         raise HTTPException(status_code=404, detail="None of the specified funding sources were found.")
@@ -1206,41 +1062,41 @@ async def get_trending(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                "https://api.github.com/search/repositories",
-                params={"q": q, "sort": "stars", "order": "desc", "per_page": 25},
-                headers=headers,
-            )
-            if resp.status_code != 200:
-                raise HTTPException(status_code=502, detail="GitHub API error.")
-
-            data = resp.json()
-            items = data.get("items", [])
-
-            repos = []
-            for r in items:
-                # Fetch topics (included in response with mercy preview header)
-                repos.append({
-                    "id": r["id"],
-                    "full_name": r["full_name"],
-                    "name": r["name"],
-                    "owner": r["owner"]["login"],
-                    "avatar_url": r["owner"]["avatar_url"],
-                    "description": r.get("description") or "",
-                    "html_url": r["html_url"],
-                    "stars": r["stargazers_count"],
-                    "forks": r["forks_count"],
-                    "language": r.get("language") or "",
-                    "topics": r.get("topics") or [],
-                    "license": (r.get("license") or {}).get("spdx_id") or "",
-                    "created_at": r["created_at"],
-                    "updated_at": r["updated_at"],
-                    "open_issues": r["open_issues_count"],
-                    "watchers": r["watchers_count"],
-                    "homepage": r.get("homepage") or "",
-                    "github_url": r["html_url"],
-                })
+        resp = await github_get(
+            "https://api.github.com/search/repositories",
+            params={"q": q, "sort": "stars", "order": "desc", "per_page": 25},
+            headers=headers,
+            timeout=15.0,
+        )
+        if resp.status_code != 200:
+            raise HTTPException(status_code=502, detail="GitHub API error.")
+
+        data = resp.json()
+        items = data.get("items", [])
+
+        repos = []
+        for r in items:
+            # Fetch topics (included in response with mercy preview header)
+            repos.append({
+                "id": r["id"],
+                "full_name": r["full_name"],
+                "name": r["name"],
+                "owner": r["owner"]["login"],
+                "avatar_url": r["owner"]["avatar_url"],
+                "description": r.get("description") or "",
+                "html_url": r["html_url"],
+                "stars": r["stargazers_count"],
+                "forks": r["forks_count"],
+                "language": r.get("language") or "",
+                "topics": r.get("topics") or [],
+                "license": (r.get("license") or {}).get("spdx_id") or "",
+                "created_at": r["created_at"],
+                "updated_at": r["updated_at"],
+                "open_issues": r["open_issues_count"],
+                "watchers": r["watchers_count"],
+                "homepage": r.get("homepage") or "",
+                "github_url": r["html_url"],
+            })
 
         return {
             "repos": repos,
@@ -1264,38 +1120,9 @@ async def get_trending(
 @app.get("/api/leaderboard")
 def get_leaderboard(limit: int = 25, db: Session = Depends(get_db)):
     """Return repos ranked by funding match quality (top_score * match_count)."""
-    repos = db.query(Repo).filter(Repo.status == "analyzed").all()
-
-    leaderboard = []
-    for repo in repos:
-        matches = db.query(Match).filter(Match.repo_id == repo.id).all()
-        if not matches:
-            continue
-        avg_score = sum(m.match_score for m in matches) / len(matches)
-        top_score = max(m.match_score for m in matches)
-        total_potential = 0
-        for m in matches:
-            fs = db.query(FundingSource).filter(FundingSource.id == m.funding_id).first()
-            if fs:
-                total_potential += fs.max_amount or 0
-        leaderboard.append({
-            "repo_id": repo.id,
-            "repo_name": repo.repo_name,
-            "github_url": repo.github_url,
-            "stars": repo.stars or 0,
-            "language": repo.language or "",
-            "description": repo.description or "",
-            "match_count": len(matches),
-            "avg_score": round(avg_score, 1),
-            "top_score": round(top_score, 1),
-            "total_potential_usd": total_potential,
-            "analyzed_at": repo.created_at.isoformat() if repo.created_at else "",
-        })
-
-    leaderboard.sort(key=lambda x: x["top_score"] * x["match_count"], reverse=True)
     return {
-        "leaderboard": leaderboard[:limit],
-        "total_repos_analyzed": len(repos),
+        "leaderboard": leaderboard.top(db, limit),
+        "total_repos_analyzed": db.query(Repo).filter(Repo.status == "analyzed").count(),
     }
 
 
@@ -4,79 +4,88 @@ Set LLM_API_KEY, LLM_BASE_URL, and LLM_MODEL in your .env file.
 Compatible with: Groq, Together AI, OpenRouter, OpenAI, Mistral, etc.
 """
 
+import asyncio
+import hashlib
 import json
 import os
-from typing import Any
-from openai import AsyncOpenAI
-from llm_utils import get_llm_client
+from typing import Any, Callable, Optional
+import llm_cache
+from llm_utils import get_llm_client, llm_semaphore
+from search_index import get_funding_index, repo_query
+from heuristic_matcher import score_heuristically
+from embeddings import embeddings_enabled, rank_by_similarity, warm_embeddings
 
 # ── LLM Client — dynamic config via settings.json ──────────────────────────
 # Configuration now happens inside run_matching or _score_batch via get_llm_client()
+# Batches are scored concurrently, bounded per provider by LLM_CONCURRENCY
 BATCH_SIZE = 10
 
 # Max candidates to send to AI after keyword pre-filter
-MAX_CANDIDATES = 25
+MAX_CANDIDATES = int(os.getenv("MAX_CANDIDATES", "25"))
+
+# "auto" scores with the LLM and falls back to local heuristics when it fails;
+# "llm" never falls back; "heuristic" never calls the LLM
+MATCHING_MODES = ("auto", "llm", "heuristic")
+MATCHING_MODE = os.getenv("MATCHING_MODE", "auto").lower()
+
+# Reciprocal rank fusion constant for combining BM25 and embedding rankings
+_RRF_K = 60
+
+
+def _funding_dict(fs, idx) -> dict:
+    """Convert ORM objects to dicts for prompt building."""
+    if isinstance(fs, dict):
+        # Assign temporary ID if missing (common in CLI raw data)
+        if "id" not in fs:
+            fs["id"] = f"raw_{idx}"
+        return fs
+    return {
+        "id": fs.id,
+        "name": fs.name,
+        "type": fs.type,
+        "min_amount": fs.min_amount,
+        "max_amount": fs.max_amount,
+        "description": fs.description,
+        "url": fs.url,
+        "category": fs.category,
+        "tags": list(fs.tags or []),
+        "eligibility": dict(fs.eligibility or {}),
+        "focus_areas": list(fs.focus_areas or []),
+        "is_recurring": fs.is_recurring,
+    }
+
+
+def funding_hash(fs) -> str:
+    """Short content hash of everything the matcher sees of a funding source."""
+    blob = json.dumps(_funding_dict(fs, 0), sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
 
 
 def _prefilter(repo_data: dict, funding_sources: list[dict]) -> list[dict]:
     """
-    Fast keyword-based pre-filter — no AI needed.
-    Scores each funding source against repo metadata using simple overlap.
-    Returns top MAX_CANDIDATES sorted by keyword score.
+    Fast keyword pre-filter — no AI needed.
+    Ranks funding sources with the prebuilt BM25 index (see search_index.py)
+    and returns the top MAX_CANDIDATES. With EMBEDDING_BACKEND set, the BM25
+    ranking is fused with embedding similarity (reciprocal rank fusion).
     """
-    lang = (repo_data.get("language") or "").lower()
-    topics = [t.lower() for t in (repo_data.get("topics") or [])]
-    desc = (repo_data.get("description") or "").lower()
-    readme = (repo_data.get("readme_excerpt") or "").lower()
-    repo_text = f"{lang} {desc} {readme} {' '.join(topics)}"
-
-    # Keywords that signal repo type
-    repo_signals = set(repo_text.split())
-    # Add topic words directly
-    repo_signals.update(topics)
-    if lang:
-        repo_signals.add(lang)
-
-    scored = []
-    for fs in funding_sources:
-        score = 0
-        fs_text = " ".join([
-            fs.get("name", ""),
-            fs.get("description", ""),
-            " ".join(fs.get("tags", [])),
-            " ".join(fs.get("focus_areas", [])),
-        ]).lower()
-
-        fs_words = set(fs_text.split())
-
-        # Keyword overlap
-        overlap = repo_signals & fs_words
-        score += len(overlap) * 2
-
-        # Focus area exact match bonus
-        for area in (fs.get("focus_areas") or []):
-            if area.lower() in repo_text or area.lower() == "any":
-                score += 5
-
-        # Tag match bonus
-        for tag in (fs.get("tags") or []):
-            if tag.lower() in repo_text:
-                score += 3
-
-        # "any" focus = always include with base score
-        if "any" in [a.lower() for a in (fs.get("focus_areas") or [])]:
-            score += 8
-
-        # Global eligibility bonus
-        elig = (fs.get("eligibility") or {}).get("location", "").lower()
-        if "global" in elig:
-            score += 4
-
-        scored.append((score, fs))
-
-    # Sort by score descending, take top MAX_CANDIDATES
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [fs for _, fs in scored[:MAX_CANDIDATES]]
+    index = get_funding_index(funding_sources)
+    query = repo_query(repo_data)
+    if not embeddings_enabled():
+        return [funding_sources[i] for i in index.top_k(query, MAX_CANDIDATES)]
+
+    fused = [0.0] * len(funding_sources)
+    for ranking in (index.top_k(query, len(funding_sources)), rank_by_similarity(repo_data, funding_sources)):
+        for rank, i in enumerate(ranking):
+            fused[i] += 1.0 / (_RRF_K + rank + 1)
+    best = sorted(range(len(fused)), key=lambda i: (-fused[i], i))[:MAX_CANDIDATES]
+    return [funding_sources[i] for i in best]
+
+
+def warm_prefilter_index(funding_sources: list[Any]) -> None:
+    """Build the pre-filter index (and embeddings) ahead of the first request."""
+    funding_dicts = [_funding_dict(fs, i) for i, fs in enumerate(funding_sources)]
+    get_funding_index(funding_dicts)
+    warm_embeddings(funding_dicts)
 
 
 def _build_repo_summary(repo_data: dict) -> str:
@@ -166,36 +175,8 @@ Example structure:
 }"""
 
 
-async def _score_batch(repo_summary: str, funding_batch: list[dict]) -> list[dict]:
-    """
-    Ask GPT-4 to score a batch of funding sources against the repo.
-    Returns parsed JSON list of match objects.
-    """
-    funding_list = "\n".join(_build_funding_summary(f) for f in funding_batch)
-
-    user_msg = f"""
-{repo_summary}
-
-FUNDING OPPORTUNITIES TO EVALUATE:
-{funding_list}
-
-Score EACH of the {len(funding_batch)} funding opportunities above against this repository.
-Return a JSON object with a "matches" array containing one entry per funding opportunity.
-"""
-
-    client, model = get_llm_client()
-    response = await client.chat.completions.create(
-        model=model,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_msg},
-        ],
-        temperature=0.3,
-        response_format={"type": "json_object"},
-        max_tokens=6000,
-    )
-
-    content = response.choices[0].message.content
+def _parse_matches(content: str) -> list[dict]:
+    """Pull the match list out of an LLM reply, tolerating the usual wrappers."""
     try:
         parsed = json.loads(content)
     except json.JSONDecodeError:
@@ -226,66 +207,159 @@ Return a JSON object with a "matches" array containing one entry per funding opp
     return []
 
 
-async def run_matching(repo_data: dict, funding_sources: list[Any]) -> list[dict]:
+async def _score_batch(repo_summary: str, funding_batch: list[dict], client=None, model=None) -> list[dict]:
+    """
+    Ask GPT-4 to score a batch of funding sources against the repo.
+    Returns parsed JSON list of match objects. Identical prompts are served
+    from the LLM response cache.
+    """
+    funding_summaries = [_build_funding_summary(f) for f in funding_batch]
+    funding_list = "\n".join(funding_summaries)
+
+    user_msg = f"""
+{repo_summary}
+
+FUNDING OPPORTUNITIES TO EVALUATE:
+{funding_list}
+
+Score EACH of the {len(funding_batch)} funding opportunities above against this repository.
+Return a JSON object with a "matches" array containing one entry per funding opportunity.
+"""
+
+    if client is None:
+        client, model = get_llm_client()
+
+    key = llm_cache.cache_key(client.provider, model, SYSTEM_PROMPT, user_msg)
+    cached = await asyncio.to_thread(llm_cache.lookup, key) if llm_cache.LLM_CACHE_ENABLED else None
+    if cached is not None:
+        return cached
+
+    async with llm_semaphore(client.provider):
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user_msg},
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"},
+            max_tokens=6000,
+        )
+
+    matches = _parse_matches(response.choices[0].message.content)
+    llm_cache.store(key, client.provider, model, matches)
+    return matches
+
+
+def _enrich(scores: list[dict], funding_dicts: list[dict], method: str) -> list[dict]:
+    """Attach funding metadata to each score."""
+    funding_by_id = {fs["id"]: fs for fs in funding_dicts}
+    enriched: list[dict] = []
+    for score_obj in scores:
+        fid = score_obj.get("funding_id")
+        if fid and fid in funding_by_id:
+            enriched.append({
+                **score_obj,
+                "method": method,
+                "funding": funding_by_id[fid],
+            })
+    return enriched
+
+
+async def run_matching(
+    repo_data: dict,
+    funding_sources: list[Any],
+    mode: Optional[str] = None,
+    on_batch: Optional[Callable[[list[dict]], None]] = None,
+    only_ids: Optional[set] = None,
+) -> list[dict]:
     """
     Main entry point: run AI matching for a repo against all funding sources.
 
     Args:
         repo_data: dict from github_api.fetch_repo_data() or Repo model
-        funding_sources: list of FundingSource ORM objects or dicts
+        funding_sources: list of FundingSource rows / catalog records, or dicts
+        mode: "llm" (LLM only), "heuristic" (no LLM calls, see heuristic_matcher)
+              or "auto" (LLM, falling back to heuristics for batches that fail).
+              Defaults to MATCHING_MODE.
+        on_batch: called with each group of enriched matches as soon as it is
+              scored (one call per LLM batch, plus one for heuristic scores)
+        only_ids: if given, only pre-filter candidates with these funding ids
+              are scored (incremental refresh of added / modified sources)
 
     Returns:
-        List of match dicts sorted by score descending, including funding source metadata.
+        List of match dicts sorted by score descending, including funding source
+        metadata and the "method" ("llm" | "heuristic") that produced each score.
     """
     if not funding_sources:
         return []
+    mode = (mode or MATCHING_MODE).lower()
+    if mode not in MATCHING_MODES:
+        raise ValueError(f"Unknown matching mode '{mode}'. Use one of: {', '.join(MATCHING_MODES)}")
 
-    # Convert ORM objects to dicts for prompt building
-    def to_dict(fs, idx) -> dict:
-        if isinstance(fs, dict):
-            # Assign temporary ID if missing (common in CLI raw data)
-            if "id" not in fs:
-                fs["id"] = f"raw_{idx}"
-            return fs
-        return {
-            "id": fs.id,
-            "name": fs.name,
-            "type": fs.type,
-            "min_amount": fs.min_amount,
-            "max_amount": fs.max_amount,
-            "description": fs.description,
-            "url": fs.url,
-            "category": fs.category,
-            "tags": fs.tags or [],
-            "eligibility": fs.eligibility or {},
-            "focus_areas": fs.focus_areas or [],
-            "is_recurring": fs.is_recurring,
-        }
-
-    funding_dicts = [to_dict(fs, i) for i, fs in enumerate(funding_sources)]
-    repo_summary = _build_repo_summary(repo_data)
+    funding_dicts = [_funding_dict(fs, i) for i, fs in enumerate(funding_sources)]
 
     # ── Smart pre-filter: keyword match to top candidates before AI scoring ──
     # This cuts 183 sources down to ~25, making local models fast enough
     candidates = _prefilter(repo_data, funding_dicts)
+    scored = candidates if only_ids is None else [c for c in candidates if c["id"] in only_ids]
+
+    if mode == "heuristic":
+        # Relevance is relative to the best candidate, so score the full list
+        heuristic = score_heuristically(repo_data, candidates, funding_dicts)
+        if only_ids is not None:
+            heuristic = [m for m in heuristic if m["funding_id"] in only_ids]
+        enriched = _enrich(heuristic, funding_dicts, "heuristic")
+        if on_batch:
+            on_batch(enriched)
+        enriched.sort(key=lambda x: x.get("score", 0), reverse=True)
+        return enriched
 
-    # Process in batches to stay within token limits
-    all_scores: list[dict] = []
-    for i in range(0, len(candidates), BATCH_SIZE):
-        batch = candidates[i : i + BATCH_SIZE]
-        batch_scores = await _score_batch(repo_summary, batch)
-        all_scores.extend(batch_scores)
+    repo_summary = _build_repo_summary(repo_data)
 
-    # Attach funding metadata to each score
-    funding_by_id = {fs["id"]: fs for fs in funding_dicts}
-    enriched: list[dict] = []
-    for score_obj in all_scores:
-        fid = score_obj.get("funding_id")
-        if fid and fid in funding_by_id:
-            enriched.append({
-                **score_obj,
-                "funding": funding_by_id[fid],
-            })
+    # Process in batches to stay within token limits; batches run concurrently
+    # and a failed batch only loses its own candidates
+    batches = [scored[i : i + BATCH_SIZE] for i in range(0, len(scored), BATCH_SIZE)]
+    try:
+        client, model = get_llm_client()
+    except Exception:
+        if mode != "auto":
+            raise
+        batches = []  # provider misconfigured: everything falls back below
+    tasks = [asyncio.ensure_future(_score_batch(repo_summary, b, client, model)) for b in batches]
+    batch_of = {t: b for t, b in zip(tasks, batches)}
+    all_scores: list[dict] = []
+    failed: list[dict] = []
+    errors: list[Exception] = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                batch_scores = await next_done
+            except Exception as e:
+                errors.append(e)
+                continue
+            all_scores.extend(batch_scores)
+            if on_batch:
+                on_batch(_enrich(batch_scores, funding_dicts, "llm"))
+    finally:
+        for t in tasks:
+            t.cancel()
+    for t in tasks:
+        if not t.cancelled() and t.exception() is not None:
+            failed.extend(batch_of[t])
+
+    enriched = _enrich(all_scores, funding_dicts, "llm")
+    if mode == "auto":
+        # Fall back to local scoring for whatever the LLM couldn't score
+        if not enriched:
+            failed = scored
+        if failed:
+            fallback = _enrich(score_heuristically(repo_data, failed, funding_dicts), funding_dicts, "heuristic")
+            if on_batch:
+                on_batch(fallback)
+            enriched += fallback
+    elif errors and len(errors) == len(batches):
+        raise errors[0]
 
     # Sort by score descending
     enriched.sort(key=lambda x: x.get("score", 0), reverse=True)
@@ -7,7 +7,7 @@ import uuid
 from datetime import datetime
 from sqlalchemy import (
     create_engine, Column, String, Integer, Float,
-    DateTime, Text, Boolean, JSON
+    DateTime, Text, Boolean, JSON, inspect, text
 )
 from sqlalchemy.orm import declarative_base, sessionmaker
 from dotenv import load_dotenv
@@ -37,6 +37,25 @@ def get_db():
 def init_db():
     """Create all tables. Safe to call on every startup."""
     Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+
+
+def _add_missing_columns():
+    """
+    create_all() never alters existing tables, so columns added to a model
+    after a database was created are appended here (nullable, no backfill).
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            present = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in present:
+                    col_type = column.type.compile(dialect=engine.dialect)
+                    conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {col_type}'))
 
 
 class Repo(Base):
@@ -46,6 +65,7 @@ class Repo(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     github_url = Column(String, nullable=False, index=True)
     repo_name = Column(String, nullable=False)          # e.g. "owner/repo"
+    repo_key = Column(String, nullable=True, index=True)  # normalized lowercase "owner/repo" (coalescing)
     owner = Column(String, nullable=True)
     stars = Column(Integer, default=0)
     forks = Column(Integer, default=0)
@@ -67,6 +87,12 @@ class Repo(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     status = Column(String, default="pending")          # pending | analyzed | error
     error_message = Column(Text, nullable=True)
+    refinement_status = Column(String, nullable=True)   # refining | complete | partial | failed | skipped (LLM pass after instant results)
+    analyzed_at = Column(DateTime, nullable=True)       # last (re-)analysis; created_at for never-refreshed rows
+    input_hash = Column(String, nullable=True)          # hash of the material GitHub inputs last scored
+    catalog_hashes = Column(JSON, nullable=True)        # {funding_id: matcher.funding_hash} at the last scoring
+    view_count = Column(Integer, default=0)             # submissions / scans of this repo (refresh priority)
+    last_viewed_at = Column(DateTime, nullable=True)
 
 
 class FundingSource(Base):
@@ -103,3 +129,111 @@ class Match(Base):
     gaps = Column(JSON, default=list)                   # What the project might be missing
     application_tips = Column(Text, nullable=True)      # How to strengthen the application
     created_at = Column(DateTime, default=datetime.utcnow)
+    provisional = Column(Boolean, default=False)        # heuristic score awaiting LLM refinement
+    refinement = Column(String, nullable=True)          # pending | refined | fallback | heuristic
+
+
+class HttpCacheEntry(Base):
+    """Cached GitHub REST response, revalidated with ETag / Last-Modified."""
+    __tablename__ = "http_cache"
+
+    key = Column(String, primary_key=True)              # sha256 of URL + params + Accept + auth
+    url = Column(Text, nullable=False)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    headers = Column(JSON, default=dict)                # subset of response headers (Link, Content-Type)
+    body = Column(Text, nullable=False)
+    fetched_at = Column(DateTime, default=datetime.utcnow)     # last full 200 response
+    validated_at = Column(DateTime, default=datetime.utcnow, index=True)  # last 200 or 304
+
+
+class PackageResolution(Base):
+    """Cached npm / PyPI package -> GitHub repo mapping (github_url NULL = no GitHub repo)."""
+    __tablename__ = "package_resolutions"
+
+    ecosystem = Column(String, primary_key=True)        # npm | pip
+    name = Column(String, primary_key=True)             # normalized package name
+    github_url = Column(String, nullable=True)
+    resolved_at = Column(DateTime, default=datetime.utcnow)
+
+
+class LlmCacheEntry(Base):
+    """Cached parsed LLM match list for one scoring batch (content-addressed)."""
+    __tablename__ = "llm_cache"
+
+    key = Column(String, primary_key=True)              # sha256 of provider, model, prompts, repo + funding summaries
+    provider = Column(String, nullable=False)
+    model = Column(String, nullable=True)
+    response = Column(JSON, default=list)               # parsed "matches" array
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    last_used_at = Column(DateTime, default=datetime.utcnow, index=True)
+    hits = Column(Integer, default=0)
+
+
+class FundingEmbedding(Base):
+    """Persisted funding-source vector for the semantic pre-filter."""
+    __tablename__ = "funding_embeddings"
+
+    key = Column(String, primary_key=True)              # sha256 of encoder + source text
+    encoder = Column(String, nullable=False)            # e.g. "hashed:512" or "local:<model>"
+    vector = Column(JSON, nullable=False)               # unit-length float list
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class Job(Base):
+    """Durable background job (see job_queue.py)."""
+    __tablename__ = "jobs"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    kind = Column(String, nullable=False)               # e.g. "analyze"
+    repo_id = Column(String, nullable=True, index=True)
+    payload = Column(JSON, default=dict)
+    status = Column(String, default="queued", index=True)   # queued | running | done | failed
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    run_after = Column(DateTime, default=datetime.utcnow, index=True)    # backoff: not claimable before this
+    lease_expires_at = Column(DateTime, nullable=True)  # running job is reclaimed after this (visibility timeout)
+    locked_by = Column(String, nullable=True)           # worker id holding the lease
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class AnalysisEvent(Base):
+    """Progress event written by a standalone worker, relayed to SSE clients by the API."""
+    __tablename__ = "analysis_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    repo_id = Column(String, nullable=False, index=True)
+    event = Column(String, nullable=False)
+    data = Column(JSON, default=dict)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class LeaderboardEntry(Base):
+    """Materialized leaderboard row for one analyzed repo (see leaderboard.py)."""
+    __tablename__ = "leaderboard"
+
+    repo_id = Column(String, primary_key=True)
+    repo_name = Column(String, nullable=False)
+    github_url = Column(String, nullable=False)
+    stars = Column(Integer, default=0)
+    language = Column(String, nullable=True)
+    description = Column(Text, nullable=True)
+    match_count = Column(Integer, default=0)
+    avg_score = Column(Float, default=0.0)
+    top_score = Column(Float, default=0.0)
+    total_potential_usd = Column(Integer, default=0)
+    rank_score = Column(Float, default=0.0, index=True)  # top_score * match_count
+    analyzed_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class CatalogVersion(Base):
+    """Single-row counter bumped whenever funding_sources changes (see funding_catalog.py)."""
+    __tablename__ = "catalog_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    content_hash = Column(String, nullable=True)        # hash of data/funding_sources.json at the last seed
+    updated_at = Column(DateTime, default=datetime.utcnow)
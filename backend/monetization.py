@@ -1,8 +1,7 @@
 import os
-import httpx
 import re
 from typing import List, Dict, Any
-from github_api import _headers, GITHUB_API_BASE
+from github_api import _headers, github_get, GITHUB_API_BASE
 from llm_utils import get_llm_client
 
 # ── LLM Client — dynamic config via settings.json ──────────────────────────
@@ -22,35 +21,34 @@ async def fetch_live_bounties(query: str = "label:bounty label:\"help wanted\" s
         "per_page": 20
     }
     
-    async with httpx.AsyncClient(headers=_headers(), timeout=20.0) as client:
-        try:
-            resp = await client.get(search_url, params=params)
-            resp.raise_for_status()
-            data = resp.json()
-            items = data.get("items", [])
+    try:
+        resp = await github_get(search_url, params=params, headers=_headers(), timeout=20.0)
+        resp.raise_for_status()
+        data = resp.json()
+        items = data.get("items", [])
+        
+        bounties = []
+        for item in items:
+            repo_url = item.get("repository_url", "")
+            repo_name = "/".join(repo_url.split("/")[-2:])
             
-            bounties = []
-            for item in items:
-                repo_url = item.get("repository_url", "")
-                repo_name = "/".join(repo_url.split("/")[-2:])
-                
-                # Mocking amount and platform for now as GitHub doesn't have native bounty amounts
-                # In a production app, we'd cross-reference with Bountysource/Algora APIs
-                bounties.append({
-                    "id": str(item.get("id")),
-                    "title": item.get("title"),
-                    "repo": repo_name,
-                    "amount": 100 if "bounty" in [l["name"].lower() for l in item.get("labels", [])] else 50,
-                    "tags": [l["name"] for l in item.get("labels", [])][:3],
-                    "level": "Intermediate", # Defaulting as GitHub doesn't specify
-                    "platform": "GitHub Issues",
-                    "url": item.get("html_url"),
-                    "posted": item.get("created_at")
-                })
-            return bounties
-        except Exception as e:
-            print(f"Error fetching bounties: {e}")
-            return []
+            # Mocking amount and platform for now as GitHub doesn't have native bounty amounts
+            # In a production app, we'd cross-reference with Bountysource/Algora APIs
+            bounties.append({
+                "id": str(item.get("id")),
+                "title": item.get("title"),
+                "repo": repo_name,
+                "amount": 100 if "bounty" in [l["name"].lower() for l in item.get("labels", [])] else 50,
+                "tags": [l["name"] for l in item.get("labels", [])][:3],
+                "level": "Intermediate", # Defaulting as GitHub doesn't specify
+                "platform": "GitHub Issues",
+                "url": item.get("html_url"),
+                "posted": item.get("created_at")
+            })
+        return bounties
+    except Exception as e:
+        print(f"Error fetching bounties: {e}")
+        return []
 
 async def generate_monetization_strategy(repo_data: Dict[str, Any]) -> Dict[str, Any]:
     """
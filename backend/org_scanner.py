@@ -6,9 +6,10 @@ analysis on each one. Returns repos ranked by fundability score.
 """
 
 import os
-import httpx
 from dotenv import load_dotenv
 from fundability import analyze_fundability
+from github_api import github_get
+from github_graphql import fetch_repos_graphql, graphql_available
 
 load_dotenv()
 
@@ -48,56 +49,68 @@ async def scan_org(org_input: str) -> dict:
     results = []
     org_info = {}
 
-    async with httpx.AsyncClient(headers=_headers(), timeout=30.0) as client:
-        # Try org first, fall back to user
-        org_resp = await client.get(f"https://api.github.com/orgs/{org_name}")
-        if org_resp.status_code == 200:
-            data = org_resp.json()
-            entity_type = "org"
-            org_info = {
-                "org": org_name,
-                "type": "org",
-                "name": data.get("name") or org_name,
-                "avatar_url": data.get("avatar_url", ""),
-                "description": data.get("description", ""),
-                "public_repos": data.get("public_repos", 0),
-                "html_url": data.get("html_url", f"https://github.com/{org_name}"),
-            }
-            repos_url = f"https://api.github.com/orgs/{org_name}/repos"
-        else:
-            user_resp = await client.get(f"https://api.github.com/users/{org_name}")
-            if user_resp.status_code != 200:
-                raise ValueError(f"Could not find GitHub org or user: '{org_name}'")
-            data = user_resp.json()
-            entity_type = "user"
-            org_info = {
-                "org": org_name,
-                "type": "user",
-                "name": data.get("name") or org_name,
-                "avatar_url": data.get("avatar_url", ""),
-                "description": data.get("bio", ""),
-                "public_repos": data.get("public_repos", 0),
-                "html_url": data.get("html_url", f"https://github.com/{org_name}"),
-            }
-            repos_url = f"https://api.github.com/users/{org_name}/repos"
-
-        # Paginate repos (up to MAX_REPOS)
-        raw_repos = []
-        page = 1
-        while len(raw_repos) < MAX_REPOS:
-            resp = await client.get(
-                repos_url,
-                params={"per_page": 30, "page": page, "sort": "updated", "type": "public"},
+    # Try org first, fall back to user
+    org_resp = await github_get(f"https://api.github.com/orgs/{org_name}", headers=_headers(), timeout=30.0)
+    if org_resp.status_code == 200:
+        data = org_resp.json()
+        entity_type = "org"
+        org_info = {
+            "org": org_name,
+            "type": "org",
+            "name": data.get("name") or org_name,
+            "avatar_url": data.get("avatar_url", ""),
+            "description": data.get("description", ""),
+            "public_repos": data.get("public_repos", 0),
+            "html_url": data.get("html_url", f"https://github.com/{org_name}"),
+        }
+        repos_url = f"https://api.github.com/orgs/{org_name}/repos"
+    else:
+        user_resp = await github_get(f"https://api.github.com/users/{org_name}", headers=_headers(), timeout=30.0)
+        if user_resp.status_code != 200:
+            raise ValueError(f"Could not find GitHub org or user: '{org_name}'")
+        data = user_resp.json()
+        entity_type = "user"
+        org_info = {
+            "org": org_name,
+            "type": "user",
+            "name": data.get("name") or org_name,
+            "avatar_url": data.get("avatar_url", ""),
+            "description": data.get("bio", ""),
+            "public_repos": data.get("public_repos", 0),
+            "html_url": data.get("html_url", f"https://github.com/{org_name}"),
+        }
+        repos_url = f"https://api.github.com/users/{org_name}/repos"
+
+    # Paginate repos (up to MAX_REPOS)
+    raw_repos = []
+    page = 1
+    while len(raw_repos) < MAX_REPOS:
+        resp = await github_get(
+            repos_url,
+            params={"per_page": 30, "page": page, "sort": "updated", "type": "public"},
+            headers=_headers(),
+            timeout=30.0,
+        )
+        if resp.status_code != 200:
+            break
+        batch = resp.json()
+        if not batch:
+            break
+        raw_repos.extend(batch)
+        page += 1
+        if len(batch) < 30:
+            break
+
+    # With a token, pull README / contributors / commit activity for every
+    # non-fork repo in a few batched GraphQL queries
+    details = {}
+    if graphql_available():
+        try:
+            details = await fetch_repos_graphql(
+                [r.get("full_name", "") for r in raw_repos[:MAX_REPOS] if not r.get("fork")]
             )
-            if resp.status_code != 200:
-                break
-            batch = resp.json()
-            if not batch:
-                break
-            raw_repos.extend(batch)
-            page += 1
-            if len(batch) < 30:
-                break
+        except Exception:
+            details = {}
 
     # Analyze each repo
     for r in raw_repos[:MAX_REPOS]:
@@ -106,6 +119,7 @@ async def scan_org(org_input: str) -> dict:
 
         license_info = r.get("license") or {}
         topics = r.get("topics") or []
+        extra = details.get((r.get("full_name") or "").lower(), {})
 
         repo_dict = {
             "repo_name": r.get("full_name", ""),
@@ -113,12 +127,12 @@ async def scan_org(org_input: str) -> dict:
             "language": r.get("language"),
             "stars": r.get("stargazers_count", 0),
             "forks": r.get("forks_count", 0),
-            "contributors_count": 0,    # Not fetched in bulk for speed
-            "commit_frequency": 0.0,    # Not fetched in bulk for speed
+            "contributors_count": extra.get("contributors_count", 0),
+            "commit_frequency": extra.get("commit_frequency", 0.0),
             "open_issues": r.get("open_issues_count", 0),
             "license_name": license_info.get("spdx_id") or license_info.get("name", ""),
             "topics": topics,
-            "readme_excerpt": "",       # Not fetched in bulk
+            "readme_excerpt": extra.get("readme_excerpt", ""),
             "homepage": r.get("homepage", ""),
             "is_fork": r.get("fork", False),
             "has_pages": r.get("has_pages", False),
@@ -135,6 +149,8 @@ async def scan_org(org_input: str) -> dict:
             "stars": r.get("stargazers_count", 0),
             "forks": r.get("forks_count", 0),
             "open_issues": r.get("open_issues_count", 0),
+            "contributors_count": repo_dict["contributors_count"],
+            "commit_frequency": repo_dict["commit_frequency"],
             "topics": topics,
             "license": license_info.get("spdx_id", ""),
             "updated_at": r.get("updated_at", ""),
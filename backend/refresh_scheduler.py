@@ -0,0 +1,183 @@
+"""
+Stale Repo Refresh Scheduler
+============================
+Re-analyzes popular repos before their cached analysis expires (the 24h
+window in submit_repo), so the next visitor gets warm results instead of
+paying for a full GitHub + LLM run.
+
+Every REFRESH_INTERVAL_SECONDS the scheduler picks analyzed repos that are
+older than REFRESH_STALE_HOURS and were requested in the last
+REFRESH_ACTIVE_DAYS, ranks them by traffic (view_count), popularity (stars)
+and staleness, and enqueues "refresh" jobs for the top ones. Refreshes are
+incremental (see analysis.analyze_and_match), and a failed refresh keeps the
+previous results.
+
+Spend is capped per rolling hour: REFRESH_GITHUB_BUDGET_PER_HOUR GitHub
+requests and REFRESH_LLM_BUDGET_PER_HOUR LLM calls, each refresh being
+charged its worst case. The refresh jobs in the `jobs` table are the ledger,
+so the budget holds across API processes and restarts. Refreshing also pauses
+while the GitHub token pool reports less than REFRESH_GITHUB_RESERVE core
+requests left, keeping headroom for interactive submissions.
+"""
+
+import asyncio
+import math
+import os
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+from sqlalchemy import func
+
+import job_queue
+from analysis import analyze_and_match
+from github_scheduler import token_pool
+from matcher import BATCH_SIZE, MAX_CANDIDATES
+from models import SessionLocal, Job, Repo
+
+load_dotenv()
+
+REFRESH_ENABLED = os.getenv("REFRESH_ENABLED", "true").lower() in ("1", "true", "yes")
+REFRESH_INTERVAL_SECONDS = float(os.getenv("REFRESH_INTERVAL_SECONDS", "300"))
+REFRESH_STALE_HOURS = float(os.getenv("REFRESH_STALE_HOURS", "20"))
+REFRESH_ACTIVE_DAYS = float(os.getenv("REFRESH_ACTIVE_DAYS", "7"))
+REFRESH_GITHUB_BUDGET_PER_HOUR = int(os.getenv("REFRESH_GITHUB_BUDGET_PER_HOUR", "300"))
+REFRESH_LLM_BUDGET_PER_HOUR = int(os.getenv("REFRESH_LLM_BUDGET_PER_HOUR", "60"))
+REFRESH_GITHUB_RESERVE = int(os.getenv("REFRESH_GITHUB_RESERVE", "500"))
+
+# Worst-case cost of one refresh: fetch_repo_data makes 5 REST calls (repo,
+# topics, README, contributors, commit activity) and the LLM scores at most
+# MAX_CANDIDATES in BATCH_SIZE batches
+GITHUB_CALLS_PER_REFRESH = 5
+LLM_CALLS_PER_REFRESH = math.ceil(MAX_CANDIDATES / BATCH_SIZE)
+
+# Candidates considered per tick (the most viewed / starred stale repos)
+_CANDIDATE_POOL = 500
+
+_last_run: dict = {}
+
+
+async def run_refresh_job(payload: dict) -> None:
+    """A refresh that fails leaves the previous analysis in place (no retries)."""
+    try:
+        await analyze_and_match(payload["repo_id"], payload.get("mode"), raise_errors=True, refresh=True)
+    except Exception:
+        pass
+
+
+job_queue.register("refresh", run_refresh_job)
+
+
+def _refreshes_last_hour(db) -> int:
+    since = datetime.utcnow() - timedelta(hours=1)
+    return db.query(func.count(Job.id)).filter(Job.kind == "refresh", Job.created_at >= since).scalar() or 0
+
+
+def _hourly_capacity() -> int:
+    """Refreshes per hour allowed by the tighter of the two budgets."""
+    return min(
+        REFRESH_GITHUB_BUDGET_PER_HOUR // GITHUB_CALLS_PER_REFRESH,
+        REFRESH_LLM_BUDGET_PER_HOUR // max(1, LLM_CALLS_PER_REFRESH),
+    )
+
+
+def _github_headroom() -> bool:
+    """False when every token with a known core budget is below the reserve."""
+    known = [s["remaining"]["core"] for s in token_pool.snapshot() if "core" in s["remaining"]]
+    return not known or max(known) >= REFRESH_GITHUB_RESERVE
+
+
+def _priority(repo: Repo, now: datetime) -> float:
+    analyzed = repo.analyzed_at or repo.created_at or now
+    staleness = (now - analyzed).total_seconds() / 3600 / REFRESH_STALE_HOURS
+    return staleness * (1 + math.log2(1 + (repo.view_count or 0))) * (1 + math.log10(1 + (repo.stars or 0)))
+
+
+def pick_stale_repos(db, limit: int) -> list[Repo]:
+    """The `limit` most deserving stale repos with no analysis already queued."""
+    if limit <= 0:
+        return []
+    now = datetime.utcnow()
+    stale_before = now - timedelta(hours=REFRESH_STALE_HOURS)
+    active_since = now - timedelta(days=REFRESH_ACTIVE_DAYS)
+    candidates = (
+        db.query(Repo)
+        .filter(
+            Repo.status == "analyzed",
+            func.coalesce(Repo.analyzed_at, Repo.created_at) < stale_before,
+            Repo.last_viewed_at >= active_since,
+        )
+        .order_by(Repo.view_count.desc(), Repo.stars.desc())
+        .limit(_CANDIDATE_POOL)
+        .all()
+    )
+    candidates.sort(key=lambda r: _priority(r, now), reverse=True)
+    picked = []
+    for repo in candidates:
+        if len(picked) >= limit:
+            break
+        if not job_queue.has_active_job(repo.id, db):
+            picked.append(repo)
+    return picked
+
+
+def schedule_refreshes() -> int:
+    """Enqueue as many refreshes as this hour's budget allows; returns the count."""
+    db = SessionLocal()
+    try:
+        room = _hourly_capacity() - _refreshes_last_hour(db)
+        if room > 0 and not _github_headroom():
+            room = 0
+        picked = pick_stale_repos(db, room)
+        for repo in picked:
+            job_queue.enqueue("refresh", {"repo_id": repo.id}, repo_id=repo.id, max_attempts=1, db=db)
+        _last_run.update({"at": datetime.utcnow().isoformat(), "enqueued": len(picked)})
+        return len(picked)
+    finally:
+        db.close()
+
+
+async def run_scheduler() -> None:
+    """Refresh loop for the API lifespan; one failed tick doesn't stop it."""
+    while True:
+        try:
+            schedule_refreshes()
+        except Exception:
+            pass
+        await asyncio.sleep(REFRESH_INTERVAL_SECONDS)
+
+
+def status() -> dict:
+    """Scheduler state and budget usage, for the ops endpoint."""
+    db = SessionLocal()
+    try:
+        used = _refreshes_last_hour(db)
+        stale_before = datetime.utcnow() - timedelta(hours=REFRESH_STALE_HOURS)
+        stale = db.query(func.count(Repo.id)).filter(
+            Repo.status == "analyzed",
+            func.coalesce(Repo.analyzed_at, Repo.created_at) < stale_before,
+        ).scalar() or 0
+        pending = dict(
+            db.query(Job.status, func.count(Job.id))
+            .filter(Job.kind == "refresh", Job.status.in_(("queued", "running")))
+            .group_by(Job.status)
+            .all()
+        )
+    finally:
+        db.close()
+    return {
+        "enabled": REFRESH_ENABLED,
+        "interval_seconds": REFRESH_INTERVAL_SECONDS,
+        "stale_after_hours": REFRESH_STALE_HOURS,
+        "stale_repos": stale,
+        "refresh_jobs": pending,
+        "last_run": dict(_last_run),
+        "budget": {
+            "refreshes_per_hour": _hourly_capacity(),
+            "refreshes_last_hour": used,
+            "github_calls_per_hour": REFRESH_GITHUB_BUDGET_PER_HOUR,
+            "github_calls_used": used * GITHUB_CALLS_PER_REFRESH,
+            "llm_calls_per_hour": REFRESH_LLM_BUDGET_PER_HOUR,
+            "llm_calls_used": used * LLM_CALLS_PER_REFRESH,
+            "github_headroom": _github_headroom(),
+        },
+    }
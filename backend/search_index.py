@@ -0,0 +1,141 @@
+"""
+Funding Source Search Index
+===========================
+BM25 inverted index over the funding catalog, used by matcher._prefilter.
+
+Each funding source is tokenized once (name, description, tags, focus areas;
+tags and focus areas are boosted) and every term's BM25 weight per source is
+precomputed into a postings list. Scoring a repo is then a sparse dot product:
+walk the postings of the repo's terms and accumulate weights, instead of
+rebuilding and scanning every source's text on each request.
+
+The index is cached per catalog fingerprint, so it is built at startup and
+rebuilt automatically when funding sources change.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+
+# BM25 parameters
+K1 = 1.5
+B = 0.75
+
+# Field boosts: a tag / focus-area hit says more than a word in the blurb
+FIELD_WEIGHTS = {"name": 1.0, "description": 1.0, "tags": 2.0, "focus_areas": 3.0}
+
+# Catalog-wide priors (in BM25 units) carried over from the old keyword filter:
+# "any"-focus programs fit every repo, globally eligible programs fit more people
+ANY_FOCUS_PRIOR = 2.0
+GLOBAL_PRIOR = 1.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the this "
+    "to was we with you your can will not all any more other their they which into also "
+    "use using used via".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words plus adjacent-word bigrams ("machine_learning")."""
+    words = [w for w in _TOKEN_RE.findall((text or "").lower()) if w not in _STOPWORDS]
+    return words + [f"{a}_{b}" for a, b in zip(words, words[1:])]
+
+
+def tokenize_field(value) -> list[str]:
+    """Tokenize a text field or a list of tags (no bigrams across list items)."""
+    if isinstance(value, (list, tuple)):
+        return [t for item in value for t in tokenize(str(item))]
+    return tokenize(value or "")
+
+
+# Query weight of each repo field when ranking funding sources
+REPO_FIELD_WEIGHTS = (("topics", 2.0), ("language", 2.0), ("description", 1.5), ("readme_excerpt", 1.0))
+
+
+def repo_query(repo_data: dict) -> dict[str, float]:
+    """Weighted query terms for a repo; each field counts a term at most once."""
+    query: dict[str, float] = {}
+    for field, weight in REPO_FIELD_WEIGHTS:
+        for term in set(tokenize_field(repo_data.get(field))):
+            query[term] = query.get(term, 0.0) + weight
+    return query
+
+
+class BM25Index:
+    """Precomputed BM25 postings: term -> [(doc index, weight)]."""
+
+    def __init__(self, docs: list[dict]):
+        doc_terms: list[Counter] = []
+        for doc in docs:
+            tf: Counter = Counter()
+            for field, weight in FIELD_WEIGHTS.items():
+                for term in tokenize_field(doc.get(field)):
+                    tf[term] += weight
+            doc_terms.append(tf)
+
+        n = len(docs)
+        lengths = [sum(tf.values()) for tf in doc_terms]
+        avg_len = (sum(lengths) / n) if n else 0.0
+        df: Counter = Counter()
+        for tf in doc_terms:
+            df.update(tf.keys())
+
+        self.postings: dict[str, list[tuple[int, float]]] = defaultdict(list)
+        for i, tf in enumerate(doc_terms):
+            norm = K1 * (1 - B + B * lengths[i] / avg_len) if avg_len else K1
+            for term, freq in tf.items():
+                idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+                self.postings[term].append((i, idf * freq * (K1 + 1) / (freq + norm)))
+
+        self.prior = []
+        for doc in docs:
+            p = 0.0
+            if "any" in [a.lower() for a in (doc.get("focus_areas") or [])]:
+                p += ANY_FOCUS_PRIOR
+            if "global" in ((doc.get("eligibility") or {}).get("location") or "").lower():
+                p += GLOBAL_PRIOR
+            self.prior.append(p)
+
+    def scores(self, query: dict[str, float]) -> list[float]:
+        """Score every document against weighted query terms."""
+        totals = list(self.prior)
+        for term, q_weight in query.items():
+            for i, w in self.postings.get(term, ()):
+                totals[i] += q_weight * w
+        return totals
+
+    def top_k(self, query: dict[str, float], k: int) -> list[int]:
+        """Indices of the best k documents, ties broken by catalog order."""
+        scored = self.scores(query)
+        return heapq.nsmallest(k, range(len(scored)), key=lambda i: (-scored[i], i))
+
+
+def fingerprint(funding_sources: list[dict]) -> int:
+    """Cheap in-process hash of the fields the index reads."""
+    return hash(tuple(
+        (
+            str(fs.get("id")), fs.get("name"), fs.get("description"),
+            tuple(fs.get("tags") or ()), tuple(fs.get("focus_areas") or ()),
+            (fs.get("eligibility") or {}).get("location"),
+        )
+        for fs in funding_sources
+    ))
+
+
+_index: BM25Index | None = None
+_index_fingerprint: int | None = None
+
+
+def get_funding_index(funding_sources: list[dict]) -> BM25Index:
+    """Return the cached index, rebuilding it if the catalog changed."""
+    global _index, _index_fingerprint
+    fp = fingerprint(funding_sources)
+    if _index is None or fp != _index_fingerprint:
+        _index = BM25Index(funding_sources)
+        _index_fingerprint = fp
+    return _index
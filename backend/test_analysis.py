@@ -0,0 +1,255 @@
+import asyncio
+
+import pytest
+
+import analysis
+from github_api import GitHubTransientError
+from models import Repo
+
+REPO_DATA = {
+    "repo_name": "octo/widget",
+    "owner": "octo",
+    "stars": 800,
+    "description": "A Python web framework for building APIs",
+    "topics": ["python", "web", "api"],
+    "language": "Python",
+    "readme_excerpt": "Fast, typed web APIs.",
+    "license_name": "MIT",
+    "contributors_count": 25,
+    "commit_frequency": 4.0,
+}
+
+
+def _repo(db, status="pending") -> str:
+    repo = Repo(github_url="https://github.com/octo/widget", repo_name="octo/widget",
+                repo_key="octo/widget", status=status)
+    db.add(repo)
+    db.commit()
+    return repo.id
+
+
+def _github(monkeypatch, result):
+    """Make fetch_repo_data return `result` (a dict) or raise it (an exception)."""
+    calls = []
+
+    async def fake_fetch(url):
+        calls.append(url)
+        if isinstance(result, Exception):
+            raise result
+        return {**result, "github_url": url}
+
+    monkeypatch.setattr(analysis, "fetch_repo_data", fake_fetch)
+    return calls
+
+
+def test_rate_limited_analyze_job_is_left_for_the_queue_to_retry(db, monkeypatch):
+    repo_id = _repo(db)
+    _github(monkeypatch, GitHubTransientError("rate limited"))
+
+    with pytest.raises(GitHubTransientError):
+        asyncio.run(analysis.run_analyze_job({"repo_id": repo_id}))
+
+    db.expire_all()
+    assert db.get(Repo, repo_id).status == "pending"
+
+
+def test_missing_repo_is_a_permanent_error(db, monkeypatch):
+    repo_id = _repo(db)
+    _github(monkeypatch, ValueError("Repository 'octo/widget' not found on GitHub."))
+
+    asyncio.run(analysis.run_analyze_job({"repo_id": repo_id}))
+
+    db.expire_all()
+    repo = db.get(Repo, repo_id)
+    assert repo.status == "error" and "not found" in repo.error_message
+
+
+@pytest.mark.parametrize("url", [
+    "https://github.com/Octo/Widget", "https://github.com/octo/widget/", "https://github.com/octo/widget.git",
+    "github.com/OCTO/widget",
+])
+def test_repo_key_normalizes_url_spellings(url):
+    assert analysis.repo_key(url) == "octo/widget"
+
+
+def test_claim_repo_converges_on_the_oldest_pending_row(db):
+    first, created_first = analysis.claim_repo(db, "octo/widget", "https://github.com/octo/widget", "octo/widget")
+    second, created_second = analysis.claim_repo(db, "octo/widget", "https://github.com/Octo/Widget", "Octo/Widget")
+
+    assert created_first and not created_second
+    assert second.id == first.id
+    assert db.query(Repo).count() == 1
+    assert analysis.find_repo(db, "octo/widget").id == first.id
+
+
+def test_analyze_once_shares_one_run_between_concurrent_callers(db, monkeypatch):
+    repo_id = _repo(db)
+    runs = []
+
+    async def fake_analyze(rid, mode=None, raise_errors=False, refresh=False):
+        runs.append(rid)
+        await asyncio.sleep(0.05)
+
+    monkeypatch.setattr(analysis, "analyze_and_match", fake_analyze)
+
+    async def scan_three_times():
+        await asyncio.gather(*(analysis.analyze_once("octo/widget", repo_id) for _ in range(3)))
+        return analysis.is_in_flight(db, "octo/widget", repo_id)
+
+    still_running = asyncio.run(scan_three_times())
+
+    assert runs == [repo_id]
+    assert not still_running
+
+
+def _spy_matching(monkeypatch, llm_methods=None):
+    """
+    Record run_matching's only_ids. Heuristic runs are real; for the LLM pass,
+    heuristic scores come back tagged with `llm_methods` (one per batch) to
+    simulate refined batches ("llm") or a fallback after an outage ("heuristic").
+    """
+    calls = []
+    real = analysis.run_matching
+
+    async def spy(repo, sources, mode=None, on_batch=None, only_ids=None):
+        calls.append((mode, only_ids))
+        results = await real(repo, sources, mode="heuristic", only_ids=only_ids)
+        if mode != "heuristic" and on_batch is not None:
+            for i, method in enumerate(llm_methods or ["llm"]):
+                batch = results[i::len(llm_methods or ["llm"])]
+                on_batch([{**m, "method": method} for m in batch])
+        return results
+
+    monkeypatch.setattr(analysis, "run_matching", spy)
+    return calls
+
+
+def _analyze(repo_id, mode):
+    asyncio.run(analysis.analyze_and_match(repo_id, mode))
+
+
+def test_unchanged_repo_only_rescores_modified_sources(db, monkeypatch):
+    from funding_catalog import bump_version
+    from funding_db import seed_funding_sources
+    from models import FundingSource, Match
+
+    seed_funding_sources(db)
+    repo_id = _repo(db)
+    _github(monkeypatch, REPO_DATA)
+    calls = _spy_matching(monkeypatch)
+
+    _analyze(repo_id, "heuristic")
+    assert calls == [("heuristic", None)]
+    matched = {m.funding_id for m in db.query(Match).filter(Match.repo_id == repo_id)}
+    assert matched
+
+    # Same inputs, same catalog: nothing is re-scored
+    calls.clear()
+    _analyze(repo_id, "heuristic")
+    assert calls == []
+
+    # One candidate edited (its ceiling went up): only it is re-scored
+    edited = db.get(FundingSource, min(matched))
+    edited.max_amount = (edited.max_amount or 0) + 10000
+    db.commit()
+    bump_version(db)
+    calls.clear()
+    _analyze(repo_id, "heuristic")
+    assert calls == [("heuristic", {edited.id})]
+    db.expire_all()
+    assert {m.funding_id for m in db.query(Match).filter(Match.repo_id == repo_id)} == matched
+
+    # Material input change (topics): full re-run
+    _github(monkeypatch, {**REPO_DATA, "topics": ["rust", "embedded"]})
+    calls.clear()
+    _analyze(repo_id, "heuristic")
+    assert calls == [("heuristic", None)]
+
+
+def test_star_noise_does_not_change_the_input_hash():
+    assert analysis.input_hash(REPO_DATA) == analysis.input_hash({**REPO_DATA, "stars": 810})
+    assert analysis.input_hash(REPO_DATA) != analysis.input_hash({**REPO_DATA, "stars": 2000})
+
+
+def test_llm_fallback_is_partial_and_not_reused(db, monkeypatch):
+    from funding_db import seed_funding_sources
+    from models import Match
+
+    seed_funding_sources(db)
+    repo_id = _repo(db)
+    _github(monkeypatch, REPO_DATA)
+
+    _spy_matching(monkeypatch, llm_methods=["llm", "heuristic"])
+    _analyze(repo_id, "auto")
+    db.expire_all()
+    assert db.get(Repo, repo_id).refinement_status == "partial"
+    assert {m.refinement for m in db.query(Match).filter(Match.repo_id == repo_id)} == {"refined", "fallback"}
+
+    # The outage is over: the next run re-scores everything with the LLM
+    calls = _spy_matching(monkeypatch, llm_methods=["llm"])
+    _analyze(repo_id, "auto")
+    assert calls == [("heuristic", None), ("auto", None)]
+    db.expire_all()
+    assert db.get(Repo, repo_id).refinement_status == "complete"
+
+    # Complete runs are reusable
+    calls.clear()
+    _analyze(repo_id, "auto")
+    assert calls == []
+
+
+@pytest.mark.parametrize("error", [
+    GitHubTransientError("GitHub returned 502"),
+    ValueError("Repository 'octo/widget' not found on GitHub."),
+    RuntimeError("connection reset"),
+])
+def test_failed_refresh_keeps_the_published_analysis(db, monkeypatch, error):
+    from funding_db import seed_funding_sources
+    from models import LeaderboardEntry, Match
+    from refresh_scheduler import run_refresh_job
+
+    seed_funding_sources(db)
+    repo_id = _repo(db)
+    _github(monkeypatch, REPO_DATA)
+    _analyze(repo_id, "heuristic")
+    matched = {m.funding_id for m in db.query(Match).filter(Match.repo_id == repo_id)}
+
+    _github(monkeypatch, error)
+    asyncio.run(run_refresh_job({"repo_id": repo_id, "mode": "heuristic"}))
+
+    db.expire_all()
+    repo = db.get(Repo, repo_id)
+    assert repo.status == "analyzed" and not repo.error_message
+    assert db.get(LeaderboardEntry, repo_id) is not None
+    assert {m.funding_id for m in db.query(Match).filter(Match.repo_id == repo_id)} == matched
+
+
+def test_failed_stale_resubmit_keeps_the_published_matches(db, monkeypatch):
+    import job_queue
+    from funding_db import seed_funding_sources
+    from models import Job, Match
+
+    seed_funding_sources(db)
+    repo_id = _repo(db)
+    _github(monkeypatch, REPO_DATA)
+    _analyze(repo_id, "heuristic")
+    matched = {m.funding_id for m in db.query(Match).filter(Match.repo_id == repo_id)}
+
+    # What submit_repo queues for a stale analyzed repo, on its last attempt
+    _github(monkeypatch, GitHubTransientError("rate limited"))
+    monkeypatch.setattr(job_queue, "JOB_POLL_INTERVAL", 0.01)
+    job_id = job_queue.enqueue("analyze", {"repo_id": repo_id, "mode": "heuristic", "refresh": True},
+                               repo_id=repo_id, max_attempts=1)
+
+    async def work():
+        pool = job_queue.JobWorkerPool(1, kinds=["analyze"], name="pool")
+        pool.start()
+        await asyncio.sleep(0.2)
+        await pool.stop()
+
+    asyncio.run(work())
+
+    db.expire_all()
+    assert db.get(Job, job_id).status == "failed"
+    assert db.get(Repo, repo_id).status == "analyzed"
+    assert {m.funding_id for m in db.query(Match).filter(Match.repo_id == repo_id)} == matched
@@ -0,0 +1,162 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import dependency_analyzer
+from dependency_analyzer import parse_packages, stream_dependencies
+
+
+def test_package_json_merges_dev_dependencies():
+    content = json.dumps({"dependencies": {"react": "^18"}, "devDependencies": {"vite": "^5", "react": "^18"}})
+
+    assert parse_packages(content, "npm") == ["react", "vite"]
+
+
+def test_npm_lockfile_v1_walks_nested_dependencies():
+    content = json.dumps({
+        "lockfileVersion": 1,
+        "dependencies": {
+            "express": {"version": "4.18.2", "dependencies": {"body-parser": {"version": "1.20.1"}}},
+            "lodash": {"version": "4.17.21"},
+        },
+    })
+
+    assert parse_packages(content, "npm") == ["express", "body-parser", "lodash"]
+
+
+def test_npm_lockfile_v2_reads_flat_packages_map():
+    content = json.dumps({
+        "lockfileVersion": 2,
+        "packages": {
+            "": {"name": "app"},
+            "node_modules/@babel/core": {},
+            "node_modules/express": {},
+            "node_modules/express/node_modules/debug": {},
+        },
+        "dependencies": {"ignored-v1-section": {}},
+    })
+
+    assert parse_packages(content, "npm") == ["@babel/core", "express", "debug"]
+
+
+def test_requirements_with_hashes_markers_and_options():
+    content = (
+        "--index-url https://pypi.org/simple\n"
+        "-r base.txt\n"
+        "# pinned\n"
+        "requests==2.31.0 \\\n"
+        "    --hash=sha256:aaa \\\n"
+        "    --hash=sha256:bbb\n"
+        "uvicorn[standard]>=0.30 ; python_version >= '3.9'  # server\n"
+        "mypkg @ git+https://github.com/me/mypkg\n"
+        "Django~=5.0\n"
+    )
+
+    assert parse_packages(content, "pip") == ["requests", "uvicorn", "mypkg", "Django"]
+
+
+def test_poetry_lock():
+    content = (
+        '[[package]]\nname = "httpx"\nversion = "0.28.1"\n\n'
+        '[[package]]\nname = "anyio"\nversion = "4.6.0"\n\n'
+        '[metadata]\nlock-version = "2.0"\n'
+    )
+
+    assert parse_packages(content, "pip") == ["httpx", "anyio"]
+
+
+def test_pipfile_lock_reads_default_and_develop():
+    content = json.dumps({"_meta": {}, "default": {"flask": {}, "click": {}}, "develop": {"pytest": {}, "click": {}}})
+
+    assert parse_packages(content, "pip") == ["flask", "click", "pytest"]
+
+
+@pytest.mark.parametrize("content, ecosystem", [
+    ("not json", "npm"),
+    ("{broken", "pip"),
+    ("[[package]]\nname = ", "pip"),
+    ("# only comments\n", "pip"),
+    ("{}", "npm"),
+])
+def test_unparseable_or_empty_input_raises_value_error(content, ecosystem):
+    with pytest.raises(ValueError):
+        parse_packages(content, ecosystem)
+
+
+def test_stream_shares_one_health_lookup_per_repo(db, monkeypatch):
+    lookups = []
+
+    async def fake_registry(pkg, ecosystem):
+        return "https://github.com/babel/babel", True
+
+    async def fake_health(github_url, batch=None):
+        lookups.append(github_url)
+        await asyncio.sleep(0.01)
+        return {"stars": 5000, "forks": 1, "language": "JS", "license": "MIT", "has_sponsors": True}
+
+    monkeypatch.setattr(dependency_analyzer, "_lookup_registry", fake_registry)
+    monkeypatch.setattr(dependency_analyzer, "fetch_repo_health", fake_health)
+
+    async def collect():
+        return [e async for e in stream_dependencies(["@babel/core", "@babel/parser", "@babel/types"], "npm")]
+
+    events = asyncio.run(collect())
+
+    assert [e["type"] for e in events] == ["start", "package", "package", "package", "summary"]
+    assert events[-1]["unique_repos"] == 1
+    assert lookups == ["https://github.com/babel/babel"]
+    assert all(e["risk"] == "low" for e in events if e["type"] == "package")
+
+
+def test_health_batch_folds_concurrent_lookups_into_one_graphql_query(monkeypatch):
+    queries = []
+
+    async def fake_graphql(full_names):
+        queries.append(sorted(full_names))
+        return {n.lower(): {"stars": 10, "forks": 0, "language": "", "license": "MIT", "has_sponsors": False}
+                for n in full_names if n != "gone/repo"}
+
+    monkeypatch.setattr(dependency_analyzer, "fetch_repo_health_graphql", fake_graphql)
+
+    async def scan():
+        batch = dependency_analyzer.HealthBatch()
+        found = await asyncio.gather(
+            dependency_analyzer.fetch_repo_health("https://github.com/a/one", batch),
+            dependency_analyzer.fetch_repo_health("https://github.com/b/two", batch),
+        )
+        missing = await batch.fetch("gone/repo")
+        return found, missing
+
+    found, missing = asyncio.run(scan())
+
+    assert queries == [["a/one", "b/two"], ["gone/repo"]]
+    assert [h["license"] for h in found] == ["MIT", "MIT"]
+    assert missing is None
+
+
+def test_failed_health_batch_fails_every_waiter_and_falls_back_to_rest(monkeypatch):
+    async def broken_graphql(full_names):
+        raise RuntimeError("GraphQL unavailable")
+
+    rest = []
+
+    async def fake_get(url, headers=None, **kwargs):
+        rest.append(url)
+        return httpx.Response(404, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(dependency_analyzer, "fetch_repo_health_graphql", broken_graphql)
+    monkeypatch.setattr(dependency_analyzer, "github_get", fake_get)
+
+    async def scan():
+        batch = dependency_analyzer.HealthBatch()
+        waiters = await asyncio.gather(batch.fetch("a/one"), batch.fetch("b/two"), return_exceptions=True)
+        health = await dependency_analyzer.fetch_repo_health("https://github.com/c/three", batch)
+        return batch, waiters, health
+
+    batch, waiters, health = asyncio.run(scan())
+
+    assert [str(w) for w in waiters] == ["GraphQL unavailable"] * 2
+    assert health["stars"] == 0 and len(rest) == 2
+    assert not batch._running
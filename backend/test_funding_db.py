@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+import funding_db
+from funding_db import seed_funding_sources
+from models import CatalogVersion, FundingSource
+
+
+def _source(name: str, **overrides) -> dict:
+    return {
+        "name": name, "type": "grant", "min_amount": 1000, "max_amount": 10000,
+        "description": f"{name} funds open source", "url": f"https://example.org/{name}",
+        "category": "foundation", "tags": ["oss"], "eligibility": "Anyone",
+        "focus_areas": ["infrastructure"], "is_recurring": True, "application_required": True,
+        "deadline": None, **overrides,
+    }
+
+
+@pytest.fixture
+def catalog_file(tmp_path, monkeypatch):
+    """Point the seeder at a small data file; call the fixture to (re)write it."""
+    path = tmp_path / "funding_sources.json"
+
+    def write(sources: list[dict]) -> None:
+        path.write_text(json.dumps(sources), encoding="utf-8")
+        monkeypatch.setattr(funding_db, "_funding_sources", None)
+
+    monkeypatch.setattr(funding_db, "FUNDING_SOURCES_PATH", str(path))
+    return write
+
+
+def _version(db) -> int:
+    db.expire_all()
+    return db.get(CatalogVersion, 1).version
+
+
+def _active(db) -> dict[str, int]:
+    db.expire_all()
+    return {s.name: s.max_amount for s in db.query(FundingSource).filter(FundingSource.active == True)}
+
+
+def test_reseeding_an_unchanged_file_is_a_no_op(db, catalog_file, monkeypatch):
+    catalog_file([_source("alpha"), _source("beta")])
+    seed_funding_sources(db)
+    version = _version(db)
+
+    def must_not_parse():
+        raise AssertionError("unchanged data file was parsed")
+
+    monkeypatch.setattr(funding_db, "load_funding_sources", must_not_parse)
+    seed_funding_sources(db)
+
+    assert _version(db) == version
+    assert _active(db) == {"alpha": 10000, "beta": 10000}
+
+
+def test_changed_file_upserts_and_deactivates_removed_entries(db, catalog_file):
+    catalog_file([_source("alpha"), _source("beta")])
+    seed_funding_sources(db)
+    ids = dict(db.query(FundingSource.name, FundingSource.id))
+    version = _version(db)
+
+    catalog_file([_source("alpha", max_amount=50000), _source("gamma")])
+    seed_funding_sources(db)
+
+    assert _version(db) == version + 1
+    assert _active(db) == {"alpha": 50000, "gamma": 10000}
+    assert db.get(FundingSource, ids["alpha"]).max_amount == 50000  # updated in place
+    assert db.get(FundingSource, ids["beta"]).active is False       # kept for existing matches
+
+
+def test_reformatted_file_with_same_entries_keeps_the_version(db, catalog_file):
+    sources = [_source("alpha"), _source("beta")]
+    catalog_file(sources)
+    seed_funding_sources(db)
+    version = _version(db)
+
+    catalog_file(list(reversed(sources)))
+    seed_funding_sources(db)
+
+    assert _version(db) == version
+    assert _active(db) == {"alpha": 10000, "beta": 10000}
@@ -0,0 +1,99 @@
+import asyncio
+import base64
+
+import httpx
+import pytest
+
+import github_api
+from github_api import GitHubTransientError, fetch_repo_data
+
+REPO = {
+    "full_name": "octo/widget",
+    "owner": {"login": "octo"},
+    "stargazers_count": 120,
+    "forks_count": 7,
+    "language": "Python",
+    "description": "Widgets",
+    "license": {"spdx_id": "MIT"},
+    "has_pages": True,
+}
+
+
+def _response(status: int, body=None, headers=None) -> httpx.Response:
+    return httpx.Response(status, json=body if body is not None else {}, headers=headers,
+                          request=httpx.Request("GET", "https://api.github.com/"))
+
+
+def _fake_github(monkeypatch, routes: dict, delay: float = 0.0, log: list = None):
+    """Serve github_get from {url suffix: response}; sub-resources sleep `delay`."""
+
+    async def fake_get(url, params=None, headers=None, timeout=None):
+        suffix = url.split("/repos/octo/widget", 1)[1]
+        if log is not None:
+            log.append(("start", suffix))
+        if suffix:
+            await asyncio.sleep(delay)
+        if log is not None:
+            log.append(("end", suffix))
+        route = routes.get(suffix, _response(404))
+        if isinstance(route, Exception):
+            raise route
+        return route
+
+    monkeypatch.setattr(github_api, "github_get", fake_get)
+
+
+def test_fetch_repo_data_fetches_sub_resources_concurrently(monkeypatch):
+    log = []
+    readme = base64.b64encode(b"# Widget\nDoes things").decode()
+    _fake_github(monkeypatch, {
+        "": _response(200, REPO),
+        "/topics": _response(200, {"names": ["python", "widgets"]}),
+        "/readme": _response(200, {"content": readme}),
+        "/contributors": _response(200, [{}], {"Link": '<https://x?page=42>; rel="last"'}),
+        "/stats/participation": _response(200, {"all": [0] * 40 + [6] * 12}),
+    }, delay=0.05, log=log)
+
+    data = asyncio.run(fetch_repo_data("https://github.com/octo/widget"))
+
+    assert data["stars"] == 120
+    assert data["topics"] == ["python", "widgets"]
+    assert data["readme_excerpt"].startswith("# Widget")
+    assert data["contributors_count"] == 42
+    assert data["commit_frequency"] == 6.0
+    assert data["has_pages"] is True
+    # Core call first, then all four sub-resources start before any of them ends
+    assert log[:2] == [("start", ""), ("end", "")]
+    assert [event for event, _ in log[2:6]] == ["start"] * 4
+
+
+def test_failed_sub_resource_falls_back_to_default(monkeypatch):
+    _fake_github(monkeypatch, {
+        "": _response(200, REPO),
+        "/topics": httpx.ConnectError("boom"),
+        "/readme": _response(404),
+        "/contributors": _response(500),
+        "/stats/participation": _response(202),
+    })
+
+    data = asyncio.run(fetch_repo_data("octo/widget"))
+
+    assert data["repo_name"] == "octo/widget"
+    assert data["topics"] == []
+    assert data["readme_excerpt"] == ""
+    assert data["contributors_count"] == 0
+    assert data["commit_frequency"] == 0.0
+
+
+@pytest.mark.parametrize("response, error", [
+    (_response(404), ValueError),
+    (_response(403, {"message": "Resource not accessible"}), ValueError),
+    (_response(403, {"message": "API rate limit exceeded"}, {"X-RateLimit-Remaining": "0"}), GitHubTransientError),
+    (_response(429), GitHubTransientError),
+    (_response(502), GitHubTransientError),
+])
+def test_core_errors_split_into_permanent_and_transient(monkeypatch, response, error):
+    _fake_github(monkeypatch, {"": response})
+
+    with pytest.raises(error):
+        asyncio.run(fetch_repo_data("https://github.com/octo/widget"))
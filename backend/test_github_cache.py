@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+
+import github_api
+import github_cache
+import github_scheduler
+from github_scheduler import TokenPool
+from models import HttpCacheEntry
+
+URL = "https://api.github.com/repos/octo/widget"
+
+
+def _fake_github(monkeypatch, etag='"v1"', tokens=()):
+    """GitHub stand-in behind the real scheduler: 304 when If-None-Match matches `etag`."""
+    sent = []
+
+    class FakeClient:
+        async def request(self, method, url, headers=None, **kwargs):
+            sent.append(dict(headers or {}))
+            request = httpx.Request(method, url)
+            if headers.get("If-None-Match") == etag:
+                return httpx.Response(304, headers={"ETag": etag}, request=request)
+            return httpx.Response(200, json={"stars": 1}, headers={"ETag": etag, "Link": "<next>"}, request=request)
+
+    monkeypatch.setattr(github_scheduler, "get_http_client", lambda: FakeClient())
+    monkeypatch.setattr(github_scheduler, "token_pool", TokenPool(list(tokens)))
+    return sent
+
+
+def _get():
+    resp = asyncio.run(github_api.github_get(URL))
+    github_cache.flush()
+    return resp
+
+
+def test_second_request_is_conditional_and_served_from_cache(db, monkeypatch):
+    sent = _fake_github(monkeypatch)
+
+    first = _get()
+    second = _get()
+
+    assert "If-None-Match" not in sent[0]
+    assert sent[1]["If-None-Match"] == '"v1"'
+    assert first.status_code == second.status_code == 200
+    assert second.json() == {"stars": 1}
+    assert second.headers["Link"] == "<next>"
+    assert db.query(HttpCacheEntry).count() == 1
+
+
+def test_changed_resource_replaces_the_entry(db, monkeypatch):
+    _fake_github(monkeypatch, etag='"v1"')
+    _get()
+    _fake_github(monkeypatch, etag='"v2"')
+    _get()
+
+    entry = db.query(HttpCacheEntry).one()
+    assert entry.etag == '"v2"'
+
+
+def test_304_touches_validated_at_at_most_hourly(db, monkeypatch):
+    _fake_github(monkeypatch)
+    _get()
+    entry = db.query(HttpCacheEntry).one()
+
+    fresh = entry.validated_at
+    _get()
+    db.refresh(entry)
+    assert entry.validated_at == fresh
+
+    entry.validated_at = datetime.utcnow() - timedelta(hours=2)
+    db.commit()
+    _get()
+    db.refresh(entry)
+    assert entry.validated_at > datetime.utcnow() - timedelta(minutes=1)
+
+
+def test_entries_are_keyed_by_the_pool_token_actually_sent(db, monkeypatch):
+    sent = _fake_github(monkeypatch, tokens=["a"])
+    _get()
+    monkeypatch.setattr(github_scheduler, "token_pool", TokenPool(["b"]))
+    _get()
+
+    # "b" never validates against the body fetched with "a"
+    assert [h["Authorization"] for h in sent] == ["token a", "token b"]
+    assert "If-None-Match" not in sent[1]
+    assert db.query(HttpCacheEntry).count() == 2
+
+
+def test_cache_key_separates_auth_and_media_type():
+    base = {"Accept": "application/json"}
+    key = github_cache.cache_key(URL, None, base)
+
+    assert key == github_cache.cache_key(URL, {}, dict(base))
+    assert key != github_cache.cache_key(URL, None, {**base, "Authorization": "token a"})
+    assert key != github_cache.cache_key(URL, None, {"Accept": "application/vnd.github.raw"})
+    assert key != github_cache.cache_key(URL, {"page": 2}, base)
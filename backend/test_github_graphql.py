@@ -0,0 +1,27 @@
+from github_graphql import _build_query, _HEALTH_FIELDS, _to_health, _to_repo_data, _valid_names
+
+
+def test_repo_data_leaves_pages_unset():
+    data = _to_repo_data({"nameWithOwner": "octo/widget", "stargazerCount": 3})
+
+    assert data["repo_name"] == "octo/widget"
+    assert "has_pages" not in data
+
+
+def test_health_maps_funding_file_to_sponsors():
+    node = {"stargazerCount": 9, "forkCount": 2, "primaryLanguage": {"name": "Go"},
+            "licenseInfo": {"spdxId": "Apache-2.0"}, "fundingFile": {"id": "x"}}
+
+    assert _to_health(node) == {"stars": 9, "forks": 2, "language": "Go", "license": "Apache-2.0", "has_sponsors": True}
+    assert _to_health({"fundingFile": None})["has_sponsors"] is False
+
+
+def test_health_query_needs_no_since_variable():
+    query = _build_query(["a/b", "c/d"], _HEALTH_FIELDS, with_since=False)
+
+    assert query.startswith("query {")
+    assert 'r1: repository(owner: "c", name: "d")' in query
+
+
+def test_invalid_names_are_dropped_and_duplicates_merged():
+    assert _valid_names(["a/b", "A/B", "a/b/c", "bad name/x", " c/d "]) == ["a/b", "c/d"]
@@ -0,0 +1,133 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+import github_scheduler
+from github_scheduler import TokenPool
+
+
+def _response(status: int, headers=None, text: str = "") -> httpx.Response:
+    return httpx.Response(status, headers=headers, text=text,
+                          request=httpx.Request("GET", "https://api.github.com/x"))
+
+
+def test_acquire_spreads_requests_across_tokens():
+    pool = TokenPool(["a", "b"])
+
+    async def take(n):
+        states = [await pool.acquire("core", time.time() + 1) for _ in range(n)]
+        for s in states:
+            pool.release(s, None, "core")
+        return [s.token for s in states]
+
+    assert sorted(asyncio.run(take(4))) == ["a", "a", "b", "b"]
+
+
+def test_acquire_skips_exhausted_token():
+    pool = TokenPool(["a", "b"])
+    pool.states[0].remaining["core"] = 0
+    pool.states[0].reset_at["core"] = time.time() + 3600
+
+    state = asyncio.run(pool.acquire("core", time.time() + 1))
+
+    assert state.token == "b"
+
+
+def test_acquire_waits_for_reset_when_every_token_is_exhausted():
+    pool = TokenPool(["a"])
+    pool.states[0].remaining["core"] = 0
+    pool.states[0].reset_at["core"] = time.time() + 0.2
+
+    started = time.monotonic()
+    asyncio.run(pool.acquire("core", time.time() + 5))
+
+    assert 0.15 <= time.monotonic() - started < 2
+
+
+def test_acquire_gives_up_waiting_at_the_deadline():
+    pool = TokenPool(["a"])
+    pool.states[0].remaining["core"] = 0
+    pool.states[0].reset_at["core"] = time.time() + 3600
+
+    started = time.monotonic()
+    state = asyncio.run(pool.acquire("core", time.time() + 0.2))
+
+    assert state.token == "a"
+    assert time.monotonic() - started < 2
+
+
+def test_release_records_reported_budget():
+    pool = TokenPool(["a"])
+    state = asyncio.run(pool.acquire("core", time.time() + 1))
+
+    pool.release(state, _response(200, {
+        "X-RateLimit-Resource": "search", "X-RateLimit-Remaining": "7",
+        "X-RateLimit-Limit": "30", "X-RateLimit-Reset": "1700000000",
+    }), "core")
+
+    assert state.in_flight == 0
+    assert state.remaining == {"search": 7}
+    assert state.limit == {"search": 30}
+    assert state.reset_at == {"search": 1700000000.0}
+
+
+def test_backoff_honors_retry_after():
+    pool = TokenPool(["a"])
+    state = pool.states[0]
+
+    delay = pool.backoff(state, _response(403, {"Retry-After": "12"}), "core", attempt=0)
+
+    assert delay == 12
+    assert state.blocked_until > time.time() + 10
+
+
+def test_backoff_on_primary_limit_waits_for_reset():
+    pool = TokenPool(["a"])
+    state = pool.states[0]
+    state.reset_at["core"] = time.time() + 30
+
+    delay = pool.backoff(state, _response(403, {"X-RateLimit-Remaining": "0"}), "core", attempt=0)
+
+    assert 25 < delay <= 30
+
+
+def test_backoff_on_secondary_limit_is_exponential():
+    pool = TokenPool(["a"])
+    state = pool.states[0]
+    body = "You have exceeded a secondary rate limit"
+
+    delays = [pool.backoff(state, _response(403, text=body), "core", attempt=n) for n in range(3)]
+
+    assert delays == [5.0, 10.0, 20.0]
+
+
+@pytest.mark.parametrize("response", [_response(200), _response(404), _response(403, text="Forbidden")])
+def test_backoff_ignores_other_responses(response):
+    pool = TokenPool(["a"])
+
+    assert pool.backoff(pool.states[0], response, "core", attempt=0) is None
+
+
+def test_request_moves_to_another_token_on_primary_limit(monkeypatch):
+    pool = TokenPool(["a", "b"])
+    monkeypatch.setattr(github_scheduler, "token_pool", pool)
+    used = []
+
+    class FakeClient:
+        async def request(self, method, url, headers=None, **kwargs):
+            token = headers["Authorization"].split()[-1]
+            used.append(token)
+            if token == "a":
+                return _response(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 3600)})
+            return _response(200, {"X-RateLimit-Remaining": "4999"})
+
+    monkeypatch.setattr(github_scheduler, "get_http_client", lambda: FakeClient())
+    pool.states[1].used = 1  # "a" is picked first
+
+    resp = asyncio.run(github_scheduler.github_request("GET", "https://api.github.com/repos/x/y"))
+
+    assert resp.status_code == 200
+    assert used == ["a", "b"]
+    assert pool.states[0].remaining["core"] == 0
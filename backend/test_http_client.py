@@ -0,0 +1,24 @@
+import asyncio
+
+import http_client
+
+
+async def _client():
+    return http_client.get_http_client()
+
+
+def test_one_client_per_loop_closed_when_the_loop_ends():
+    first = asyncio.run(_client())
+    second = asyncio.run(_client())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
+def test_client_is_shared_within_a_loop():
+    async def twice():
+        return http_client.get_http_client(), http_client.get_http_client()
+
+    a, b = asyncio.run(twice())
+
+    assert a is b
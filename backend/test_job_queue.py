@@ -0,0 +1,127 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import job_queue
+from models import Job, Repo
+
+
+def _repo(db, status="pending") -> str:
+    repo = Repo(github_url="https://github.com/octo/widget", repo_name="octo/widget", status=status)
+    db.add(repo)
+    db.commit()
+    return repo.id
+
+
+def _job(db, job_id: str) -> Job:
+    db.expire_all()
+    return db.get(Job, job_id)
+
+
+def test_only_one_worker_can_claim_a_job(db):
+    job_id = job_queue.enqueue("analyze", {"repo_id": "r"})
+
+    first = job_queue.claim("w1")
+    second = job_queue.claim("w2")
+
+    assert first["id"] == job_id and first["attempts"] == 1
+    assert second is None
+    job = _job(db, job_id)
+    assert job.status == "running" and job.locked_by == "w1"
+
+
+def test_claim_filters_by_kind(db):
+    job_queue.enqueue("refresh", {})
+
+    assert job_queue.claim("w1", kinds=["analyze"]) is None
+    assert job_queue.claim("w1", kinds=["refresh"])["kind"] == "refresh"
+
+
+def test_expired_lease_is_reclaimable(db):
+    job_id = job_queue.enqueue("analyze", {})
+    job_queue.claim("w1")
+    job = _job(db, job_id)
+    job.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+
+    reclaimed = job_queue.claim("w2")
+
+    assert reclaimed["id"] == job_id and reclaimed["attempts"] == 2
+    # The old worker lost its lease and can no longer settle the job
+    job_queue.complete(job_id, "w1")
+    assert _job(db, job_id).status == "running"
+
+
+def test_fail_retries_with_backoff_then_gives_up(db):
+    repo_id = _repo(db)
+    job_id = job_queue.enqueue("analyze", {}, repo_id=repo_id, max_attempts=2)
+
+    job = job_queue.claim("w1")
+    job_queue.fail(job, "w1", "rate limited")
+
+    queued = _job(db, job_id)
+    assert queued.status == "queued" and queued.last_error == "rate limited"
+    assert queued.run_after > datetime.utcnow() + timedelta(seconds=job_queue.JOB_RETRY_BASE_SECONDS - 2)
+    assert db.get(Repo, repo_id).status == "pending"
+    assert job_queue.claim("w1") is None  # backing off
+
+    queued.run_after = datetime.utcnow()
+    db.commit()
+    job = job_queue.claim("w1")
+    job_queue.fail(job, "w1", "still rate limited")
+
+    assert _job(db, job_id).status == "failed"
+    assert db.get(Repo, repo_id).status == "error"
+
+
+def test_release_hands_the_job_back_without_spending_an_attempt(db):
+    job_id = job_queue.enqueue("analyze", {})
+    job_queue.claim("w1")
+
+    job_queue.release(job_id, "w1")
+
+    job = _job(db, job_id)
+    assert job.status == "queued" and job.attempts == 0 and job.locked_by is None
+    assert job_queue.claim("w2")["id"] == job_id
+
+
+def _run_pool(handler, stop_timeout: float, settle: float = 0.05):
+    job_queue.register("test", handler)
+
+    async def run():
+        pool = job_queue.JobWorkerPool(1, kinds=["test"], name="pool")
+        pool.start()
+        await asyncio.sleep(settle)
+        await pool.stop(timeout=stop_timeout)
+
+    asyncio.run(run())
+
+
+def test_pool_completes_and_fails_jobs(db, monkeypatch):
+    monkeypatch.setattr(job_queue, "JOB_POLL_INTERVAL", 0.01)
+    ok = job_queue.enqueue("test", {"fail": False})
+    bad = job_queue.enqueue("test", {"fail": True}, max_attempts=1)
+
+    async def handler(payload):
+        if payload["fail"]:
+            raise RuntimeError("boom")
+
+    _run_pool(handler, stop_timeout=0, settle=0.2)
+
+    assert _job(db, ok).status == "done"
+    assert _job(db, bad).status == "failed" and _job(db, bad).last_error == "boom"
+
+
+def test_stop_grace_lets_running_jobs_finish(db, monkeypatch):
+    monkeypatch.setattr(job_queue, "JOB_POLL_INTERVAL", 0.01)
+    job_id = job_queue.enqueue("test", {})
+
+    async def slow(payload):
+        await asyncio.sleep(0.2)
+
+    _run_pool(slow, stop_timeout=5)
+    assert _job(db, job_id).status == "done"
+
+    job_id = job_queue.enqueue("test", {})
+    _run_pool(slow, stop_timeout=0)
+    job = _job(db, job_id)
+    assert job.status == "queued" and job.attempts == 0
@@ -0,0 +1,36 @@
+import llm_cache
+from models import LlmCacheEntry
+
+
+def test_key_covers_provider_model_and_both_prompts():
+    key = llm_cache.cache_key("anthropic", "m1", "system v1", "user")
+
+    assert key == llm_cache.cache_key("anthropic", "m1", "system v1", "user")
+    assert key != llm_cache.cache_key("anthropic", "m1", "system v2", "user")
+    assert key != llm_cache.cache_key("anthropic", "m2", "system v1", "user")
+    assert key != llm_cache.cache_key("openai", "m1", "system v1", "user")
+    assert key != llm_cache.cache_key("anthropic", "m1", "system v1user", "")
+
+
+def test_hits_are_recorded_in_the_background(db):
+    key = llm_cache.cache_key("anthropic", "m1", "system", "user")
+    matches = [{"funding_id": "f1", "score": 80}]
+
+    assert llm_cache.lookup(key) is None
+    llm_cache.store(key, "anthropic", "m1", matches)
+    llm_cache.flush()
+
+    assert llm_cache.lookup(key) == matches
+    assert llm_cache.lookup(key) == matches
+    llm_cache.flush()
+
+    assert db.get(LlmCacheEntry, key).hits == 2
+
+
+def test_empty_results_are_not_cached(db):
+    key = llm_cache.cache_key("anthropic", "m1", "system", "user")
+
+    llm_cache.store(key, "anthropic", "m1", [])
+    llm_cache.flush()
+
+    assert db.query(LlmCacheEntry).count() == 0
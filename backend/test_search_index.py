@@ -0,0 +1,46 @@
+import matcher
+from search_index import BM25Index, get_funding_index, repo_query, tokenize
+
+DOCS = [
+    {"id": 1, "name": "Rust Foundation Grants", "description": "Funding for Rust crates", "tags": ["rust"], "focus_areas": ["systems"]},
+    {"id": 2, "name": "ML Research Fund", "description": "Machine learning research", "tags": ["ai"], "focus_areas": ["machine learning"]},
+    {"id": 3, "name": "Open Anything", "description": "Any open source project", "tags": [], "focus_areas": ["any"],
+     "eligibility": {"location": "Global"}},
+    {"id": 4, "name": "Web Tools Program", "description": "JavaScript web tooling", "tags": ["javascript", "web"], "focus_areas": ["web"]},
+]
+
+
+def test_tokenize_drops_stopwords_and_adds_bigrams():
+    assert tokenize("The Machine Learning toolkit for C++") == [
+        "machine", "learning", "toolkit", "c++", "machine_learning", "learning_toolkit", "toolkit_c++",
+    ]
+
+
+def test_field_matches_outrank_priors_and_ties_keep_catalog_order():
+    index = BM25Index(DOCS)
+    query = repo_query({"topics": ["machine-learning"], "description": "Machine learning research library"})
+
+    ranking = index.top_k(query, len(DOCS))
+
+    assert ranking[0] == 1
+    assert ranking[1] == 2  # "any"-focus + global prior beats unrelated sources
+    assert index.top_k({}, 4) == [2, 0, 1, 3]
+
+
+def test_index_is_rebuilt_only_when_the_catalog_changes():
+    first = get_funding_index(DOCS)
+
+    assert get_funding_index([dict(d) for d in DOCS]) is first
+    changed = [*DOCS[:3], {**DOCS[3], "tags": ["typescript"]}]
+    assert get_funding_index(changed) is not first
+
+
+def test_prefilter_fuses_bm25_and_embedding_rankings(monkeypatch):
+    monkeypatch.setattr(matcher, "MAX_CANDIDATES", 2)
+    monkeypatch.setattr(matcher, "embeddings_enabled", lambda: True)
+    # Embeddings put the web program first; BM25 puts the Rust grant first
+    monkeypatch.setattr(matcher, "rank_by_similarity", lambda repo, docs: [3, 0, 1, 2])
+
+    picked = matcher._prefilter({"topics": ["rust"], "description": "rust crate"}, DOCS)
+
+    assert [d["id"] for d in picked] == [1, 4]
@@ -0,0 +1,139 @@
+"""
+Standalone Analysis Worker
+==========================
+Runs queued repo analyses outside the web process, so CPU work (pre-filter,
+DNA scoring, JSON parsing) doesn't compete with request handling and the API
+and analysis tiers can be scaled independently. Workers share the database
+with the API: they claim jobs from the `jobs` table (see job_queue.py) and
+publish progress through `analysis_events`, which the API relays to SSE
+clients.
+
+    python worker.py                      # WORKER_PROCESSES x WORKER_CONCURRENCY
+    python worker.py --processes 4 --concurrency 2
+
+Each process runs its own event loop with `concurrency` async job workers.
+SIGTERM / SIGINT trigger a graceful shutdown: no new jobs are claimed,
+in-flight jobs get WORKER_SHUTDOWN_GRACE seconds to finish, and anything
+still running after that is handed back to the queue for another worker.
+
+Set JOB_WORKERS=0 on the web process when running a dedicated worker tier.
+
+Output goes through `logging`: the supervisor logs as "opengrant.worker" and
+each child as "opengrant.worker.<index>", at WORKER_LOG_LEVEL.
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+WORKER_PROCESSES = int(os.getenv("WORKER_PROCESSES", str(min(4, os.cpu_count() or 1))))
+WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "2"))
+WORKER_SHUTDOWN_GRACE = float(os.getenv("WORKER_SHUTDOWN_GRACE", "30"))
+WORKER_LOG_LEVEL = os.getenv("WORKER_LOG_LEVEL", "INFO").upper()
+
+logger = logging.getLogger("opengrant.worker")
+
+
+def _configure_logging() -> None:
+    """Called in the supervisor and again in each spawned child (fresh interpreter)."""
+    logging.basicConfig(
+        level=WORKER_LOG_LEVEL,
+        format="%(asctime)s %(levelname)s [%(processName)s] %(name)s: %(message)s",
+    )
+
+
+async def _serve(index: int, concurrency: int, stop_flag) -> None:
+    import events
+    import job_queue
+    import analysis  # noqa: F401  (registers the "analyze" job handler)
+    import refresh_scheduler  # noqa: F401  (registers the "refresh" job handler)
+    from http_client import close_http_client
+    from matcher import warm_prefilter_index
+    from models import SessionLocal
+    from funding_db import get_all_funding_sources
+
+    log = logger.getChild(str(index))
+    events.enable_persistence()
+
+    db = SessionLocal()
+    try:
+        warm_prefilter_index(get_all_funding_sources(db))
+    finally:
+        db.close()
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stopping.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows: rely on the parent's stop flag
+
+    pool = job_queue.JobWorkerPool(concurrency, name=f"worker-{os.getpid()}")
+    pool.start()
+    log.info("pid %d running %d job workers", os.getpid(), concurrency)
+
+    while not stopping.is_set() and not stop_flag.is_set():
+        try:
+            await asyncio.wait_for(stopping.wait(), timeout=0.5)
+        except asyncio.TimeoutError:
+            pass
+
+    log.info("shutting down")
+    await pool.stop(timeout=WORKER_SHUTDOWN_GRACE)
+    await close_http_client()
+
+
+def _process_main(index: int, concurrency: int, stop_flag) -> None:
+    _configure_logging()
+    asyncio.run(_serve(index, concurrency, stop_flag))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OpenGrant analysis worker")
+    parser.add_argument("--processes", type=int, default=WORKER_PROCESSES)
+    parser.add_argument("--concurrency", type=int, default=WORKER_CONCURRENCY,
+                        help="concurrent jobs per process")
+    args = parser.parse_args()
+    _configure_logging()
+
+    # Tables and funding data exist before any child starts claiming jobs
+    from models import init_db, SessionLocal
+    from funding_db import seed_funding_sources
+    init_db()
+    db = SessionLocal()
+    try:
+        seed_funding_sources(db)
+    finally:
+        db.close()
+
+    ctx = multiprocessing.get_context("spawn")
+    stop_flag = ctx.Event()
+    procs = [
+        ctx.Process(target=_process_main, args=(i, args.concurrency, stop_flag), name=f"opengrant-worker-{i}")
+        for i in range(max(1, args.processes))
+    ]
+    for p in procs:
+        p.start()
+
+    def shutdown(signum, frame):
+        stop_flag.set()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    for p in procs:
+        p.join()
+        if p.exitcode not in (0, None):
+            logger.error("%s exited with code %s", p.name, p.exitcode)
+
+
+if __name__ == "__main__":
+    main()
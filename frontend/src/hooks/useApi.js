@@ -34,10 +34,16 @@ export function useSubmitRepo() {
 }
 
 // ---------------------------------------------------------------------------
-// Poll repo status until "analyzed" or "error"
+// Follow repo status until "analyzed" or "error", then through LLM refinement.
+// Listens on the SSE stream (/api/repos/{id}/events); falls back to polling
+// every 2 seconds if EventSource is unavailable or the stream fails.
+// `version` goes up whenever published scores change after the repo became
+// "analyzed" (a refined batch landed, or refinement finished), so pass it to
+// useMatches / useFundability to refetch.
 // ---------------------------------------------------------------------------
 export function useRepoStatus(repoId) {
   const [repo, setRepo] = useState(null)
+  const [version, setVersion] = useState(0)
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState(null)
 
@@ -46,15 +52,30 @@ export function useRepoStatus(repoId) {
 
     let cancelled = false
     let timer
+    let source
+    let last = null
+
+    const bump = () => { if (!cancelled) setVersion(v => v + 1) }
+
+    const fetchRepo = async () => {
+      const res = await axios.get(`${API_BASE}/api/repos/${repoId}`)
+      if (!cancelled) {
+        const data = res.data
+        if (last?.status === 'analyzed' && data.status === 'analyzed' &&
+            last.refinement_status !== data.refinement_status) bump()
+        last = data
+        setRepo(data)
+      }
+      return res.data
+    }
 
     const poll = async () => {
       setLoading(true)
       try {
-        const res = await axios.get(`${API_BASE}/api/repos/${repoId}`)
+        const data = await fetchRepo()
         if (!cancelled) {
-          setRepo(res.data)
-          if (res.data.status === 'pending') {
-            // Keep polling every 2 seconds while analysis is in progress
+          if (data.status === 'pending' || data.refinement_status === 'refining') {
+            // Keep polling every 2 seconds while analysis or refinement is in progress
             timer = setTimeout(poll, 2000)
           } else {
             setLoading(false)
@@ -68,21 +89,48 @@ export function useRepoStatus(repoId) {
       }
     }
 
-    poll()
+    if (typeof EventSource === 'undefined') {
+      poll()
+    } else {
+      setLoading(true)
+      source = new EventSource(`${API_BASE}/api/repos/${repoId}/events`)
+      const refresh = () => fetchRepo().catch(() => {})
+      source.addEventListener('status', (e) => {
+        const { status } = JSON.parse(e.data)
+        // Re-read the repo on transitions that change what the page shows
+        if (status === 'fetched' || status === 'analyzed') refresh()
+        // A batch of refined scores was saved: matches changed
+        if (status === 'batch_scored') bump()
+      })
+      source.addEventListener('complete', () => {
+        source.close()
+        refresh().finally(() => { if (!cancelled) setLoading(false) })
+      })
+      source.addEventListener('error', (e) => {
+        source.close()
+        if (cancelled) return
+        if (e.data) {
+          refresh().finally(() => { if (!cancelled) setLoading(false) })
+        } else {
+          poll()  // connection-level failure: fall back to polling
+        }
+      })
+    }
 
     return () => {
       cancelled = true
       clearTimeout(timer)
+      if (source) source.close()
     }
   }, [repoId])
 
-  return { repo, loading, error }
+  return { repo, version, loading, error }
 }
 
 // ---------------------------------------------------------------------------
-// Fetch matches for a repo
+// Fetch matches for a repo; refetched (without the spinner) when `version` changes
 // ---------------------------------------------------------------------------
-export function useMatches(repoId, ready) {
+export function useMatches(repoId, ready, version = 0) {
   const [matches, setMatches] = useState([])
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState(null)
@@ -93,7 +141,7 @@ export function useMatches(repoId, ready) {
     let cancelled = false
 
     const fetchMatches = async () => {
-      setLoading(true)
+      if (!version) setLoading(true)
       try {
         const res = await axios.get(`${API_BASE}/api/repos/${repoId}/matches?limit=30`)
         if (!cancelled) {
@@ -110,7 +158,7 @@ export function useMatches(repoId, ready) {
 
     fetchMatches()
     return () => { cancelled = true }
-  }, [repoId, ready])
+  }, [repoId, ready, version])
 
   return { matches, loading, error }
 }
@@ -118,7 +166,7 @@ export function useMatches(repoId, ready) {
 // ---------------------------------------------------------------------------
 // Fundability analysis for a repo
 // ---------------------------------------------------------------------------
-export function useFundability(repoId, ready) {
+export function useFundability(repoId, ready, version = 0) {
   const [data, setData] = useState(null)
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState(null)
@@ -126,13 +174,13 @@ export function useFundability(repoId, ready) {
   useEffect(() => {
     if (!repoId || !ready) return
     let cancelled = false
-    setLoading(true)
+    if (!version) setLoading(true)
     axios.get(`${API_BASE}/api/repos/${repoId}/fundability`)
       .then(res => { if (!cancelled) setData(res.data) })
       .catch(err => { if (!cancelled) setError(err.response?.data?.detail || 'Could not load fundability.') })
       .finally(() => { if (!cancelled) setLoading(false) })
     return () => { cancelled = true }
-  }, [repoId, ready])
+  }, [repoId, ready, version])
 
   return { data, loading, error }
 }
@@ -259,10 +259,10 @@ function MatchCard({ match, index, repoId, repoData }) {
 
 export default function Results() {
   const { repoId } = useParams()
-  const { repo, loading: repoLoading, error: repoError } = useRepoStatus(repoId)
+  const { repo, version, loading: repoLoading, error: repoError } = useRepoStatus(repoId)
   const isReady = repo?.status === 'analyzed'
-  const { matches, loading: matchesLoading, error: matchesError } = useMatches(repoId, isReady)
-  const { data: fundability, loading: fundLoading } = useFundability(repoId, isReady)
+  const { matches, loading: matchesLoading, error: matchesError } = useMatches(repoId, isReady, version)
+  const { data: fundability, loading: fundLoading } = useFundability(repoId, isReady, version)
 
   const isPending = !repo || repo.status === 'pending'
   const isError = repo?.status === 'error' || repoError || matchesError
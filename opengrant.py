@@ -185,9 +185,9 @@ def run_dependency_scan():
         table.add_column("Stars", justify="right")
         table.add_column("Funding Status", style="green")
         
-        for r in results:
+        for r in results["packages"]:
             status = "[bold green]✓ SPONSORED[/bold green]" if r["has_sponsors"] else "[dim]Unfunded[/dim]"
-            table.add_row(r["name"], str(r["stars"]), status)
+            table.add_row(r["package"], str(r["stars"]), status)
         
         console.print(table)
     except Exception as e: